@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+Offline benchmarks for the agent loop's hot paths.
+
+Agents use the passthrough model and connect to local stdio MCP servers
+(benchmark_server.py), so no API keys or network access are needed. Each benchmark
+reports the best time per operation over several rounds. Results can be saved as JSON,
+and compared with a baseline saved on the same machine: a benchmark regresses when it
+is slower than the baseline by more than its tolerance. Exits with status 1 if any
+benchmark regresses.
+
+    python scripts/benchmark.py --save-baseline benchmarks.json
+    python scripts/benchmark.py --baseline benchmarks.json --output results.json
+    python scripts/benchmark.py --only converters --only serialization
+"""
+
+import asyncio
+import base64
+import json
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import typer
+import yaml
+from mcp.types import EmbeddedResource, ImageContent, TextContent, TextResourceContents
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from mcp_agent.core.fastagent import FastAgent
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.llm.augmented_llm_passthrough import FIXED_RESPONSE_INDICATOR
+from mcp_agent.llm.providers.multipart_converter_anthropic import AnthropicConverter
+from mcp_agent.llm.providers.multipart_converter_openai import OpenAIConverter
+from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.transport import AsyncEventBus
+from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.mcp.prompt_serialization import (
+    delimited_format_to_multipart_messages,
+    json_to_multipart_messages,
+    multipart_messages_to_delimited_format,
+    multipart_messages_to_json,
+)
+
+SERVER = Path(__file__).parent / "benchmark_server.py"
+
+GROUPS = ["startup", "agent", "tools", "converters", "serialization", "logging", "workflows"]
+
+# Allowed slowdown relative to the baseline, by group. Process startup is noisier.
+TOLERANCES = {"startup": 0.5}
+DEFAULT_TOLERANCE = 0.25
+
+# (servers, tools per server) for the aggregator startup benchmarks
+STARTUP_SIZES = [(1, 10), (4, 10), (4, 100)]
+
+console = Console()
+
+
+@dataclass
+class Result:
+    name: str
+    group: str
+    ms: float
+    """Best time per operation, in milliseconds"""
+
+    @property
+    def ops_per_second(self) -> float:
+        return 1000 / self.ms if self.ms else 0.0
+
+
+def time_sync(func: Callable[[], Any], iterations: int, rounds: int) -> float:
+    """Best time per call over several rounds, in milliseconds"""
+    func()
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, (time.perf_counter() - started) / iterations)
+    return best * 1000
+
+
+async def time_async(func: Callable[[], Awaitable[Any]], iterations: int, rounds: int) -> float:
+    """Best time per awaited call over several rounds, in milliseconds"""
+    await func()
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await func()
+        best = min(best, (time.perf_counter() - started) / iterations)
+    return best * 1000
+
+
+def write_config(directory: Path, servers: int, tools: int) -> Path:
+    """Write a config with `servers` benchmark servers, each serving `tools` tools"""
+    config = {
+        "default_model": "passthrough",
+        "logger": {
+            "type": "none",
+            "progress_display": False,
+            "show_chat": False,
+            "show_tools": False,
+        },
+        "mcp": {
+            "servers": {
+                f"bench_{index}": {
+                    "command": sys.executable,
+                    "args": [str(SERVER), "--tools", str(tools)],
+                }
+                for index in range(servers)
+            }
+        },
+    }
+    path = directory / f"fastagent.{servers}x{tools}.config.yaml"
+    path.write_text(yaml.safe_dump(config))
+    return path
+
+
+def multimodal_message() -> PromptMessageMultipart:
+    image = base64.b64encode(b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 64).decode("ascii")
+    return Prompt.user(
+        "Describe the chart and summarise the attached report.",
+        ImageContent(type="image", data=image, mimeType="image/png"),
+        EmbeddedResource(
+            type="resource",
+            resource=TextResourceContents(
+                uri="file:///reports/quarterly.md",
+                mimeType="text/markdown",
+                text="# Quarterly report\n\n" + "Revenue grew in every region. " * 200,
+            ),
+        ),
+    )
+
+
+def conversation(turns: int) -> List[PromptMessageMultipart]:
+    messages: List[PromptMessageMultipart] = []
+    for turn in range(turns):
+        messages.append(multimodal_message() if turn % 5 == 0 else Prompt.user(f"Question {turn}"))
+        messages.append(
+            PromptMessageMultipart(
+                role="assistant", content=[TextContent(type="text", text=f"Answer {turn} " * 50)]
+            )
+        )
+    return messages
+
+
+async def bench_startup(directory: Path, rounds: int) -> List[Result]:
+    results = []
+    for servers, tools in STARTUP_SIZES:
+        config_path = write_config(directory, servers, tools)
+        best = float("inf")
+        for _ in range(rounds):
+            fast = FastAgent("benchmark", config_path=str(config_path), ignore_unknown_args=True)
+            fast.agent("agent", servers=[f"bench_{index}" for index in range(servers)])(_noop)
+
+            started = time.perf_counter()
+            async with fast.run():
+                best = min(best, time.perf_counter() - started)
+            AsyncEventBus.reset()
+        results.append(Result(f"aggregator_startup[{servers}x{tools}]", "startup", best * 1000))
+    return results
+
+
+async def _noop() -> None:
+    pass
+
+
+def converter_results(iterations: int, rounds: int) -> List[Result]:
+    message = multimodal_message()
+    return [
+        Result(
+            "anthropic_converter",
+            "converters",
+            time_sync(lambda: AnthropicConverter.convert_to_anthropic(message), iterations, rounds),
+        ),
+        Result(
+            "openai_converter",
+            "converters",
+            time_sync(lambda: OpenAIConverter.convert_to_openai(message), iterations, rounds),
+        ),
+    ]
+
+
+def serialization_results(iterations: int, rounds: int) -> List[Result]:
+    messages = conversation(20)
+    as_json = multipart_messages_to_json(messages)
+    delimited = multipart_messages_to_delimited_format(messages)
+    iterations = max(1, iterations // 10)
+    return [
+        Result(
+            "serialize_json[40]",
+            "serialization",
+            time_sync(lambda: multipart_messages_to_json(messages), iterations, rounds),
+        ),
+        Result(
+            "deserialize_json[40]",
+            "serialization",
+            time_sync(lambda: json_to_multipart_messages(as_json), iterations, rounds),
+        ),
+        Result(
+            "serialize_delimited[40]",
+            "serialization",
+            time_sync(lambda: multipart_messages_to_delimited_format(messages), iterations, rounds),
+        ),
+        Result(
+            "deserialize_delimited[40]",
+            "serialization",
+            time_sync(
+                lambda: delimited_format_to_multipart_messages("\n".join(delimited)),
+                iterations,
+                rounds,
+            ),
+        ),
+    ]
+
+
+async def bench_app(
+    directory: Path, groups: List[str], iterations: int, rounds: int
+) -> List[Result]:
+    """Benchmarks that run within a started application"""
+    fast = FastAgent(
+        "benchmark", config_path=str(write_config(directory, 1, 10)), ignore_unknown_args=True
+    )
+    fast.agent("echo", model="passthrough", use_history=False)(_noop)
+    fast.agent("writer", model="passthrough", use_history=False)(_noop)
+    fast.agent("reviewer", model="passthrough", use_history=False)(_noop)
+    fast.agent("tools", servers=["bench_0"], model="passthrough", use_history=False)(_noop)
+    fast.chain("chain", sequence=["echo", "writer", "reviewer"])(_noop)
+    fast.parallel("parallel", fan_out=["echo", "writer", "reviewer"])(_noop)
+    fast.orchestrator("orchestrator", agents=["writer", "reviewer"], max_iterations=1)(_noop)
+
+    results: List[Result] = []
+    async with fast.run() as app:
+        if "agent" in groups:
+            results.append(
+                Result(
+                    "agent_turn",
+                    "agent",
+                    await time_async(lambda: app.echo.send("hello"), iterations, rounds),
+                )
+            )
+
+        if "tools" in groups:
+            command = '***CALL_TOOL bench_0-echo_0 {"text": "hello"}'
+            results.append(
+                Result(
+                    "tool_call",
+                    "tools",
+                    await time_async(lambda: app.tools.send(command), iterations, rounds),
+                )
+            )
+
+            aggregator = app.tools
+
+            async def concurrent_calls() -> None:
+                await asyncio.gather(
+                    *(aggregator.call_tool("bench_0-echo_0", {"text": "hello"}) for _ in range(20))
+                )
+
+            batch_ms = await time_async(concurrent_calls, max(1, iterations // 10), rounds)
+            results.append(Result("tool_call_concurrent[20]", "tools", batch_ms / 20))
+
+        if "logging" in groups:
+            logger = get_logger("benchmark")
+            data = {"agent_name": "echo", "turn": 1, "tokens": {"input": 120, "output": 40}}
+            results.append(
+                Result(
+                    "log_event",
+                    "logging",
+                    time_sync(
+                        lambda: logger.info("Benchmark event", data=data), iterations * 10, rounds
+                    ),
+                )
+            )
+
+        if "workflows" in groups:
+            plan = {
+                "steps": [
+                    {
+                        "description": "Draft",
+                        "tasks": [{"description": "Draft", "agent": "writer"}],
+                    },
+                    {
+                        "description": "Review",
+                        "tasks": [{"description": "Review", "agent": "reviewer"}],
+                    },
+                ],
+                "is_complete": True,
+            }
+            await app.orchestrator._llm.generate(
+                [Prompt.user(f"{FIXED_RESPONSE_INDICATOR} {json.dumps(plan)}")]
+            )
+            for name in ("chain", "parallel", "orchestrator"):
+                agent = app[name]
+                results.append(
+                    Result(
+                        f"workflow[{name}]",
+                        "workflows",
+                        await time_async(lambda: agent.send("hello"), iterations, rounds),
+                    )
+                )
+    AsyncEventBus.reset()
+    return results
+
+
+async def run_benchmarks(groups: List[str], iterations: int, rounds: int) -> List[Result]:
+    results: List[Result] = []
+    with tempfile.TemporaryDirectory() as directory:
+        if "startup" in groups:
+            results.extend(await bench_startup(Path(directory), rounds))
+        if set(groups) & {"agent", "tools", "logging", "workflows"}:
+            results.extend(await bench_app(Path(directory), groups, iterations, rounds))
+    if "converters" in groups:
+        results.extend(converter_results(iterations, rounds))
+    if "serialization" in groups:
+        results.extend(serialization_results(iterations, rounds))
+    return results
+
+
+def to_json(results: List[Result], tolerances: bool = False) -> Dict[str, Any]:
+    entries: Dict[str, Any] = {}
+    for result in results:
+        entry = {
+            "group": result.group,
+            "ms": round(result.ms, 6),
+            "ops_per_second": round(result.ops_per_second, 1),
+        }
+        if tolerances:
+            entry["tolerance"] = TOLERANCES.get(result.group, DEFAULT_TOLERANCE)
+        entries[result.name] = entry
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": entries,
+    }
+
+
+def main(
+    only: Optional[List[str]] = typer.Option(
+        None, help=f"Benchmark groups to run: {', '.join(GROUPS)}"
+    ),
+    iterations: int = typer.Option(200, help="Operations per round"),
+    rounds: int = typer.Option(3, help="Rounds per benchmark; the fastest is reported"),
+    output: Optional[Path] = typer.Option(None, help="Write the results to a JSON file"),
+    baseline: Optional[Path] = typer.Option(None, help="Compare with a saved baseline"),
+    save_baseline: Optional[Path] = typer.Option(
+        None, help="Save the results, with regression tolerances, as a baseline"
+    ),
+) -> None:
+    """Run the offline benchmarks and check them for regressions."""
+    groups = only or GROUPS
+    unknown = sorted(set(groups) - set(GROUPS))
+    if unknown:
+        raise typer.BadParameter(f"Unknown benchmark groups: {', '.join(unknown)}")
+
+    results = asyncio.run(run_benchmarks(groups, iterations, rounds))
+    expected = json.loads(baseline.read_text())["results"] if baseline else {}
+
+    table = Table(title="Benchmarks")
+    table.add_column("Benchmark")
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("Ops/s", justify="right")
+    table.add_column("Baseline (ms)", justify="right")
+    table.add_column("Change", justify="right")
+
+    regressed = []
+    for result in results:
+        reference = expected.get(result.name)
+        change = ""
+        if reference:
+            ratio = result.ms / reference["ms"] - 1
+            tolerance = reference.get("tolerance", DEFAULT_TOLERANCE)
+            change = f"{ratio:+.0%}"
+            if ratio > tolerance:
+                regressed.append(result.name)
+                change = f"[red]{change}[/red]"
+        table.add_row(
+            escape(result.name),
+            f"{result.ms:.3f}",
+            f"{result.ops_per_second:,.0f}",
+            f"{reference['ms']:.3f}" if reference else "",
+            change,
+        )
+    console.print(table)
+
+    if output:
+        output.write_text(json.dumps(to_json(results), indent=2))
+    if save_baseline:
+        save_baseline.write_text(json.dumps(to_json(results, tolerances=True), indent=2))
+    if regressed:
+        console.print(f"[red]Regressed: {', '.join(regressed)}[/red]")
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Stdio MCP server for the benchmarks in benchmark.py, with a configurable number of tools.
+
+    python scripts/benchmark_server.py --tools 50
+"""
+
+import argparse
+
+from mcp.server.fastmcp import FastMCP
+
+
+def echo(text: str) -> str:
+    """Return the text unchanged"""
+    return text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark MCP server")
+    parser.add_argument("--tools", type=int, default=10, help="Number of tools to serve")
+    args = parser.parse_args()
+
+    server = FastMCP("benchmark", log_level="ERROR")
+    for index in range(args.tools):
+        server.add_tool(echo, name=f"echo_{index}", description=f"Echo tool {index}")
+    server.run()
+
+
+if __name__ == "__main__":
+    main()
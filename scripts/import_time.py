@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Import time benchmark for the mcp_agent package and the fast-agent CLI.
+
+Each entry point is imported in a fresh interpreter, and the best time over several runs
+is compared with its budget. Entry points must also not import the listed modules, which
+should only be loaded by the code that uses them. Exits with status 1 if any check fails.
+
+    python scripts/import_time.py --runs 5
+    python scripts/import_time.py --profile mcp_agent.core.fastagent
+"""
+
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+PROVIDER_SDKS = ["anthropic", "openai"]
+DEFERRED = [*PROVIDER_SDKS, "prompt_toolkit", "aiohttp", "opentelemetry.sdk"]
+
+
+@dataclass
+class ImportBudget:
+    module: str
+    budget_ms: float
+    """Maximum import time, in milliseconds, in a fresh interpreter"""
+
+    forbidden: List[str] = field(default_factory=list)
+    """Modules that must not be imported as a side effect"""
+
+
+BUDGETS = [
+    # The package itself only defines lazy attributes
+    ImportBudget("mcp_agent", 25, [*DEFERRED, "mcp", "rich", "pydantic_settings"]),
+    # fast-agent --help, setup and bootstrap
+    ImportBudget("mcp_agent.cli.__main__", 300, [*DEFERRED, "mcp", "pydantic_settings"]),
+    # Spawned as an MCP server subprocess
+    ImportBudget("mcp_agent.mcp.prompts.__main__", 1000, DEFERRED),
+    # Applications define agents before any provider is known
+    ImportBudget("mcp_agent.core.fastagent", 1200, DEFERRED),
+]
+
+_MEASURE = """
+import sys, time
+started = time.perf_counter()
+import {module}
+print(time.perf_counter() - started)
+print(" ".join(sys.modules))
+"""
+
+
+def measure(module: str) -> Tuple[float, List[str]]:
+    """Import a module in a fresh interpreter, returning the time in ms and the modules loaded"""
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", _MEASURE.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, modules = result.stdout.strip().splitlines()[-2:]
+    return float(elapsed) * 1000, modules.split()
+
+
+def unexpected_imports(loaded: List[str], forbidden: List[str]) -> List[str]:
+    """Return the forbidden modules (or their submodules) that were loaded"""
+    return sorted(
+        name
+        for name in forbidden
+        if any(module == name or module.startswith(f"{name}.") for module in loaded)
+    )
+
+
+def profile(module: str, limit: int) -> None:
+    """Print the slowest imports for a module, as reported by python -X importtime"""
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, self_us, cumulative_us, name = (
+            part.strip() for part in line.replace("|", ":").split(":")
+        )
+        timings.append((int(cumulative_us), int(self_us), name))
+
+    table = Table(title=f"Slowest imports for {module}")
+    table.add_column("Module")
+    table.add_column("Self (ms)", justify="right")
+    table.add_column("Cumulative (ms)", justify="right")
+    for cumulative_us, self_us, name in sorted(timings, reverse=True)[:limit]:
+        table.add_row(name, f"{self_us / 1000:.1f}", f"{cumulative_us / 1000:.1f}")
+    Console().print(table)
+
+
+def main(
+    runs: int = typer.Option(5, help="Imports per entry point; the fastest is reported"),
+    profile_module: str = typer.Option(
+        None, "--profile", help="Show the slowest imports for a module instead"
+    ),
+    limit: int = typer.Option(25, help="Number of imports to show with --profile"),
+) -> None:
+    """Check import times and deferred imports against their budgets."""
+    if profile_module:
+        profile(profile_module, limit)
+        return
+
+    table = Table(title="Import time")
+    table.add_column("Entry point")
+    table.add_column("Time (ms)", justify="right")
+    table.add_column("Budget (ms)", justify="right")
+    table.add_column("Unexpected imports")
+
+    failed = False
+    for budget in BUDGETS:
+        measurements = [measure(budget.module) for _ in range(runs)]
+        elapsed = min(elapsed for elapsed, _ in measurements)
+        unexpected = unexpected_imports(measurements[0][1], budget.forbidden)
+        over = elapsed > budget.budget_ms
+        failed = failed or over or bool(unexpected)
+        table.add_row(
+            budget.module,
+            f"[red]{elapsed:.0f}[/red]" if over else f"{elapsed:.0f}",
+            f"{budget.budget_ms:.0f}",
+            f"[red]{', '.join(unexpected)}[/red]" if unexpected else "",
+        )
+
+    Console().print(table)
+    if failed:
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    typer.run(main)
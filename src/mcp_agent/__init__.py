@@ -1,43 +1,85 @@
 """fast-agent - (fast-agent-mcp) An MCP native agent application framework"""
 
-# Import important MCP types
-from mcp.types import (
-    CallToolResult,
-    EmbeddedResource,
-    GetPromptResult,
-    ImageContent,
-    Prompt,
-    PromptMessage,
-    ReadResourceResult,
-    Role,
-    TextContent,
-    Tool,
-)
+# Public names are imported on first use (PEP 562), so that importing a submodule -
+# for example the CLI or the prompt server - does not load every provider and UI library.
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-# Core agent components
-from mcp_agent.agents.agent import Agent, AgentConfig
-from mcp_agent.core.agent_app import AgentApp
+if TYPE_CHECKING:
+    # Import important MCP types
+    from mcp.types import (
+        CallToolResult,
+        EmbeddedResource,
+        GetPromptResult,
+        ImageContent,
+        Prompt,
+        PromptMessage,
+        ReadResourceResult,
+        Role,
+        TextContent,
+        Tool,
+    )
 
-# Workflow decorators
-from mcp_agent.core.direct_decorators import (
-    agent,
-    chain,
-    evaluator_optimizer,
-    orchestrator,
-    parallel,
-    router,
-)
+    # Core agent components
+    from mcp_agent.agents.agent import Agent, AgentConfig
+    from mcp_agent.core.agent_app import AgentApp
+
+    # Workflow decorators
+    from mcp_agent.core.direct_decorators import (
+        agent,
+        chain,
+        evaluator_optimizer,
+        orchestrator,
+        parallel,
+        router,
+    )
+
+    # FastAgent components
+    from mcp_agent.core.fastagent import FastAgent
 
-# FastAgent components
-from mcp_agent.core.fastagent import FastAgent
+    # Request configuration
+    from mcp_agent.core.request_params import RequestParams
 
-# Request configuration
-from mcp_agent.core.request_params import RequestParams
+    # Core protocol interfaces
+    from mcp_agent.mcp.interfaces import AgentProtocol, AugmentedLLMProtocol
+    from mcp_agent.mcp.mcp_aggregator import MCPAggregator, MCPCompoundServer
+    from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
-# Core protocol interfaces
-from mcp_agent.mcp.interfaces import AgentProtocol, AugmentedLLMProtocol
-from mcp_agent.mcp.mcp_aggregator import MCPAggregator, MCPCompoundServer
-from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+# Maps each public name to the module that defines it
+_LAZY_IMPORTS: Dict[str, str] = {
+    # MCP types
+    "Prompt": "mcp.types",
+    "Tool": "mcp.types",
+    "CallToolResult": "mcp.types",
+    "TextContent": "mcp.types",
+    "ImageContent": "mcp.types",
+    "PromptMessage": "mcp.types",
+    "GetPromptResult": "mcp.types",
+    "ReadResourceResult": "mcp.types",
+    "EmbeddedResource": "mcp.types",
+    "Role": "mcp.types",
+    # Core protocols
+    "AgentProtocol": "mcp_agent.mcp.interfaces",
+    "AugmentedLLMProtocol": "mcp_agent.mcp.interfaces",
+    # Core agent components
+    "Agent": "mcp_agent.agents.agent",
+    "AgentConfig": "mcp_agent.agents.agent",
+    "MCPAggregator": "mcp_agent.mcp.mcp_aggregator",
+    "MCPCompoundServer": "mcp_agent.mcp.mcp_aggregator",
+    "PromptMessageMultipart": "mcp_agent.mcp.prompt_message_multipart",
+    # FastAgent components
+    "FastAgent": "mcp_agent.core.fastagent",
+    "AgentApp": "mcp_agent.core.agent_app",
+    # Workflow decorators
+    "agent": "mcp_agent.core.direct_decorators",
+    "orchestrator": "mcp_agent.core.direct_decorators",
+    "router": "mcp_agent.core.direct_decorators",
+    "chain": "mcp_agent.core.direct_decorators",
+    "parallel": "mcp_agent.core.direct_decorators",
+    "evaluator_optimizer": "mcp_agent.core.direct_decorators",
+    # Request configuration
+    "RequestParams": "mcp_agent.core.request_params",
+}
 
 __all__ = [
     # MCP types
@@ -73,3 +115,17 @@ __all__ = [
     # Request configuration
     "RequestParams",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
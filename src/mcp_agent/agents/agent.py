@@ -9,7 +9,6 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar
 
 from mcp_agent.agents.base_agent import BaseAgent
 from mcp_agent.core.agent_types import AgentConfig
-from mcp_agent.core.interactive_prompt import InteractivePrompt
 from mcp_agent.human_input.types import HumanInputCallback
 from mcp_agent.logging.logger import get_logger
 from mcp_agent.mcp.interfaces import AugmentedLLMProtocol
@@ -68,7 +67,9 @@ class Agent(BaseAgent):
         # Create agent_types dictionary with just this agent
         agent_types = {agent_name_str: self.agent_type}
 
-        # Create the interactive prompt
+        # Create the interactive prompt (prompt_toolkit is only imported when needed)
+        from mcp_agent.core.interactive_prompt import InteractivePrompt
+
         prompt = InteractivePrompt(agent_types=agent_types)
 
         # Define wrapper for send function
@@ -7,6 +7,7 @@ and delegates operations to an attached AugmentedLLMProtocol instance.
 
 import asyncio
 import uuid
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -622,6 +623,34 @@ class BaseAgent(MCPAggregator, AgentProtocol):
         response = await self.generate(prompts, request_params)
         return response.first_text()
 
+    async def apply_prompt_file(
+        self, file: str | Path, request_params: RequestParams | None = None
+    ) -> str:
+        """
+        Apply the messages saved in a prompt or history file (.json, or the delimited
+        text format) and return the result.
+
+        Playback LLMs consume the file as it is played back, so long recordings are never
+        fully loaded. Other LLMs are sent the whole conversation, as for
+        apply_prompt_messages.
+
+        Args:
+            file: Path to the prompt or history file
+            request_params: Optional request parameters
+
+        Returns:
+            The text response from the LLM
+        """
+        from mcp_agent.mcp.prompts.prompt_load import iter_prompt_multipart
+
+        assert self._llm
+        messages = iter_prompt_multipart(Path(file))
+        load_messages = getattr(self._llm, "load_messages", None)
+        if load_messages is not None:
+            load_messages(messages)
+            return "HISTORY LOADED"
+        return await self.apply_prompt_messages(list(messages), request_params)
+
     @property
     def agent_type(self) -> str:
         """
@@ -14,6 +14,10 @@ from mcp_agent.agents.base_agent import BaseAgent
 from mcp_agent.core.agent_types import AgentConfig, AgentType
 from mcp_agent.core.prompt import Prompt
 from mcp_agent.core.request_params import RequestParams
+from mcp_agent.executor.checkpoint import WorkflowCheckpoint, open_checkpoint
+from mcp_agent.llm.usage_ledger import tracks_usage
+from mcp_agent.logging.profiler import profiles_workflow_step
+from mcp_agent.logging.tracing import traces_workflow_step
 from mcp_agent.mcp.interfaces import ModelT
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
@@ -51,6 +55,9 @@ class ChainAgent(BaseAgent):
         self.agents = agents
         self.cumulative = cumulative
 
+    @traces_workflow_step
+    @profiles_workflow_step
+    @tracks_usage
     async def generate(
         self,
         multipart_messages: List[PromptMessageMultipart],
@@ -66,7 +73,18 @@ class ChainAgent(BaseAgent):
         Returns:
             The response from the final agent in the chain
         """
+        # Resume from the checkpoint of a failed run, skipping agents that completed
+        checkpoint = open_checkpoint(self, multipart_messages)
+        async with checkpoint.running():
+            return await self._run_chain(multipart_messages, request_params, checkpoint)
 
+    async def _run_chain(
+        self,
+        multipart_messages: List[PromptMessageMultipart],
+        request_params: Optional[RequestParams],
+        checkpoint: WorkflowCheckpoint,
+    ) -> PromptMessageMultipart:
+        """Run the request through the agents, recording each response in the checkpoint"""
         # # Get the original user message (last message in the list)
         user_message = multipart_messages[-1] if multipart_messages else None
 
@@ -80,11 +98,23 @@ class ChainAgent(BaseAgent):
         # Initialize messages with the input
 
         if not self.cumulative:
-            response: PromptMessageMultipart = await self.agents[0].generate(multipart_messages)
+            response: PromptMessageMultipart = await checkpoint.step(
+                "agent/0",
+                lambda: self.agents[0].generate(multipart_messages),
+                PromptMessageMultipart,
+                self.agents[0],
+                multipart_messages,
+            )
             # Process the rest of the agents in the chain
-            for agent in self.agents[1:]:
+            for i, agent in enumerate(self.agents[1:], start=1):
                 next_message = Prompt.user(response.content[0].text)
-                response = await agent.generate([next_message])
+                response = await checkpoint.step(
+                    f"agent/{i}",
+                    lambda agent=agent, message=next_message: agent.generate([message]),
+                    PromptMessageMultipart,
+                    agent,
+                    [next_message],
+                )
 
             return response
 
@@ -103,7 +133,15 @@ class ChainAgent(BaseAgent):
             # In cumulative mode, include the original message and all previous responses
             chain_messages = multipart_messages.copy()
             chain_messages.extend(all_responses)
-            current_response = await agent.generate(chain_messages, request_params)
+            current_response = await checkpoint.step(
+                f"agent/{i}",
+                lambda agent=agent, messages=chain_messages: agent.generate(
+                    messages, request_params
+                ),
+                PromptMessageMultipart,
+                agent,
+                chain_messages,
+            )
 
             # Store the response
             all_responses.append(current_response)
@@ -124,6 +162,9 @@ class ChainAgent(BaseAgent):
             content=[TextContent(type="text", text=response_text)],
         )
 
+    @traces_workflow_step
+    @profiles_workflow_step
+    @tracks_usage
     async def structured(
         self,
         prompt: List[PromptMessageMultipart],
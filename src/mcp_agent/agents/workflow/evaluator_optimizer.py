@@ -18,7 +18,11 @@ from mcp_agent.core.agent_types import AgentType
 from mcp_agent.core.exceptions import AgentConfigError
 from mcp_agent.core.prompt import Prompt
 from mcp_agent.core.request_params import RequestParams
+from mcp_agent.executor.checkpoint import WorkflowCheckpoint, open_checkpoint
+from mcp_agent.llm.usage_ledger import tracks_usage
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.profiler import profiles_workflow_step
+from mcp_agent.logging.tracing import traces_workflow_step
 from mcp_agent.mcp.interfaces import ModelT
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
@@ -106,6 +110,9 @@ class EvaluatorOptimizerAgent(BaseAgent):
         self.max_refinements = max_refinements
         self.refinement_history = []
 
+    @traces_workflow_step
+    @profiles_workflow_step
+    @tracks_usage
     async def generate(
         self,
         multipart_messages: List[PromptMessageMultipart],
@@ -121,6 +128,18 @@ class EvaluatorOptimizerAgent(BaseAgent):
         Returns:
             The optimized response after evaluation and refinement
         """
+        # Resume from the checkpoint of a failed run, skipping completed iterations
+        checkpoint = open_checkpoint(self, multipart_messages)
+        async with checkpoint.running():
+            return await self._refine(multipart_messages, request_params, checkpoint)
+
+    async def _refine(
+        self,
+        multipart_messages: List[PromptMessageMultipart],
+        request_params: Optional[RequestParams],
+        checkpoint: WorkflowCheckpoint,
+    ) -> PromptMessageMultipart:
+        """Run the generate-evaluate loop, recording each response and evaluation"""
         # Initialize tracking variables
         refinement_count = 0
         best_response = None
@@ -131,7 +150,13 @@ class EvaluatorOptimizerAgent(BaseAgent):
         request = multipart_messages[-1].all_text() if multipart_messages else ""
 
         # Initial generation
-        response = await self.generator_agent.generate(multipart_messages, request_params)
+        response = await checkpoint.step(
+            "generate/0",
+            lambda: self.generator_agent.generate(multipart_messages, request_params),
+            PromptMessageMultipart,
+            self.generator_agent,
+            multipart_messages,
+        )
         best_response = response
 
         # Refinement loop
@@ -145,8 +170,15 @@ class EvaluatorOptimizerAgent(BaseAgent):
 
             # Create evaluation message and get structured evaluation result
             eval_message = Prompt.user(eval_prompt)
-            evaluation_result, _ = await self.evaluator_agent.structured(
-                [eval_message], EvaluationResult, request_params
+
+            async def evaluate() -> EvaluationResult | None:
+                result, _ = await self.evaluator_agent.structured(
+                    [eval_message], EvaluationResult, request_params
+                )
+                return result
+
+            evaluation_result = await checkpoint.step(
+                f"evaluate/{refinement_count}", evaluate, EvaluationResult, self.evaluator_agent
             )
 
             # If structured parsing failed, use default evaluation
@@ -195,14 +227,24 @@ class EvaluatorOptimizerAgent(BaseAgent):
                 iteration=refinement_count,
             )
 
-            # Create refinement message and get refined response
+            # Create refinement message and get refined response. The refinement builds on
+            # the generator's conversation, which replayed steps are added to.
             refinement_message = Prompt.user(refinement_prompt)
-            response = await self.generator_agent.generate([refinement_message], request_params)
+            response = await checkpoint.step(
+                f"generate/{refinement_count + 1}",
+                lambda: self.generator_agent.generate([refinement_message], request_params),
+                PromptMessageMultipart,
+                self.generator_agent,
+                [refinement_message],
+            )
 
             refinement_count += 1
 
         return best_response
 
+    @traces_workflow_step
+    @profiles_workflow_step
+    @tracks_usage
     async def structured(
         self,
         prompt: List[PromptMessageMultipart],
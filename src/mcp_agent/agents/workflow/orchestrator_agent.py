@@ -31,7 +31,11 @@ from mcp_agent.core.agent_types import AgentConfig, AgentType
 from mcp_agent.core.exceptions import AgentConfigError
 from mcp_agent.core.prompt import Prompt
 from mcp_agent.core.request_params import RequestParams
+from mcp_agent.executor.checkpoint import WorkflowCheckpoint, open_checkpoint
+from mcp_agent.llm.usage_ledger import tracks_usage
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.profiler import profiles_workflow_step
+from mcp_agent.logging.tracing import tracer, traces_workflow_step
 from mcp_agent.mcp.interfaces import ModelT
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
@@ -87,6 +91,9 @@ class OrchestratorAgent(BaseAgent):
         # For tracking state during execution
         self.plan_result: Optional[PlanResult] = None
 
+    @traces_workflow_step
+    @profiles_workflow_step
+    @tracks_usage
     async def generate(
         self,
         multipart_messages: List[PromptMessageMultipart],
@@ -108,8 +115,10 @@ class OrchestratorAgent(BaseAgent):
         # Initialize execution parameters
         params = self._merge_request_params(request_params)
 
-        # Execute the plan
-        plan_result = await self._execute_plan(objective, params)
+        # Execute the plan, resuming from its checkpoint if a previous run failed
+        checkpoint = open_checkpoint(self, multipart_messages)
+        async with checkpoint.running():
+            plan_result = await self._execute_plan(objective, params, checkpoint)
         self.plan_result = plan_result
 
         # Return the result
@@ -118,6 +127,9 @@ class OrchestratorAgent(BaseAgent):
             content=[TextContent(type="text", text=plan_result.result or "No result available")],
         )
 
+    @traces_workflow_step
+    @profiles_workflow_step
+    @tracks_usage
     async def structured(
         self,
         prompt: List[PromptMessageMultipart],
@@ -173,17 +185,24 @@ class OrchestratorAgent(BaseAgent):
             except Exception as e:
                 self.logger.warning(f"Error shutting down agent {agent_name}: {str(e)}")
 
-    async def _execute_plan(self, objective: str, request_params: RequestParams) -> PlanResult:
+    async def _execute_plan(
+        self,
+        objective: str,
+        request_params: RequestParams,
+        checkpoint: Optional[WorkflowCheckpoint] = None,
+    ) -> PlanResult:
         """
         Execute a plan to achieve the given objective.
 
         Args:
             objective: The objective to achieve
             request_params: Request parameters for execution
+            checkpoint: Records completed plans, tasks and the synthesis
 
         Returns:
             PlanResult containing execution results and final output
         """
+        checkpoint = checkpoint or WorkflowCheckpoint()
         iterations = 0
         total_steps_executed = 0
         max_iterations = request_params.max_iterations
@@ -196,7 +215,11 @@ class OrchestratorAgent(BaseAgent):
         while iterations < max_iterations:
             # Generate plan based on planning mode
             if self.plan_type == "iterative":
-                next_step = await self._get_next_step(objective, plan_result, request_params)
+                next_step = await checkpoint.step(
+                    f"plan/{iterations}",
+                    lambda: self._get_next_step(objective, plan_result, request_params, checkpoint),
+                    NextStep,
+                )
                 if next_step is None:
                     self.logger.error("Failed to generate next step, ending iteration early")
                     plan_result.max_iterations_reached = True
@@ -205,7 +228,11 @@ class OrchestratorAgent(BaseAgent):
                 logger.debug(f"Iteration {iterations}: Iterative plan:", data=next_step)
                 plan = Plan(steps=[next_step], is_complete=next_step.is_complete)
             elif self.plan_type == "full":
-                plan = await self._get_full_plan(objective, plan_result, request_params)
+                plan = await checkpoint.step(
+                    f"plan/{iterations}",
+                    lambda: self._get_full_plan(objective, plan_result, request_params, checkpoint),
+                    Plan,
+                )
                 if plan is None:
                     self.logger.error("Failed to generate full plan, ending iteration early")
                     plan_result.max_iterations_reached = True
@@ -232,7 +259,17 @@ class OrchestratorAgent(BaseAgent):
                     break
 
                 # Execute the step and collect results
-                step_result = await self._execute_step(step, plan_result, request_params)
+                with tracer.start_as_current_span(
+                    f"step {self.name}",
+                    attributes={
+                        "agent.name": self.name,
+                        "mcp_agent.step": total_steps_executed + 1,
+                        "mcp_agent.step.description": step.description,
+                    },
+                ):
+                    step_result = await self._execute_step(
+                        step, plan_result, request_params, checkpoint, total_steps_executed
+                    )
 
                 plan_result.add_step_result(step_result)
                 total_steps_executed += 1
@@ -269,14 +306,23 @@ class OrchestratorAgent(BaseAgent):
             )
 
         # Generate final synthesis
-        plan_result.result = await self._planner_generate_str(
-            synthesis_prompt, request_params.model_copy(update={"max_iterations": 1})
+        plan_result.result = await checkpoint.step(
+            "synthesis",
+            lambda: self._planner_generate_str(
+                synthesis_prompt, request_params.model_copy(update={"max_iterations": 1})
+            ),
+            str,
         )
 
         return plan_result
 
     async def _execute_step(
-        self, step: Step, previous_result: PlanResult, request_params: RequestParams
+        self,
+        step: Step,
+        previous_result: PlanResult,
+        request_params: RequestParams,
+        checkpoint: Optional[WorkflowCheckpoint] = None,
+        step_index: int = 0,
     ) -> Any:
         """
         Execute a single step from the plan.
@@ -285,10 +331,14 @@ class OrchestratorAgent(BaseAgent):
             step: The step to execute
             previous_result: Results of the plan execution so far
             request_params: Request parameters
+            checkpoint: Records completed tasks. When checkpoints are enabled, a task
+                        that fails every attempt fails the run.
+            step_index: Position of the step in the run
 
         Returns:
             Result of executing the step
         """
+        checkpoint = checkpoint or WorkflowCheckpoint()
         from mcp_agent.agents.workflow.orchestrator_models import StepResult
 
         # Initialize step result
@@ -301,7 +351,7 @@ class OrchestratorAgent(BaseAgent):
         futures = []
         error_tasks = []
 
-        for task in step.tasks:
+        for index, task in enumerate(step.tasks):
             # Check agent exists
             agent = self.agents.get(task.agent)
             if not agent:
@@ -322,26 +372,29 @@ class OrchestratorAgent(BaseAgent):
             )
 
             # Queue task for execution
+            task_messages = [
+                PromptMessageMultipart(
+                    role="user", content=[TextContent(type="text", text=task_description)]
+                )
+            ]
             futures.append(
                 (
+                    f"step/{step_index}/task/{index}",
                     task,
-                    agent.generate(
-                        [
-                            PromptMessageMultipart(
-                                role="user",
-                                content=[TextContent(type="text", text=task_description)],
-                            )
-                        ]
-                    ),
+                    agent,
+                    task_messages,
+                    lambda agent=agent, messages=task_messages: agent.generate(messages),
                 )
             )
 
         # Wait for all tasks
         task_results = []
         for future in futures:
-            task, future_obj = future
+            key, task, agent, task_messages, run_task = future
             try:
-                result = await future_obj
+                result = await checkpoint.step(
+                    key, run_task, PromptMessageMultipart, agent, task_messages
+                )
                 result_text = result.all_text()
 
                 # Create task result
@@ -354,6 +407,8 @@ class OrchestratorAgent(BaseAgent):
                 task_results.append(task_result)
             except Exception as e:
                 self.logger.error(f"Error executing task: {str(e)}")
+                if checkpoint.enabled:
+                    raise
                 # Add error result
                 task_model = task.model_dump()
                 task_results.append(
@@ -384,7 +439,11 @@ class OrchestratorAgent(BaseAgent):
         return step_result
 
     async def _get_full_plan(
-        self, objective: str, plan_result: PlanResult, request_params: RequestParams
+        self,
+        objective: str,
+        plan_result: PlanResult,
+        request_params: RequestParams,
+        checkpoint: Optional[WorkflowCheckpoint] = None,
     ) -> Optional[Plan]:
         """
         Generate a full plan with all steps.
@@ -393,6 +452,7 @@ class OrchestratorAgent(BaseAgent):
             objective: The objective to achieve
             plan_result: Current plan execution state
             request_params: Request parameters
+            checkpoint: When checkpoints are enabled, planning errors fail the run
 
         Returns:
             Complete Plan with all steps, or None if parsing fails
@@ -438,10 +498,16 @@ class OrchestratorAgent(BaseAgent):
             return plan
         except Exception as e:
             self.logger.error(f"Failed to parse plan: {str(e)}")
+            if checkpoint is not None and checkpoint.enabled:
+                raise
             return None
 
     async def _get_next_step(
-        self, objective: str, plan_result: PlanResult, request_params: RequestParams
+        self,
+        objective: str,
+        plan_result: PlanResult,
+        request_params: RequestParams,
+        checkpoint: Optional[WorkflowCheckpoint] = None,
     ) -> Optional[NextStep]:
         """
         Generate just the next step for iterative planning.
@@ -450,6 +516,7 @@ class OrchestratorAgent(BaseAgent):
             objective: The objective to achieve
             plan_result: Current plan execution state
             request_params: Request parameters
+            checkpoint: When checkpoints are enabled, planning errors fail the run
 
         Returns:
             Next step to execute, or None if parsing fails
@@ -493,6 +560,8 @@ class OrchestratorAgent(BaseAgent):
             return next_step
         except Exception as e:
             self.logger.error(f"Failed to parse next step: {str(e)}")
+            if checkpoint is not None and checkpoint.enabled:
+                raise
             return None
 
     def _validate_agent_names(self, plan: Plan) -> None:
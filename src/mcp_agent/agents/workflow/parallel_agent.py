@@ -7,6 +7,11 @@ from mcp_agent.agents.agent import Agent
 from mcp_agent.agents.base_agent import BaseAgent
 from mcp_agent.core.agent_types import AgentConfig, AgentType
 from mcp_agent.core.request_params import RequestParams
+from mcp_agent.executor.process import ProcessExecutor
+from mcp_agent.llm.conversation_scope import current_conversation_scope
+from mcp_agent.llm.usage_ledger import tracks_usage
+from mcp_agent.logging.profiler import profiles_workflow_step
+from mcp_agent.logging.tracing import traces_workflow_step
 from mcp_agent.mcp.interfaces import ModelT
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
@@ -47,6 +52,9 @@ class ParallelAgent(BaseAgent):
         self.fan_out_agents = fan_out_agents
         self.include_request = include_request
 
+    @traces_workflow_step
+    @profiles_workflow_step
+    @tracks_usage
     async def generate(
         self,
         multipart_messages: List[PromptMessageMultipart],
@@ -64,7 +72,10 @@ class ParallelAgent(BaseAgent):
         """
         # Execute all fan-out agents in parallel
         responses: List[PromptMessageMultipart] = await asyncio.gather(
-            *[agent.generate(multipart_messages, request_params) for agent in self.fan_out_agents]
+            *[
+                self._fan_out(agent, multipart_messages, request_params)
+                for agent in self.fan_out_agents
+            ]
         )
 
         # Extract the received message from the input
@@ -88,6 +99,25 @@ class ParallelAgent(BaseAgent):
         # Use the fan-in agent to aggregate the responses
         return await self.fan_in_agent.generate([formatted_prompt], request_params)
 
+    async def _fan_out(
+        self,
+        agent: Agent,
+        multipart_messages: List[PromptMessageMultipart],
+        request_params: Optional[RequestParams],
+    ) -> PromptMessageMultipart:
+        """Run a fan-out agent, in a worker process when using the process executor"""
+        if not isinstance(self.executor, ProcessExecutor):
+            return await agent.generate(multipart_messages, request_params)
+
+        # The branch keeps its conversation on one worker, separately for each caller
+        scope = current_conversation_scope()
+        session = "/".join(
+            name for name in (scope.name if scope else None, self.name, agent.name) if name
+        )
+        return await self.executor.run_agent(
+            agent.name, multipart_messages, request_params, session=session
+        )
+
     def _format_responses(self, responses: List[Any], message: Optional[str] = None) -> str:
         """
         Format a list of responses for the fan-in agent.
@@ -114,6 +144,9 @@ class ParallelAgent(BaseAgent):
             )
         return "\n\n".join(formatted)
 
+    @traces_workflow_step
+    @profiles_workflow_step
+    @tracks_usage
     async def structured(
         self,
         prompt: List[PromptMessageMultipart],
@@ -135,7 +168,7 @@ class ParallelAgent(BaseAgent):
         """
         # Generate parallel responses first
         responses: List[PromptMessageMultipart] = await asyncio.gather(
-            *[agent.generate(prompt, request_params) for agent in self.fan_out_agents]
+            *[self._fan_out(agent, prompt, request_params) for agent in self.fan_out_agents]
         )
 
         # Extract the received message
@@ -16,7 +16,10 @@ from mcp_agent.core.agent_types import AgentConfig, AgentType
 from mcp_agent.core.exceptions import AgentConfigError
 from mcp_agent.core.prompt import Prompt
 from mcp_agent.core.request_params import RequestParams
+from mcp_agent.llm.usage_ledger import tracks_usage
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.profiler import profiles_workflow_step
+from mcp_agent.logging.tracing import traces_workflow_step
 from mcp_agent.mcp.interfaces import ModelT
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
@@ -201,6 +204,9 @@ class RouterAgent(BaseAgent):
 
         return routing_result
 
+    @traces_workflow_step
+    @profiles_workflow_step
+    @tracks_usage
     async def generate(
         self,
         multipart_messages: List[PromptMessageMultipart],
@@ -239,6 +245,9 @@ class RouterAgent(BaseAgent):
         # Dispatch the request to the selected agent
         return await selected_agent.generate(multipart_messages, request_params)
 
+    @traces_workflow_step
+    @profiles_workflow_step
+    @tracks_usage
     async def structured(
         self,
         prompt: List[PromptMessageMultipart],
@@ -151,6 +151,18 @@ class MCPApp:
                 "agent_name": self.name or "fastagent loop",
             },
         )
+        # Remove any resources spilled to disk
+        if self._context.resource_cache is not None:
+            self._context.resource_cache.clear()
+        if self._context.session_store is not None:
+            self._context.session_store.close()
+        if self._context.checkpoint_store is not None:
+            self._context.checkpoint_store.close()
+        if self._context.response_cache is not None:
+            self._context.response_cache.close()
+        if self._context.executor is not None:
+            await self._context.executor.shutdown()
+
         try:
             await cleanup_context()
         except asyncio.CancelledError:
@@ -0,0 +1,451 @@
+"""
+Load testing for agent applications.
+
+    fast-agent bench agent.py --agent assistant --corpus messages.jsonl -n 8 --duration 60
+    fast-agent bench --url http://localhost:8000/sse --agent assistant --requests 500
+
+Each concurrent session holds its own conversation with the agent, sending the messages
+of the corpus in turn until the request count or duration is reached. Agent files are
+run in this process, so tool latency and token usage are taken from the usage ledger;
+a running server (fast-agent --server --transport sse) is driven through its
+<agent>_send tool, and only turn latency and errors are measured.
+"""
+
+import asyncio
+import itertools
+import json
+import runpy
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from mcp_agent.core.fastagent import FastAgent
+
+console = Console()
+
+Send = Callable[[str], Awaitable[Any]]
+OpenSession = Callable[[], AsyncContextManager[Send]]
+
+DEFAULT_REQUESTS = 100
+
+
+class RemoteTurnError(Exception):
+    """The agent server returned an error result for a turn"""
+
+
+@dataclass
+class TurnResult:
+    latency: float
+    """Wall time of the turn, in seconds"""
+
+    error: str | None = None
+    """Exception type name, if the turn failed"""
+
+
+@dataclass
+class LatencySummary:
+    """Latency distribution, in milliseconds"""
+
+    count: int = 0
+    mean: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
+
+    @classmethod
+    def of(cls, seconds: Sequence[float]) -> "LatencySummary":
+        if not seconds:
+            return cls()
+        values = sorted(value * 1000 for value in seconds)
+        return cls(
+            count=len(values),
+            mean=sum(values) / len(values),
+            p50=percentile(values, 50),
+            p95=percentile(values, 95),
+            p99=percentile(values, 99),
+            max=values[-1],
+        )
+
+
+@dataclass
+class UsageTotals:
+    llm_calls: int = 0
+    tool_calls: int = 0
+    tool_errors: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+    tool_latency: LatencySummary = field(default_factory=LatencySummary)
+
+
+@dataclass
+class BenchReport:
+    target: str
+    agent: str
+    concurrency: int
+    elapsed: float
+    """Wall time of the run, in seconds"""
+
+    turns: int
+    errors: Dict[str, int]
+    """Failed turns by exception type"""
+
+    turn_latency: LatencySummary
+    usage: UsageTotals | None = None
+    """Tool and LLM usage, when the agents ran in this process"""
+
+    @property
+    def failed(self) -> int:
+        return sum(self.errors.values())
+
+    @property
+    def throughput(self) -> float:
+        """Completed turns per second"""
+        return self.turns / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.failed / self.turns if self.turns else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            "failed": self.failed,
+            "throughput": self.throughput,
+            "error_rate": self.error_rate,
+        }
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """The q-th percentile of sorted values, interpolating between the closest ranks"""
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def load_corpus(path: Path) -> List[str]:
+    """
+    Read messages from a JSONL file. Each line is either a JSON string or an object with
+    a "message" field; blank lines are ignored.
+    """
+    messages = []
+    with open(path, encoding="utf-8") as corpus_file:
+        for number, line in enumerate(corpus_file, start=1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if isinstance(entry, dict):
+                entry = entry.get("message")
+            if not isinstance(entry, str):
+                raise ValueError(f"{path}:{number}: expected a string or an object with 'message'")
+            messages.append(entry)
+    if not messages:
+        raise ValueError(f"{path} contains no messages")
+    return messages
+
+
+async def drive(
+    open_session: OpenSession,
+    messages: Sequence[str],
+    concurrency: int,
+    requests: int | None = None,
+    duration: float | None = None,
+    session_turns: int = 0,
+    timeout: float | None = None,
+) -> Tuple[List[TurnResult], float]:
+    """
+    Run concurrent sessions until `requests` turns have started or `duration` seconds have
+    passed. Turns in progress at the deadline are completed. Returns the result of every
+    turn and the elapsed time.
+    """
+    results: List[TurnResult] = []
+    started_turns = 0
+    started = time.perf_counter()
+    deadline = started + duration if duration is not None else None
+
+    def turns_remaining() -> bool:
+        if requests is not None and started_turns >= requests:
+            return False
+        return deadline is None or time.perf_counter() < deadline
+
+    def claim_turn() -> bool:
+        nonlocal started_turns
+        if not turns_remaining():
+            return False
+        started_turns += 1
+        return True
+
+    async def run_session(index: int) -> None:
+        # Sessions start at different points in the corpus
+        position = index
+        while turns_remaining():
+            async with open_session() as send:
+                turns = range(session_turns) if session_turns else itertools.count()
+                for _ in turns:
+                    if not claim_turn():
+                        return
+                    message = messages[position % len(messages)]
+                    position += 1
+                    turn_started = time.perf_counter()
+                    error = None
+                    try:
+                        await asyncio.wait_for(send(message), timeout)
+                    except Exception as e:
+                        error = type(e).__name__
+                    results.append(TurnResult(time.perf_counter() - turn_started, error))
+
+    await asyncio.gather(*(run_session(index) for index in range(concurrency)))
+    return results, time.perf_counter() - started
+
+
+def summarize(
+    target: str,
+    agent: str,
+    concurrency: int,
+    results: Sequence[TurnResult],
+    elapsed: float,
+    usage: UsageTotals | None = None,
+) -> BenchReport:
+    errors: Dict[str, int] = {}
+    for result in results:
+        if result.error:
+            errors[result.error] = errors.get(result.error, 0) + 1
+    return BenchReport(
+        target=target,
+        agent=agent,
+        concurrency=concurrency,
+        elapsed=elapsed,
+        turns=len(results),
+        errors=errors,
+        turn_latency=LatencySummary.of([r.latency for r in results if r.error is None]),
+        usage=usage,
+    )
+
+
+def load_fast_agent(path: Path, model: str | None = None) -> "FastAgent":
+    """Run an agent definition file without its __main__ block, returning its FastAgent"""
+    from mcp_agent.core.fastagent import FastAgent
+
+    # FastAgent parses the command line when it is created
+    saved_argv = sys.argv
+    sys.argv = [str(path), "--quiet", *(["--model", model] if model else [])]
+    sys.path.insert(0, str(path.resolve().parent))
+    try:
+        namespace = runpy.run_path(str(path), run_name="__fast_agent_bench__")
+    finally:
+        sys.argv = saved_argv
+
+    for value in namespace.values():
+        if isinstance(value, FastAgent):
+            return value
+    raise ValueError(f"No FastAgent application found in {path}")
+
+
+async def bench_agent_file(
+    path: Path, agent_name: str | None, model: str | None, **options
+) -> BenchReport:
+    """Benchmark an agent from a definition file, running it in this process"""
+    from mcp_agent.llm.conversation_scope import ConversationScope, conversation_scope
+
+    fast = load_fast_agent(path, model)
+    async with fast.run() as agent_app:
+        agent = agent_app._agent(agent_name)
+
+        @asynccontextmanager
+        async def open_session() -> AsyncIterator[Send]:
+            with conversation_scope(ConversationScope(agent.name)):
+                yield agent.send
+
+        ledger = agent_app.usage_ledger
+        if ledger is not None:
+            ledger.clear()
+        results, elapsed = await drive(open_session, **options)
+
+        usage = None
+        if ledger is not None:
+            summary = ledger.summary()
+            tool_records = [record for record in ledger.records if record.kind == "tool"]
+            usage = UsageTotals(
+                llm_calls=summary.llm_calls,
+                tool_calls=summary.tool_calls,
+                tool_errors=sum(record.error for record in tool_records),
+                input_tokens=summary.input_tokens,
+                output_tokens=summary.output_tokens,
+                cost=summary.cost,
+                tool_latency=LatencySummary.of([record.latency for record in tool_records]),
+            )
+
+    return summarize(str(path), agent.name, options["concurrency"], results, elapsed, usage)
+
+
+async def bench_server(url: str, agent_name: str | None, **options) -> BenchReport:
+    """Benchmark an agent served by a running fast-agent MCP server over SSE"""
+    from mcp import ClientSession
+    from mcp.client.sse import sse_client
+
+    from mcp_agent.mcp.helpers.content_helpers import get_text
+
+    @asynccontextmanager
+    async def connect() -> AsyncIterator[ClientSession]:
+        async with sse_client(url) as (read, write), ClientSession(read, write) as session:
+            await session.initialize()
+            yield session
+
+    if agent_name is None:
+        async with connect() as session:
+            tools = (await session.list_tools()).tools
+        send_tools = [tool.name for tool in tools if tool.name.endswith("_send")]
+        if not send_tools:
+            raise ValueError(f"No agents found at {url}")
+        agent_name = send_tools[0].removesuffix("_send")
+
+    @asynccontextmanager
+    async def open_session() -> AsyncIterator[Send]:
+        async with connect() as session:
+
+            async def send(message: str) -> str:
+                result = await session.call_tool(f"{agent_name}_send", {"message": message})
+                text = "".join(get_text(content) or "" for content in result.content)
+                if result.isError:
+                    raise RemoteTurnError(text)
+                return text
+
+            yield send
+
+    results, elapsed = await drive(open_session, **options)
+    return summarize(url, agent_name, options["concurrency"], results, elapsed)
+
+
+def _ms(value: float) -> str:
+    return f"{value:,.1f} ms"
+
+
+def _latency_row(latency: LatencySummary) -> str:
+    return " / ".join(_ms(value) for value in (latency.p50, latency.p95, latency.p99))
+
+
+def show_report(report: BenchReport) -> None:
+    table = Table(title=f"\nBenchmark: {report.agent} ({report.target})")
+    table.add_column("Metric", style="green")
+    table.add_column("Value", justify="right")
+
+    table.add_row("Sessions", str(report.concurrency))
+    table.add_row("Duration", f"{report.elapsed:,.2f} s")
+    table.add_row("Turns", str(report.turns))
+    table.add_row("Throughput", f"{report.throughput:,.2f} turns/s")
+    table.add_row("Errors", f"{report.failed} ({report.error_rate:.1%})")
+    for error, count in sorted(report.errors.items()):
+        table.add_row(f"  {error}", str(count))
+    table.add_row("Turn latency p50 / p95 / p99", _latency_row(report.turn_latency))
+    table.add_row(
+        "Turn latency mean / max",
+        f"{_ms(report.turn_latency.mean)} / {_ms(report.turn_latency.max)}",
+    )
+
+    usage = report.usage
+    if usage is not None:
+        table.add_row("Tool calls", f"{usage.tool_calls} ({usage.tool_errors} errors)")
+        if usage.tool_latency.count:
+            table.add_row("Tool latency p50 / p95 / p99", _latency_row(usage.tool_latency))
+        table.add_row("LLM calls", str(usage.llm_calls))
+        table.add_row("Tokens in / out", f"{usage.input_tokens:,} / {usage.output_tokens:,}")
+        if report.turns:
+            tokens_per_turn = (usage.input_tokens + usage.output_tokens) / report.turns
+            table.add_row("Tokens per turn", f"{tokens_per_turn:,.0f}")
+        if usage.cost:
+            table.add_row("Estimated cost", f"${usage.cost:,.4f}")
+
+    console.print(table)
+
+
+def bench(
+    agent_file: Optional[Path] = typer.Argument(
+        None, help="Agent definition file, e.g. agent.py", exists=True, dir_okay=False
+    ),
+    url: Optional[str] = typer.Option(
+        None, "--url", help="SSE URL of a running fast-agent server, instead of an agent file"
+    ),
+    agent: Optional[str] = typer.Option(
+        None, "--agent", "-a", help="Agent to send messages to (defaults to the first agent)"
+    ),
+    corpus: Optional[Path] = typer.Option(
+        None, "--corpus", "-c", help="JSONL file of messages", exists=True, dir_okay=False
+    ),
+    message: str = typer.Option(
+        "Hello", "--message", "-m", help="Message to send when no corpus is given"
+    ),
+    concurrency: int = typer.Option(4, "--concurrency", "-n", min=1, help="Concurrent sessions"),
+    requests: Optional[int] = typer.Option(
+        None, "--requests", "-r", min=1, help=f"Turns to send [default: {DEFAULT_REQUESTS}]"
+    ),
+    duration: Optional[float] = typer.Option(
+        None, "--duration", "-d", min=0, help="Stop starting new turns after this many seconds"
+    ),
+    session_turns: int = typer.Option(
+        0, "--session-turns", min=0, help="Start a new conversation after this many turns"
+    ),
+    timeout: float = typer.Option(300, "--timeout", min=0, help="Timeout for each turn"),
+    model: Optional[str] = typer.Option(None, "--model", help="Override the agents' model"),
+    output: Optional[str] = typer.Option(
+        None, "--json", help="Write the report as JSON to this file, or - for stdout"
+    ),
+) -> None:
+    """Load test an agent with concurrent sessions, reporting latency percentiles."""
+    if (agent_file is None) == (url is None):
+        raise typer.BadParameter("Specify either an agent file or --url")
+    if requests is None and duration is None:
+        requests = DEFAULT_REQUESTS
+
+    try:
+        messages = load_corpus(corpus) if corpus else [message]
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--corpus")
+
+    options = dict(
+        messages=messages,
+        concurrency=concurrency,
+        requests=requests,
+        duration=duration,
+        session_turns=session_turns,
+        timeout=timeout,
+    )
+    try:
+        if url is not None:
+            report = asyncio.run(bench_server(url, agent, **options))
+        else:
+            report = asyncio.run(bench_agent_file(agent_file, agent, model, **options))
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if output == "-":
+        print(json.dumps(report.to_dict(), indent=2))
+        return
+    show_report(report)
+    if output:
+        Path(output).write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+        console.print(f"\nReport written to {output}")
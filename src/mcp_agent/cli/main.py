@@ -4,7 +4,7 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from mcp_agent.cli.commands import bootstrap, setup
+from mcp_agent.cli.commands import bench, bootstrap, setup
 from mcp_agent.cli.terminal import Application
 
 app = typer.Typer(
@@ -15,6 +15,7 @@ app = typer.Typer(
 # Subcommands
 app.add_typer(setup.app, name="setup", help="Set up a new agent project")
 app.add_typer(bootstrap.app, name="bootstrap", help="Create example applications")
+app.command(name="bench")(bench.bench)
 
 # Shared application context
 application = Application()
@@ -40,6 +41,7 @@ def show_welcome() -> None:
 
     table.add_row("setup", "Set up a new agent project with configuration files")
     table.add_row("bootstrap", "Create example applications (workflow, researcher, etc.)")
+    table.add_row("bench", "Load test an agent with concurrent sessions")
     # table.add_row("config", "Manage agent configuration settings")
 
     console.print(table)
@@ -21,6 +21,12 @@ class MCPServerAuthSettings(BaseModel):
 class MCPSamplingSettings(BaseModel):
     model: str = "haiku"
 
+    max_concurrency: int | None = None
+    """Maximum concurrent sampling requests from this server"""
+
+    requests_per_minute: int | None = None
+    """Maximum sampling requests per minute from this server"""
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
@@ -98,6 +104,28 @@ class MCPSettings(BaseModel):
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
+class RateLimitSettings(BaseModel):
+    """
+    Rate limits for requests to an LLM provider. Budgets apply separately to each
+    API key and model.
+    """
+
+    requests_per_minute: int | None = None
+    """Maximum requests per minute"""
+
+    tokens_per_minute: int | None = None
+    """Maximum estimated input plus requested output tokens per minute"""
+
+    max_retries: int = 3
+    """Retries for rate limited, overloaded and connection errors"""
+
+    initial_backoff_seconds: float = 1.0
+    """Delay before the first retry when the provider does not send retry-after"""
+
+    max_backoff_seconds: float = 60.0
+    """Maximum delay between retries"""
+
+
 class AnthropicSettings(BaseModel):
     """
     Settings for using Anthropic models in the fast-agent application.
@@ -107,6 +135,8 @@ class AnthropicSettings(BaseModel):
 
     base_url: str | None = None
 
+    rate_limit: RateLimitSettings | None = None
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
@@ -120,6 +150,8 @@ class OpenAISettings(BaseModel):
 
     base_url: str | None = None
 
+    rate_limit: RateLimitSettings | None = None
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
@@ -133,6 +165,8 @@ class DeepSeekSettings(BaseModel):
 
     base_url: str | None = None
 
+    rate_limit: RateLimitSettings | None = None
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
@@ -145,6 +179,8 @@ class GenericSettings(BaseModel):
 
     base_url: str | None = None
 
+    rate_limit: RateLimitSettings | None = None
+
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
 
@@ -159,6 +195,32 @@ class TemporalSettings(BaseModel):
     api_key: str | None = None
 
 
+class ProcessSettings(BaseModel):
+    """
+    Settings for the process execution engine, which runs agents in worker processes.
+    """
+
+    workers: int | None = None
+    """Number of worker processes (defaults to the number of CPUs)"""
+
+    worker_concurrency: int = 8
+    """Agent turns run at once by each worker; further turns wait for the worker"""
+
+    max_pending: int = 256
+    """Agent turns submitted and not yet finished. Further submissions wait, applying
+    back-pressure to callers."""
+
+    max_tasks_per_worker: int | None = None
+    """Replace a worker after it has run this many turns. Conversations held by a
+    replaced worker start again on its successor."""
+
+    start_method: Literal["spawn", "forkserver", "fork"] = "spawn"
+    """multiprocessing start method for worker processes"""
+
+    startup_timeout_seconds: float = 120
+    """Time allowed for a worker to create its agents and connect to their MCP servers"""
+
+
 class OpenTelemetrySettings(BaseModel):
     """
     OTEL settings for the fast-agent application.
@@ -171,13 +233,36 @@ class OpenTelemetrySettings(BaseModel):
     service_version: str | None = None
 
     otlp_endpoint: str | None = None
-    """OTLP endpoint for OpenTelemetry tracing"""
+    """OTLP endpoint for OpenTelemetry tracing. No spans are recorded unless this or
+    console_debug is set."""
 
     console_debug: bool = False
     """Log spans to console"""
 
     sample_rate: float = 1.0
-    """Sample rate for tracing (1.0 = sample everything)"""
+    """Fraction of new traces to record (1.0 = sample everything). Requests that continue
+    a caller's trace follow the caller's sampling decision."""
+
+
+class MetricsSettings(BaseModel):
+    """
+    Metrics settings for the fast-agent application.
+    """
+
+    enabled: bool = True
+
+    otlp_endpoint: str | None = None
+    """OTLP endpoint for metrics, for example http://localhost:4318/v1/metrics"""
+
+    export_interval_seconds: float = 60
+    """Interval between exports to the OTLP endpoint"""
+
+    prometheus_port: int | None = None
+    """Serve metrics in Prometheus text format on this port (at /metrics) while agents are
+    served over MCP. No metrics are recorded unless this or otlp_endpoint is set."""
+
+    prometheus_host: str = "127.0.0.1"
+    """Address the Prometheus endpoint listens on"""
 
 
 class LoggerSettings(BaseModel):
@@ -223,6 +308,133 @@ class LoggerSettings(BaseModel):
     """Truncate display of long tool calls"""
 
 
+class SamplingSettings(BaseModel):
+    """
+    Settings for handling sampling requests from MCP servers.
+    """
+
+    max_concurrency: int = 8
+    """Maximum concurrent sampling requests across all servers"""
+
+    pool_size: int = 4
+    """Number of idle sampling LLMs kept for reuse per model"""
+
+
+class ResourceCacheSettings(BaseModel):
+    """
+    Settings for caching MCP resource contents read by agents.
+    """
+
+    enabled: bool = False
+    """Cache resources read from MCP servers. Resources from servers that do not send update
+    notifications may be up to ttl_seconds old."""
+
+    max_entries: int = 128
+    """Maximum number of cached resources"""
+
+    max_memory_mb: float = 64
+    """Maximum size of resources held in memory"""
+
+    spill_threshold_mb: float = 4
+    """Resources larger than this are stored on disk rather than in memory"""
+
+    max_disk_mb: float = 512
+    """Maximum size of resources stored on disk"""
+
+    ttl_seconds: float | None = 30
+    """Revalidation interval for resources from servers that do not send update notifications"""
+
+    spill_dir: str | None = None
+    """Directory for spilled resources (defaults to the system temp directory)"""
+
+
+class SessionStoreSettings(BaseModel):
+    """
+    Settings for durable storage of agent conversation history.
+    """
+
+    enabled: bool = False
+    """Append each turn to the session store"""
+
+    path: str = ".fast-agent/sessions.db"
+    """SQLite database holding the sessions"""
+
+    blob_threshold_bytes: int = 1024
+    """Image and binary content at least this large is stored once, deduplicated by hash"""
+
+
+class CheckpointSettings(BaseModel):
+    """
+    Settings for durable checkpoints of workflow agents (orchestrator, chain and
+    evaluator-optimizer).
+    """
+
+    enabled: bool = False
+    """Record each completed workflow step, so that a failed run resumes when repeated"""
+
+    store: Literal["sqlite", "file"] = "sqlite"
+    """Checkpoint storage: a SQLite database, or a directory of JSON files"""
+
+    path: str | None = None
+    """SQLite database or directory of checkpoints (defaults to .fast-agent/checkpoints.db
+    or .fast-agent/checkpoints)"""
+
+    max_attempts: int = 3
+    """Attempts at each step, including the first, before the run fails"""
+
+    initial_interval_seconds: float = 1.0
+    """Delay before retrying a failed step"""
+
+    backoff_coefficient: float = 2.0
+    """Multiplier applied to the delay after each failed attempt"""
+
+    max_interval_seconds: float = 60.0
+    """Maximum delay between attempts"""
+
+    ttl_seconds: float | None = 7 * 24 * 60 * 60
+    """Time after which the checkpoint of a failed run that was not resumed is deleted
+    (None keeps checkpoints until their run completes)"""
+
+
+class ResponseCacheSettings(BaseModel):
+    """
+    Settings for caching provider responses, so that repeated runs of agent scripts and
+    evaluations with identical inputs do not call the provider again.
+    """
+
+    enabled: bool = False
+    """Cache responses by a hash of the model, system prompt, messages, tools and parameters"""
+
+    mode: Literal["read_write", "read_only", "record", "replay"] = "read_write"
+    """read_write serves cached responses and caches new ones. read_only does not write to
+    the cache (for CI). record always calls the provider, caching its responses. replay only
+    serves cached responses, failing on requests that were not recorded."""
+
+    path: str = ".fast-agent/responses.db"
+    """SQLite database holding the responses"""
+
+    max_size_mb: float = 512
+    """Maximum size of cached responses, beyond which the least recently used are evicted"""
+
+    max_entries: int | None = None
+    """Maximum number of cached responses"""
+
+
+class AgentServerSettings(BaseModel):
+    """
+    Settings for serving agents to MCP clients (fast-agent --server).
+    """
+
+    max_sessions: int = 100
+    """Client sessions holding a conversation at once. The least recently used idle session is evicted."""
+
+    max_concurrent_requests: int = 16
+    """Requests processed at once across all sessions; further requests wait in a queue"""
+
+    session_idle_timeout_seconds: float = 1800
+    """Conversations idle for longer than this are discarded"""
+
+
 class Settings(BaseSettings):
     """
     Settings class for the fast-agent application.
@@ -239,9 +451,12 @@ class Settings(BaseSettings):
     mcp: MCPSettings | None = MCPSettings()
     """MCP config, such as MCP servers"""
 
-    execution_engine: Literal["asyncio", "temporal"] = "asyncio"
+    execution_engine: Literal["asyncio", "temporal", "process"] = "asyncio"
     """Execution engine for the fast-agent application"""
 
+    startup_concurrency: int = 8
+    """Maximum number of agents, and of MCP servers, initialized concurrently at startup"""
+
     default_model: str | None = "haiku"
     """
     Default model for agents. Format is provider.model_name.<reasoning_effort>, for example openai.o3-mini.low
@@ -250,12 +465,18 @@ class Settings(BaseSettings):
     temporal: TemporalSettings | None = None
     """Settings for Temporal workflow orchestration"""
 
+    process: ProcessSettings | None = ProcessSettings()
+    """Settings for the process execution engine"""
+
     anthropic: AnthropicSettings | None = None
     """Settings for using Anthropic models in the fast-agent application"""
 
     otel: OpenTelemetrySettings | None = OpenTelemetrySettings()
     """OpenTelemetry logging settings for the fast-agent application"""
 
+    metrics: MetricsSettings | None = MetricsSettings()
+    """Metrics settings for the fast-agent application"""
+
     openai: OpenAISettings | None = None
     """Settings for using OpenAI models in the fast-agent application"""
 
@@ -268,6 +489,24 @@ class Settings(BaseSettings):
     logger: LoggerSettings | None = LoggerSettings()
     """Logger settings for the fast-agent application"""
 
+    sampling: SamplingSettings | None = SamplingSettings()
+    """Settings for handling sampling requests from MCP servers"""
+
+    resource_cache: ResourceCacheSettings | None = ResourceCacheSettings()
+    """Settings for caching MCP resource contents"""
+
+    session_store: SessionStoreSettings | None = SessionStoreSettings()
+    """Settings for durable conversation history"""
+
+    checkpoints: CheckpointSettings | None = CheckpointSettings()
+    """Settings for durable workflow checkpoints"""
+
+    response_cache: ResponseCacheSettings | None = ResponseCacheSettings()
+    """Settings for caching provider responses"""
+
+    agent_server: AgentServerSettings | None = AgentServerSettings()
+    """Settings for serving agents over MCP"""
+
     @classmethod
     def find_config(cls) -> Path | None:
         """Find the config file in the current directory or parent directories."""
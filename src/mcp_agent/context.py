@@ -8,24 +8,27 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 
 from mcp import ServerSession
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.propagate import set_global_textmap
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
-from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 from pydantic import BaseModel, ConfigDict
 
 from mcp_agent.config import Settings, get_settings
+from mcp_agent.core.startup_timeline import StartupTimeline
+from mcp_agent.executor.checkpoint import CheckpointStore, create_checkpoint_store
 from mcp_agent.executor.decorator_registry import (
     DecoratorRegistry,
     register_asyncio_decorators,
 )
 from mcp_agent.executor.executor import AsyncioExecutor, Executor
 from mcp_agent.executor.task_registry import ActivityRegistry
+from mcp_agent.llm.rate_limiter import RateLimiter
+from mcp_agent.llm.response_cache import ResponseCache, create_response_cache
+from mcp_agent.llm.usage_ledger import UsageLedger
 from mcp_agent.logging.events import EventFilter
 from mcp_agent.logging.logger import LoggingConfig, get_logger
+from mcp_agent.logging.metrics import configure_metrics
 from mcp_agent.logging.transport import create_transport
+from mcp_agent.mcp.resource_cache import ResourceCache, create_resource_cache
+from mcp_agent.mcp.sampling import SamplingService
+from mcp_agent.mcp.session_store import SessionStore, create_session_store
 from mcp_agent.mcp_server_registry import ServerRegistry
 
 if TYPE_CHECKING:
@@ -58,6 +61,15 @@ class Context(BaseModel):
 
     tracer: Optional[trace.Tracer] = None
 
+    resource_cache: Optional[ResourceCache] = None
+    sampling_service: Optional[SamplingService] = None
+    session_store: Optional[SessionStore] = None
+    checkpoint_store: Optional[CheckpointStore] = None
+    usage_ledger: Optional[UsageLedger] = None
+    rate_limiter: Optional[RateLimiter] = None
+    response_cache: Optional[ResponseCache] = None
+    startup_timeline: Optional[StartupTimeline] = None
+
     model_config = ConfigDict(
         extra="allow",
         arbitrary_types_allowed=True,  # Tell Pydantic to defer type evaluation
@@ -71,8 +83,20 @@ async def configure_otel(config: "Settings") -> None:
     if not config.otel.enabled:
         return
 
+    # Spans are only recorded when there is somewhere to send them
+    if not config.otel.otlp_endpoint and not config.otel.console_debug:
+        return
+
+    # The SDK and exporters are only imported when tracing is enabled
+    from opentelemetry.propagate import set_global_textmap
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
     # Check if a provider is already set to avoid re-initialization
-    if trace.get_tracer_provider().__class__.__name__ != "NoOpTracerProvider":
+    if isinstance(trace.get_tracer_provider(), TracerProvider):
         return
 
     # Set up global textmap propagator first
@@ -95,19 +119,19 @@ async def configure_otel(config: "Settings") -> None:
         }
     )
 
-    # Create provider with resource
-    tracer_provider = TracerProvider(resource=resource)
+    # Sample a fraction of new traces, and follow the caller's decision for the rest
+    sampler = ParentBased(TraceIdRatioBased(min(max(config.otel.sample_rate, 0.0), 1.0)))
+    tracer_provider = TracerProvider(resource=resource, sampler=sampler)
 
     # Add exporters based on config
     otlp_endpoint = config.otel.otlp_endpoint
     if otlp_endpoint:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
         exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
         tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
 
-        if config.otel.console_debug:
-            tracer_provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
-    else:
-        # Default to console exporter in development
+    if config.otel.console_debug:
         tracer_provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
 
     # Set as global tracer provider
@@ -130,14 +154,6 @@ async def configure_logger(config: "Settings") -> None:
     )
 
 
-async def configure_usage_telemetry(_config: "Settings") -> None:
-    """
-    Configure usage telemetry based on the application config.
-    TODO: saqadri - implement usage tracking
-    """
-    pass
-
-
 async def configure_executor(config: "Settings"):
     """
     Configure the executor based on the application config.
@@ -150,6 +166,10 @@ async def configure_executor(config: "Settings"):
 
         executor = TemporalExecutor(config=config.temporal)
         return executor
+    elif config.execution_engine == "process":
+        from mcp_agent.executor.process import ProcessExecutor
+
+        return ProcessExecutor(settings=config.process)
     else:
         # Default to asyncio executor
         executor = AsyncioExecutor()
@@ -174,7 +194,7 @@ async def initialize_context(
     # Configure logging and telemetry
     await configure_otel(config)
     await configure_logger(config)
-    await configure_usage_telemetry(config)
+    configure_metrics(config)
 
     # Configure the executor
     context.executor = await configure_executor(config)
@@ -183,6 +203,13 @@ async def initialize_context(
     context.decorator_registry = DecoratorRegistry()
     register_asyncio_decorators(context.decorator_registry)
 
+    context.resource_cache = create_resource_cache(config.resource_cache)
+    context.session_store = create_session_store(config.session_store)
+    context.checkpoint_store = create_checkpoint_store(config.checkpoints)
+    context.usage_ledger = UsageLedger()
+    context.rate_limiter = RateLimiter()
+    context.response_cache = create_response_cache(config.response_cache)
+
     # Store the tracer in context if needed
     context.tracer = trace.get_tracer(config.otel.service_name)
 
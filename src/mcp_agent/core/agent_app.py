@@ -2,13 +2,16 @@
 Direct AgentApp implementation for interacting with agents without proxies.
 """
 
-from typing import Dict, List, Optional, Union
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
 
 from deprecated import deprecated
 from mcp.types import PromptMessage
 
 from mcp_agent.agents.agent import Agent
-from mcp_agent.core.interactive_prompt import InteractivePrompt
+from mcp_agent.llm.usage_ledger import UsageLedger, UsageSummary
+from mcp_agent.logging.profiler import Profiler
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
 
@@ -99,6 +102,52 @@ class AgentApp:
 
         return next(iter(self._agents.values()))
 
+    @property
+    def usage_ledger(self) -> Optional[UsageLedger]:
+        """The ledger recording LLM and tool calls made by these agents"""
+        if not self._agents:
+            return None
+        return getattr(next(iter(self._agents.values())).context, "usage_ledger", None)
+
+    def usage(self, name: str | None = None) -> UsageSummary:
+        """
+        Return token, latency and cost totals.
+
+        Args:
+            name: An agent or workflow name. Workflow totals include every agent called
+                  within the workflow. If not specified, totals for all calls are returned.
+
+        Returns:
+            The usage summary
+        """
+        ledger = self.usage_ledger
+        if ledger is None:
+            return UsageSummary()
+        if name is None:
+            return ledger.summary()
+        if name in ledger.by_workflow():
+            return ledger.summary(workflow=name)
+        return ledger.summary(agent=name)
+
+    @contextmanager
+    def profile(self, path: str | Path | None = None) -> Iterator[Profiler]:
+        """
+        Record the phases of the turns run within this block.
+
+        Args:
+            path: Optional file to write a Chrome trace (Perfetto JSON) of the phases to
+
+        Returns:
+            The profiler, for its summary() and report()
+        """
+        profiler = Profiler()
+        try:
+            with profiler:
+                yield profiler
+        finally:
+            if path is not None:
+                profiler.write_chrome_trace(path)
+
     async def apply_prompt(
         self,
         prompt_name: str,
@@ -118,6 +167,20 @@ class AgentApp:
         """
         return await self._agent(agent_name).apply_prompt(prompt_name, arguments)
 
+    async def apply_prompt_file(self, file: str | Path, agent_name: str | None = None) -> str:
+        """
+        Apply the messages saved in a prompt or history file to an agent (default agent
+        if not specified). Playback agents stream the file as it is played back.
+
+        Args:
+            file: Path to the prompt or history file
+            agent_name: Name of the agent to send to
+
+        Returns:
+            The agent's response as a string
+        """
+        return await self._agent(agent_name).apply_prompt_file(file)
+
     async def list_prompts(self, server_name: str | None = None, agent_name: str | None = None):
         """
         List available prompts for an agent.
@@ -250,7 +313,9 @@ class AgentApp:
         # Create agent_types dictionary mapping agent names to their types
         agent_types = {name: agent.agent_type for name, agent in self._agents.items()}
 
-        # Create the interactive prompt
+        # Create the interactive prompt (prompt_toolkit is only imported when needed)
+        from mcp_agent.core.interactive_prompt import InteractivePrompt
+
         prompt = InteractivePrompt(agent_types=agent_types)
 
         # Define the wrapper for send function
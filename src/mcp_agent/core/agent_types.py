@@ -9,6 +9,7 @@ from typing import List
 
 # Forward imports to avoid circular dependencies
 from mcp_agent.core.request_params import RequestParams
+from mcp_agent.llm.memory import MemoryPolicy
 
 
 class AgentType(Enum):
@@ -34,9 +35,10 @@ class AgentConfig:
     default_request_params: RequestParams | None = None
     human_input: bool = False
     agent_type: str = AgentType.BASIC.value
+    memory: MemoryPolicy | None = None
 
     def __post_init__(self) -> None:
-        """Ensure default_request_params exists with proper history setting"""
+        """Ensure default_request_params exists with proper history and memory settings"""
 
         if self.default_request_params is None:
             self.default_request_params = RequestParams(
@@ -45,3 +47,6 @@ class AgentConfig:
         else:
             # Override the request params history setting if explicitly configured
             self.default_request_params.use_history = self.use_history
+
+        if self.memory is not None:
+            self.default_request_params.memory = self.memory
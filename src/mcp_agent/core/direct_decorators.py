@@ -22,6 +22,7 @@ from typing import (
 from mcp_agent.agents.agent import AgentConfig
 from mcp_agent.core.agent_types import AgentType
 from mcp_agent.core.request_params import RequestParams
+from mcp_agent.llm.memory import MemoryPolicy
 
 # Type variables for the decorated function
 P = ParamSpec("P")  # Parameters
@@ -90,6 +91,7 @@ def _decorator_impl(
     use_history: bool = True,
     request_params: RequestParams | None = None,
     human_input: bool = False,
+    memory: MemoryPolicy | None = None,
     **extra_kwargs,
 ) -> Callable[[AgentCallable[P, R]], DecoratedAgentProtocol[P, R]]:
     """
@@ -104,6 +106,7 @@ def _decorator_impl(
         use_history: Whether to maintain conversation history
         request_params: Additional request parameters for the LLM
         human_input: Whether to enable human input capabilities
+        memory: Policy limiting the conversation history sent with each request
         **extra_kwargs: Additional agent/workflow-specific parameters
     """
 
@@ -132,11 +135,14 @@ def _decorator_impl(
             model=model,
             use_history=use_history,
             human_input=human_input,
+            memory=memory,
         )
 
         # Update request params if provided
         if request_params:
             config.default_request_params = request_params
+            if memory is not None:
+                config.default_request_params.memory = memory
 
         # Store metadata on the wrapper function
         agent_data = {
@@ -174,6 +180,7 @@ def agent(
     use_history: bool = True,
     request_params: RequestParams | None = None,
     human_input: bool = False,
+    memory: MemoryPolicy | None = None,
 ) -> Callable[[AgentCallable[P, R]], DecoratedAgentProtocol[P, R]]:
     """
     Decorator to create and register a standard agent with type-safe signature.
@@ -187,6 +194,7 @@ def agent(
         use_history: Whether to maintain conversation history
         request_params: Additional request parameters for the LLM
         human_input: Whether to enable human input capabilities
+        memory: Policy limiting the conversation history sent with each request
 
     Returns:
         A decorator that registers the agent with proper type annotations
@@ -203,6 +211,7 @@ def agent(
         use_history=use_history,
         request_params=request_params,
         human_input=human_input,
+        memory=memory,
     )
 
 
@@ -3,6 +3,7 @@ Direct factory functions for creating agent and workflow instances without proxi
 Implements type-safe factories with improved error handling.
 """
 
+import asyncio
 from typing import Any, Callable, Dict, Optional, Protocol, TypeVar
 
 from mcp_agent.agents.agent import Agent, AgentConfig
@@ -16,11 +17,14 @@ from mcp_agent.agents.workflow.router_agent import RouterAgent
 from mcp_agent.app import MCPApp
 from mcp_agent.core.agent_types import AgentType
 from mcp_agent.core.exceptions import AgentConfigError
+from mcp_agent.core.startup_timeline import StartupTimeline
 from mcp_agent.core.validation import get_dependencies_groups
 from mcp_agent.event_progress import ProgressAction
 from mcp_agent.llm.augmented_llm import RequestParams
 from mcp_agent.llm.model_factory import ModelFactory
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.mcp.mcp_agent_client_session import MCPAgentClientSession
+from mcp_agent.mcp.mcp_aggregator import get_connection_manager
 
 # Type aliases for improved readability and IDE support
 AgentDict = Dict[str, Agent]
@@ -120,195 +124,16 @@ async def create_agents_by_type(
         def model_factory_func(model=None, request_params=None):
             return lambda: None
 
-    # Create a dictionary to store the initialized agents
-    result_agents: AgentDict = {}
-
-    # Get all agents of the specified type
-    for name, agent_data in agents_dict.items():
-        logger.info(
-            f"Loaded {name}",
-            data={
-                "progress_action": ProgressAction.LOADED,
-                "agent_name": name,
-            },
-        )
-
-        if agent_data["type"] == agent_type.value:
-            # Get common configuration
-            config = agent_data["config"]
-
-            # Type-specific initialization
-            if agent_type == AgentType.BASIC:
-                # Create a basic agent
-                agent = Agent(
-                    config=config,
-                    context=app_instance.context,
-                )
-                await agent.initialize()
-
-                # Attach LLM to the agent
-                llm_factory = model_factory_func(model=config.model)
-                await agent.attach_llm(llm_factory, request_params=config.default_request_params)
-                result_agents[name] = agent
-
-            elif agent_type == AgentType.ORCHESTRATOR:
-                # Get base params configured with model settings
-                base_params = (
-                    config.default_request_params.model_copy()
-                    if config.default_request_params
-                    else RequestParams()
-                )
-                base_params.use_history = False  # Force no history for orchestrator
-
-                # Get the child agents
-                child_agents = []
-                for agent_name in agent_data["child_agents"]:
-                    if agent_name not in active_agents:
-                        raise AgentConfigError(f"Agent {agent_name} not found")
-                    agent = active_agents[agent_name]
-                    child_agents.append(agent)
-
-                # Create the orchestrator
-                orchestrator = OrchestratorAgent(
-                    config=config,
-                    context=app_instance.context,
-                    agents=child_agents,
-                    plan_type=agent_data.get("plan_type", "full"),
-                )
-
-                # Initialize the orchestrator
-                await orchestrator.initialize()
-
-                # Attach LLM to the orchestrator
-                llm_factory = model_factory_func(model=config.model)
-                await orchestrator.attach_llm(
-                    llm_factory, request_params=config.default_request_params
-                )
-
-                result_agents[name] = orchestrator
-
-            elif agent_type == AgentType.PARALLEL:
-                # Get the fan-out and fan-in agents
-                fan_in_name = agent_data.get("fan_in")
-                fan_out_names = agent_data["fan_out"]
-
-                # Create or retrieve the fan-in agent
-                if not fan_in_name:
-                    # Create default fan-in agent with auto-generated name
-                    fan_in_name = f"{name}_fan_in"
-                    fan_in_agent = await _create_default_fan_in_agent(
-                        fan_in_name, app_instance.context, model_factory_func
-                    )
-                    # Add to result_agents so it's registered properly
-                    result_agents[fan_in_name] = fan_in_agent
-                elif fan_in_name not in active_agents:
-                    raise AgentConfigError(f"Fan-in agent {fan_in_name} not found")
-                else:
-                    fan_in_agent = active_agents[fan_in_name]
-
-                # Get the fan-out agents
-                fan_out_agents = []
-                for agent_name in fan_out_names:
-                    if agent_name not in active_agents:
-                        raise AgentConfigError(f"Fan-out agent {agent_name} not found")
-                    fan_out_agents.append(active_agents[agent_name])
-
-                # Create the parallel agent
-                parallel = ParallelAgent(
-                    config=config,
-                    context=app_instance.context,
-                    fan_in_agent=fan_in_agent,
-                    fan_out_agents=fan_out_agents,
-                )
-                await parallel.initialize()
-                result_agents[name] = parallel
-
-            elif agent_type == AgentType.ROUTER:
-                # Get the router agents
-                router_agents = []
-                for agent_name in agent_data["router_agents"]:
-                    if agent_name not in active_agents:
-                        raise AgentConfigError(f"Router agent {agent_name} not found")
-                    router_agents.append(active_agents[agent_name])
-
-                # Create the router agent
-                router = RouterAgent(
-                    config=config,
-                    context=app_instance.context,
-                    agents=router_agents,
-                    routing_instruction=agent_data.get("instruction"),
-                )
-                await router.initialize()
-
-                # Attach LLM to the router
-                llm_factory = model_factory_func(model=config.model)
-                await router.attach_llm(llm_factory, request_params=config.default_request_params)
-                result_agents[name] = router
-
-            elif agent_type == AgentType.CHAIN:
-                # Get the chained agents
-                chain_agents = []
-
-                agent_names = agent_data["sequence"]
-                if 0 == len(agent_names):
-                    raise AgentConfigError("No agents in the chain")
-
-                for agent_name in agent_data["sequence"]:
-                    if agent_name not in active_agents:
-                        raise AgentConfigError(f"Chain agent {agent_name} not found")
-                    chain_agents.append(active_agents[agent_name])
-
-                from mcp_agent.agents.workflow.chain_agent import ChainAgent
-
-                # Get the cumulative parameter
-                cumulative = agent_data.get("cumulative", False)
-
-                chain = ChainAgent(
-                    config=config,
-                    context=app_instance.context,
-                    agents=chain_agents,
-                    cumulative=cumulative,
-                )
-                await chain.initialize()
-                result_agents[name] = chain
-
-            elif agent_type == AgentType.EVALUATOR_OPTIMIZER:
-                # Get the generator and evaluator agents
-                generator_name = agent_data["generator"]
-                evaluator_name = agent_data["evaluator"]
-
-                if generator_name not in active_agents:
-                    raise AgentConfigError(f"Generator agent {generator_name} not found")
-
-                if evaluator_name not in active_agents:
-                    raise AgentConfigError(f"Evaluator agent {evaluator_name} not found")
-
-                generator_agent = active_agents[generator_name]
-                evaluator_agent = active_agents[evaluator_name]
-
-                # Get min_rating and max_refinements from agent_data
-                min_rating_str = agent_data.get("min_rating", "GOOD")
-                min_rating = QualityRating(min_rating_str)
-                max_refinements = agent_data.get("max_refinements", 3)
-
-                # Create the evaluator-optimizer agent
-                evaluator_optimizer = EvaluatorOptimizerAgent(
-                    config=config,
-                    context=app_instance.context,
-                    generator_agent=generator_agent,
-                    evaluator_agent=evaluator_agent,
-                    min_rating=min_rating,
-                    max_refinements=max_refinements,
-                )
-
-                # Initialize the agent
-                await evaluator_optimizer.initialize()
-                result_agents[name] = evaluator_optimizer
-
-            else:
-                raise ValueError(f"Unknown agent type: {agent_type}")
-
-    return result_agents
+    return await _create_agents(
+        app_instance,
+        {
+            name: agent_data
+            for name, agent_data in agents_dict.items()
+            if agent_data["type"] == agent_type.value
+        },
+        active_agents,
+        model_factory_func,
+    )
 
 
 async def create_agents_in_dependency_order(
@@ -316,15 +141,22 @@ async def create_agents_in_dependency_order(
     agents_dict: AgentConfigDict,
     model_factory_func: ModelFactoryFn,
     allow_cycles: bool = False,
+    max_concurrency: Optional[int] = None,
 ) -> AgentDict:
     """
     Create agent instances in dependency order without proxies.
 
+    The MCP servers used by any agent are connected first, so each is launched once and
+    shared. Agents in the same dependency group are then initialized concurrently.
+    Timings are recorded in the context's startup_timeline.
+
     Args:
         app_instance: The main application instance
         agents_dict: Dictionary of agent configurations
         model_factory_func: Function for creating model factories
         allow_cycles: Whether to allow cyclic dependencies
+        max_concurrency: Maximum agents (and servers) initialized at once.
+                         Defaults to the startup_concurrency setting.
 
     Returns:
         Dictionary of initialized agent instances
@@ -332,102 +164,324 @@ async def create_agents_in_dependency_order(
     # Get the dependencies between agents
     dependencies = get_dependencies_groups(agents_dict, allow_cycles)
 
+    context = app_instance.context
+    timeline = StartupTimeline()
+    context.startup_timeline = timeline
+    semaphore = asyncio.Semaphore(max_concurrency or _startup_concurrency(app_instance))
+
+    await _warm_servers(app_instance, agents_dict, semaphore, timeline)
+
     # Create a dictionary to store all active agents/workflows
     active_agents: AgentDict = {}
 
-    # Create agent proxies for each group in dependency order
-    for group in dependencies:
-        # Create basic agents first
-        if AgentType.BASIC.value in [agents_dict[name]["type"] for name in group]:
-            basic_agents = await create_agents_by_type(
+    # Agents in a group only depend on agents in earlier groups
+    try:
+        for group in dependencies:
+            group_agents = await _create_agents(
                 app_instance,
-                {
-                    name: agents_dict[name]
-                    for name in group
-                    if agents_dict[name]["type"] == AgentType.BASIC.value
-                },
-                AgentType.BASIC,
+                {name: agents_dict[name] for name in group},
                 active_agents,
                 model_factory_func,
+                semaphore,
+                timeline,
             )
-            active_agents.update(basic_agents)
+            active_agents.update(group_agents)
+    except BaseException:
+        await _shutdown_agents(active_agents)
+        raise
+
+    logger.info(
+        f"Agents ready in {timeline.total:.2f}s",
+        data={"timeline": timeline.summary()},
+    )
+    return active_agents
 
-        # Create parallel agents
-        if AgentType.PARALLEL.value in [agents_dict[name]["type"] for name in group]:
-            parallel_agents = await create_agents_by_type(
-                app_instance,
-                {
-                    name: agents_dict[name]
-                    for name in group
-                    if agents_dict[name]["type"] == AgentType.PARALLEL.value
-                },
-                AgentType.PARALLEL,
-                active_agents,
-                model_factory_func,
-            )
-            active_agents.update(parallel_agents)
 
-        # Create router agents
-        if AgentType.ROUTER.value in [agents_dict[name]["type"] for name in group]:
-            router_agents = await create_agents_by_type(
-                app_instance,
-                {
-                    name: agents_dict[name]
-                    for name in group
-                    if agents_dict[name]["type"] == AgentType.ROUTER.value
-                },
-                AgentType.ROUTER,
-                active_agents,
-                model_factory_func,
-            )
-            active_agents.update(router_agents)
+def _startup_concurrency(app_instance: MCPApp) -> int:
+    config = app_instance.context.config
+    return max(1, config.startup_concurrency if config else 8)
 
-        # Create chain agents
-        if AgentType.CHAIN.value in [agents_dict[name]["type"] for name in group]:
-            chain_agents = await create_agents_by_type(
-                app_instance,
-                {
-                    name: agents_dict[name]
-                    for name in group
-                    if agents_dict[name]["type"] == AgentType.CHAIN.value
-                },
-                AgentType.CHAIN,
-                active_agents,
-                model_factory_func,
-            )
-            active_agents.update(chain_agents)
 
-        # Create evaluator-optimizer agents
-        if AgentType.EVALUATOR_OPTIMIZER.value in [agents_dict[name]["type"] for name in group]:
-            evaluator_agents = await create_agents_by_type(
-                app_instance,
-                {
-                    name: agents_dict[name]
-                    for name in group
-                    if agents_dict[name]["type"] == AgentType.EVALUATOR_OPTIMIZER.value
-                },
-                AgentType.EVALUATOR_OPTIMIZER,
-                active_agents,
-                model_factory_func,
-            )
-            active_agents.update(evaluator_agents)
+async def _warm_servers(
+    app_instance: MCPApp,
+    agents_dict: AgentConfigDict,
+    semaphore: asyncio.Semaphore,
+    timeline: StartupTimeline,
+) -> None:
+    """
+    Connect to every MCP server used by the agents, concurrently, before the agents are
+    initialized. Failures are logged here and reported when the agent loads its servers.
+    """
+    server_names = list(
+        dict.fromkeys(
+            server_name
+            for agent_data in agents_dict.values()
+            for server_name in agent_data["config"].servers
+        )
+    )
+    if not server_names:
+        return
 
-        # Create orchestrator agents last since they might depend on other agents
-        if AgentType.ORCHESTRATOR.value in [agents_dict[name]["type"] for name in group]:
-            orchestrator_agents = await create_agents_by_type(
-                app_instance,
-                {
-                    name: agents_dict[name]
-                    for name in group
-                    if agents_dict[name]["type"] == AgentType.ORCHESTRATOR.value
-                },
-                AgentType.ORCHESTRATOR,
-                active_agents,
-                model_factory_func,
+    connection_manager = await get_connection_manager(app_instance.context)
+
+    async def warm(server_name: str) -> None:
+        async with semaphore:
+            try:
+                with timeline.track("server", server_name):
+                    await connection_manager.get_server(
+                        server_name, client_session_factory=MCPAgentClientSession
+                    )
+            except Exception as e:
+                logger.warning(f"Unable to connect to server '{server_name}': {e}")
+
+    await asyncio.gather(*(warm(server_name) for server_name in server_names))
+
+
+async def _create_agents(
+    app_instance: MCPApp,
+    agents_dict: AgentConfigDict,
+    active_agents: AgentDict,
+    model_factory_func: ModelFactoryFn,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    timeline: Optional[StartupTimeline] = None,
+) -> AgentDict:
+    """
+    Create independent agents concurrently. If any agent fails, the first error is raised
+    once the others have finished, and the agents that were created are shut down.
+    """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_startup_concurrency(app_instance))
+    if timeline is None:
+        timeline = StartupTimeline()
+
+    async def create(name: str, agent_data: Dict[str, Any]) -> AgentDict:
+        async with semaphore:
+            with timeline.track("agent", name):
+                return await _create_agent(
+                    app_instance, name, agent_data, active_agents, model_factory_func
+                )
+
+    results = await asyncio.gather(
+        *(create(name, agent_data) for name, agent_data in agents_dict.items()),
+        return_exceptions=True,
+    )
+
+    result_agents: AgentDict = {}
+    for result in results:
+        if not isinstance(result, BaseException):
+            result_agents.update(result)
+    error = next((result for result in results if isinstance(result, BaseException)), None)
+    if error is not None:
+        await _shutdown_agents(result_agents)
+        raise error
+    return result_agents
+
+
+async def _shutdown_agents(agents: AgentDict) -> None:
+    """Shut down agents created before a failure, closing their server connections"""
+    results = await asyncio.gather(
+        *(agent.shutdown() for agent in agents.values()), return_exceptions=True
+    )
+    for name, result in zip(agents, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Unable to shut down agent '{name}': {result}")
+
+
+async def _create_agent(
+    app_instance: MCPApp,
+    name: str,
+    agent_data: Dict[str, Any],
+    active_agents: AgentDict,
+    model_factory_func: ModelFactoryFn,
+) -> AgentDict:
+    """
+    Create and initialize a single agent. Returns the agent keyed by name, along with
+    any agents created for it (such as a default fan-in agent).
+    """
+    logger.info(
+        f"Loaded {name}",
+        data={
+            "progress_action": ProgressAction.LOADED,
+            "agent_name": name,
+        },
+    )
+
+    agent_type = AgentType(agent_data["type"])
+    result_agents: AgentDict = {}
+
+    # Get common configuration
+    config = agent_data["config"]
+
+    # Type-specific initialization
+    if agent_type == AgentType.BASIC:
+        # Create a basic agent
+        agent = Agent(
+            config=config,
+            context=app_instance.context,
+        )
+        await agent.initialize()
+
+        # Attach LLM to the agent
+        llm_factory = model_factory_func(model=config.model)
+        await agent.attach_llm(llm_factory, request_params=config.default_request_params)
+        result_agents[name] = agent
+
+    elif agent_type == AgentType.ORCHESTRATOR:
+        # Get base params configured with model settings
+        base_params = (
+            config.default_request_params.model_copy()
+            if config.default_request_params
+            else RequestParams()
+        )
+        base_params.use_history = False  # Force no history for orchestrator
+
+        # Get the child agents
+        child_agents = []
+        for agent_name in agent_data["child_agents"]:
+            if agent_name not in active_agents:
+                raise AgentConfigError(f"Agent {agent_name} not found")
+            agent = active_agents[agent_name]
+            child_agents.append(agent)
+
+        # Create the orchestrator
+        orchestrator = OrchestratorAgent(
+            config=config,
+            context=app_instance.context,
+            agents=child_agents,
+            plan_type=agent_data.get("plan_type", "full"),
+        )
+
+        # Initialize the orchestrator
+        await orchestrator.initialize()
+
+        # Attach LLM to the orchestrator
+        llm_factory = model_factory_func(model=config.model)
+        await orchestrator.attach_llm(llm_factory, request_params=config.default_request_params)
+
+        result_agents[name] = orchestrator
+
+    elif agent_type == AgentType.PARALLEL:
+        # Get the fan-out and fan-in agents
+        fan_in_name = agent_data.get("fan_in")
+        fan_out_names = agent_data["fan_out"]
+
+        # Create or retrieve the fan-in agent
+        if not fan_in_name:
+            # Create default fan-in agent with auto-generated name
+            fan_in_name = f"{name}_fan_in"
+            fan_in_agent = await _create_default_fan_in_agent(
+                fan_in_name, app_instance.context, model_factory_func
             )
-            active_agents.update(orchestrator_agents)
+            # Add to result_agents so it's registered properly
+            result_agents[fan_in_name] = fan_in_agent
+        elif fan_in_name not in active_agents:
+            raise AgentConfigError(f"Fan-in agent {fan_in_name} not found")
+        else:
+            fan_in_agent = active_agents[fan_in_name]
+
+        # Get the fan-out agents
+        fan_out_agents = []
+        for agent_name in fan_out_names:
+            if agent_name not in active_agents:
+                raise AgentConfigError(f"Fan-out agent {agent_name} not found")
+            fan_out_agents.append(active_agents[agent_name])
+
+        # Create the parallel agent
+        parallel = ParallelAgent(
+            config=config,
+            context=app_instance.context,
+            fan_in_agent=fan_in_agent,
+            fan_out_agents=fan_out_agents,
+        )
+        await parallel.initialize()
+        result_agents[name] = parallel
+
+    elif agent_type == AgentType.ROUTER:
+        # Get the router agents
+        router_agents = []
+        for agent_name in agent_data["router_agents"]:
+            if agent_name not in active_agents:
+                raise AgentConfigError(f"Router agent {agent_name} not found")
+            router_agents.append(active_agents[agent_name])
+
+        # Create the router agent
+        router = RouterAgent(
+            config=config,
+            context=app_instance.context,
+            agents=router_agents,
+            routing_instruction=agent_data.get("instruction"),
+        )
+        await router.initialize()
 
-    return active_agents
+        # Attach LLM to the router
+        llm_factory = model_factory_func(model=config.model)
+        await router.attach_llm(llm_factory, request_params=config.default_request_params)
+        result_agents[name] = router
+
+    elif agent_type == AgentType.CHAIN:
+        # Get the chained agents
+        chain_agents = []
+
+        agent_names = agent_data["sequence"]
+        if 0 == len(agent_names):
+            raise AgentConfigError("No agents in the chain")
+
+        for agent_name in agent_data["sequence"]:
+            if agent_name not in active_agents:
+                raise AgentConfigError(f"Chain agent {agent_name} not found")
+            chain_agents.append(active_agents[agent_name])
+
+        from mcp_agent.agents.workflow.chain_agent import ChainAgent
+
+        # Get the cumulative parameter
+        cumulative = agent_data.get("cumulative", False)
+
+        chain = ChainAgent(
+            config=config,
+            context=app_instance.context,
+            agents=chain_agents,
+            cumulative=cumulative,
+        )
+        await chain.initialize()
+        result_agents[name] = chain
+
+    elif agent_type == AgentType.EVALUATOR_OPTIMIZER:
+        # Get the generator and evaluator agents
+        generator_name = agent_data["generator"]
+        evaluator_name = agent_data["evaluator"]
+
+        if generator_name not in active_agents:
+            raise AgentConfigError(f"Generator agent {generator_name} not found")
+
+        if evaluator_name not in active_agents:
+            raise AgentConfigError(f"Evaluator agent {evaluator_name} not found")
+
+        generator_agent = active_agents[generator_name]
+        evaluator_agent = active_agents[evaluator_name]
+
+        # Get min_rating and max_refinements from agent_data
+        min_rating_str = agent_data.get("min_rating", "GOOD")
+        min_rating = QualityRating(min_rating_str)
+        max_refinements = agent_data.get("max_refinements", 3)
+
+        # Create the evaluator-optimizer agent
+        evaluator_optimizer = EvaluatorOptimizerAgent(
+            config=config,
+            context=app_instance.context,
+            generator_agent=generator_agent,
+            evaluator_agent=evaluator_agent,
+            min_rating=min_rating,
+            max_refinements=max_refinements,
+        )
+
+        # Initialize the agent
+        await evaluator_optimizer.initialize()
+        result_agents[name] = evaluator_optimizer
+
+    else:
+        raise ValueError(f"Unknown agent type: {agent_type}")
+
+    return result_agents
 
 
 async def _create_default_fan_in_agent(
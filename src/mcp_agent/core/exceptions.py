@@ -69,3 +69,28 @@ class PromptExitError(FastAgentError):
     # TODO an exception for flow control :(
     def __init__(self, message: str, details: str = "") -> None:
         super().__init__(message, details)
+
+
+class ContextWindowExceededError(FastAgentError):
+    """Raised when a request is estimated to be too large for the model's context window,
+    even after the conversation history has been trimmed
+    """
+
+    def __init__(self, message: str, details: str = "") -> None:
+        super().__init__(message, details)
+
+
+class WorkerProcessError(FastAgentError):
+    """Raised when an agent run in a worker process fails because the worker
+    could not start, or exited while running it
+    """
+
+    def __init__(self, message: str, details: str = "") -> None:
+        super().__init__(message, details)
+
+
+class ResponseCacheMissError(FastAgentError):
+    """Raised when the response cache is in replay mode and a request was not recorded"""
+
+    def __init__(self, message: str, details: str = "") -> None:
+        super().__init__(message, details)
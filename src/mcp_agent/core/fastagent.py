@@ -53,7 +53,9 @@ from mcp_agent.core.validation import (
     validate_server_references,
     validate_workflow_references,
 )
+from mcp_agent.executor.process import ProcessExecutor
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.profiler import Profiler
 
 if TYPE_CHECKING:
     from mcp_agent.agents.agent import Agent
@@ -112,6 +114,12 @@ class FastAgent:
             action="store_true",
             help="Run as an MCP server",
         )
+        parser.add_argument(
+            "--profile",
+            nargs="?",
+            const="fastagent-profile.json",
+            help="Profile agent turns, writing a Chrome trace to this file on exit",
+        )
         parser.add_argument(
             "--transport",
             choices=["sse", "stdio"],
@@ -210,6 +218,7 @@ class FastAgent:
         Initializes all registered agents.
         """
         active_agents: Dict[str, Agent] = {}
+        profiler: Profiler | None = None
         had_error = False
         await self.app.initialize()
 
@@ -238,6 +247,14 @@ class FastAgent:
                 validate_server_references(self.context, self.agents)
                 validate_workflow_references(self.agents)
 
+                # Worker processes create the same agents
+                if isinstance(self.context.executor, ProcessExecutor):
+                    self.context.executor.register_agents(
+                        self.agents,
+                        self.context.config,
+                        model=self.args.model if hasattr(self, "args") else None,
+                    )
+
                 # Get a model factory function
                 def model_factory_func(model=None, request_params=None):
                     return get_model_factory(
@@ -257,6 +274,11 @@ class FastAgent:
                 # Create a wrapper with all agents for simplified access
                 wrapper = AgentApp(active_agents)
 
+                # Profile every turn until the application exits
+                if getattr(self.args, "profile", None):
+                    profiler = Profiler()
+                    profiler.start()
+
                 # Handle command line options that should be processed after agent initialization
 
                 # Handle --server option
@@ -276,6 +298,8 @@ class FastAgent:
                         mcp_server = AgentMCPServer(
                             agent_app=wrapper,
                             server_name=f"{self.name}-MCP-Server",
+                            settings=self.context.config.agent_server,
+                            metrics=self.context.config.metrics,
                         )
 
                         # Run the server directly (this is a blocking call)
@@ -335,6 +359,9 @@ class FastAgent:
             raise SystemExit(1)
 
         finally:
+            if profiler is not None:
+                self._write_profile(profiler)
+
             # Clean up any active agents
             if active_agents and not had_error:
                 for agent in active_agents.values():
@@ -343,6 +370,13 @@ class FastAgent:
                     except Exception:
                         pass
 
+    def _write_profile(self, profiler: Profiler) -> None:
+        """Write the --profile trace, and the phase summary to stderr"""
+        profiler.stop()
+        profiler.write_chrome_trace(self.args.profile)
+        print(profiler.report(), file=sys.stderr)
+        print(f"Profile written to {self.args.profile}", file=sys.stderr)
+
     def _handle_error(self, e: Exception, error_type: Optional[str] = None) -> None:
         """
         Handle errors with consistent formatting and messaging.
@@ -441,6 +475,7 @@ class FastAgent:
             original_args.quiet if original_args and hasattr(original_args, "quiet") else False
         )
         self.args.model = None
+        self.args.profile = getattr(original_args, "profile", None)
         if hasattr(original_args, "model"):
             self.args.model = original_args.model
 
@@ -2,12 +2,14 @@
 Request parameters definitions for LLM interactions.
 """
 
-from typing import List
+from typing import List, Literal
 
 from mcp import SamplingMessage
 from mcp.types import CreateMessageRequestParams
 from pydantic import Field
 
+from mcp_agent.llm.memory import MemoryPolicy
+
 
 class RequestParams(CreateMessageRequestParams):
     """
@@ -34,6 +36,11 @@ class RequestParams(CreateMessageRequestParams):
     Include the message history in the generate request.
     """
 
+    memory: MemoryPolicy | None = None
+    """
+    Policy limiting the history sent with each request. Defaults to keeping all history.
+    """
+
     max_iterations: int = 10
     """
     The maximum number of iterations to run the LLM for.
@@ -44,3 +51,9 @@ class RequestParams(CreateMessageRequestParams):
     Whether to allow multiple tool calls per iteration.
     Also known as multi-step tool use.
     """
+
+    priority: Literal["interactive", "batch"] = "interactive"
+    """
+    Queueing priority when requests are held by the provider rate limiter.
+    Interactive requests are sent before batch requests.
+    """
@@ -0,0 +1,79 @@
+"""
+Timing of application startup: MCP server connections and agent initialization.
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Literal
+
+
+@dataclass
+class StartupEvent:
+    """Initialization of a single server or agent"""
+
+    kind: Literal["server", "agent"]
+    name: str
+    start: float
+    """Seconds after the timeline started"""
+
+    duration: float
+    error: str | None = None
+
+
+class StartupTimeline:
+    """Records how long each server and agent took to become ready"""
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._end = self._origin
+        self.events: List[StartupEvent] = []
+
+    @contextmanager
+    def track(self, kind: Literal["server", "agent"], name: str) -> Iterator[None]:
+        """Time the enclosed block, recording an error if it raises"""
+        started = time.perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as e:
+            error = str(e) or type(e).__name__
+            raise
+        finally:
+            finished = time.perf_counter()
+            self._end = max(self._end, finished)
+            self.events.append(
+                StartupEvent(
+                    kind=kind,
+                    name=name,
+                    start=started - self._origin,
+                    duration=finished - started,
+                    error=error,
+                )
+            )
+
+    @property
+    def total(self) -> float:
+        """Seconds from the start of the timeline to the end of the last event"""
+        return self._end - self._origin
+
+    def slowest(self, count: int = 5) -> List[StartupEvent]:
+        return sorted(self.events, key=lambda event: event.duration, reverse=True)[:count]
+
+    def summary(self) -> Dict[str, float]:
+        """Duration of each event keyed by "kind:name", in start order"""
+        return {
+            f"{event.kind}:{event.name}": round(event.duration, 3)
+            for event in sorted(self.events, key=lambda event: event.start)
+        }
+
+    def report(self) -> str:
+        """A table of events in start order, for display"""
+        lines = [f"{'':8} {'name':30} {'start':>8} {'duration':>9}"]
+        for event in sorted(self.events, key=lambda event: event.start):
+            line = f"{event.kind:8} {event.name:30} {event.start:7.2f}s {event.duration:8.2f}s"
+            if event.error:
+                line += f"  failed: {event.error}"
+            lines.append(line)
+        lines.append(f"{'total':8} {'':30} {'':8} {self.total:8.2f}s")
+        return "\n".join(lines)
@@ -228,7 +228,9 @@ def get_dependencies_groups(
 
         if agent_type == AgentType.PARALLEL.value:
             # Parallel agents depend on their fan-out and fan-in agents
-            dependencies[name].update(agent_data.get("parallel_agents", []))
+            dependencies[name].update(agent_data.get("fan_out", []))
+            if agent_data.get("fan_in"):
+                dependencies[name].add(agent_data["fan_in"])
         elif agent_type == AgentType.CHAIN.value:
             # Chain agents depend on the agents in their sequence
             dependencies[name].update(agent_data.get("sequence", []))
@@ -240,7 +242,9 @@ def get_dependencies_groups(
             dependencies[name].update(agent_data.get("child_agents", []))
         elif agent_type == AgentType.EVALUATOR_OPTIMIZER.value:
             # Evaluator-Optimizer agents depend on their evaluation and optimization agents
-            dependencies[name].update(agent_data.get("eval_optimizer_agents", []))
+            for key in ("generator", "evaluator"):
+                if agent_data.get(key):
+                    dependencies[name].add(agent_data[key])
 
     # Check for cycles if not allowed
     if not allow_cycles:
@@ -0,0 +1,453 @@
+"""
+Durable checkpoints for workflow agents (orchestrator, chain and evaluator-optimizer).
+
+A workflow run records the result of each step it completes, such as a plan, a task
+delegated to an agent or an evaluation, under a key given by the step's position in the
+run. Runs are identified by the workflow agent, its input and the name of the
+conversation scope it runs in, such as an MCP client's session. When a failed run is repeated, recorded steps are replayed from the
+checkpoint rather than calling the LLM again, and the run continues from the first step
+that had not completed.
+
+Steps are retried with exponential backoff before the run fails. The checkpoint is
+deleted once the run completes, and checkpoints of failed runs expire after a TTL.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from mcp_agent.config import CheckpointSettings
+from mcp_agent.core.exceptions import (
+    AgentConfigError,
+    ModelConfigError,
+    ProviderKeyError,
+    ServerConfigError,
+)
+from mcp_agent.executor.workflow import WorkflowState
+from mcp_agent.llm.conversation_scope import current_conversation_scope
+from mcp_agent.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from mcp_agent.agents.base_agent import BaseAgent
+    from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Configuration and credential errors are not resolved by retrying a step
+NON_RETRYABLE_ERRORS = (AgentConfigError, ModelConfigError, ProviderKeyError, ServerConfigError)
+
+
+class Checkpoint(BaseModel):
+    """The state of a workflow run and the results of its completed steps"""
+
+    state: WorkflowState
+    steps: Dict[str, Any] = Field(default_factory=dict)
+
+
+class CheckpointStore(ABC):
+    """
+    Storage for workflow checkpoints. Implementations must be safe to use from
+    multiple threads.
+    """
+
+    @abstractmethod
+    def load(self, workflow_id: str) -> Checkpoint | None:
+        """Load a run's checkpoint, or None if there is none"""
+
+    @abstractmethod
+    def save_state(self, workflow_id: str, state: WorkflowState) -> None:
+        """Create or update a run's state"""
+
+    @abstractmethod
+    def save_step(self, workflow_id: str, key: str, value: Any) -> None:
+        """Record the JSON-serializable result of a completed step"""
+
+    @abstractmethod
+    def delete(self, workflow_id: str) -> None:
+        """Delete a run's checkpoint"""
+
+    @abstractmethod
+    def list_checkpoints(self) -> List[str]:
+        """Return the IDs of runs with a checkpoint"""
+
+    @abstractmethod
+    def delete_expired(self, updated_before: float) -> int:
+        """Delete checkpoints last updated before a time, returning the number deleted"""
+
+    def close(self) -> None:
+        """Release resources held by the store"""
+        pass
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflows (
+    id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS steps (
+    workflow_id TEXT NOT NULL REFERENCES workflows(id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (workflow_id, key)
+);
+CREATE INDEX IF NOT EXISTS workflows_updated_at ON workflows(updated_at);
+"""
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Stores checkpoints in a SQLite database, recording each step in its own transaction"""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        if self.path.parent and not self.path.parent.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        self._connection.executescript(_SCHEMA)
+
+    def load(self, workflow_id: str) -> Checkpoint | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT state FROM workflows WHERE id = ?", (workflow_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            steps = self._connection.execute(
+                "SELECT key, value FROM steps WHERE workflow_id = ?", (workflow_id,)
+            ).fetchall()
+        return Checkpoint(
+            state=WorkflowState.model_validate_json(row[0]),
+            steps={key: json.loads(value) for key, value in steps},
+        )
+
+    def save_state(self, workflow_id: str, state: WorkflowState) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO workflows (id, state, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET state = excluded.state, "
+                "updated_at = excluded.updated_at",
+                (workflow_id, state.model_dump_json(), time.time()),
+            )
+
+    def save_step(self, workflow_id: str, key: str, value: Any) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO steps (workflow_id, key, value) VALUES (?, ?, ?)",
+                (workflow_id, key, json.dumps(value)),
+            )
+
+    def delete(self, workflow_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM workflows WHERE id = ?", (workflow_id,))
+
+    def list_checkpoints(self) -> List[str]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id FROM workflows ORDER BY updated_at DESC"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def delete_expired(self, updated_before: float) -> int:
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM workflows WHERE updated_at < ?", (updated_before,)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Stores each checkpoint in its own directory: the run's state in state.json, and
+    completed steps appended to steps.jsonl.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def load(self, workflow_id: str) -> Checkpoint | None:
+        path = self.directory / workflow_id
+        with self._lock:
+            try:
+                state = WorkflowState.model_validate_json((path / "state.json").read_text())
+            except FileNotFoundError:
+                return None
+            steps: Dict[str, Any] = {}
+            steps_file = path / "steps.jsonl"
+            if steps_file.exists():
+                for line in steps_file.read_text().splitlines():
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A step interrupted while being written is run again
+                        continue
+                    steps[record["key"]] = record["value"]
+        return Checkpoint(state=state, steps=steps)
+
+    def save_state(self, workflow_id: str, state: WorkflowState) -> None:
+        path = self.directory / workflow_id
+        with self._lock:
+            path.mkdir(exist_ok=True)
+            temporary = path / "state.json.tmp"
+            temporary.write_text(state.model_dump_json())
+            os.replace(temporary, path / "state.json")
+
+    def save_step(self, workflow_id: str, key: str, value: Any) -> None:
+        with self._lock:
+            with open(self.directory / workflow_id / "steps.jsonl", "a") as steps_file:
+                steps_file.write(json.dumps({"key": key, "value": value}) + "\n")
+                steps_file.flush()
+                os.fsync(steps_file.fileno())
+
+    def delete(self, workflow_id: str) -> None:
+        with self._lock:
+            shutil.rmtree(self.directory / workflow_id, ignore_errors=True)
+
+    def list_checkpoints(self) -> List[str]:
+        with self._lock:
+            paths = [path for path in self.directory.iterdir() if (path / "state.json").exists()]
+        paths.sort(key=lambda path: (path / "state.json").stat().st_mtime, reverse=True)
+        return [path.name for path in paths]
+
+    def delete_expired(self, updated_before: float) -> int:
+        deleted = 0
+        with self._lock:
+            for path in self.directory.iterdir():
+                state = path / "state.json"
+                if state.exists() and state.stat().st_mtime < updated_before:
+                    shutil.rmtree(path, ignore_errors=True)
+                    deleted += 1
+        return deleted
+
+
+def create_checkpoint_store(settings: Optional[CheckpointSettings]) -> CheckpointStore | None:
+    """Create a CheckpointStore from settings, or None if checkpoints are disabled."""
+    if settings is None or not settings.enabled:
+        return None
+    store: CheckpointStore
+    if settings.store == "file":
+        store = FileCheckpointStore(settings.path or ".fast-agent/checkpoints")
+    else:
+        store = SQLiteCheckpointStore(settings.path or ".fast-agent/checkpoints.db")
+    if settings.ttl_seconds is not None:
+        expired = store.delete_expired(time.time() - settings.ttl_seconds)
+        if expired:
+            logger.debug(f"Deleted {expired} expired workflow checkpoints")
+    return store
+
+
+def workflow_id(
+    workflow: str, messages: List["PromptMessageMultipart"], scope: str | None = None
+) -> str:
+    """
+    Identify a workflow run by the workflow agent and its input, and by the name of the
+    conversation scope it runs in, if any, so concurrent sessions sending the same input
+    do not share a checkpoint while a session's failed run still resumes after a restart.
+    """
+    body = json.dumps(
+        [message.model_dump(by_alias=True, mode="json", exclude_none=True) for message in messages],
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(f"{workflow}\n{scope or ''}\n{body}".encode("utf-8")).hexdigest()
+    return f"{workflow}-{digest[:32]}"
+
+
+class WorkflowCheckpoint:
+    """
+    Records the steps of one workflow run. Without a store, steps are simply run, and
+    errors are handled by the workflow as before.
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStore | None = None,
+        workflow_id: str = "",
+        workflow: str | None = None,
+        settings: Optional[CheckpointSettings] = None,
+    ) -> None:
+        self.store = store
+        self.workflow_id = workflow_id
+        self.settings = settings or CheckpointSettings()
+        self.state = WorkflowState(name=workflow)
+        self.replayed_steps = 0
+        self._steps: Dict[str, Any] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether steps are recorded. Workflows let step errors fail the run when they are."""
+        return self.store is not None
+
+    @asynccontextmanager
+    async def running(self) -> AsyncIterator["WorkflowCheckpoint"]:
+        """
+        Run the workflow from its checkpoint. The checkpoint is deleted when the run
+        completes, and kept with the error when it fails.
+        """
+        if self.store is None:
+            yield self
+            return
+
+        checkpoint = await asyncio.to_thread(self.store.load, self.workflow_id)
+        if checkpoint is not None and self._expired(checkpoint):
+            logger.info(
+                f"Discarding expired checkpoint of workflow {checkpoint.state.name}",
+                data={"workflow_id": self.workflow_id},
+            )
+            await asyncio.to_thread(self.store.delete, self.workflow_id)
+            checkpoint = None
+        if checkpoint is not None:
+            self.state = checkpoint.state
+            self._steps = dict(checkpoint.steps)
+            logger.info(
+                f"Resuming workflow {self.state.name} from checkpoint "
+                f"({len(self._steps)} completed steps)",
+                data={"workflow_id": self.workflow_id},
+            )
+        await self._save_state("running")
+
+        try:
+            yield self
+        except Exception as e:
+            self.state.record_error(e)
+            await self._save_state("failed")
+            raise
+        await asyncio.to_thread(self.store.delete, self.workflow_id)
+
+    async def step(
+        self,
+        key: str,
+        run: Callable[[], Awaitable[T]],
+        result_type: Any,
+        agent: Optional["BaseAgent"] = None,
+        prompt: Optional[List["PromptMessageMultipart"]] = None,
+    ) -> T:
+        """
+        Run a step, or replay its result if the checkpoint recorded it. Steps returning
+        None are not recorded, so they are run again on resume.
+
+        Args:
+            key: Identifies the step within the run, for example "plan/0"
+            run: Runs the step
+            result_type: Type of the step's result, used to restore it from JSON
+            agent: The agent the step sends its prompt to. Its conversation is restored
+                   before a failed attempt is retried, and the replayed exchange is added
+                   to it, so later steps see the history they would have seen.
+            prompt: The messages the step sends to the agent
+        """
+        if self.store is None:
+            return await run()
+
+        adapter = TypeAdapter(result_type)
+        if key in self._steps:
+            self.replayed_steps += 1
+            value = adapter.validate_python(self._steps[key])
+            llm = _agent_llm(agent)
+            if llm is not None and prompt is not None and value is not None:
+                llm.replay_exchange(prompt, value)
+            return value
+
+        value = await self._run_with_retry(key, run, agent)
+        if value is not None:
+            self._steps[key] = adapter.dump_python(value, mode="json")
+            await asyncio.to_thread(self.store.save_step, self.workflow_id, key, self._steps[key])
+        return value
+
+    async def _run_with_retry(
+        self, key: str, run: Callable[[], Awaitable[T]], agent: Optional["BaseAgent"]
+    ) -> T:
+        llm = _agent_llm(agent)
+        # A failed attempt may have added its prompt to the conversation already
+        restore = llm.snapshot_conversation() if llm is not None else None
+        attempt = 1
+        while True:
+            try:
+                return await run()
+            except NON_RETRYABLE_ERRORS:
+                raise
+            except Exception as e:
+                if attempt >= self.settings.max_attempts:
+                    raise
+                if restore is not None:
+                    restore()
+                delay = min(
+                    self.settings.max_interval_seconds,
+                    self.settings.initial_interval_seconds
+                    * self.settings.backoff_coefficient ** (attempt - 1),
+                )
+                logger.warning(
+                    f"Workflow step {key} failed ({type(e).__name__}: {e}), "
+                    f"retrying in {delay:.1f}s (attempt {attempt} of {self.settings.max_attempts})"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _expired(self, checkpoint: Checkpoint) -> bool:
+        ttl, updated_at = self.settings.ttl_seconds, checkpoint.state.updated_at
+        return ttl is not None and updated_at is not None and updated_at < time.time() - ttl
+
+    async def _save_state(self, status: str) -> None:
+        self.state.status = status
+        if status == "running":
+            self.state.error = None
+        self.state.updated_at = time.time()
+        await asyncio.to_thread(self.store.save_state, self.workflow_id, self.state)
+
+
+def open_checkpoint(
+    agent: "BaseAgent", messages: List["PromptMessageMultipart"]
+) -> WorkflowCheckpoint:
+    """The checkpoint for a workflow agent's run on the given messages"""
+    try:
+        context = agent.context
+    except RuntimeError:
+        return WorkflowCheckpoint(workflow=agent.name)
+
+    store = getattr(context, "checkpoint_store", None)
+    if store is None:
+        return WorkflowCheckpoint(workflow=agent.name)
+    scope = current_conversation_scope()
+    return WorkflowCheckpoint(
+        store,
+        workflow_id(agent.name, messages, scope.name if scope is not None else None),
+        workflow=agent.name,
+        settings=context.config.checkpoints if context.config else None,
+    )
+
+
+def _agent_llm(agent: Optional["BaseAgent"]) -> Any:
+    """The LLM holding an agent's conversation, if it has one that can be restored"""
+    llm = getattr(agent, "_llm", None)
+    return llm if hasattr(llm, "snapshot_conversation") else None
@@ -1,5 +1,6 @@
 import asyncio
 import functools
+import time
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 from datetime import timedelta
@@ -26,6 +27,7 @@ from mcp_agent.executor.workflow_signal import (
     SignalValueT,
 )
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.metrics import executor_in_flight, executor_semaphore_wait
 
 if TYPE_CHECKING:
     from mcp_agent.context import Context
@@ -78,6 +80,10 @@ class Executor(ABC, ContextDependent):
             # TODO: saqadri - add logging or other error handling here
             raise e
 
+    async def shutdown(self) -> None:
+        """Release resources held by the executor, such as worker processes"""
+        pass
+
     @abstractmethod
     async def execute(
         self,
@@ -224,10 +230,19 @@ class AsyncioExecutor(Executor):
                 return e
 
         if self._activity_semaphore:
+            started = time.perf_counter()
             async with self._activity_semaphore:
-                return await run_task(task)
+                executor_semaphore_wait.record(time.perf_counter() - started)
+                return await self._run_tracked(run_task(task))
         else:
-            return await run_task(task)
+            return await self._run_tracked(run_task(task))
+
+    async def _run_tracked(self, task: Coroutine[Any, Any, R]) -> R:
+        executor_in_flight.add(1)
+        try:
+            return await task
+        finally:
+            executor_in_flight.add(-1)
 
     async def execute(
         self,
@@ -0,0 +1,492 @@
+"""
+Process based executor, running agents in a pool of worker processes.
+
+An event loop uses a single core, so one fast-agent process cannot use more than one
+core however many conversations it holds. With the process executor, independent agent
+turns - parallel fan-out branches, and conversations with agents served over MCP - run
+in worker processes. Each worker creates the application's agents from their
+definitions, with its own MCP server connections and provider clients.
+
+Turns are sent to workers as JSON over a pipe. Turns in the same session always run on
+the same worker, which holds the session's conversations. A worker that exits fails
+only the turns it was running, and is replaced on next use.
+
+Other tasks given to the executor, such as provider SDK calls, run in-process as with
+the asyncio executor.
+"""
+
+import asyncio
+import itertools
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Literal
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from mcp_agent.config import ProcessSettings
+from mcp_agent.core import exceptions
+from mcp_agent.core.exceptions import FastAgentError, WorkerProcessError
+from mcp_agent.core.request_params import RequestParams
+from mcp_agent.executor.executor import AsyncioExecutor, ExecutorConfig
+from mcp_agent.executor.workflow_signal import SignalHandler
+from mcp_agent.logging.logger import get_logger
+from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.process import BaseProcess
+
+    from mcp_agent.config import Settings
+
+logger = get_logger(__name__)
+
+
+class AgentJob(BaseModel):
+    """A request sent to a worker process"""
+
+    id: int = 0
+    kind: Literal["generate", "history", "end_session", "stop"] = "generate"
+    agent: str = ""
+    session: str | None = None
+    """Turns in the same session share conversations. None runs the turn in a new one."""
+
+    messages: List[PromptMessageMultipart] = []
+    request_params: RequestParams | None = None
+
+
+class AgentJobResult(BaseModel):
+    """A worker's reply to a request. Id 0 reports that the worker is ready."""
+
+    id: int = 0
+    messages: List[PromptMessageMultipart] = []
+    error_type: str | None = None
+    error: str | None = None
+    details: str = ""
+
+
+@dataclass
+class WorkerSpec:
+    """Everything a worker needs to create the application's agents"""
+
+    settings: "Settings"
+    agents: Dict[str, Dict[str, Any]]
+    model: str | None = None
+    """Model override given on the command line"""
+
+
+@dataclass
+class _Worker:
+    index: int
+    process: "BaseProcess"
+    conn: "Connection"
+    slots: asyncio.Semaphore
+    send_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    pending: Dict[int, asyncio.Future] = field(default_factory=dict)
+    active: int = 0
+    """Turns holding or waiting for a slot on this worker"""
+    completed: int = 0
+    alive: bool = True
+    retiring: bool = False
+    reader: asyncio.Task | None = None
+
+
+class ProcessExecutor(AsyncioExecutor):
+    """Runs agent turns in a pool of worker processes"""
+
+    def __init__(
+        self,
+        settings: ProcessSettings | None = None,
+        config: ExecutorConfig | None = None,
+        signal_bus: SignalHandler | None = None,
+    ) -> None:
+        super().__init__(config=config, signal_bus=signal_bus)
+        self.execution_engine = "process"
+        self.settings = settings or ProcessSettings()
+        self.worker_count = max(1, self.settings.workers or os.cpu_count() or 1)
+
+        self._spec: WorkerSpec | None = None
+        self._workers: List[_Worker | None] = [None] * self.worker_count
+        self._sessions: Dict[str, int] = {}
+        """The worker holding each session"""
+        self._ids = itertools.count(1)
+        self._mp = multiprocessing.get_context(self.settings.start_method)
+        # Pipes are read and written in threads, so workers do not block the event loop
+        self._io = ThreadPoolExecutor(
+            max_workers=2 * self.worker_count + 1, thread_name_prefix="fast-agent-ipc"
+        )
+        self._pending_slots = asyncio.Semaphore(max(1, self.settings.max_pending))
+        self._start_locks = [asyncio.Lock() for _ in range(self.worker_count)]
+        self._stopping: set[asyncio.Task] = set()
+
+    def register_agents(
+        self, agents: Dict[str, Dict[str, Any]], settings: "Settings", model: str | None = None
+    ) -> None:
+        """Set the agent definitions (as collected by the FastAgent decorators) workers create"""
+        definitions = {
+            name: {key: value for key, value in data.items() if key != "func"}
+            for name, data in agents.items()
+        }
+        self._spec = WorkerSpec(settings=settings, agents=definitions, model=model)
+
+    async def run_agent(
+        self,
+        agent: str,
+        messages: List[PromptMessageMultipart],
+        request_params: RequestParams | None = None,
+        session: str | None = None,
+    ) -> PromptMessageMultipart:
+        """Run a turn with an agent in a worker process, returning the agent's response"""
+        result = await self._submit(
+            AgentJob(agent=agent, session=session, messages=messages, request_params=request_params)
+        )
+        return result.messages[0]
+
+    async def history(self, agent: str, session: str) -> List[PromptMessageMultipart]:
+        """The session's conversation with an agent, as held by its worker"""
+        if session not in self._sessions:
+            return []
+        result = await self._submit(AgentJob(kind="history", agent=agent, session=session))
+        return result.messages
+
+    async def end_session(self, session: str) -> None:
+        """
+        Discard the conversations held for a session, and for the sessions nested in it,
+        such as those of its fan-out branches ("{session}/{parallel}/{agent}")
+        """
+        prefix = f"{session}/"
+        ended = [key for key in self._sessions if key == session or key.startswith(prefix)]
+        for key in ended:
+            await self._submit(AgentJob(kind="end_session", session=key))
+            self._sessions.pop(key, None)
+
+    async def shutdown(self) -> None:
+        """Stop the worker processes"""
+        loop = asyncio.get_running_loop()
+        for index, worker in enumerate(self._workers):
+            self._workers[index] = None
+            if worker is not None and worker.alive:
+                await self._stop(worker)
+                await loop.run_in_executor(self._io, worker.process.join, 5)
+                if worker.process.is_alive():
+                    worker.process.terminate()
+        self._sessions.clear()
+        self._io.shutdown(wait=False)
+
+    async def _submit(self, job: AgentJob) -> AgentJobResult:
+        if self._spec is None:
+            raise WorkerProcessError(
+                "No agents are registered with the process executor",
+                "Agents are registered when a FastAgent application is run with "
+                "execution_engine: process",
+            )
+
+        async with self._pending_slots:
+            index = self._assign(job.session)
+            result = None
+            while result is None:
+                worker = await self._worker(index)
+                worker.active += 1
+                try:
+                    async with worker.slots:
+                        if not worker.alive:
+                            raise WorkerProcessError(
+                                f"Worker process {index} exited before the turn ran"
+                            )
+                        # The worker was retired while this turn waited, so use its replacement
+                        if worker.retiring:
+                            continue
+                        job.id = next(self._ids)
+                        future = asyncio.get_running_loop().create_future()
+                        worker.pending[job.id] = future
+                        await self._send(worker, job)
+                        result = await future
+                        self._completed(worker)
+                finally:
+                    worker.active -= 1
+                    self._stop_if_retired(worker)
+
+        if result.error_type is not None:
+            raise _worker_error(result)
+        return result
+
+    def _assign(self, session: str | None) -> int:
+        """Choose a worker: the session's worker, or the least busy"""
+        if session is not None and session in self._sessions:
+            return self._sessions[session]
+        index = min(
+            range(self.worker_count),
+            key=lambda i: len(self._workers[i].pending) if self._workers[i] else 0,
+        )
+        if session is not None:
+            self._sessions[session] = index
+        return index
+
+    async def _worker(self, index: int) -> _Worker:
+        async with self._start_locks[index]:
+            worker = self._workers[index]
+            if worker is None or not worker.alive or worker.retiring:
+                worker = await self._start_worker(index)
+                self._workers[index] = worker
+            return worker
+
+    async def _start_worker(self, index: int) -> _Worker:
+        loop = asyncio.get_running_loop()
+        parent_conn, child_conn = self._mp.Pipe()
+        process = self._mp.Process(
+            target=_worker_main,
+            args=(child_conn, self._spec),
+            name=f"fast-agent-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+
+        try:
+            ready = await asyncio.wait_for(
+                loop.run_in_executor(self._io, parent_conn.recv_bytes),
+                timeout=self.settings.startup_timeout_seconds,
+            )
+        except (asyncio.TimeoutError, EOFError, OSError) as e:
+            process.terminate()
+            raise WorkerProcessError(
+                f"Worker process {index} did not start",
+                f"exit code {process.exitcode}" if process.exitcode is not None else str(e),
+            )
+        result = AgentJobResult.model_validate_json(ready)
+        if result.error_type is not None:
+            await loop.run_in_executor(self._io, process.join, 5)
+            raise _worker_error(result)
+
+        logger.debug(f"Started worker process {index} (pid {process.pid})")
+        worker = _Worker(
+            index=index,
+            process=process,
+            conn=parent_conn,
+            slots=asyncio.Semaphore(max(1, self.settings.worker_concurrency)),
+        )
+        worker.reader = asyncio.create_task(self._read(worker))
+        return worker
+
+    async def _send(self, worker: _Worker, job: AgentJob) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            async with worker.send_lock:
+                await loop.run_in_executor(self._io, worker.conn.send_bytes, to_json(job))
+        except (OSError, ValueError) as e:
+            worker.pending.pop(job.id, None)
+            raise WorkerProcessError(f"Could not send the turn to worker {worker.index}", str(e))
+
+    async def _read(self, worker: _Worker) -> None:
+        """Deliver a worker's results, until it exits"""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                payload = await loop.run_in_executor(self._io, worker.conn.recv_bytes)
+                result = AgentJobResult.model_validate_json(payload)
+                future = worker.pending.pop(result.id, None)
+                if future is not None and not future.done():
+                    future.set_result(result)
+        except (EOFError, OSError):
+            pass
+        except Exception as e:
+            # Without a reader, the worker's results would never be delivered
+            logger.error(f"Unable to read results from worker process {worker.index}: {e}")
+            worker.process.terminate()
+
+        worker.alive = False
+        await loop.run_in_executor(self._io, worker.process.join, 5)
+        if worker.pending:
+            logger.error(
+                f"Worker process {worker.index} exited with code {worker.process.exitcode} "
+                f"while running {len(worker.pending)} turns"
+            )
+        for future in worker.pending.values():
+            if not future.done():
+                future.set_exception(
+                    WorkerProcessError(
+                        f"Worker process {worker.index} exited while running the turn",
+                        f"exit code {worker.process.exitcode}",
+                    )
+                )
+        worker.pending.clear()
+        if self._workers[worker.index] is worker:
+            self._workers[worker.index] = None
+            self._release_sessions(worker.index)
+
+    def _completed(self, worker: _Worker) -> None:
+        """Count a finished turn, and retire the worker once it has run enough of them"""
+        worker.completed += 1
+        limit = self.settings.max_tasks_per_worker
+        if limit and worker.completed >= limit and not worker.retiring:
+            worker.retiring = True
+            self._release_sessions(worker.index)
+            logger.debug(f"Replacing worker process {worker.index} after {worker.completed} turns")
+
+    def _stop_if_retired(self, worker: _Worker) -> None:
+        """Stop a retired worker once no turn holds or waits for it"""
+        if worker.retiring and not worker.active and worker.alive:
+            task = asyncio.create_task(self._stop(worker))
+            self._stopping.add(task)
+            task.add_done_callback(self._stopping.discard)
+
+    def _release_sessions(self, index: int) -> None:
+        sessions = [session for session, i in self._sessions.items() if i == index]
+        for session in sessions:
+            del self._sessions[session]
+        if sessions:
+            logger.warning(
+                f"Conversations for {len(sessions)} sessions were held by worker process "
+                f"{index}, and start again"
+            )
+
+    async def _stop(self, worker: _Worker) -> None:
+        try:
+            async with worker.send_lock:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._io, worker.conn.send_bytes, to_json(AgentJob(kind="stop"))
+                )
+        except (OSError, ValueError):
+            pass
+
+
+def _worker_error(result: AgentJobResult) -> FastAgentError:
+    """Recreate the error raised in a worker, if it is a FastAgentError"""
+    error_class = getattr(exceptions, result.error_type or "", None)
+    if isinstance(error_class, type) and issubclass(error_class, FastAgentError):
+        return error_class(result.error or "", result.details)
+    return WorkerProcessError(f"{result.error_type}: {result.error}", result.details)
+
+
+def _error_result(job_id: int, error: Exception) -> AgentJobResult:
+    if isinstance(error, FastAgentError):
+        message, details = error.message, error.details
+    else:
+        message, details = str(error), ""
+    return AgentJobResult(
+        id=job_id, error_type=type(error).__name__, error=message, details=details
+    )
+
+
+def _worker_settings(settings: "Settings") -> "Settings":
+    """Workers run agents without a console, and do not start executors or endpoints"""
+    settings = settings.model_copy(deep=True)
+    settings.execution_engine = "asyncio"
+    if settings.logger is not None:
+        settings.logger.progress_display = False
+        settings.logger.show_chat = False
+        settings.logger.show_tools = False
+        if settings.logger.type == "console":
+            settings.logger.type = "none"
+    if settings.metrics is not None:
+        settings.metrics.prometheus_port = None
+    return settings
+
+
+def _worker_main(conn: "Connection", spec: WorkerSpec) -> None:
+    """Entry point of a worker process"""
+    # stdout may carry the MCP stdio transport of the parent
+    sys.stdout = sys.stderr
+    try:
+        asyncio.run(_serve(conn, spec))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        conn.close()
+
+
+async def _serve(conn: "Connection", spec: WorkerSpec) -> None:
+    from mcp_agent.app import MCPApp
+    from mcp_agent.core.direct_factory import (
+        create_agents_in_dependency_order,
+        get_model_factory,
+    )
+    from mcp_agent.llm.conversation_scope import ConversationScope, conversation_scope
+
+    loop = asyncio.get_running_loop()
+    io = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fast-agent-ipc")
+    send_lock = asyncio.Lock()
+
+    async def send(result: AgentJobResult) -> None:
+        async with send_lock:
+            await loop.run_in_executor(io, conn.send_bytes, to_json(result))
+
+    app = MCPApp(
+        name=f"fast-agent-worker-{os.getpid()}",
+        settings=_worker_settings(spec.settings),
+        human_input_callback=None,
+    )
+    async with app.run():
+
+        def model_factory_func(model=None, request_params=None):
+            return get_model_factory(
+                app.context, model=model, request_params=request_params, cli_model=spec.model
+            )
+
+        try:
+            agents = await create_agents_in_dependency_order(app, spec.agents, model_factory_func)
+        except Exception as e:
+            await send(_error_result(0, e))
+            return
+        await send(AgentJobResult(id=0))
+
+        sessions: Dict[str, ConversationScope] = {}
+        session_locks: Dict[str, asyncio.Lock] = {}
+
+        async def handle(job: AgentJob) -> None:
+            try:
+                if job.kind == "end_session":
+                    if job.session is not None:
+                        prefix = f"{job.session}/"
+                        ended = [k for k in sessions if k == job.session or k.startswith(prefix)]
+                        for key in ended:
+                            sessions.pop(key, None)
+                            session_locks.pop(key, None)
+                    await send(AgentJobResult(id=job.id))
+                    return
+
+                agent = agents.get(job.agent)
+                if agent is None:
+                    raise exceptions.AgentConfigError(f"Agent '{job.agent}' not found")
+                if job.session is None:
+                    scope, lock = ConversationScope(), asyncio.Lock()
+                else:
+                    scope = sessions.setdefault(job.session, ConversationScope(name=job.session))
+                    lock = session_locks.setdefault(job.session, asyncio.Lock())
+
+                # Turns in a session run one at a time
+                async with lock:
+                    with conversation_scope(scope):
+                        if job.kind == "history":
+                            llm = getattr(agent, "_llm", None)
+                            messages = list(llm.message_history) if llm else []
+                        else:
+                            messages = [await agent.generate(job.messages, job.request_params)]
+                result = AgentJobResult(id=job.id, messages=messages)
+            except Exception as e:
+                result = _error_result(job.id, e)
+            await send(result)
+
+        tasks: set[asyncio.Task] = set()
+        while True:
+            try:
+                payload = await loop.run_in_executor(io, conn.recv_bytes)
+            except (EOFError, OSError):
+                break
+            job = AgentJob.model_validate_json(payload)
+            if job.kind == "stop":
+                break
+            task = asyncio.create_task(handle(job))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for agent in agents.values():
+            try:
+                await agent.shutdown()
+            except Exception:
+                pass
+    io.shutdown(wait=False)
@@ -3,7 +3,6 @@ import asyncio
 from rich.panel import Panel
 
 from mcp_agent.console import console
-from mcp_agent.core.enhanced_prompt import get_enhanced_input, handle_special_commands
 from mcp_agent.human_input.types import (
     HumanInputRequest,
     HumanInputResponse,
@@ -13,6 +12,7 @@ from mcp_agent.progress_display import progress_display
 
 async def console_input_callback(request: HumanInputRequest) -> HumanInputResponse:
     """Request input from a human user via console using prompt_toolkit."""
+    from mcp_agent.core.enhanced_prompt import get_enhanced_input, handle_special_commands
 
     # Prepare the prompt text
     prompt_text = request.prompt
@@ -1,7 +1,15 @@
+import asyncio
+import json
+import time
+import uuid
 from abc import abstractmethod
+from contextlib import asynccontextmanager
+from dataclasses import asdict
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
+    Callable,
     Generic,
     List,
     Optional,
@@ -18,21 +26,41 @@ from mcp.types import (
     PromptMessage,
     TextContent,
 )
-from pydantic_core import from_json
+from opentelemetry.trace import SpanKind
+from pydantic import BaseModel
 from rich.text import Text
 
 from mcp_agent.context_dependent import ContextDependent
-from mcp_agent.core.exceptions import PromptExitError
+from mcp_agent.core.exceptions import ContextWindowExceededError, PromptExitError
 from mcp_agent.core.prompt import Prompt
 from mcp_agent.core.request_params import RequestParams
 from mcp_agent.event_progress import ProgressAction
-from mcp_agent.llm.memory import Memory, SimpleMemory
+from mcp_agent.llm.conversation_scope import ConversationState, current_conversation_scope
+from mcp_agent.llm.memory import (
+    Memory,
+    MemoryPolicy,
+    MemoryReport,
+    SimpleMemory,
+    Summarizer,
+    format_transcript,
+)
+from mcp_agent.llm.response_cache import ResponseCache, request_key
 from mcp_agent.llm.sampling_format_converter import (
     BasicFormatConverter,
     ProviderFormatConverter,
 )
+from mcp_agent.llm.structured_output import parse_structured, repair_prompt
+from mcp_agent.llm.token_counter import TokenCounter, Tokenizer, get_token_counter
+from mcp_agent.llm.usage_ledger import TokenUsage, UsageLedger, UsageRecord
 from mcp_agent.logging.logger import get_logger
-from mcp_agent.mcp.helpers.content_helpers import get_text
+from mcp_agent.logging.metrics import (
+    agent_turns,
+    llm_request_duration,
+    response_cache_lookups,
+    structured_outputs,
+)
+from mcp_agent.logging.profiler import profile_phase
+from mcp_agent.logging.tracing import record_error, set_usage_attributes, tracer
 from mcp_agent.mcp.interfaces import (
     AugmentedLLMProtocol,
     ModelT,
@@ -49,12 +77,20 @@ MessageT = TypeVar("MessageT")
 # Forward reference for type annotations
 if TYPE_CHECKING:
     from mcp_agent.agents.agent import Agent
+    from mcp_agent.config import RateLimitSettings
     from mcp_agent.context import Context
+    from mcp_agent.llm.model_factory import ModelCapabilities
+    from mcp_agent.mcp.session_store import SessionStore
 
 
 # TODO -- move this to a constant
 HUMAN_INPUT_TOOL_NAME = "__human_input__"
 
+SUMMARY_INSTRUCTION = (
+    "Summarize the conversation below for use as context in a continuing conversation. "
+    "Keep facts, decisions, tool results and open questions. Be concise."
+)
+
 
 class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT, MessageT]):
     """
@@ -66,6 +102,12 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
 
     provider: str | None = None
 
+    # Providers that constrain responses to a JSON schema override _structured_provider_specific
+    native_structured_output: bool = False
+
+    # Further requests made when a structured response fails validation
+    structured_repair_attempts: int = 1
+
     def __init__(
         self,
         agent: Optional["Agent"] = None,
@@ -105,10 +147,7 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
         self.name = agent.name if agent else name
         self.instruction = agent.instruction if agent else instruction
 
-        # memory contains provider specific API types.
-        self.history: Memory[MessageParamT] = SimpleMemory[MessageParamT]()
-
-        self._message_history: List[PromptMessageMultipart] = []
+        self._summary_llm: AugmentedLLMProtocol | None = None
 
         # Initialize the display component
         self.display = ConsoleDisplay(config=self.context.config)
@@ -126,6 +165,12 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
                 self.default_request_params, self._init_request_params
             )
 
+        # The conversation used outside of any conversation scope.
+        # Its memory contains provider specific API types.
+        self._conversation: ConversationState[MessageParamT] = ConversationState(
+            history=SimpleMemory[MessageParamT](token_counter=self.token_counter)
+        )
+
         self.type_converter = type_converter
         self.verb = kwargs.get("verb")
 
@@ -139,25 +184,147 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
             use_history=True,
         )
 
+    @property
+    def _conversation_state(self) -> ConversationState[MessageParamT]:
+        """The conversation for the current conversation scope, or the LLM's own"""
+        scope = current_conversation_scope()
+        if scope is None:
+            return self._conversation
+        return scope.state(self, self._new_conversation_state)
+
+    def _new_conversation_state(self) -> ConversationState[MessageParamT]:
+        """Start a scoped conversation, keeping any prompts applied to this LLM"""
+        history = SimpleMemory[MessageParamT](token_counter=self.token_counter)
+        history.extend(self._conversation.history.get(include_history=False), is_prompt=True)
+        return ConversationState(history=history)
+
+    @property
+    def history(self) -> Memory[MessageParamT]:
+        """Provider messages for the current conversation"""
+        return self._conversation_state.history
+
+    @history.setter
+    def history(self, history: Memory[MessageParamT]) -> None:
+        self._conversation_state.history = history
+
+    @property
+    def _message_history(self) -> List[PromptMessageMultipart]:
+        return self._conversation_state.messages
+
+    @_message_history.setter
+    def _message_history(self, messages: List[PromptMessageMultipart]) -> None:
+        self._conversation_state.messages = messages
+
+    @property
+    def session_id(self) -> str | None:
+        """ID of the session this conversation is saved to, when a session store is configured"""
+        return self._conversation_state.session_id
+
+    @session_id.setter
+    def session_id(self, session_id: str | None) -> None:
+        self._conversation_state.session_id = session_id
+
+    @property
+    def memory_report(self) -> MemoryReport | None:
+        """Token estimates for the history sent with the conversation's latest request"""
+        return self._conversation_state.memory_report
+
+    @memory_report.setter
+    def memory_report(self, report: MemoryReport | None) -> None:
+        self._conversation_state.memory_report = report
+
     async def structured(
         self,
         prompt: List[PromptMessageMultipart],
         model: Type[ModelT],
         request_params: RequestParams | None = None,
     ) -> Tuple[ModelT | None, PromptMessageMultipart]:
-        """Apply the prompt and return the result as a Pydantic model, or None if coercion fails"""
-        try:
-            result: PromptMessageMultipart = await self.generate(prompt, request_params)
-            final_generation = get_text(result.content[-1]) or ""
-            await self.show_assistant_message(final_generation)
-            json_data = from_json(final_generation, allow_partial=True)
-            validated_model = model.model_validate(json_data)
+        """
+        Apply the prompt and return the result as a Pydantic model, or None if coercion fails.
+        A response that does not validate is sent back to the model with the validation error,
+        up to structured_repair_attempts times.
+        """
+        attributes = {
+            "provider": self.provider or type(self).__name__,
+            "mode": "native" if self.native_structured_output else "text",
+        }
+        use_history = self.get_request_params(request_params).use_history
+        messages = prompt
+        for attempt in range(self.structured_repair_attempts + 1):
+            try:
+                response = await self._generate_structured(messages, model, request_params)
+            except Exception as e:
+                error = e
+                break
+            try:
+                result = parse_structured(response.all_text(), model)
+            except ValueError as e:
+                error = e
+            else:
+                outcome = "parsed" if attempt == 0 else "repaired"
+                structured_outputs.add(1, {**attributes, "outcome": outcome})
+                return result, response
 
-            return cast("ModelT", validated_model), Prompt.assistant(json_data)
-        except Exception as e:
-            logger = get_logger(__name__)
-            logger.error(f"Failed to parse structured response: {str(e)}")
-            return None, Prompt.assistant(f"Failed to parse structured response: {str(e)}")
+            self.logger.warning(
+                f"Structured response for {model.__name__} failed validation",
+                data={"agent_name": self.name, "attempt": attempt + 1, "error": str(error)},
+            )
+            # Without history, the repair request has to include the failed exchange
+            messages = [repair_prompt(error)]
+            if not use_history:
+                messages = [*prompt, response, *messages]
+
+        structured_outputs.add(1, {**attributes, "outcome": "failed"})
+        logger = get_logger(__name__)
+        logger.error(f"Failed to parse structured response: {str(error)}")
+        return None, Prompt.assistant(f"Failed to parse structured response: {str(error)}")
+
+    async def _generate_structured(
+        self,
+        prompt: List[PromptMessageMultipart],
+        model: Type[ModelT],
+        request_params: RequestParams | None = None,
+    ) -> PromptMessageMultipart:
+        """
+        Generate a response to be parsed as the model. Providers with native structured
+        output constrain the response to the model's schema, otherwise it is requested as
+        ordinary text.
+        """
+        if not self.native_structured_output:
+            result = await self.generate(prompt, request_params)
+            await self.show_assistant_message(result.all_text())
+            return result
+
+        async with self._generation(prompt, request_params):
+            return await self._structured_provider_specific(prompt, model, request_params)
+
+    async def _structured_provider_specific(
+        self,
+        prompt: List[PromptMessageMultipart],
+        model: Type[ModelT],
+        request_params: RequestParams | None = None,
+    ) -> PromptMessageMultipart:
+        """
+        Request a response constrained to the model's schema, recording the exchange in the
+        conversation. Implemented by providers with native structured output; otherwise the
+        response is requested as ordinary text.
+        """
+        result = await self._generate_text(prompt, request_params)
+        await self.show_assistant_message(result.all_text())
+        return result
+
+    async def _add_structured_exchange(
+        self,
+        prompt: List[PromptMessageMultipart],
+        converted: List[MessageParamT],
+        response: PromptMessageMultipart,
+        params: RequestParams,
+    ) -> None:
+        """Record a structured request and its response in the conversation, as generate does"""
+        self._message_history.extend([*prompt, response])
+        if params.use_history:
+            self.history.extend([*converted, self._convert_to_provider(response)])
+        await self._save_to_session([*prompt, response])
 
     async def generate(
         self,
@@ -178,21 +345,504 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
             )
             return Prompt.assistant(f"History saved to {filename}")
 
+        async with self._generation(multipart_messages, request_params):
+            return await self._generate_text(multipart_messages, request_params)
+
+    async def _generate_text(
+        self,
+        multipart_messages: List[PromptMessageMultipart],
+        request_params: RequestParams | None = None,
+    ) -> PromptMessageMultipart:
+        """Send the messages and record the exchange, once the pre-send steps have run"""
         self._message_history.extend(multipart_messages)
+        with profile_phase(self.provider or type(self).__name__, "provider"):
+            assistant_response: PromptMessageMultipart = await self._apply_prompt_provider_specific(
+                multipart_messages, request_params
+            )
 
-        if multipart_messages[-1].role == "user":
-            self.show_user_message(
-                render_multipart_message(multipart_messages[-1]),
-                model=self.default_request_params.model,
-                chat_turn=self.chat_turn(),
+        self._message_history.append(assistant_response)
+        with profile_phase("save_session", "llm"):
+            await self._save_to_session([*multipart_messages, assistant_response])
+        return assistant_response
+
+    @asynccontextmanager
+    async def _generation(
+        self,
+        multipart_messages: List[PromptMessageMultipart],
+        request_params: RequestParams | None = None,
+    ) -> AsyncIterator[None]:
+        """
+        Trace and profile a generation, count the agent turn, show the user's message and
+        apply the memory policy to the history before the request is prepared. Shared by
+        generate and native structured output.
+        """
+        model = self.default_request_params.model
+        with (
+            tracer.start_as_current_span(
+                f"generate {self.name}",
+                attributes={
+                    "agent.name": self.name or "",
+                    "gen_ai.request.model": model or "",
+                    "mcp_agent.message_count": len(multipart_messages),
+                },
+            ) as span,
+            profile_phase("generate", "llm", agent=self.name, model=model),
+        ):
+            span.set_attribute("mcp_agent.chat_turn", self.chat_turn())
+            agent_turns.add(1, {"agent": self.name or ""})
+
+            if multipart_messages[-1].role == "user":
+                self.show_user_message(
+                    render_multipart_message(multipart_messages[-1]),
+                    model=model,
+                    chat_turn=self.chat_turn(),
+                )
+
+            with profile_phase("memory", "llm"):
+                await self._apply_memory_policy(request_params)
+            yield
+
+    def clear_history(self) -> None:
+        """Clear the conversation history, including any applied prompt messages"""
+        self.history.clear(clear_prompts=True)
+        self._message_history = []
+
+    def snapshot_conversation(self) -> Callable[[], None]:
+        """Capture the current conversation, returning a function that restores it"""
+        state = self._conversation_state
+        prompts = len(state.history.get(include_history=False))
+        history = state.history.get()[prompts:]
+        messages = list(state.messages)
+
+        def restore() -> None:
+            state.history.set(history)
+            state.messages = list(messages)
+
+        return restore
+
+    def replay_exchange(
+        self, prompt: List[PromptMessageMultipart], response: PromptMessageMultipart
+    ) -> None:
+        """
+        Add an exchange recorded elsewhere, such as in a workflow checkpoint, to the
+        conversation without sending it, so later requests see the same history.
+        """
+        self._message_history.extend([*prompt, response])
+        if not self.default_request_params.use_history:
+            return
+        try:
+            converted = [self._convert_to_provider(message) for message in [*prompt, response]]
+        except NotImplementedError:
+            return
+        self.history.extend(converted)
+
+    async def _apply_memory_policy(self, request_params: RequestParams | None = None) -> None:
+        """Apply the configured memory policy to the history before a request is sent"""
+        params = self.get_request_params(request_params)
+        if not params.use_history:
+            return
+
+        policy = params.memory or MemoryPolicy()
+        self.memory_report = await self.history.apply_policy(
+            policy, self._memory_summarizer(policy)
+        )
+        self.logger.debug(
+            "Conversation memory",
+            data={
+                "agent_name": self.name,
+                "chat_turn": self.chat_turn(),
+                "strategy": policy.strategy,
+                **asdict(self.memory_report),
+            },
+        )
+
+    def _memory_summarizer(self, policy: MemoryPolicy) -> Summarizer | None:
+        if policy.strategy != "summarize":
+            return None
+
+        async def summarizer(messages: List[Any]) -> str | None:
+            return await self._summarize_history(messages, policy.summary_model)
+
+        return summarizer
+
+    @property
+    def token_counter(self) -> TokenCounter:
+        """The token counter for this LLM's provider and model"""
+        return get_token_counter(
+            type(self).__name__, self.default_request_params.model, self._create_tokenizer
+        )
+
+    def _create_tokenizer(self) -> Tokenizer | None:
+        """
+        Create an offline tokenizer for the current model, or return None to estimate
+        tokens from character counts. Override in provider classes that have a tokenizer.
+        """
+        return None
+
+    @property
+    def model_capabilities(self) -> Optional["ModelCapabilities"]:
+        """Context window and output limits for the current model, if known"""
+        from mcp_agent.llm.model_factory import ModelFactory
+
+        return ModelFactory.get_capabilities(self.default_request_params.model)
+
+    def _count_request_overhead(self, system_prompt: str | None, tools: Any) -> int:
+        """Estimate the tokens used by the system prompt and tool definitions of a request"""
+        counter = self.token_counter
+        tokens = int(counter.count_text(system_prompt)) if system_prompt else 0
+        if tools:
+            tokens += int(counter.count_text(json.dumps(tools, default=str)))
+        return tokens
+
+    async def _fit_context_window(
+        self,
+        messages: List[MessageParamT],
+        pinned: int,
+        overhead_tokens: int,
+        params: RequestParams,
+    ) -> Tuple[List[MessageParamT], int]:
+        """
+        Check the estimated size of a request against the model's context window before
+        it is sent. Oversized conversations are trimmed with the memory policy (using the
+        "window" strategy if the policy is unbounded) rather than failing at the provider.
+
+        Args:
+            messages: The messages about to be sent
+            pinned: The number of leading messages (system and prompt messages) to keep
+            overhead_tokens: Estimated tokens for the system prompt and tools
+            params: The request parameters
+
+        Returns:
+            The messages to send, and the unscaled token estimate for the request
+
+        Raises:
+            ContextWindowExceededError: If the request is still too large after trimming
+        """
+        estimate = overhead_tokens + self.history.count_tokens(messages)
+
+        capabilities = self.model_capabilities
+        if capabilities is None:
+            return messages, estimate
+
+        reserved = min(params.maxTokens or 0, capabilities.max_output_tokens)
+        budget = capabilities.context_window - reserved
+        counter = self.token_counter
+        if counter.scaled(estimate) <= budget:
+            return messages, estimate
+
+        policy = params.memory or MemoryPolicy()
+        memory = SimpleMemory[MessageParamT](token_counter=counter)
+        memory.set(messages[:pinned], is_prompt=True)
+        memory.set(messages[pinned:])
+        report = await memory.apply_policy(
+            policy.model_copy(
+                update={
+                    "strategy": "window" if policy.strategy == "unbounded" else policy.strategy,
+                    "max_tokens": counter.unscaled(budget) - overhead_tokens,
+                }
+            ),
+            self._memory_summarizer(policy),
+        )
+        self.logger.info(
+            "Trimmed conversation to fit the context window",
+            data={
+                "agent_name": self.name,
+                "model": self.default_request_params.model,
+                "estimated_tokens": counter.scaled(estimate),
+                "budget": budget,
+                **asdict(report),
+            },
+        )
+        self.memory_report = report
+
+        estimate = overhead_tokens + report.estimated_tokens
+        if counter.scaled(estimate) > budget:
+            raise ContextWindowExceededError(
+                f"Request is too large for {self.default_request_params.model}",
+                f"The request is estimated at {counter.scaled(estimate)} tokens, but the model "
+                f"accepts {budget} input tokens ({capabilities.context_window} token context "
+                f"window, less {reserved} reserved for the response).",
             )
+        return memory.get(), estimate
 
-        assistant_response: PromptMessageMultipart = await self._apply_prompt_provider_specific(
-            multipart_messages, request_params
+    def _rate_limit_settings(self) -> Optional["RateLimitSettings"]:
+        """Rate limit settings for this LLM's provider. Overridden by provider classes."""
+        return None
+
+    async def _execute_request(
+        self,
+        request: Callable[..., Any],
+        arguments: dict[str, Any],
+        params: RequestParams,
+        api_key: str | None = None,
+        token_estimate: int | None = None,
+    ) -> Any:
+        """
+        Send a request to the provider with the executor, within the rate limits shared by
+        every LLM using the same provider, API key and model. Rate limited and overloaded
+        requests are retried. If a response cache is configured, identical requests are
+        answered from the cache. Requests sent to the provider are recorded in the usage
+        ledger; cached responses cost nothing, so are not.
+
+        Args:
+            token_estimate: Unscaled input token estimate, used to reserve rate limit
+                            budget and calibrated against the usage the provider reports
+
+        Returns:
+            The response, or the exception if the request failed
+
+        Raises:
+            ResponseCacheMissError: If the response cache is in replay mode and the request
+                                    was not recorded
+        """
+        model = self.default_request_params.model or ""
+        provider = (self.provider or type(self).__name__).lower()
+        cache = self._response_cache
+        cache_key = request_key(provider, request, arguments) if cache is not None else None
+        with (
+            tracer.start_as_current_span(
+                f"chat {model}",
+                kind=SpanKind.CLIENT,
+                attributes={
+                    "gen_ai.operation.name": "chat",
+                    "gen_ai.system": provider,
+                    "gen_ai.request.model": model,
+                    "gen_ai.request.max_tokens": params.maxTokens or 0,
+                },
+            ) as span,
+            profile_phase("request", "http", model=model),
+        ):
+            if cache_key is not None and cache.reads_responses:
+                cached = await asyncio.to_thread(cache.get, cache_key)
+                outcome = "hit" if cached is not None else "miss"
+                response_cache_lookups.add(1, {"provider": provider, "outcome": outcome})
+                span.set_attribute("fast_agent.response_cache.hit", cached is not None)
+                if cached is not None:
+                    set_usage_attributes(span, getattr(cached, "usage", None))
+                    return cached
+
+            started = time.perf_counter()
+            response = await self._send_request(request, arguments, params, api_key, token_estimate)
+            latency = time.perf_counter() - started
+            failed = isinstance(response, BaseException)
+            llm_request_duration.record(
+                latency, {"provider": provider, "model": model, "error": failed}
+            )
+            if failed:
+                record_error(span, response)
+                self._record_llm_call(latency, error=True)
+                return response
+            set_usage_attributes(span, getattr(response, "usage", None))
+            usage = self._response_usage(response)
+            if usage is not None and token_estimate is not None:
+                self.token_counter.calibrate(token_estimate, usage.input_tokens)
+            self._record_llm_call(latency, **asdict(usage or TokenUsage()))
+            cacheable = cache_key is not None and isinstance(response, BaseModel)
+            if cacheable and cache.writes_responses:
+                try:
+                    await asyncio.to_thread(cache.put, cache_key, response, provider, model)
+                except Exception as e:
+                    self.logger.warning(f"Unable to cache response: {e}")
+            return response
+
+    async def _send_request(
+        self,
+        request: Callable[..., Any],
+        arguments: dict[str, Any],
+        params: RequestParams,
+        api_key: str | None,
+        token_estimate: int | None,
+    ) -> Any:
+        async def send() -> Any:
+            result = (await self.executor.execute(request, **arguments))[0]
+            if isinstance(result, BaseException):
+                raise result
+            return result
+
+        rate_limiter = getattr(self.context, "rate_limiter", None)
+        if rate_limiter is None:
+            return (await self.executor.execute(request, **arguments))[0]
+
+        limiter = rate_limiter.limiter(
+            self.provider or type(self).__name__,
+            api_key,
+            self.default_request_params.model,
+            self._rate_limit_settings(),
         )
+        tokens = self.token_counter.scaled(token_estimate or 0) + (params.maxTokens or 0)
+        # Failed and cancelled requests use nothing, so their whole reservation is returned
+        used: int | None = 0
+        try:
+            response = await limiter.call(send, tokens=tokens, priority=params.priority)
+            usage = self._response_usage(response)
+            used = usage.total_tokens if usage is not None else None
+            return response
+        except Exception as e:
+            return e
+        finally:
+            limiter.settle(tokens, used)
 
-        self._message_history.append(assistant_response)
-        return assistant_response
+    def _client_retry_options(self) -> dict[str, Any]:
+        """
+        Retry options for provider SDK clients. The rate limiter retries requests when one
+        is configured, so the client must not; otherwise the SDK's own retries are kept.
+        """
+        if getattr(self.context, "rate_limiter", None) is None:
+            return {}
+        return {"max_retries": 0}
+
+    def _response_usage(self, response: Any) -> TokenUsage | None:
+        """
+        The token usage reported by a provider response, or None if it reports none.
+        Overridden by provider classes.
+        """
+        return None
+
+    @property
+    def _usage_ledger(self) -> UsageLedger | None:
+        return getattr(self.context, "usage_ledger", None)
+
+    @property
+    def _response_cache(self) -> ResponseCache | None:
+        return getattr(self.context, "response_cache", None)
+
+    def _record_llm_call(
+        self,
+        latency: float,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        error: bool = False,
+    ) -> None:
+        """
+        Record a provider call in the usage ledger. input_tokens includes cache read and
+        cache write tokens.
+        """
+
+        ledger = self._usage_ledger
+        if ledger is None:
+            return
+        capabilities = self.model_capabilities
+        cost = None
+        if capabilities is not None:
+            cost = capabilities.cost(
+                input_tokens, output_tokens, cache_read_tokens, cache_write_tokens
+            )
+        ledger.record(
+            UsageRecord(
+                kind="llm",
+                name=self.default_request_params.model or "unknown",
+                agent=self.name,
+                latency=latency,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cache_read_tokens=cache_read_tokens,
+                cache_write_tokens=cache_write_tokens,
+                cost=cost,
+                error=error,
+            )
+        )
+
+    async def _summarize_history(self, messages: List[Any], model: str | None) -> str | None:
+        """Summarize provider messages with a separate LLM, returning None on failure"""
+        transcript = format_transcript(messages)
+        try:
+            if self._summary_llm is None:
+                from mcp_agent.agents.agent import Agent, AgentConfig
+                from mcp_agent.llm.model_factory import ModelFactory
+
+                agent = Agent(
+                    config=AgentConfig(
+                        name=f"{self.name or 'agent'}_memory",
+                        instruction=SUMMARY_INSTRUCTION,
+                        servers=[],
+                        use_history=False,
+                    ),
+                    context=self.context,
+                    connection_persistence=False,
+                )
+                factory = ModelFactory.create_factory(model or self.default_request_params.model)
+                self._summary_llm = factory(agent=agent)
+                agent._llm = self._summary_llm
+
+            result = await self._summary_llm.generate(
+                [Prompt.user(transcript)], RequestParams(use_history=False)
+            )
+            return result.all_text() or None
+        except Exception as e:
+            self.logger.warning(f"Unable to summarize conversation history: {e}")
+            return None
+
+    @property
+    def _session_store(self) -> Optional["SessionStore"]:
+        return getattr(self.context, "session_store", None)
+
+    async def _save_to_session(self, messages: List[PromptMessageMultipart]) -> None:
+        """Append messages to the session store, if one is configured"""
+        store = self._session_store
+        if store is None:
+            return
+        if self.session_id is None:
+            self.session_id = f"{self.name or 'agent'}-{uuid.uuid4().hex[:12]}"
+        try:
+            await asyncio.to_thread(store.append, self.session_id, messages)
+        except Exception as e:
+            self.logger.warning(f"Unable to save session {self.session_id}: {e}")
+
+    async def resume_session(self, session_id: str, max_messages: int | None = None) -> int:
+        """
+        Replace the conversation history with a session from the session store.
+        New turns are appended to the same session.
+
+        Args:
+            session_id: The session to resume
+            max_messages: Only load this many of the most recent messages. Older messages
+                          remain available from the store.
+
+        Returns:
+            The number of messages restored
+        """
+        store = self._session_store
+        if store is None:
+            raise ValueError("Session storage is not enabled (session_store.enabled)")
+
+        start = -max_messages if max_messages else 0
+        messages = await asyncio.to_thread(store.load, session_id, start)
+        # Conversations must start with a user message
+        while messages and messages[0].role != "user":
+            messages.pop(0)
+
+        try:
+            converted = [self._convert_to_provider(message) for message in messages]
+        except NotImplementedError:
+            converted = []
+
+        self.history.set(converted)
+        self._message_history = messages
+        self.session_id = session_id
+        return len(messages)
+
+    def _convert_to_provider(self, message: PromptMessageMultipart) -> MessageParamT:
+        """
+        Convert a message to this LLM's provider format.
+        To be implemented by LLM classes that keep provider history.
+        """
+        raise NotImplementedError("Must be implemented by subclass")
+
+    def _convert_cached(
+        self,
+        message: PromptMessageMultipart,
+        convert: Callable[[PromptMessageMultipart], MessageParamT],
+    ) -> MessageParamT:
+        """
+        Convert a message to this provider's format, reusing the conversion cached on the
+        message. Cached conversions are invalidated when the model changes.
+        """
+        with profile_phase("convert", "convert"):
+            return message.converted(
+                self.provider or type(self).__name__, convert, self.default_request_params.model
+            )
 
     def chat_turn(self) -> int:
         """Return the current chat turn number"""
@@ -315,7 +965,19 @@ class AugmentedLLM(ContextDependent, AugmentedLLMProtocol, Generic[MessageParamT
 
             tool_name = request.params.name
             tool_args = request.params.arguments
+            started = time.perf_counter()
             result = await self.aggregator.call_tool(tool_name, tool_args)
+            ledger = self._usage_ledger
+            if ledger is not None:
+                ledger.record(
+                    UsageRecord(
+                        kind="tool",
+                        name=tool_name,
+                        agent=self.name,
+                        latency=time.perf_counter() - started,
+                        error=bool(result.isError),
+                    )
+                )
 
             postprocess = await self.post_tool_call(
                 tool_call_id=tool_call_id, request=request, result=result
@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, Iterable, Iterator, List
 
 from mcp_agent.core.prompt import Prompt
 from mcp_agent.llm.augmented_llm import RequestParams
@@ -18,6 +18,9 @@ class PlaybackLLM(PassthroughLLM):
     After apply_prompts has been called, each call to generate_str returns the next
     "ASSISTANT" message in the loaded messages. If no messages are set or all messages have
     been played back, it returns a message indicating that messages are exhausted.
+
+    Large recordings can be played back without loading them into memory by passing an
+    iterator (e.g. from iter_prompt_multipart) to load_messages.
     """
 
     def __init__(self, name: str = "Playback", **kwargs: dict[str, Any]) -> None:
@@ -25,6 +28,33 @@ class PlaybackLLM(PassthroughLLM):
         self._messages: List[PromptMessageMultipart] = []
         self._current_index = -1
         self._overage = -1
+        # Streamed messages, consumed as playback reaches them
+        self._pending: Iterator[PromptMessageMultipart] | None = None
+        self._streamed = 0
+
+    def load_messages(self, messages: Iterable[PromptMessageMultipart]) -> None:
+        """
+        Load messages for playback. Messages are consumed lazily, one at a time,
+        so a generator over a large recording is never materialized.
+        """
+        self._messages = []
+        self._pending = iter(messages)
+        self._streamed = 0
+        self._current_index = 0
+        self._overage = -1
+
+    def _next_message(self) -> PromptMessageMultipart | None:
+        if self._current_index < len(self._messages):
+            message = self._messages[self._current_index]
+            self._current_index += 1
+            return message
+        if self._pending is not None:
+            message = next(self._pending, None)
+            if message is not None:
+                self._streamed += 1
+                return message
+            self._pending = None
+        return None
 
     def _get_next_assistant_message(self) -> PromptMessageMultipart:
         """
@@ -32,17 +62,16 @@ class PlaybackLLM(PassthroughLLM):
         Increments the current message index and skips user messages.
         """
         # Find next assistant message
-        while self._current_index < len(self._messages):
-            message = self._messages[self._current_index]
-            self._current_index += 1
-            if "assistant" != message.role:
-                continue
-
-            return message
+        message = self._next_message()
+        while message is not None:
+            if "assistant" == message.role:
+                return message
+            message = self._next_message()
 
         self._overage += 1
         return Prompt.assistant(
-            f"MESSAGES EXHAUSTED (list size {len(self._messages)}) ({self._overage} overage)"
+            f"MESSAGES EXHAUSTED (list size {len(self._messages) + self._streamed}) "
+            f"({self._overage} overage)"
         )
 
     async def generate(
@@ -0,0 +1,81 @@
+"""
+Separate conversations for LLMs shared between concurrent callers.
+
+An LLM normally holds a single conversation. Within `conversation_scope(scope)`, every
+LLM instead reads and writes a conversation kept in the scope, so one agent - and the
+agents it delegates to - can hold an isolated conversation for each caller, such as
+each client of an MCP server. The scope is carried in a ContextVar, so concurrent
+tasks using different scopes do not interfere.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Generic, Iterator, List, TypeVar
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from mcp_agent.llm.memory import Memory, MemoryReport
+    from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+
+MessageParamT = TypeVar("MessageParamT")
+
+
+@dataclass
+class ConversationState(Generic[MessageParamT]):
+    """The conversation held by an LLM"""
+
+    history: "Memory[MessageParamT]"
+    """Provider messages sent with each request"""
+
+    messages: List["PromptMessageMultipart"] = field(default_factory=list)
+    """The conversation as multipart messages"""
+
+    session_id: str | None = None
+    """The session store session this conversation is saved to"""
+
+    memory_report: "MemoryReport | None" = None
+    """Token estimates for the history sent with the latest request"""
+
+
+class ConversationScope:
+    """Holds a separate ConversationState for each LLM used within the scope"""
+
+    def __init__(self, name: str | None = None) -> None:
+        self.name = name
+        self._states: WeakKeyDictionary[Any, ConversationState] = WeakKeyDictionary()
+
+    def state(self, owner: Any, factory: Callable[[], ConversationState]) -> ConversationState:
+        """Return the conversation for an LLM, creating it with factory on first use"""
+        state = self._states.get(owner)
+        if state is None:
+            state = factory()
+            self._states[owner] = state
+        return state
+
+    def clear(self) -> None:
+        """Discard every conversation held by the scope"""
+        self._states.clear()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+_current_scope: ContextVar[ConversationScope | None] = ContextVar(
+    "conversation_scope", default=None
+)
+
+
+def current_conversation_scope() -> ConversationScope | None:
+    """The conversation scope for the current task, if any"""
+    return _current_scope.get()
+
+
+@contextmanager
+def conversation_scope(scope: ConversationScope) -> Iterator[ConversationScope]:
+    """Use the conversations held by `scope` for every LLM called within this block"""
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
@@ -1,8 +1,59 @@
-from typing import Generic, List, Protocol, TypeVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Literal, Protocol, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+from mcp_agent.llm.token_counter import TokenCounter
 
 # Define our own type variable for implementation use
 MessageParamT = TypeVar("MessageParamT")
 
+DROPPED_TOOL_RESULT = "[tool result removed from history]"
+SUMMARY_PREFIX = "Summary of the earlier conversation:\n"
+# Pairs the summary with a reply, so the history still alternates user and assistant turns
+SUMMARY_ACKNOWLEDGEMENT = "Understood. I will continue from that summary."
+
+# Character-based estimates, used when no provider-specific counter is supplied
+_DEFAULT_COUNTER = TokenCounter()
+
+
+class MemoryPolicy(BaseModel):
+    """
+    Limits applied to the conversation history before each request.
+
+    strategy:
+        "unbounded" keeps the full history (the default)
+        "window" drops the oldest turns once the history exceeds max_tokens
+        "summarize" replaces the oldest summarize_turns turns with a summary from
+        summary_model, then drops turns if the history is still over budget
+    """
+
+    strategy: Literal["unbounded", "window", "summarize"] = "unbounded"
+    max_tokens: int | None = None
+    """Estimated token budget for prompt messages plus history."""
+
+    tool_result_turns: int | None = None
+    """Tool results older than this many turns are dropped. None pins all tool results."""
+
+    summarize_turns: int = 4
+    summary_model: str | None = None
+    """Model used for summaries. Defaults to the agent's own model."""
+
+
+@dataclass
+class MemoryReport:
+    """Token estimates for the history sent with a request, and what the policy removed"""
+
+    messages: int
+    estimated_tokens: int
+    dropped_messages: int = 0
+    summarized_messages: int = 0
+    dropped_tool_results: int = 0
+
+
+# Summarizes a list of messages, returning None if no summary could be produced
+Summarizer = Callable[[List[Any]], Awaitable[str | None]]
+
 
 class Memory(Protocol, Generic[MessageParamT]):
     """
@@ -23,6 +74,14 @@ class Memory(Protocol, Generic[MessageParamT]):
 
     def clear(self, clear_prompts: bool = False) -> None: ...
 
+    def estimate_tokens(self, include_history: bool = True) -> int: ...
+
+    def count_tokens(self, messages: List[MessageParamT]) -> int: ...
+
+    async def apply_policy(
+        self, policy: MemoryPolicy, summarizer: Summarizer | None = None
+    ) -> MemoryReport: ...
+
 
 class SimpleMemory(Memory, Generic[MessageParamT]):
     """
@@ -32,9 +91,16 @@ class SimpleMemory(Memory, Generic[MessageParamT]):
     generated conversation history (which is included based on use_history setting).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, token_counter: TokenCounter | None = None) -> None:
+        """
+        Args:
+            token_counter: Counts the tokens in a message. Defaults to a character-based estimate.
+        """
         self.history: List[MessageParamT] = []
         self.prompt_messages: List[MessageParamT] = []  # Always included
+        self.token_counter = token_counter or _DEFAULT_COUNTER
+        # Token estimates by message id; the message is held so the id stays valid
+        self._token_cache: Dict[int, Tuple[MessageParamT, int]] = {}
 
     def extend(self, messages: List[MessageParamT], is_prompt: bool = False) -> None:
         """
@@ -61,6 +127,7 @@ class SimpleMemory(Memory, Generic[MessageParamT]):
             self.prompt_messages = messages.copy()
         else:
             self.history = messages.copy()
+        self._prune_token_cache()
 
     def append(self, message: MessageParamT, is_prompt: bool = False) -> None:
         """
@@ -101,3 +168,200 @@ class SimpleMemory(Memory, Generic[MessageParamT]):
         self.history = []
         if clear_prompts:
             self.prompt_messages = []
+        self._prune_token_cache()
+
+    def estimate_tokens(self, include_history: bool = True) -> int:
+        """
+        Estimate the number of tokens in memory.
+
+        Args:
+            include_history: If True, include regular history messages
+        """
+        messages = self.prompt_messages + self.history if include_history else self.prompt_messages
+        return self.count_tokens(messages)
+
+    def count_tokens(self, messages: List[MessageParamT]) -> int:
+        """
+        Estimate the number of tokens in a list of messages. Counts are cached, so
+        messages already in memory are not counted again.
+        """
+        return sum(self._message_tokens(message) for message in messages)
+
+    async def apply_policy(
+        self, policy: MemoryPolicy, summarizer: Summarizer | None = None
+    ) -> MemoryReport:
+        """
+        Apply a memory policy to the history. Prompt messages are never removed.
+
+        Turns (a user message and the responses, tool calls and tool results that
+        follow it) are removed whole so that tool use and tool result messages stay paired.
+        The most recent turn is always kept.
+
+        Args:
+            policy: The policy to apply
+            summarizer: Produces a summary of the oldest turns for the "summarize" strategy
+
+        Returns:
+            A report of the remaining history size and what was removed
+        """
+        report = MemoryReport(messages=0, estimated_tokens=0)
+        turns = split_turns(self.history)
+
+        if policy.tool_result_turns is not None and len(turns) > policy.tool_result_turns:
+            for turn in turns[: len(turns) - policy.tool_result_turns]:
+                for i, message in enumerate(turn):
+                    dropped = drop_tool_result(message)
+                    if dropped is not None:
+                        turn[i] = dropped
+                        report.dropped_tool_results += 1
+
+        if policy.strategy != "unbounded" and policy.max_tokens is not None:
+            budget = policy.max_tokens - self.estimate_tokens(include_history=False)
+            turn_tokens = [self._turn_tokens(turn) for turn in turns]
+
+            if policy.strategy == "summarize" and summarizer is not None:
+                count = min(policy.summarize_turns, len(turns) - 1)
+                if count > 0 and sum(turn_tokens) > budget:
+                    oldest = [message for turn in turns[:count] for message in turn]
+                    summary = await summarizer(oldest)
+                    if summary:
+                        summary_turn = [
+                            text_message("user", SUMMARY_PREFIX + summary),
+                            text_message("assistant", SUMMARY_ACKNOWLEDGEMENT),
+                        ]
+                        turns = [summary_turn] + turns[count:]
+                        turn_tokens = [self._turn_tokens(summary_turn)] + turn_tokens[count:]
+                        report.summarized_messages = len(oldest)
+
+            total = sum(turn_tokens)
+            while len(turns) > 1 and total > budget:
+                total -= turn_tokens.pop(0)
+                report.dropped_messages += len(turns.pop(0))
+
+        self.history = [message for turn in turns for message in turn]
+        self._prune_token_cache()
+
+        report.messages = len(self.prompt_messages) + len(self.history)
+        report.estimated_tokens = self.estimate_tokens()
+        return report
+
+    def _message_tokens(self, message: MessageParamT) -> int:
+        cached = self._token_cache.get(id(message))
+        if cached is not None and cached[0] is message:
+            return cached[1]
+        tokens = self.token_counter.count_message(message)
+        self._token_cache[id(message)] = (message, tokens)
+        return tokens
+
+    def _turn_tokens(self, turn: List[MessageParamT]) -> int:
+        return sum(self._message_tokens(message) for message in turn)
+
+    def _prune_token_cache(self) -> None:
+        current = {id(message) for message in self.prompt_messages + self.history}
+        self._token_cache = {
+            key: value for key, value in self._token_cache.items() if key in current
+        }
+
+
+def _field(value: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a provider message or content block, which may be a dict or object"""
+    if isinstance(value, dict):
+        return value.get(name, default)
+    return getattr(value, name, default)
+
+
+def estimate_tokens(message: Any) -> int:
+    """
+    Estimate the tokens in a provider message from its character count.
+    Inline images and other base64 data are counted as a fixed amount.
+    """
+    return _DEFAULT_COUNTER.count_message(message)
+
+
+def is_tool_result(message: Any) -> bool:
+    """True if the message carries tool results (an OpenAI tool message or Anthropic tool_result)"""
+    role = _field(message, "role")
+    if role == "tool":
+        return True
+    content = _field(message, "content")
+    if role != "user" or not isinstance(content, list):
+        return False
+    return any(_field(block, "type") == "tool_result" for block in content)
+
+
+def split_turns(messages: List[MessageParamT]) -> List[List[MessageParamT]]:
+    """
+    Split messages into turns. A turn starts at each user message that is not a tool result.
+    """
+    turns: List[List[MessageParamT]] = []
+    for message in messages:
+        if not turns or (_field(message, "role") == "user" and not is_tool_result(message)):
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+    return turns
+
+
+def drop_tool_result(message: Any) -> Any | None:
+    """
+    Return a copy of a tool result message with its content replaced by a placeholder,
+    or None if the message is not a tool result or has already been dropped.
+    """
+    if not isinstance(message, dict) or not is_tool_result(message):
+        return None
+
+    if message.get("role") == "tool":
+        if message.get("content") == DROPPED_TOOL_RESULT:
+            return None
+        return {**message, "content": DROPPED_TOOL_RESULT}
+
+    placeholder = [{"type": "text", "text": DROPPED_TOOL_RESULT}]
+    changed = False
+    content = []
+    for block in message["content"]:
+        if _field(block, "type") == "tool_result" and _field(block, "content") != placeholder:
+            block = {
+                "type": "tool_result",
+                "tool_use_id": _field(block, "tool_use_id"),
+                "content": placeholder,
+                "is_error": _field(block, "is_error", False),
+            }
+            changed = True
+        content.append(block)
+    return {**message, "content": content} if changed else None
+
+
+def message_text(message: Any) -> str:
+    """Extract readable text from a provider message, including tool calls and results"""
+    content = _field(message, "content")
+    parts: List[str] = []
+    if isinstance(content, str):
+        parts.append(content)
+    elif isinstance(content, list):
+        for block in content:
+            block_type = _field(block, "type")
+            if block_type == "text":
+                parts.append(_field(block, "text", ""))
+            elif block_type == "tool_use":
+                parts.append(f"[tool call: {_field(block, 'name')}({_field(block, 'input')})]")
+            elif block_type == "tool_result":
+                parts.append(f"[tool result: {message_text(block)}]")
+            elif block_type is not None:
+                parts.append(f"[{block_type}]")
+
+    for tool_call in _field(message, "tool_calls") or []:
+        function = _field(tool_call, "function")
+        parts.append(f"[tool call: {_field(function, 'name')}({_field(function, 'arguments')})]")
+    return "\n".join(part for part in parts if part)
+
+
+def format_transcript(messages: List[Any]) -> str:
+    """Format provider messages as a plain text transcript"""
+    return "\n\n".join(
+        f"{_field(message, 'role')}: {message_text(message)}" for message in messages
+    )
+
+
+def text_message(role: str, text: str) -> Dict[str, str]:
+    """Create a plain text message, accepted by both the Anthropic and OpenAI APIs"""
+    return {"role": role, "content": text}
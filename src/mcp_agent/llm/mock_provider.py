@@ -0,0 +1,502 @@
+"""
+Local stand-in for the Anthropic Messages and OpenAI Chat Completions APIs.
+
+Point anthropic.base_url, or openai.base_url / generic.base_url, at the server to
+exercise the real HTTP path offline: client pooling, rate limiting, retries and
+streaming. Responses are scripted, or echo the last message. Latency is sampled from a
+configurable distribution, and rate limited (429) and overloaded (529) responses can be
+injected at random or scripted.
+
+From tests:
+
+    async with MockProviderServer() as server:
+        server.add_responses(MockResponse(tool_calls=[MockToolCall(name="fetch")]))
+        settings = AnthropicSettings(api_key="test", base_url=server.anthropic_base_url)
+
+For load tests:
+
+    python -m mcp_agent.llm.mock_provider --port 8089 --latency 0.8 \\
+        --latency-distribution lognormal --latency-spread 0.4 --overloaded-rate 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+import uuid
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Literal, Tuple
+
+from aiohttp import web
+from pydantic import BaseModel, Field
+
+from mcp_agent.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Latency(BaseModel):
+    """Distribution of the delay before a response (or its first token, when streaming)"""
+
+    distribution: Literal["constant", "uniform", "normal", "lognormal", "exponential"] = "constant"
+    seconds: float = 0.0
+    """Mean delay"""
+
+    spread: float = 0.0
+    """Half-width for uniform, standard deviation for normal, and sigma for lognormal"""
+
+    def sample(self, rng: random.Random) -> float:
+        if self.distribution == "uniform":
+            value = rng.uniform(self.seconds - self.spread, self.seconds + self.spread)
+        elif self.distribution == "normal":
+            value = rng.gauss(self.seconds, self.spread)
+        elif self.distribution == "lognormal" and self.seconds > 0:
+            # Parameterised so that the mean is `seconds`
+            value = rng.lognormvariate(math.log(self.seconds) - self.spread**2 / 2, self.spread)
+        elif self.distribution == "exponential" and self.seconds > 0:
+            value = rng.expovariate(1 / self.seconds)
+        else:
+            value = self.seconds
+        return max(0.0, value)
+
+
+class MockToolCall(BaseModel):
+    """A tool call made by a scripted response"""
+
+    name: str
+    arguments: Dict[str, Any] = Field(default_factory=dict)
+
+
+class MockResponse(BaseModel):
+    """A scripted response. Responses are used in order, one per request."""
+
+    text: str | None = None
+    tool_calls: List[MockToolCall] = Field(default_factory=list)
+
+    status: int | None = None
+    """Reply with an error with this HTTP status instead, for example 429 or 529"""
+
+    retry_after: float | None = None
+    """retry-after header sent with an error"""
+
+    latency: float | None = None
+    """Delay before replying, instead of one sampled from the server's latency"""
+
+
+_ERROR_TYPES = {
+    400: "invalid_request_error",
+    401: "authentication_error",
+    429: "rate_limit_error",
+    500: "api_error",
+    529: "overloaded_error",
+}
+
+
+class MockProviderServer:
+    """
+    HTTP server implementing POST /v1/messages (Anthropic) and POST /v1/chat/completions
+    (OpenAI), with and without streaming. Requests received are kept in `requests`.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Latency | None = None,
+        token_interval: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        overloaded_rate: float = 0.0,
+        retry_after: float | None = 1.0,
+        responses: Iterable[MockResponse] = (),
+        seed: int | None = None,
+    ) -> None:
+        """
+        Args:
+            host: Interface to listen on
+            port: Port to listen on, or 0 for any free port
+            latency: Delay before each response, or before its first token when streaming
+            token_interval: Delay between streamed chunks, in seconds
+            rate_limit_rate: Fraction of requests rejected with 429
+            overloaded_rate: Fraction of requests rejected with 529
+            retry_after: retry-after header sent with injected errors
+            responses: Scripted responses. Once used up, responses echo the last message.
+            seed: Seed for latency sampling and error injection
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency or Latency()
+        self.token_interval = token_interval
+        self.rate_limit_rate = rate_limit_rate
+        self.overloaded_rate = overloaded_rate
+        self.retry_after = retry_after
+        self.requests: List[Dict[str, Any]] = []
+        self._responses: Deque[MockResponse] = deque(responses)
+        self._rng = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def anthropic_base_url(self) -> str:
+        return self.url
+
+    @property
+    def openai_base_url(self) -> str:
+        return f"{self.url}/v1"
+
+    def add_responses(self, *responses: MockResponse) -> None:
+        """Script the responses to the next requests"""
+        self._responses.extend(responses)
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/v1/messages", self._anthropic)
+        app.router.add_post("/v1/chat/completions", self._openai)
+        app.router.add_post("/chat/completions", self._openai)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        # Report the bound port, when started on port 0
+        self.port = self._runner.addresses[0][1]
+        logger.info(f"Mock provider listening at {self.url}")
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "MockProviderServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def _anthropic(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        self.requests.append({"api": "anthropic", "body": body})
+        response = self._next_response(_last_text(body.get("messages", [])))
+
+        error = await self._delay_or_error(response)
+        if error is not None:
+            status, retry_after = error
+            return web.json_response(
+                {
+                    "type": "error",
+                    "error": {
+                        "type": _ERROR_TYPES.get(status, "api_error"),
+                        "message": f"Mock provider returned {status}",
+                    },
+                },
+                status=status,
+                headers=_retry_headers(retry_after),
+            )
+
+        message_id = f"msg_{uuid.uuid4().hex[:24]}"
+        content: List[Dict[str, Any]] = []
+        if response.text or not response.tool_calls:
+            content.append({"type": "text", "text": response.text or ""})
+        for call in response.tool_calls:
+            content.append(
+                {
+                    "type": "tool_use",
+                    "id": f"toolu_{uuid.uuid4().hex[:24]}",
+                    "name": call.name,
+                    "input": call.arguments,
+                }
+            )
+        usage = {
+            "input_tokens": _estimate_tokens(body.get("messages")),
+            "output_tokens": _estimate_tokens(content),
+        }
+        stop_reason = "tool_use" if response.tool_calls else "end_turn"
+
+        if not body.get("stream"):
+            return web.json_response(
+                {
+                    "id": message_id,
+                    "type": "message",
+                    "role": "assistant",
+                    "model": body.get("model", "mock"),
+                    "content": content,
+                    "stop_reason": stop_reason,
+                    "stop_sequence": None,
+                    "usage": usage,
+                }
+            )
+
+        async def events() -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+            yield (
+                "message_start",
+                {
+                    "type": "message_start",
+                    "message": {
+                        "id": message_id,
+                        "type": "message",
+                        "role": "assistant",
+                        "model": body.get("model", "mock"),
+                        "content": [],
+                        "stop_reason": None,
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": usage["input_tokens"], "output_tokens": 0},
+                    },
+                },
+            )
+            for index, block in enumerate(content):
+                if block["type"] == "text":
+                    start = {"type": "text", "text": ""}
+                    deltas = [
+                        {"type": "text_delta", "text": chunk} for chunk in _chunks(block["text"])
+                    ]
+                else:
+                    start = {**block, "input": {}}
+                    deltas = [
+                        {"type": "input_json_delta", "partial_json": json.dumps(block["input"])}
+                    ]
+                yield (
+                    "content_block_start",
+                    {
+                        "type": "content_block_start",
+                        "index": index,
+                        "content_block": start,
+                    },
+                )
+                for delta in deltas:
+                    yield (
+                        "content_block_delta",
+                        {
+                            "type": "content_block_delta",
+                            "index": index,
+                            "delta": delta,
+                        },
+                    )
+                yield "content_block_stop", {"type": "content_block_stop", "index": index}
+            yield (
+                "message_delta",
+                {
+                    "type": "message_delta",
+                    "delta": {"stop_reason": stop_reason, "stop_sequence": None},
+                    "usage": {"output_tokens": usage["output_tokens"]},
+                },
+            )
+            yield "message_stop", {"type": "message_stop"}
+
+        return await self._stream(
+            request,
+            (f"event: {event}\ndata: {json.dumps(data)}\n\n" async for event, data in events()),
+        )
+
+    async def _openai(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        self.requests.append({"api": "openai", "body": body})
+        response = self._next_response(_last_text(body.get("messages", [])))
+
+        error = await self._delay_or_error(response)
+        if error is not None:
+            status, retry_after = error
+            return web.json_response(
+                {
+                    "error": {
+                        "message": f"Mock provider returned {status}",
+                        "type": _ERROR_TYPES.get(status, "api_error"),
+                        "code": str(status),
+                    }
+                },
+                status=status,
+                headers=_retry_headers(retry_after),
+            )
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        model = body.get("model", "mock")
+        tool_calls = [
+            {
+                "id": f"call_{uuid.uuid4().hex[:24]}",
+                "type": "function",
+                "function": {"name": call.name, "arguments": json.dumps(call.arguments)},
+            }
+            for call in response.tool_calls
+        ]
+        prompt_tokens = _estimate_tokens(body.get("messages"))
+        completion_tokens = _estimate_tokens([response.text, tool_calls])
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        finish_reason = "tool_calls" if tool_calls else "stop"
+
+        if not body.get("stream"):
+            message: Dict[str, Any] = {"role": "assistant", "content": response.text or ""}
+            if tool_calls:
+                message["content"] = response.text
+                message["tool_calls"] = tool_calls
+            return web.json_response(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+                    "usage": usage,
+                }
+            )
+
+        def chunk(delta: Dict[str, Any], finish: str | None = None) -> Dict[str, Any]:
+            return {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+            }
+
+        async def chunks() -> AsyncIterator[Dict[str, Any]]:
+            yield chunk({"role": "assistant", "content": ""})
+            for text in _chunks(response.text or ""):
+                yield chunk({"content": text})
+            for index, call in enumerate(tool_calls):
+                yield chunk({"tool_calls": [{"index": index, **call}]})
+            yield chunk({}, finish_reason)
+            if (body.get("stream_options") or {}).get("include_usage"):
+                yield {**chunk({}), "choices": [], "usage": usage}
+
+        async def lines() -> AsyncIterator[str]:
+            async for data in chunks():
+                yield f"data: {json.dumps(data)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return await self._stream(request, lines())
+
+    def _next_response(self, last_text: str) -> MockResponse:
+        if self._responses:
+            return self._responses.popleft()
+        return MockResponse(text=last_text)
+
+    async def _delay_or_error(self, response: MockResponse) -> Tuple[int, float | None] | None:
+        """Wait for the response's latency, returning (status, retry-after) for an error"""
+        if response.status is not None:
+            await asyncio.sleep(response.latency or 0)
+            return response.status, response.retry_after
+
+        roll = self._rng.random()
+        if roll < self.rate_limit_rate:
+            return 429, self.retry_after
+        if roll < self.rate_limit_rate + self.overloaded_rate:
+            return 529, self.retry_after
+
+        delay = response.latency if response.latency is not None else self.latency.sample(self._rng)
+        await asyncio.sleep(delay)
+        return None
+
+    async def _stream(self, request: web.Request, body: AsyncIterator[str]) -> web.StreamResponse:
+        stream = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+        )
+        await stream.prepare(request)
+        first = True
+        async for data in body:
+            if not first and self.token_interval:
+                await asyncio.sleep(self.token_interval)
+            first = False
+            await stream.write(data.encode("utf-8"))
+        await stream.write_eof()
+        return stream
+
+
+def _retry_headers(retry_after: float | None) -> Dict[str, str]:
+    return {"retry-after": f"{retry_after:g}"} if retry_after is not None else {}
+
+
+def _chunks(text: str) -> List[str]:
+    """Split text into word-sized chunks for streaming"""
+    return re.findall(r"\s*\S+\s*", text) or ([text] if text else [])
+
+
+def _estimate_tokens(value: Any) -> int:
+    """Approximate token count, at four characters per token"""
+    return max(1, len(json.dumps(value, default=str)) // 4)
+
+
+def _text_parts(content: Any) -> List[str]:
+    if isinstance(content, str):
+        return [content]
+    parts = []
+    for part in content or []:
+        if not isinstance(part, dict):
+            continue
+        if isinstance(part.get("text"), str):
+            parts.append(part["text"])
+        elif part.get("type") == "tool_result":
+            parts.extend(_text_parts(part.get("content")))
+    return parts
+
+
+def _last_text(messages: List[Dict[str, Any]]) -> str:
+    """Text of the last message, including tool results, for echo responses"""
+    return "\n".join(_text_parts(messages[-1].get("content"))) if messages else ""
+
+
+def _load_responses(path: str) -> List[MockResponse]:
+    with open(path) as script:
+        return [MockResponse.model_validate_json(line) for line in script if line.strip()]
+
+
+async def _serve(server: MockProviderServer) -> None:
+    async with server:
+        print(f"Anthropic base_url: {server.anthropic_base_url}")
+        print(f"OpenAI base_url:    {server.openai_base_url}")
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mock Anthropic and OpenAI API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean response delay (s)")
+    parser.add_argument(
+        "--latency-distribution",
+        default="constant",
+        choices=["constant", "uniform", "normal", "lognormal", "exponential"],
+    )
+    parser.add_argument("--latency-spread", type=float, default=0.0)
+    parser.add_argument(
+        "--token-interval", type=float, default=0.0, help="Delay between streamed chunks (s)"
+    )
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of 429s")
+    parser.add_argument("--overloaded-rate", type=float, default=0.0, help="Fraction of 529s")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--script", help="JSONL file of scripted responses")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    server = MockProviderServer(
+        host=args.host,
+        port=args.port,
+        latency=Latency(
+            distribution=args.latency_distribution,
+            seconds=args.latency,
+            spread=args.latency_spread,
+        ),
+        token_interval=args.token_interval,
+        rate_limit_rate=args.rate_limit_rate,
+        overloaded_rate=args.overloaded_rate,
+        retry_after=args.retry_after,
+        responses=_load_responses(args.script) if args.script else (),
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(_serve(server))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,30 @@
+import importlib
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Callable, Dict, Optional, Type, Union
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Type, Union
 
-from mcp_agent.agents.agent import Agent
 from mcp_agent.core.exceptions import ModelConfigError
 from mcp_agent.core.request_params import RequestParams
-from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
-from mcp_agent.llm.augmented_llm_playback import PlaybackLLM
-from mcp_agent.llm.providers.augmented_llm_anthropic import AnthropicAugmentedLLM
-from mcp_agent.llm.providers.augmented_llm_deepseek import DeepSeekAugmentedLLM
-from mcp_agent.llm.providers.augmented_llm_generic import GenericAugmentedLLM
-from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
 from mcp_agent.mcp.interfaces import AugmentedLLMProtocol
 
+if TYPE_CHECKING:
+    from mcp_agent.agents.agent import Agent
+    from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+    from mcp_agent.llm.augmented_llm_playback import PlaybackLLM
+    from mcp_agent.llm.providers.augmented_llm_anthropic import AnthropicAugmentedLLM
+    from mcp_agent.llm.providers.augmented_llm_deepseek import DeepSeekAugmentedLLM
+    from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
+
 # from mcp_agent.workflows.llm.augmented_llm_deepseek import DeekSeekAugmentedLLM
 
 
 # Type alias for LLM classes
 LLMClass = Union[
-    Type[AnthropicAugmentedLLM],
-    Type[OpenAIAugmentedLLM],
-    Type[PassthroughLLM],
-    Type[PlaybackLLM],
-    Type[DeepSeekAugmentedLLM],
+    Type["AnthropicAugmentedLLM"],
+    Type["OpenAIAugmentedLLM"],
+    Type["PassthroughLLM"],
+    Type["PlaybackLLM"],
+    Type["DeepSeekAugmentedLLM"],
 ]
 
 
@@ -53,6 +55,43 @@ class ModelConfig:
     reasoning_effort: Optional[ReasoningEffort] = None
 
 
+@dataclass(frozen=True)
+class ModelCapabilities:
+    """Context window and output limits for a model, in tokens, and its pricing"""
+
+    context_window: int
+    max_output_tokens: int
+    # Prices in USD per million tokens. Cache prices default to the input price.
+    input_price: float | None = None
+    output_price: float | None = None
+    cache_read_price: float | None = None
+    cache_write_price: float | None = None
+
+    def cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> float | None:
+        """
+        Estimate the cost of a call in USD, or None if pricing is not known.
+        input_tokens includes any cache read and cache write tokens.
+        """
+        if self.input_price is None or self.output_price is None:
+            return None
+        read_price = self.input_price if self.cache_read_price is None else self.cache_read_price
+        write_price = self.input_price if self.cache_write_price is None else self.cache_write_price
+        uncached = max(0, input_tokens - cache_read_tokens - cache_write_tokens)
+        total = (
+            uncached * self.input_price
+            + cache_read_tokens * read_price
+            + cache_write_tokens * write_price
+            + output_tokens * self.output_price
+        )
+        return total / 1_000_000
+
+
 class ModelFactory:
     """Factory for creating LLM instances based on model specifications"""
 
@@ -72,7 +111,6 @@ class ModelFactory:
         "high": ReasoningEffort.HIGH,
     }
 
-    # TODO -- add context window size information for display/management
     # TODO -- add audio supporting got-4o-audio-preview
     # TODO -- bring model parameter configuration here
     # Mapping of model names to their default providers
@@ -113,19 +151,153 @@ class ModelFactory:
         "deepseek": "deepseek-chat",
     }
 
-    # Mapping of providers to their LLM classes
-    PROVIDER_CLASSES: Dict[Provider, LLMClass] = {
-        Provider.ANTHROPIC: AnthropicAugmentedLLM,
-        Provider.OPENAI: OpenAIAugmentedLLM,
-        Provider.FAST_AGENT: PassthroughLLM,
-        Provider.DEEPSEEK: DeepSeekAugmentedLLM,
-        Provider.GENERIC: GenericAugmentedLLM,
+    # Limits and pricing for known models, keyed by model name (aliases resolve to these names)
+    MODEL_CAPABILITIES: Dict[str, ModelCapabilities] = {
+        "gpt-4o": ModelCapabilities(
+            context_window=128_000,
+            max_output_tokens=16_384,
+            input_price=2.5,
+            output_price=10,
+            cache_read_price=1.25,
+        ),
+        "gpt-4o-mini": ModelCapabilities(
+            context_window=128_000,
+            max_output_tokens=16_384,
+            input_price=0.15,
+            output_price=0.6,
+            cache_read_price=0.075,
+        ),
+        "o1-mini": ModelCapabilities(
+            context_window=128_000,
+            max_output_tokens=65_536,
+            input_price=1.1,
+            output_price=4.4,
+            cache_read_price=0.55,
+        ),
+        "o1": ModelCapabilities(
+            context_window=200_000,
+            max_output_tokens=100_000,
+            input_price=15,
+            output_price=60,
+            cache_read_price=7.5,
+        ),
+        "o1-preview": ModelCapabilities(
+            context_window=128_000,
+            max_output_tokens=32_768,
+            input_price=15,
+            output_price=60,
+            cache_read_price=7.5,
+        ),
+        "o3-mini": ModelCapabilities(
+            context_window=200_000,
+            max_output_tokens=100_000,
+            input_price=1.1,
+            output_price=4.4,
+            cache_read_price=0.55,
+        ),
+        "claude-3-haiku-20240307": ModelCapabilities(
+            context_window=200_000,
+            max_output_tokens=4_096,
+            input_price=0.25,
+            output_price=1.25,
+            cache_read_price=0.03,
+            cache_write_price=0.3,
+        ),
+        "claude-3-5-haiku-20241022": ModelCapabilities(
+            context_window=200_000,
+            max_output_tokens=8_192,
+            input_price=0.8,
+            output_price=4,
+            cache_read_price=0.08,
+            cache_write_price=1,
+        ),
+        "claude-3-5-haiku-latest": ModelCapabilities(
+            context_window=200_000,
+            max_output_tokens=8_192,
+            input_price=0.8,
+            output_price=4,
+            cache_read_price=0.08,
+            cache_write_price=1,
+        ),
+        "claude-3-5-sonnet-20240620": ModelCapabilities(
+            context_window=200_000,
+            max_output_tokens=8_192,
+            input_price=3,
+            output_price=15,
+            cache_read_price=0.3,
+            cache_write_price=3.75,
+        ),
+        "claude-3-5-sonnet-20241022": ModelCapabilities(
+            context_window=200_000,
+            max_output_tokens=8_192,
+            input_price=3,
+            output_price=15,
+            cache_read_price=0.3,
+            cache_write_price=3.75,
+        ),
+        "claude-3-5-sonnet-latest": ModelCapabilities(
+            context_window=200_000,
+            max_output_tokens=8_192,
+            input_price=3,
+            output_price=15,
+            cache_read_price=0.3,
+            cache_write_price=3.75,
+        ),
+        "claude-3-7-sonnet-20250219": ModelCapabilities(
+            context_window=200_000,
+            max_output_tokens=64_000,
+            input_price=3,
+            output_price=15,
+            cache_read_price=0.3,
+            cache_write_price=3.75,
+        ),
+        "claude-3-7-sonnet-latest": ModelCapabilities(
+            context_window=200_000,
+            max_output_tokens=64_000,
+            input_price=3,
+            output_price=15,
+            cache_read_price=0.3,
+            cache_write_price=3.75,
+        ),
+        "claude-3-opus-20240229": ModelCapabilities(
+            context_window=200_000,
+            max_output_tokens=4_096,
+            input_price=15,
+            output_price=75,
+            cache_read_price=1.5,
+            cache_write_price=18.75,
+        ),
+        "claude-3-opus-latest": ModelCapabilities(
+            context_window=200_000,
+            max_output_tokens=4_096,
+            input_price=15,
+            output_price=75,
+            cache_read_price=1.5,
+            cache_write_price=18.75,
+        ),
+        "deepseek-chat": ModelCapabilities(
+            context_window=64_000,
+            max_output_tokens=8_192,
+            input_price=0.27,
+            output_price=1.1,
+            cache_read_price=0.07,
+        ),
+    }
+
+    # Mapping of providers to their LLM classes, as "module:class" paths.
+    # Provider SDKs are slow to import, so classes are only imported when a model uses them.
+    PROVIDER_CLASSES: Dict[Provider, str] = {
+        Provider.ANTHROPIC: "mcp_agent.llm.providers.augmented_llm_anthropic:AnthropicAugmentedLLM",
+        Provider.OPENAI: "mcp_agent.llm.providers.augmented_llm_openai:OpenAIAugmentedLLM",
+        Provider.FAST_AGENT: "mcp_agent.llm.augmented_llm_passthrough:PassthroughLLM",
+        Provider.DEEPSEEK: "mcp_agent.llm.providers.augmented_llm_deepseek:DeepSeekAugmentedLLM",
+        Provider.GENERIC: "mcp_agent.llm.providers.augmented_llm_generic:GenericAugmentedLLM",
     }
 
     # Mapping of special model names to their specific LLM classes
     # This overrides the provider-based class selection
-    MODEL_SPECIFIC_CLASSES: Dict[str, LLMClass] = {
-        "playback": PlaybackLLM,
+    MODEL_SPECIFIC_CLASSES: Dict[str, str] = {
+        "playback": "mcp_agent.llm.augmented_llm_playback:PlaybackLLM",
     }
 
     @classmethod
@@ -165,6 +337,32 @@ class ModelFactory:
             provider=provider, model_name=model_name, reasoning_effort=reasoning_effort
         )
 
+    @classmethod
+    def get_capabilities(cls, model_string: str | None) -> ModelCapabilities | None:
+        """
+        Return the limits for a model name, alias or full model string (e.g. "openai.o3-mini.high"),
+        or None if the model is not known.
+        """
+        if not model_string:
+            return None
+        model_name = cls.MODEL_ALIASES.get(model_string, model_string)
+        if model_name not in cls.MODEL_CAPABILITIES:
+            try:
+                model_name = cls.parse_model_string(model_string).model_name
+            except ModelConfigError:
+                return None
+        return cls.MODEL_CAPABILITIES.get(model_name)
+
+    @classmethod
+    def get_llm_class(cls, config: ModelConfig) -> LLMClass:
+        """Import and return the LLM class for a parsed model configuration"""
+        path = (
+            cls.MODEL_SPECIFIC_CLASSES.get(config.model_name)
+            or cls.PROVIDER_CLASSES[config.provider]
+        )
+        module_name, class_name = path.split(":")
+        return getattr(importlib.import_module(module_name), class_name)
+
     @classmethod
     def create_factory(
         cls, model_string: str, request_params: Optional[RequestParams] = None
@@ -181,14 +379,11 @@ class ModelFactory:
         """
         # Parse configuration up front
         config = cls.parse_model_string(model_string)
-        if config.model_name in cls.MODEL_SPECIFIC_CLASSES:
-            llm_class = cls.MODEL_SPECIFIC_CLASSES[config.model_name]
-        else:
-            llm_class = cls.PROVIDER_CLASSES[config.provider]
+        llm_class = cls.get_llm_class(config)
 
         # Create a factory function matching the updated attach_llm protocol
         def factory(
-            agent: Agent, request_params: Optional[RequestParams] = None, **kwargs
+            agent: "Agent", request_params: Optional[RequestParams] = None, **kwargs
         ) -> AugmentedLLMProtocol:
             # Create base params with parsed model name
             base_params = RequestParams()
@@ -1,8 +1,25 @@
-from mcp_agent.llm.providers.sampling_converter_anthropic import (
-    AnthropicSamplingConverter,
-)
-from mcp_agent.llm.providers.sampling_converter_openai import (
-    OpenAISamplingConverter,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mcp_agent.llm.providers.sampling_converter_anthropic import (
+        AnthropicSamplingConverter,
+    )
+    from mcp_agent.llm.providers.sampling_converter_openai import (
+        OpenAISamplingConverter,
+    )
+
+# Imported on first use, so that importing one provider does not import every provider SDK
+_LAZY_IMPORTS = {
+    "AnthropicSamplingConverter": "mcp_agent.llm.providers.sampling_converter_anthropic",
+    "OpenAISamplingConverter": "mcp_agent.llm.providers.sampling_converter_openai",
+}
 
 __all__ = ["AnthropicSamplingConverter", "OpenAISamplingConverter"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -1,5 +1,6 @@
+import json
 import os
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Tuple, Type
 
 from mcp.types import EmbeddedResource, ImageContent, TextContent
 
@@ -10,6 +11,7 @@ from mcp_agent.llm.providers.multipart_converter_anthropic import (
 from mcp_agent.llm.providers.sampling_converter_anthropic import (
     AnthropicSamplingConverter,
 )
+from mcp_agent.llm.structured_output import model_schema
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
 if TYPE_CHECKING:
@@ -32,15 +34,22 @@ from mcp.types import (
 )
 from rich.text import Text
 
+from mcp_agent.config import RateLimitSettings
 from mcp_agent.core.exceptions import ProviderKeyError
 from mcp_agent.llm.augmented_llm import (
     AugmentedLLM,
+    ModelT,
     RequestParams,
 )
+from mcp_agent.llm.usage_ledger import TokenUsage
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.profiler import profile_phase
 
 DEFAULT_ANTHROPIC_MODEL = "claude-3-7-sonnet-latest"
 
+# Structured responses are requested by forcing a call to this tool
+STRUCTURED_OUTPUT_TOOL = "structured_output"
+
 
 class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
     """
@@ -50,10 +59,14 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
     selecting appropriate tools, and determining what information to retain.
     """
 
+    native_structured_output = True
+
     def __init__(self, *args, **kwargs) -> None:
         self.provider = "Anthropic"
         # Initialize logger - keep it simple without name reference
         self.logger = get_logger(__name__)
+        self._client: Anthropic | None = None
+        self._client_key: Tuple[str, str | None] | None = None
 
         # Now call super().__init__
         super().__init__(*args, type_converter=AnthropicSamplingConverter, **kwargs)
@@ -69,10 +82,39 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
             use_history=True,
         )
 
+    def _rate_limit_settings(self) -> RateLimitSettings | None:
+        config = self.context.config
+        return config.anthropic.rate_limit if config and config.anthropic else None
+
     def _base_url(self) -> str | None:
         assert self.context.config
         return self.context.config.anthropic.base_url if self.context.config.anthropic else None
 
+    def _anthropic_client(self, api_key: str) -> Anthropic:
+        """The client for this LLM's API key and base URL, created on first use"""
+        base_url = self._base_url()
+        if base_url and base_url.endswith("/v1"):
+            base_url = base_url.removesuffix("/v1")
+        if self._client is None or self._client_key != (api_key, base_url):
+            self._client = Anthropic(
+                api_key=api_key, base_url=base_url, **self._client_retry_options()
+            )
+            self._client_key = (api_key, base_url)
+        return self._client
+
+    def _response_usage(self, response: Message) -> TokenUsage | None:
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return None
+        cache_write_tokens = getattr(usage, "cache_creation_input_tokens", None) or 0
+        cache_read_tokens = getattr(usage, "cache_read_input_tokens", None) or 0
+        return TokenUsage(
+            input_tokens=usage.input_tokens + cache_write_tokens + cache_read_tokens,
+            output_tokens=usage.output_tokens,
+            cache_read_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
+        )
+
     async def generate_internal(
         self,
         message_param,
@@ -84,12 +126,9 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
         """
 
         api_key = self._api_key(self.context.config)
-        base_url = self._base_url()
-        if base_url and base_url.endswith("/v1"):
-            base_url = base_url.rstrip("/v1")
 
         try:
-            anthropic = Anthropic(api_key=api_key, base_url=base_url)
+            anthropic = self._anthropic_client(api_key)
             messages: List[MessageParam] = []
             params = self.get_request_params(request_params)
         except AuthenticationError as e:
@@ -117,13 +156,19 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
         responses: List[TextContent | ImageContent | EmbeddedResource] = []
 
         model = self.default_request_params.model
+        system_prompt = self.instruction or params.systemPrompt
+        pinned = len(self.history.get(include_history=False))
+        overhead_tokens = self._count_request_overhead(system_prompt, available_tools)
 
         for i in range(params.max_iterations):
             self._log_chat_progress(self.chat_turn(), model=model)
+            messages, token_estimate = await self._fit_context_window(
+                messages, pinned, overhead_tokens, params
+            )
             arguments = {
                 "model": model,
                 "messages": messages,
-                "system": self.instruction or params.systemPrompt,
+                "system": system_prompt,
                 "stop_sequences": params.stopSequences,
                 "tools": available_tools,
             }
@@ -136,9 +181,13 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
 
             self.logger.debug(f"{arguments}")
 
-            executor_result = await self.executor.execute(anthropic.messages.create, **arguments)
-
-            response = executor_result[0]
+            response = await self._execute_request(
+                anthropic.messages.create,
+                arguments,
+                params,
+                api_key=api_key,
+                token_estimate=token_estimate,
+            )
 
             if isinstance(response, AuthenticationError):
                 raise ProviderKeyError(
@@ -147,7 +196,7 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
                 ) from response
             elif isinstance(response, BaseException):
                 error_details = str(response)
-                self.logger.error(f"Error: {error_details}", data=executor_result)
+                self.logger.error(f"Error: {error_details}", data=response)
 
                 # Try to extract more useful information for API errors
                 if hasattr(response, "status_code") and hasattr(response, "response"):
@@ -315,6 +364,80 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
         )
         return Prompt.assistant(*res)
 
+    async def _structured_provider_specific(
+        self,
+        prompt: List[PromptMessageMultipart],
+        model: Type[ModelT],
+        request_params: RequestParams | None = None,
+    ) -> PromptMessageMultipart:
+        """
+        Constrain the response to the model's schema by forcing a call to a tool that takes
+        the model as its input. The tool input is returned as JSON text, and the exchange is
+        kept in history as text so that no tool result is expected.
+        """
+        params = self.get_request_params(request_params)
+        api_key = self._api_key(self.context.config)
+        anthropic = self._anthropic_client(api_key)
+        model_name = self.default_request_params.model
+
+        converted = [self._convert_to_provider(message) for message in prompt]
+        messages = [*self.history.get(include_history=params.use_history), *converted]
+        system_prompt = self.instruction or params.systemPrompt
+        tool = ToolParam(
+            name=STRUCTURED_OUTPUT_TOOL,
+            description=f"Respond with a {model.__name__} object",
+            input_schema=model_schema(model),
+        )
+        messages, token_estimate = await self._fit_context_window(
+            messages,
+            len(self.history.get(include_history=False)),
+            self._count_request_overhead(system_prompt, [tool]),
+            params,
+        )
+        arguments = {
+            "model": model_name,
+            "messages": messages,
+            "system": system_prompt,
+            "tools": [tool],
+            "tool_choice": {"type": "tool", "name": STRUCTURED_OUTPUT_TOOL},
+        }
+        if params.maxTokens is not None:
+            arguments["max_tokens"] = params.maxTokens
+        if params.metadata:
+            arguments = {**arguments, **params.metadata}
+
+        self._log_chat_progress(self.chat_turn(), model=model_name)
+        with profile_phase(self.provider or type(self).__name__, "provider"):
+            response = await self._execute_request(
+                anthropic.messages.create,
+                arguments,
+                params,
+                api_key=api_key,
+                token_estimate=token_estimate,
+            )
+        if isinstance(response, BaseException):
+            if isinstance(response, AuthenticationError):
+                raise ProviderKeyError(
+                    "Invalid Anthropic API key",
+                    "The configured Anthropic API key was rejected.\nPlease check that your API key is valid and not expired.",
+                ) from response
+            raise response
+
+        tool_use = next((block for block in response.content if block.type == "tool_use"), None)
+        if tool_use is not None:
+            text = json.dumps(tool_use.input)
+        else:
+            text = "".join(block.text for block in response.content if block.type == "text")
+        result = Prompt.assistant(text)
+
+        await self.show_assistant_message(text)
+        await self._add_structured_exchange(prompt, converted, result, params)
+        self._log_chat_finished(model=model_name)
+        return result
+
+    def _convert_to_provider(self, message: PromptMessageMultipart) -> MessageParam:
+        return self._convert_cached(message, AnthropicConverter.convert_to_anthropic)
+
     async def _apply_prompt_provider_specific(
         self,
         multipart_messages: List["PromptMessageMultipart"],
@@ -329,13 +452,13 @@ class AnthropicAugmentedLLM(AugmentedLLM[MessageParam, Message]):
         )
         converted = []
         for msg in messages_to_add:
-            converted.append(AnthropicConverter.convert_to_anthropic(msg))
+            converted.append(self._convert_to_provider(msg))
 
         self.history.extend(converted, is_prompt=True)
 
         if last_message.role == "user":
             self.logger.debug("Last message in prompt is from user, generating assistant response")
-            message_param = AnthropicConverter.convert_to_anthropic(last_message)
+            message_param = self._convert_to_provider(last_message)
             return await self.generate_messages(message_param, request_params)
         else:
             # For assistant messages: Return the last message content as text
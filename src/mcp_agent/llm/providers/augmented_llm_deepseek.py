@@ -1,5 +1,6 @@
 import os
 
+from mcp_agent.config import RateLimitSettings
 from mcp_agent.core.exceptions import ProviderKeyError
 from mcp_agent.core.request_params import RequestParams
 from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
@@ -46,6 +47,10 @@ class DeepSeekAugmentedLLM(OpenAIAugmentedLLM):
             )
         return api_key
 
+    def _rate_limit_settings(self) -> RateLimitSettings | None:
+        config = self.context.config
+        return config.deepseek.rate_limit if config and config.deepseek else None
+
     def _base_url(self) -> str:
         if self.context.config and self.context.config.deepseek:
             base_url = self.context.config.deepseek.base_url
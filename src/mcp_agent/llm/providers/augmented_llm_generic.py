@@ -1,5 +1,6 @@
 import os
 
+from mcp_agent.config import RateLimitSettings
 from mcp_agent.core.request_params import RequestParams
 from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
 
@@ -39,6 +40,10 @@ class GenericAugmentedLLM(OpenAIAugmentedLLM):
 
         return api_key or "ollama"
 
+    def _rate_limit_settings(self) -> RateLimitSettings | None:
+        config = self.context.config
+        return config.generic.rate_limit if config and config.generic else None
+
     def _base_url(self) -> str:
         base_url = None
         if self.context.config and self.context.config.generic:
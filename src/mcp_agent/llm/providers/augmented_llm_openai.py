@@ -9,10 +9,11 @@ from mcp.types import (
     ImageContent,
     TextContent,
 )
-from openai import AuthenticationError, OpenAI
+from openai import AuthenticationError, BadRequestError, OpenAI
 
 # from openai.types.beta.chat import
 from openai.types.chat import (
+    ChatCompletion,
     ChatCompletionMessage,
     ChatCompletionMessageParam,
     ChatCompletionSystemMessageParam,
@@ -22,6 +23,7 @@ from openai.types.chat import (
 from pydantic_core import from_json
 from rich.text import Text
 
+from mcp_agent.config import RateLimitSettings
 from mcp_agent.core.exceptions import ProviderKeyError
 from mcp_agent.core.prompt import Prompt
 from mcp_agent.llm.augmented_llm import (
@@ -33,7 +35,11 @@ from mcp_agent.llm.providers.multipart_converter_openai import OpenAIConverter
 from mcp_agent.llm.providers.sampling_converter_openai import (
     OpenAISamplingConverter,
 )
+from mcp_agent.llm.structured_output import model_schema
+from mcp_agent.llm.token_counter import Tokenizer
+from mcp_agent.llm.usage_ledger import TokenUsage
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.profiler import profile_phase
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
 _logger = get_logger(__name__)
@@ -57,6 +63,10 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
         super().__init__(*args, **kwargs)
 
         self.provider = provider_name
+        # OpenAI-compatible providers may not support json_schema response formats
+        self.native_structured_output = provider_name == "OpenAI"
+        self._client: OpenAI | None = None
+        self._client_key: Tuple[str, str | None] | None = None
         # Initialize logger with name if available
         self.logger = get_logger(f"{__name__}.{self.name}" if self.name else __name__)
 
@@ -114,6 +124,31 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
     def _base_url(self) -> str:
         return self.context.config.openai.base_url if self.context.config.openai else None
 
+    def _openai_client(self, api_key: str) -> OpenAI:
+        """The client for this LLM's API key and base URL, created on first use"""
+        base_url = self._base_url()
+        if self._client is None or self._client_key != (api_key, base_url):
+            self._client = OpenAI(
+                api_key=api_key, base_url=base_url, **self._client_retry_options()
+            )
+            self._client_key = (api_key, base_url)
+        return self._client
+
+    def _rate_limit_settings(self) -> RateLimitSettings | None:
+        config = self.context.config
+        return config.openai.rate_limit if config and config.openai else None
+
+    def _response_usage(self, response: ChatCompletion) -> TokenUsage | None:
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return None
+        details = getattr(usage, "prompt_tokens_details", None)
+        return TokenUsage(
+            input_tokens=usage.prompt_tokens,
+            output_tokens=usage.completion_tokens,
+            cache_read_tokens=(getattr(details, "cached_tokens", None) or 0),
+        )
+
     async def generate_internal(
         self,
         message,
@@ -126,7 +161,8 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
         """
 
         try:
-            openai_client = OpenAI(api_key=self._api_key(), base_url=self._base_url())
+            api_key = self._api_key()
+            openai_client = self._openai_client(api_key)
             messages: List[ChatCompletionMessageParam] = []
             params = self.get_request_params(request_params)
         except AuthenticationError as e:
@@ -169,9 +205,14 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
 
         responses: List[TextContent | ImageContent | EmbeddedResource] = []
         model = self.default_request_params.model
+        pinned = len(self.history.get(include_history=False)) + (1 if system_prompt else 0)
+        overhead_tokens = self._count_request_overhead(None, available_tools)
 
         # we do NOT send stop sequences as this causes errors with mutlimodal processing
         for i in range(params.max_iterations):
+            messages, token_estimate = await self._fit_context_window(
+                messages, pinned, overhead_tokens, params
+            )
             arguments = {
                 "model": model or "gpt-4o",
                 "messages": messages,
@@ -194,12 +235,14 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
             self.logger.debug(f"{arguments}")
             self._log_chat_progress(self.chat_turn(), model=model)
 
-            executor_result = await self.executor.execute(
-                openai_client.chat.completions.create, **arguments
+            response = await self._execute_request(
+                openai_client.chat.completions.create,
+                arguments,
+                params,
+                api_key=api_key,
+                token_estimate=token_estimate,
             )
 
-            response = executor_result[0]
-
             self.logger.debug(
                 "OpenAI ChatCompletion response:",
                 data=response,
@@ -315,6 +358,26 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
 
         return responses
 
+    def _create_tokenizer(self) -> Tokenizer | None:
+        try:
+            import tiktoken
+        except ImportError:
+            return None
+
+        try:
+            encoding = tiktoken.encoding_for_model(self.default_request_params.model or "gpt-4o")
+        except KeyError:
+            # Models served through compatible APIs are not known to tiktoken
+            return None
+        except Exception as e:
+            # Encodings are downloaded on first use, which fails when offline
+            self.logger.warning(f"Unable to load tiktoken encoding: {e}")
+            return None
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+    def _convert_to_provider(self, message: PromptMessageMultipart) -> ChatCompletionMessageParam:
+        return self._convert_cached(message, OpenAIConverter.convert_to_openai)
+
     async def _apply_prompt_provider_specific(
         self,
         multipart_messages: List["PromptMessageMultipart"],
@@ -331,13 +394,13 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
         )
         converted = []
         for msg in messages_to_add:
-            converted.append(OpenAIConverter.convert_to_openai(msg))
+            converted.append(self._convert_to_provider(msg))
         self.history.extend(converted, is_prompt=True)
 
         if last_message.role == "user":
             # For user messages: Generate response to the last one
             self.logger.debug("Last message in prompt is from user, generating assistant response")
-            message_param = OpenAIConverter.convert_to_openai(last_message)
+            message_param = self._convert_to_provider(last_message)
             responses: List[
                 TextContent | ImageContent | EmbeddedResource
             ] = await self.generate_internal(
@@ -350,80 +413,84 @@ class OpenAIAugmentedLLM(AugmentedLLM[ChatCompletionMessageParam, ChatCompletion
             self.logger.debug("Last message in prompt is from assistant, returning it directly")
             return last_message
 
-    async def structured(
+    async def _structured_provider_specific(
         self,
         prompt: List[PromptMessageMultipart],
         model: Type[ModelT],
         request_params: RequestParams | None = None,
-    ) -> Tuple[ModelT | None, PromptMessageMultipart]:
+    ) -> PromptMessageMultipart:
         """
-        Apply the prompt and return the result as a Pydantic model.
-
-        Uses OpenAI's beta parse feature when compatible, falling back to standard
-        JSON parsing if the beta feature fails or is unavailable.
-
-        Args:
-            prompt: List of messages to process
-            model: Pydantic model to parse the response into
-            request_params: Optional request parameters
-
-        Returns:
-            The parsed response as a Pydantic model, or None if parsing fails
+        Constrain the response to the model's JSON schema with a json_schema response format.
+        OpenAI-compatible providers, which may not support it, request ordinary text.
         """
+        params = self.get_request_params(request_params)
+        api_key = self._api_key()
+        openai_client = self._openai_client(api_key)
+        model_name = self.default_request_params.model or DEFAULT_OPENAI_MODEL
 
-        if not "OpenAI" == self.provider:
-            return await super().structured(prompt, model, request_params)
-
-        logger = get_logger(__name__)
-
-        # First try to use OpenAI's beta.chat.completions.parse feature
-        try:
-            # Convert the multipart messages to OpenAI format
-            messages = []
-            for msg in prompt:
-                messages.append(OpenAIConverter.convert_to_openai(msg))
-
-            # Add system prompt if available and not already present
-            if self.instruction and not any(m.get("role") == "system" for m in messages):
-                system_msg = ChatCompletionSystemMessageParam(
-                    role="system", content=self.instruction
-                )
-                messages.insert(0, system_msg)
-            model_name = self.default_request_params.model
-            self.show_user_message(prompt[-1].first_text(), model_name, self.chat_turn())
-            # Use the beta parse feature
-            try:
-                openai_client = OpenAI(api_key=self._api_key(), base_url=self._base_url())
-                model_name = self.default_request_params.model
-
-                logger.debug(
-                    f"Using OpenAI beta parse with model {model_name} for structured output"
-                )
-                response = await self.executor.execute(
-                    openai_client.beta.chat.completions.parse,
-                    model=model_name,
-                    messages=messages,
-                    response_format=model,
-                )
-
-                if response and isinstance(response[0], BaseException):
-                    raise response[0]
-                parsed_result = response[0].choices[0].message
-                await self.show_assistant_message(parsed_result.content)
-                logger.debug("Successfully used OpenAI beta parse feature for structured output")
-                return parsed_result.parsed, Prompt.assistant(parsed_result.content)
+        converted = [self._convert_to_provider(message) for message in prompt]
+        messages: List[ChatCompletionMessageParam] = []
+        system_prompt = self.instruction or params.systemPrompt
+        if system_prompt:
+            messages.append(ChatCompletionSystemMessageParam(role="system", content=system_prompt))
+        messages.extend(self.history.get(include_history=params.use_history))
+        messages.extend(converted)
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {"name": model.__name__, "schema": model_schema(model)},
+        }
+        messages, token_estimate = await self._fit_context_window(
+            messages,
+            len(self.history.get(include_history=False)) + (1 if system_prompt else 0),
+            self._count_request_overhead(None, response_format),
+            params,
+        )
 
-            except (ImportError, AttributeError, NotImplementedError) as e:
-                # Beta feature not available, log and continue to fallback
-                logger.debug(f"OpenAI beta parse feature not available: {str(e)}")
-                # Continue to fallback
+        arguments = {
+            "model": model_name,
+            "messages": messages,
+            "response_format": response_format,
+        }
+        if params.maxTokens is not None:
+            tokens_argument = "max_completion_tokens" if self._reasoning else "max_tokens"
+            arguments[tokens_argument] = params.maxTokens
+        if self._reasoning:
+            arguments["reasoning_effort"] = self._reasoning_effort
+        if params.metadata:
+            arguments = {**arguments, **params.metadata}
+
+        self._log_chat_progress(self.chat_turn(), model=model_name)
+        with profile_phase(self.provider or type(self).__name__, "provider"):
+            response = await self._execute_request(
+                openai_client.chat.completions.create,
+                arguments,
+                params,
+                api_key=api_key,
+                token_estimate=token_estimate,
+            )
+        if isinstance(response, BadRequestError):
+            # Not every model accepts json_schema response formats
+            self.logger.debug(
+                "Structured output request was rejected, requesting text instead",
+                data={"model": model_name, "error": str(response)},
+            )
+            return await super()._structured_provider_specific(prompt, model, request_params)
+        if isinstance(response, BaseException):
+            if isinstance(response, AuthenticationError):
+                raise ProviderKeyError(
+                    "Invalid OpenAI API key",
+                    "The configured OpenAI API key was rejected.\n"
+                    "Please check that your API key is valid and not expired.",
+                ) from response
+            raise response
 
-        except Exception as e:
-            logger.debug(f"OpenAI beta parse failed: {str(e)}, falling back to standard method")
-            # Continue to standard method as fallback
+        text = response.choices[0].message.content or ""
+        result = Prompt.assistant(text)
 
-        # Fallback to standard method (inheriting from base class)
-        return await super().structured(prompt, model, request_params)
+        await self.show_assistant_message(text)
+        await self._add_structured_exchange(prompt, converted, result, params)
+        self._log_chat_finished(model=model_name)
+        return result
 
     async def pre_tool_call(self, tool_call_id: str | None, request: CallToolRequest):
         return request
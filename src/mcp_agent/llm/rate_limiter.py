@@ -0,0 +1,309 @@
+"""
+Shared rate limiting for LLM provider requests.
+
+Requests are limited per provider, API key and model using token buckets for
+requests-per-minute and tokens-per-minute budgets. Waiting requests are served in
+priority order, so interactive turns go ahead of batch work. Rate limit (429) and
+overloaded responses are retried, honouring the provider's retry-after header, with
+jittered exponential backoff otherwise.
+"""
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Tuple, TypeVar
+
+from opentelemetry import metrics
+
+from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.metrics import LATENCY_BUCKETS
+
+if TYPE_CHECKING:
+    from mcp_agent.config import RateLimitSettings
+
+logger = get_logger(__name__)
+
+R = TypeVar("R")
+
+# Lower values are served first
+PRIORITIES = {"interactive": 0, "batch": 1}
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+RETRYABLE_ERRORS = {"APIConnectionError", "APITimeoutError"}
+
+
+class TokenBucket:
+    """A bucket holding up to `per_minute` units, refilled continuously"""
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = self.capacity
+        self._updated = time.monotonic()
+
+    def delay(self, amount: float) -> float:
+        """
+        Seconds until `amount` units are available. Amounts above the capacity wait
+        for a full bucket.
+        """
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self.available -= amount
+
+    def refund(self, amount: float) -> None:
+        """Return units to the bucket (or take more, if negative)"""
+        self._refill()
+        self.available = min(self.capacity, self.available + amount)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+@dataclass
+class RateLimitStats:
+    """Queueing and retry statistics for a rate limiter"""
+
+    requests: int = 0
+    queued: int = 0
+    """Requests that had to wait for budget"""
+
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    retries: int = 0
+    rate_limited: int = 0
+    """Responses rejected by the provider with a 429 status"""
+
+
+class ProviderRateLimiter:
+    """Rate limits and retries for requests to one provider, API key and model"""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_retries: int = 3,
+        initial_backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 60.0,
+    ) -> None:
+        self.name = name
+        self.max_retries = max_retries
+        self.initial_backoff_seconds = initial_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.stats = RateLimitStats()
+
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._condition: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        meter = metrics.get_meter("mcp_agent.rate_limit")
+        self._wait_histogram = meter.create_histogram(
+            "fast_agent.rate_limit.wait",
+            unit="s",
+            explicit_bucket_boundaries_advisory=LATENCY_BUCKETS,
+            description="Time requests waited for provider rate limit budget",
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for budget"""
+        return len(self._waiters)
+
+    async def acquire(self, tokens: int = 0, priority: str = "interactive") -> float:
+        """
+        Wait until a request of `tokens` tokens fits the budgets, then reserve it.
+        Higher priority requests are served first.
+
+        Returns:
+            The time spent waiting, in seconds
+        """
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._waiters = []
+        started = time.monotonic()
+        entry = (PRIORITIES.get(priority, 0), next(self._sequence))
+
+        async with self._condition:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    if self._waiters[0] == entry:
+                        delay = self._delay(tokens)
+                        if delay <= 0:
+                            break
+                        try:
+                            await asyncio.wait_for(self._condition.wait(), delay)
+                        except asyncio.TimeoutError:
+                            pass
+                    else:
+                        await self._condition.wait()
+            except BaseException:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+                raise
+
+            heapq.heappop(self._waiters)
+            if self._requests:
+                self._requests.consume(1)
+            if self._tokens:
+                self._tokens.consume(tokens)
+            self._condition.notify_all()
+
+        waited = time.monotonic() - started
+        self.stats.requests += 1
+        self.stats.total_wait += waited
+        self.stats.max_wait = max(self.stats.max_wait, waited)
+        if waited > 0.001:
+            self.stats.queued += 1
+            logger.debug(
+                f"Waited {waited:.2f}s for rate limit budget",
+                data={"limiter": self.name, "priority": priority, "queue_depth": self.queue_depth},
+            )
+        self._wait_histogram.record(waited, {"limiter": self.name, "priority": priority})
+        return waited
+
+    def settle(self, reserved_tokens: int, actual_tokens: int | None) -> None:
+        """
+        Correct the tokens-per-minute budget once a request has finished. actual_tokens is
+        0 for failed requests, returning the whole reservation, and None if the provider
+        did not report usage, in which case the reservation stands.
+        """
+        if self._tokens and actual_tokens is not None:
+            self._tokens.refund(reserved_tokens - actual_tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hold all requests for `seconds`, for example after the provider returns retry-after"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def call(
+        self,
+        request: Callable[[], Awaitable[R]],
+        tokens: int = 0,
+        priority: str = "interactive",
+    ) -> R:
+        """
+        Make a request within the rate limits, retrying rate limited, overloaded and
+        connection errors. Other errors, and the final failure, are raised.
+        """
+        attempt = 0
+        while True:
+            await self.acquire(tokens, priority)
+            try:
+                return await request()
+            except Exception as error:
+                if attempt >= self.max_retries or not is_retryable(error):
+                    raise
+
+                status = getattr(error, "status_code", None)
+                delay = retry_after(error)
+                if status == 429:
+                    self.stats.rate_limited += 1
+                    # The whole key is over budget, so hold everyone rather than just this request
+                    self.pause(delay if delay is not None else self._backoff(attempt))
+                if delay is None:
+                    delay = self._backoff(attempt)
+
+                self.stats.retries += 1
+                logger.warning(
+                    f"Request failed ({status or type(error).__name__}), retrying in {delay:.1f}s",
+                    data={"limiter": self.name, "attempt": attempt + 1},
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff, jittered so that concurrent retries spread out"""
+        ceiling = min(self.max_backoff_seconds, self.initial_backoff_seconds * (2**attempt))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def _delay(self, tokens: int) -> float:
+        delay = self._paused_until - time.monotonic()
+        if self._requests:
+            delay = max(delay, self._requests.delay(1))
+        if self._tokens:
+            delay = max(delay, self._tokens.delay(tokens))
+        return delay
+
+
+def is_retryable(error: BaseException) -> bool:
+    """True for rate limit, overloaded, server and connection errors from provider SDKs"""
+    if getattr(error, "status_code", None) in RETRYABLE_STATUS_CODES:
+        return True
+    return any(cls.__name__ in RETRYABLE_ERRORS for cls in type(error).__mro__)
+
+
+def retry_after(error: BaseException) -> float | None:
+    """Read the retry-after delay in seconds from a provider error response, if present"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(0.0, float(value) / 1000)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Process-wide registry of ProviderRateLimiters, shared by all LLMs in a Context.
+    """
+
+    def __init__(self) -> None:
+        self._limiters: Dict[Tuple[str, str, str], ProviderRateLimiter] = {}
+
+    def limiter(
+        self,
+        provider: str,
+        api_key: str | None,
+        model: str | None,
+        settings: "RateLimitSettings | None" = None,
+    ) -> ProviderRateLimiter:
+        """Return the limiter for a provider, API key and model, creating it from settings"""
+        key_hash = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:12]
+        key = (provider, key_hash, model or "")
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            options: Dict[str, Any] = settings.model_dump() if settings else {}
+            limiter = ProviderRateLimiter(name=f"{provider}/{model or 'default'}", **options)
+            self._limiters[key] = limiter
+        return limiter
+
+    def stats(self) -> Dict[str, RateLimitStats]:
+        """Statistics for each limiter, keyed by provider/model"""
+        return {limiter.name: limiter.stats for limiter in self._limiters.values()}
@@ -0,0 +1,286 @@
+"""
+A content-addressed cache of provider responses, for development, evaluation and replay.
+
+Requests are keyed by a SHA-256 hash of their canonical JSON: the provider, the endpoint
+and every request argument (model, system prompt, messages, tools and sampling
+parameters). When an agent script or evaluation is run again with identical inputs,
+responses are served from the cache rather than calling the provider. API keys are not
+part of the key.
+
+Responses are stored in a SQLite database, bounded in size and entry count, with the
+least recently used responses evicted first. The cache has four modes:
+
+    read_write  Serve cached responses and cache new ones
+    read_only   Serve cached responses without writing to the cache, for CI
+    record      Always call the provider, caching (or replacing) its responses
+    replay      Serve cached responses, raising ResponseCacheMissError for any other request
+"""
+
+import hashlib
+import importlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Literal, Optional
+
+from pydantic import BaseModel
+
+from mcp_agent.core.exceptions import ResponseCacheMissError
+from mcp_agent.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from mcp_agent.config import ResponseCacheSettings
+
+logger = get_logger(__name__)
+
+CacheMode = Literal["read_write", "read_only", "record", "replay"]
+
+# Changing how keys or responses are encoded must change this, so old entries are not used
+KEY_VERSION = "1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    response_type TEXT NOT NULL,
+    body TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_used_at ON responses(used_at);
+"""
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", exclude_none=True)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def request_key(
+    provider: str, request: Callable[..., Any], arguments: Dict[str, Any]
+) -> str | None:
+    """
+    The cache key for a provider request, or None if its arguments cannot be encoded
+    as JSON (such requests are not cached).
+    """
+    endpoint = getattr(request, "__qualname__", type(request).__name__)
+    try:
+        body = json.dumps(
+            [KEY_VERSION, provider, endpoint, arguments],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_canonical,
+        )
+    except (TypeError, ValueError) as e:
+        logger.debug(f"Request to {provider} is not cacheable: {e}")
+        return None
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def _type_name(response: BaseModel) -> str:
+    return f"{type(response).__module__}:{type(response).__qualname__}"
+
+
+def _load_type(name: str) -> type[BaseModel]:
+    module_name, _, qualname = name.partition(":")
+    value: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        value = getattr(value, part)
+    if not (isinstance(value, type) and issubclass(value, BaseModel)):
+        raise TypeError(f"{name} is not a Pydantic model")
+    return value
+
+
+class ResponseCache:
+    """
+    Caches provider responses by request key. Responses must be Pydantic models, as the
+    Anthropic and OpenAI SDK responses are. Safe to use from multiple threads and
+    processes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: CacheMode = "read_write",
+        max_size_bytes: int = 512 * 1024 * 1024,
+        max_entries: int | None = None,
+    ) -> None:
+        """
+        Args:
+            path: SQLite database file. Created if it does not exist, unless the mode
+                  does not write to the cache.
+            mode: read_write, read_only, record or replay
+            max_size_bytes: Maximum total size of cached responses
+            max_entries: Maximum number of cached responses
+        """
+        self.path = Path(path)
+        self.mode = mode
+        self.max_size_bytes = max_size_bytes
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        if self.writes_responses:
+            if self.path.parent and not self.path.parent.exists():
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(_SCHEMA)
+        elif self.path.exists():
+            self._connection = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                timeout=30,
+            )
+        else:
+            logger.warning(
+                f"Response cache {self.path} does not exist, so nothing will be replayed"
+            )
+
+    @property
+    def reads_responses(self) -> bool:
+        """Whether cached responses are served"""
+        return self.mode != "record"
+
+    @property
+    def writes_responses(self) -> bool:
+        """Whether provider responses are cached"""
+        return self.mode in ("read_write", "record")
+
+    def get(self, key: str) -> BaseModel | None:
+        """
+        Return the cached response for a request key, or None if there is none.
+
+        Raises:
+            ResponseCacheMissError: In replay mode, if the response is not cached
+        """
+        row = None
+        if self._connection is not None:
+            with self._lock:
+                try:
+                    row = self._connection.execute(
+                        "SELECT response_type, body FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.OperationalError as e:
+                    logger.warning(f"Unable to read the response cache: {e}")
+                if row is not None and self.writes_responses:
+                    with self._connection:
+                        self._connection.execute(
+                            "UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key)
+                        )
+
+        response = None
+        if row is not None:
+            try:
+                response = _load_type(row[0]).model_validate_json(row[1])
+            except Exception as e:
+                logger.warning(f"Unable to restore cached response {key}: {e}")
+
+        if response is None:
+            self.misses += 1
+            if self.mode == "replay":
+                raise ResponseCacheMissError(
+                    "No cached response for this request",
+                    f"The response cache {self.path} is in replay mode and has no response "
+                    f"for request {key}.\nRecord it by running with the read_write or record "
+                    "mode.",
+                )
+            return None
+        self.hits += 1
+        return response
+
+    def put(self, key: str, response: BaseModel, provider: str = "", model: str = "") -> None:
+        """Cache a response, evicting the least recently used responses beyond the limits"""
+        if not self.writes_responses or self._connection is None:
+            return
+        body = response.model_dump_json()
+        size = len(body.encode("utf-8"))
+        if size > self.max_size_bytes:
+            logger.debug(f"Response {key} is too large to cache ({size} bytes)")
+            return
+
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, provider, model, response_type, body, size, created_at, used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, model, _type_name(response), body, size, now, now),
+            )
+            self.writes += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        count, total = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_size_bytes and (self.max_entries is None or count <= self.max_entries):
+            return
+        evicted = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY used_at"
+        ).fetchall():
+            if total <= self.max_size_bytes and (
+                self.max_entries is None or count <= self.max_entries
+            ):
+                break
+            evicted.append((key,))
+            count -= 1
+            total -= size
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+    def clear(self) -> None:
+        """Remove every cached response"""
+        if not self.writes_responses or self._connection is None:
+            return
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss, write and eviction counts and the current size"""
+        count, total = 0, 0
+        if self._connection is not None:
+            with self._lock:
+                count, total = self._connection.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                ).fetchone()
+        return {
+            "entries": count,
+            "size_bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        if self._connection is not None:
+            with self._lock:
+                self._connection.close()
+                self._connection = None
+
+
+def create_response_cache(settings: Optional["ResponseCacheSettings"]) -> ResponseCache | None:
+    """Create a ResponseCache from settings, or None if response caching is disabled."""
+    if settings is None or not settings.enabled:
+        return None
+    return ResponseCache(
+        settings.path,
+        mode=settings.mode,
+        max_size_bytes=int(settings.max_size_mb * 1024 * 1024),
+        max_entries=settings.max_entries,
+    )
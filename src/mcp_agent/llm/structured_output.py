@@ -0,0 +1,47 @@
+"""
+Helpers for structured output: JSON schemas for Pydantic models, parsing of model
+responses, and the prompt asking the model to repair a response that failed validation.
+"""
+
+import functools
+import re
+from typing import Any, Dict, Type
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.mcp.interfaces import ModelT
+from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+
+_FENCED_JSON = re.compile(r"^```(?:json)?\s*(.*?)\s*```$", re.DOTALL)
+
+
+@functools.lru_cache(maxsize=256)
+def model_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """The JSON schema of a model, generated once per model. Must not be modified."""
+    return model.model_json_schema()
+
+
+def parse_structured(text: str, model: Type[ModelT]) -> ModelT:
+    """
+    Validate a JSON response against a model. Markdown code fences around the JSON are
+    ignored, and truncated JSON is completed where possible.
+
+    Raises:
+        ValueError: If the text is not JSON or does not match the model
+    """
+    text = text.strip()
+    fenced = _FENCED_JSON.match(text)
+    if fenced:
+        text = fenced.group(1)
+    return model.model_validate(from_json(text, allow_partial=True))
+
+
+def repair_prompt(error: Exception) -> PromptMessageMultipart:
+    """Ask the model to correct a response that failed parsing or validation"""
+    return Prompt.user(
+        "Your response could not be parsed against the required JSON schema:\n"
+        f"{error}\n"
+        "Reply with only the corrected JSON object."
+    )
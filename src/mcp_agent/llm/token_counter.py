@@ -0,0 +1,156 @@
+"""
+Offline token estimates for provider messages.
+
+Providers only report token usage after a request has been made. A TokenCounter
+estimates the size of a request before it is sent, using a tokenizer when one is
+available and a character count otherwise. Estimates are calibrated against the
+input token counts reported by the provider, so they improve as a model is used.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from pydantic import BaseModel
+
+from mcp_agent.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Rough heuristic used for token estimates when no tokenizer is available
+CHARS_PER_TOKEN = 4
+# Fixed estimate for inline images and other base64 data
+BINARY_TOKEN_ESTIMATE = 1500
+
+# Requests smaller than this are dominated by fixed provider overhead, so are not
+# used for calibration
+CALIBRATION_MIN_TOKENS = 500
+# Weight given to each new observation when calibrating
+CALIBRATION_RATE = 0.3
+MIN_SCALE = 0.25
+MAX_SCALE = 4.0
+
+Tokenizer = Callable[[str], int]
+
+
+class TokenCounter:
+    """
+    Estimates tokens for a provider and model. Counts are returned unscaled so they
+    can be cached; apply `scaled` to a total to correct it using calibration.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Tokenizer | None = None,
+        chars_per_token: float = CHARS_PER_TOKEN,
+        tokenizer_factory: Callable[[], Tokenizer | None] | None = None,
+    ) -> None:
+        """
+        Args:
+            tokenizer: Returns the number of tokens in a string. If not supplied,
+                       tokens are estimated from the character count.
+            chars_per_token: Characters per token used when there is no tokenizer
+            tokenizer_factory: Creates the tokenizer when the first string is counted.
+                               Loading a tokenizer may need the network, so failures
+                               fall back to character counts.
+        """
+        self.tokenizer = tokenizer
+        self.chars_per_token = chars_per_token
+        self.scale = 1.0
+        self._lock = threading.Lock()
+        self._tokenizer_factory = tokenizer_factory
+
+    def count_text(self, text: str) -> float:
+        """Count the tokens in a string"""
+        if self._tokenizer_factory is not None:
+            self._load_tokenizer()
+        if self.tokenizer is not None:
+            return self.tokenizer(text)
+        return len(text) / self.chars_per_token
+
+    def _load_tokenizer(self) -> None:
+        with self._lock:
+            factory = self._tokenizer_factory
+            self._tokenizer_factory = None
+            if factory is None:
+                return
+            try:
+                self.tokenizer = factory()
+            except Exception as e:
+                logger.warning(f"Unable to load tokenizer, estimating tokens from characters: {e}")
+
+    def count(self, value: Any) -> int:
+        """
+        Count the tokens in a message, content block, tool definition or any other value
+        sent to a provider. Inline images and other base64 data are counted as a fixed amount.
+        """
+        return int(self._count(value))
+
+    def count_message(self, message: Any) -> int:
+        """Count the tokens in a provider message. Every message counts as at least one token."""
+        return max(1, self.count(message))
+
+    def scaled(self, tokens: int) -> int:
+        """Apply the calibrated correction to an unscaled token count"""
+        return int(tokens * self.scale)
+
+    def unscaled(self, tokens: int) -> int:
+        """Convert a calibrated token count back to this counter's unscaled units"""
+        return int(tokens / self.scale)
+
+    def calibrate(self, estimated: int, actual: int) -> None:
+        """
+        Adjust the scale towards the ratio between a provider's reported input tokens
+        and our unscaled estimate for the same request.
+        """
+        if estimated < CALIBRATION_MIN_TOKENS or actual <= 0:
+            return
+        ratio = actual / estimated
+        with self._lock:
+            scale = self.scale + CALIBRATION_RATE * (ratio - self.scale)
+            self.scale = min(MAX_SCALE, max(MIN_SCALE, scale))
+
+    def _count(self, value: Any) -> float:
+        if isinstance(value, str):
+            if value.startswith("data:"):
+                return BINARY_TOKEN_ESTIMATE
+            return self.count_text(value)
+        if isinstance(value, BaseModel):
+            value = value.model_dump(exclude_none=True)
+        if isinstance(value, dict):
+            if value.get("type") == "base64":
+                return BINARY_TOKEN_ESTIMATE
+            return sum(self._count(item) for item in value.values())
+        if isinstance(value, (list, tuple)):
+            return sum(self._count(item) for item in value)
+        if value is None or isinstance(value, (bool, int, float)):
+            return 0
+        return self.count_text(str(value))
+
+
+# Counters are shared by every LLM using the same provider and model, so that
+# calibration carries over between agents
+_counters: Dict[Tuple[str, str], TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def get_token_counter(
+    provider: str | None,
+    model: str | None,
+    tokenizer_factory: Callable[[], Tokenizer | None] | None = None,
+) -> TokenCounter:
+    """
+    Return the shared TokenCounter for a provider and model, creating it if needed.
+
+    Args:
+        provider: The provider name
+        model: The model name
+        tokenizer_factory: Creates a tokenizer for the model when it is first needed,
+                           or returns None if no tokenizer is available
+    """
+    key = (provider or "", model or "")
+    with _counters_lock:
+        counter = _counters.get(key)
+        if counter is None:
+            counter = TokenCounter(tokenizer_factory=tokenizer_factory)
+            _counters[key] = counter
+        return counter
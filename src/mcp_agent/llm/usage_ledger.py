@@ -0,0 +1,230 @@
+"""
+Accounting of LLM and tool calls: tokens, cached tokens, latency and estimated cost.
+
+The ledger is shared by all agents in a Context. Each call is recorded against the
+agent that made it and the workflows (chain, parallel, orchestrator...) it ran within,
+so usage can be broken down by agent, workflow or model. Records are also sent to the
+logging bus and to OpenTelemetry metrics.
+"""
+
+import functools
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Literal, Tuple, TypeVar
+
+from opentelemetry import metrics
+
+from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.metrics import LATENCY_BUCKETS
+
+logger = get_logger(__name__)
+
+FuncT = TypeVar("FuncT", bound=Callable[..., Any])
+
+# Names of the workflows enclosing the current call, outermost first
+_workflows: ContextVar[Tuple[str, ...]] = ContextVar("usage_workflows", default=())
+
+
+@dataclass
+class TokenUsage:
+    """Token usage reported by a provider response"""
+
+    input_tokens: int = 0
+    """Input tokens, including cached tokens"""
+
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+@dataclass
+class UsageRecord:
+    """A single LLM or tool call"""
+
+    kind: Literal["llm", "tool"]
+    name: str
+    """The model for LLM calls, or the tool name for tool calls"""
+
+    agent: str | None = None
+    workflows: Tuple[str, ...] = ()
+    latency: float = 0.0
+    """Wall time of the call, in seconds"""
+
+    input_tokens: int = 0
+    """Input tokens, including cached tokens"""
+
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost: float | None = None
+    """Estimated cost in USD, if pricing is known for the model"""
+
+    error: bool = False
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass
+class UsageSummary:
+    """Totals for a set of usage records"""
+
+    llm_calls: int = 0
+    tool_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    llm_time: float = 0.0
+    tool_time: float = 0.0
+    cost: float = 0.0
+    errors: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def add(self, record: UsageRecord) -> None:
+        if record.kind == "llm":
+            self.llm_calls += 1
+            self.llm_time += record.latency
+        else:
+            self.tool_calls += 1
+            self.tool_time += record.latency
+        self.input_tokens += record.input_tokens
+        self.output_tokens += record.output_tokens
+        self.cache_read_tokens += record.cache_read_tokens
+        self.cache_write_tokens += record.cache_write_tokens
+        self.cost += record.cost or 0.0
+        self.errors += 1 if record.error else 0
+
+
+class UsageLedger:
+    """
+    Records LLM and tool calls, keeping running totals per agent, workflow and model.
+    Only the most recent max_records individual records are retained; totals cover every call.
+    """
+
+    def __init__(self, max_records: int = 10_000) -> None:
+        self._records: Deque[UsageRecord] = deque(maxlen=max_records)
+        self._total = UsageSummary()
+        self._by_agent: Dict[str, UsageSummary] = {}
+        self._by_workflow: Dict[str, UsageSummary] = {}
+        self._by_model: Dict[str, UsageSummary] = {}
+
+        meter = metrics.get_meter("mcp_agent.usage")
+        self._tokens = meter.create_counter(
+            "fast_agent.llm.tokens", unit="token", description="Tokens used by LLM calls"
+        )
+        self._cost = meter.create_counter(
+            "fast_agent.llm.cost", unit="USD", description="Estimated cost of LLM calls"
+        )
+        self._duration = meter.create_histogram(
+            "fast_agent.call.duration",
+            unit="s",
+            explicit_bucket_boundaries_advisory=LATENCY_BUCKETS,
+            description="Duration of LLM and tool calls",
+        )
+
+    @property
+    def records(self) -> List[UsageRecord]:
+        """The most recent usage records, oldest first"""
+        return list(self._records)
+
+    def record(self, record: UsageRecord) -> None:
+        """Add a record to the ledger and export it"""
+        if not record.workflows:
+            record.workflows = _workflows.get()
+        self._records.append(record)
+        self._total.add(record)
+        if record.agent:
+            self._by_agent.setdefault(record.agent, UsageSummary()).add(record)
+        for workflow in record.workflows:
+            self._by_workflow.setdefault(workflow, UsageSummary()).add(record)
+        if record.kind == "llm":
+            self._by_model.setdefault(record.name, UsageSummary()).add(record)
+
+        logger.debug(f"{record.kind.upper()} call usage", data=asdict(record))
+        self._export_metrics(record)
+
+    def summary(self, agent: str | None = None, workflow: str | None = None) -> UsageSummary:
+        """
+        Return totals for an agent, a workflow, or (with no arguments) every call.
+        Unknown agents and workflows return an empty summary.
+        """
+        if agent is not None:
+            return self._by_agent.get(agent, UsageSummary())
+        if workflow is not None:
+            return self._by_workflow.get(workflow, UsageSummary())
+        return self._total
+
+    def by_agent(self) -> Dict[str, UsageSummary]:
+        return dict(self._by_agent)
+
+    def by_workflow(self) -> Dict[str, UsageSummary]:
+        return dict(self._by_workflow)
+
+    def by_model(self) -> Dict[str, UsageSummary]:
+        return dict(self._by_model)
+
+    def clear(self) -> None:
+        """Discard all records and totals"""
+        self._records.clear()
+        self._total = UsageSummary()
+        self._by_agent.clear()
+        self._by_workflow.clear()
+        self._by_model.clear()
+
+    def _export_metrics(self, record: UsageRecord) -> None:
+        attributes = {"kind": record.kind, "name": record.name}
+        if record.agent:
+            attributes["agent"] = record.agent
+        if record.workflows:
+            attributes["workflow"] = record.workflows[0]
+        if record.error:
+            attributes["error"] = True
+
+        self._duration.record(record.latency, attributes)
+        if record.kind != "llm":
+            return
+        for token_type, count in (
+            ("input", record.input_tokens),
+            ("output", record.output_tokens),
+            ("cache_read", record.cache_read_tokens),
+            ("cache_write", record.cache_write_tokens),
+        ):
+            if count:
+                self._tokens.add(count, {**attributes, "token_type": token_type})
+        if record.cost:
+            self._cost.add(record.cost, attributes)
+
+
+def current_workflows() -> Tuple[str, ...]:
+    """Names of the workflows enclosing the current call, outermost first"""
+    return _workflows.get()
+
+
+@contextmanager
+def workflow_scope(name: str) -> Iterator[None]:
+    """Attribute usage recorded within this block to the named workflow"""
+    token = _workflows.set(_workflows.get() + (name,))
+    try:
+        yield
+    finally:
+        _workflows.reset(token)
+
+
+def tracks_usage(method: FuncT) -> FuncT:
+    """Decorator for workflow agent methods, attributing usage within the call to the agent"""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        with workflow_scope(self.name):
+            return await method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
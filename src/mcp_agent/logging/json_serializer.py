@@ -12,6 +12,7 @@ from uuid import UUID
 import httpx
 
 from mcp_agent.logging import logger
+from mcp_agent.logging.profiler import profiled
 
 
 class JSONSerializer:
@@ -51,6 +52,7 @@ class JSONSerializer:
             return value + "....."
         return value[:10] + "....."
 
+    @profiled("serialization")
     def serialize(self, obj: Any) -> Any:
         """Main entry point for serialization."""
         # Reset processed objects for new serialization
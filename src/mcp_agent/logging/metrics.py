@@ -0,0 +1,177 @@
+"""
+Metrics for capacity planning: LLM request and tool call latency, MCP server connections,
+event bus and executor load, and agent turns.
+
+Instruments use the OpenTelemetry metrics API, so recording is cheap until
+configure_metrics installs a MeterProvider. Metrics are exported with OTLP, or read by
+the Prometheus endpoint started when agents are served over MCP.
+"""
+
+from collections import Counter
+from typing import TYPE_CHECKING, Iterable, List
+from weakref import WeakSet
+
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+    from mcp_agent.config import Settings
+    from mcp_agent.mcp.mcp_connection_manager import MCPConnectionManager
+
+meter = metrics.get_meter("mcp_agent")
+
+# Histogram buckets for latencies, in seconds (the SDK defaults suit milliseconds)
+LATENCY_BUCKETS = [
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+]
+
+llm_request_duration = meter.create_histogram(
+    "fast_agent.llm.request.duration",
+    unit="s",
+    explicit_bucket_boundaries_advisory=LATENCY_BUCKETS,
+    description="Duration of provider requests, by provider and model",
+)
+tool_call_duration = meter.create_histogram(
+    "fast_agent.tool.call.duration",
+    unit="s",
+    explicit_bucket_boundaries_advisory=LATENCY_BUCKETS,
+    description="Duration of MCP tool calls, by server and tool",
+)
+agent_turns = meter.create_counter(
+    "fast_agent.agent.turns", unit="{turn}", description="Conversation turns handled by agents"
+)
+structured_outputs = meter.create_counter(
+    "fast_agent.llm.structured_outputs",
+    unit="{request}",
+    description="Structured output requests, by provider, mode and outcome",
+)
+response_cache_lookups = meter.create_counter(
+    "fast_agent.llm.response_cache.lookups",
+    unit="{request}",
+    description="Provider requests looked up in the response cache, by provider and outcome",
+)
+event_bus_dropped = meter.create_counter(
+    "fast_agent.event_bus.dropped",
+    unit="{event}",
+    description="Log events that were not delivered to the transport or listeners",
+)
+executor_in_flight = meter.create_up_down_counter(
+    "fast_agent.executor.in_flight",
+    unit="{task}",
+    description="Tasks running in the executor",
+)
+executor_semaphore_wait = meter.create_histogram(
+    "fast_agent.executor.semaphore.wait",
+    unit="s",
+    explicit_bucket_boundaries_advisory=LATENCY_BUCKETS,
+    description="Time tasks waited for an executor slot (max_concurrent_activities)",
+)
+
+# Connection managers whose servers are reported by the connection gauge
+_connection_managers: "WeakSet[MCPConnectionManager]" = WeakSet()
+
+
+def track_connections(manager: "MCPConnectionManager") -> None:
+    """Report the state of the manager's server connections"""
+    _connection_managers.add(manager)
+
+
+def _observe_connections(_options: CallbackOptions) -> Iterable[Observation]:
+    states = Counter(
+        (name, connection.state)
+        for manager in list(_connection_managers)
+        for name, connection in list(manager.running_servers.items())
+    )
+    return [
+        Observation(count, {"server": server, "state": state})
+        for (server, state), count in states.items()
+    ]
+
+
+def _observe_event_bus(_options: CallbackOptions) -> Iterable[Observation]:
+    from mcp_agent.logging.transport import AsyncEventBus
+
+    bus = AsyncEventBus._instance
+    return [Observation(bus._queue.qsize())] if bus is not None else []
+
+
+meter.create_observable_gauge(
+    "fast_agent.mcp.connections",
+    callbacks=[_observe_connections],
+    unit="{connection}",
+    description="MCP server connections, by server and state (connecting, connected, failed)",
+)
+meter.create_observable_gauge(
+    "fast_agent.event_bus.queue.depth",
+    callbacks=[_observe_event_bus],
+    unit="{event}",
+    description="Log events waiting for the event bus listeners",
+)
+
+_prometheus_reader: "InMemoryMetricReader | None" = None
+
+
+def prometheus_reader() -> "InMemoryMetricReader | None":
+    """The reader behind the Prometheus endpoint, if metrics.prometheus_port is set"""
+    return _prometheus_reader
+
+
+def configure_metrics(config: "Settings") -> None:
+    """
+    Install a MeterProvider exporting to the configured OTLP endpoint and Prometheus
+    endpoint. Without either, the metrics API is left as a no-op.
+    """
+    global _prometheus_reader
+
+    settings = config.metrics
+    if settings is None or not settings.enabled:
+        return
+    if not settings.otlp_endpoint and settings.prometheus_port is None:
+        return
+
+    # The SDK and exporters are only imported when metrics are enabled
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader, MetricReader
+    from opentelemetry.sdk.resources import Resource
+
+    # Check if a provider is already set to avoid re-initialization
+    if isinstance(metrics.get_meter_provider(), MeterProvider):
+        return
+
+    readers: List[MetricReader] = []
+    if settings.otlp_endpoint:
+        from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+
+        readers.append(
+            PeriodicExportingMetricReader(
+                OTLPMetricExporter(endpoint=settings.otlp_endpoint),
+                export_interval_millis=settings.export_interval_seconds * 1000,
+            )
+        )
+    if settings.prometheus_port is not None:
+        _prometheus_reader = InMemoryMetricReader()
+        readers.append(_prometheus_reader)
+
+    service_name = config.otel.service_name if config.otel else "fast-agent"
+    metrics.set_meter_provider(
+        MeterProvider(
+            resource=Resource.create({"service.name": service_name}), metric_readers=readers
+        )
+    )
@@ -0,0 +1,272 @@
+"""
+Profiling of the phases of agent turns, exported as a Chrome trace.
+
+While a Profiler is active, each instrumented phase is timed: LLM turns, history
+conversion, provider requests, MCP calls, console rendering, log serialization, event bus
+work and workflow steps. Phases are recorded on a track per asyncio task, so concurrent
+turns appear side by side when the trace is opened in https://ui.perfetto.dev or
+chrome://tracing.
+
+    with Profiler() as profiler:
+        await agent.send("hello")
+    profiler.write_chrome_trace("profile.json")
+    print(profiler.report())
+
+When no profiler is active, a phase costs a global lookup.
+"""
+
+import asyncio
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Tuple, TypeVar
+from weakref import WeakKeyDictionary
+
+FuncT = TypeVar("FuncT", bound=Callable[..., Any])
+
+_active: "Profiler | None" = None
+_not_profiling = nullcontext()
+
+
+class _OpenPhase:
+    __slots__ = ("task", "child_time")
+
+    def __init__(self, task: asyncio.Task | None) -> None:
+        self.task = task
+        self.child_time = 0.0
+
+
+# The innermost phase open in the current task
+_open_phase: ContextVar[_OpenPhase | None] = ContextVar("profile_phase", default=None)
+
+
+@dataclass
+class PhaseEvent:
+    """A single timed phase"""
+
+    name: str
+    category: str
+    start: float
+    """Seconds after the profiler started"""
+
+    duration: float
+    self_time: float
+    """Duration excluding phases nested within this one in the same task"""
+
+    track: int
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class PhaseSummary:
+    """Totals for every occurrence of a phase"""
+
+    category: str
+    name: str
+    count: int = 0
+    total: float = 0.0
+    self_total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+def _current_task() -> asyncio.Task | None:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+class Profiler:
+    """Records the phases of agent turns while active"""
+
+    def __init__(self, max_events: int = 100_000) -> None:
+        self.max_events = max_events
+        self.events: List[PhaseEvent] = []
+        self.dropped = 0
+        """Events not recorded because max_events was reached"""
+
+        self._origin = time.perf_counter()
+        self._tracks: WeakKeyDictionary[asyncio.Task, int] = WeakKeyDictionary()
+        self._track_names: Dict[int, str] = {0: "main"}
+        self._previous: Profiler | None = None
+
+    def start(self) -> None:
+        """Make this the active profiler, restarting its clock"""
+        global _active
+        self._previous = _active
+        self._origin = time.perf_counter()
+        _active = self
+
+    def stop(self) -> None:
+        """Stop recording, restoring any profiler that was active before this one"""
+        global _active
+        if _active is self:
+            _active = self._previous
+        self._previous = None
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @contextmanager
+    def phase(self, name: str, category: str, **args: Any) -> Iterator[None]:
+        """Time the enclosed block as a phase"""
+        task = _current_task()
+        parent = _open_phase.get()
+        current = _OpenPhase(task)
+        token = _open_phase.set(current)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - started
+            _open_phase.reset(token)
+            if parent is not None and parent.task is task:
+                parent.child_time += duration
+            self._record(
+                PhaseEvent(
+                    name=name,
+                    category=category,
+                    start=started - self._origin,
+                    duration=duration,
+                    self_time=max(duration - current.child_time, 0.0),
+                    track=self._track(task),
+                    args=args,
+                )
+            )
+
+    def _record(self, event: PhaseEvent) -> None:
+        if len(self.events) >= self.max_events:
+            self.dropped += 1
+            return
+        self.events.append(event)
+
+    def _track(self, task: asyncio.Task | None) -> int:
+        if task is None:
+            return 0
+        track = self._tracks.get(task)
+        if track is None:
+            track = len(self._track_names)
+            self._tracks[task] = track
+            self._track_names[track] = task.get_name()
+        return track
+
+    def summary(self) -> List[PhaseSummary]:
+        """Totals for each phase, by descending self time"""
+        phases: Dict[Tuple[str, str], PhaseSummary] = {}
+        for event in self.events:
+            key = (event.category, event.name)
+            summary = phases.get(key)
+            if summary is None:
+                summary = phases[key] = PhaseSummary(event.category, event.name)
+            summary.count += 1
+            summary.total += event.duration
+            summary.self_total += event.self_time
+            summary.max = max(summary.max, event.duration)
+        return sorted(phases.values(), key=lambda summary: summary.self_total, reverse=True)
+
+    def report(self) -> str:
+        """A table of phase totals in milliseconds, for display"""
+        lines = [
+            f"{'category':14} {'phase':28} {'count':>6} {'total':>10} {'self':>10} "
+            f"{'mean':>9} {'max':>9}"
+        ]
+        for phase in self.summary():
+            lines.append(
+                f"{phase.category:14} {phase.name[:28]:28} {phase.count:6} "
+                f"{phase.total * 1000:10.1f} {phase.self_total * 1000:10.1f} "
+                f"{phase.mean * 1000:9.2f} {phase.max * 1000:9.2f}"
+            )
+        if self.dropped:
+            lines.append(f"{self.dropped} phases were not recorded (max_events reached)")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """The recorded phases in Chrome trace event format, also read by Perfetto"""
+        pid = os.getpid()
+        trace_events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "fast-agent"}}
+        ]
+        for track, name in self._track_names.items():
+            trace_events.append(
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": track, "args": {"name": name}}
+            )
+        for event in self.events:
+            trace_events.append(
+                {
+                    "name": event.name,
+                    "cat": event.category,
+                    "ph": "X",
+                    "ts": round(event.start * 1_000_000, 3),
+                    "dur": round(event.duration * 1_000_000, 3),
+                    "pid": pid,
+                    "tid": event.track,
+                    "args": event.args,
+                }
+            )
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str | Path) -> None:
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(self.chrome_trace(), trace_file, default=str)
+
+
+def active_profiler() -> Profiler | None:
+    """The profiler recording phases, if any"""
+    return _active
+
+
+def profile_phase(name: str, category: str, **args: Any) -> ContextManager[None]:
+    """Time the enclosed block as a phase if a profiler is active"""
+    profiler = _active
+    if profiler is None:
+        return _not_profiling
+    return profiler.phase(name, category, **args)
+
+
+def profiled(category: str, name: str | None = None) -> Callable[[FuncT], FuncT]:
+    """Decorator timing each call of a sync or async function as a phase"""
+
+    def decorator(func: FuncT) -> FuncT:
+        phase_name = name or func.__name__
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with profile_phase(phase_name, category):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            with profile_phase(phase_name, category):
+                return func(*args, **kwargs)
+
+        return sync_wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def profiles_workflow_step(method: FuncT) -> FuncT:
+    """Decorator for workflow agent methods, timing each call as a workflow phase"""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        with profile_phase(type(self).__name__, "workflow", agent=self.name):
+            return await method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
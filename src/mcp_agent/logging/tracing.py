@@ -5,19 +5,27 @@ for the Logger module for MCP Agent
 
 import asyncio
 import functools
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, TypeVar
 
 from opentelemetry import trace
-from opentelemetry.context import Context as OtelContext
 from opentelemetry.propagate import extract as otel_extract
-from opentelemetry.trace import SpanKind, Status, StatusCode, set_span_in_context
-from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+from opentelemetry.propagate import inject as otel_inject
+from opentelemetry.trace import SpanKind, Status, StatusCode
 
 from mcp_agent.context_dependent import ContextDependent
 
 if TYPE_CHECKING:
+    from mcp.types import ClientRequest
+
     from mcp_agent.context import Context
 
+FuncT = TypeVar("FuncT", bound=Callable[..., Any])
+
+# Spans for LLM turns, provider requests, MCP requests and workflow steps. The tracer
+# follows the global provider, so spans are dropped until configure_otel installs one.
+tracer = trace.get_tracer("mcp_agent")
+
 
 class TelemetryManager(ContextDependent):
     """
@@ -100,39 +108,71 @@ class MCPRequestTrace:
     """Helper class for trace context propagation in MCP"""
 
     @staticmethod
+    @contextmanager
     def start_span_from_mcp_request(
-        method: str, params: Dict[str, Any]
-    ) -> Tuple[trace.Span, OtelContext]:
-        """Extract trace context from incoming MCP request and start a new span"""
-        # Extract trace context from _meta if present
-        carrier = {}
-        _meta = params.get("_meta", {})
-        if "traceparent" in _meta:
-            carrier["traceparent"] = _meta["traceparent"]
-        if "tracestate" in _meta:
-            carrier["tracestate"] = _meta["tracestate"]
-
-        # Extract context and start span
-        ctx = otel_extract(carrier, context=OtelContext())
-        tracer = trace.get_tracer(__name__)
-        span = tracer.start_span(method, context=ctx, kind=SpanKind.SERVER)
-        return span, set_span_in_context(span)
+        name: str, meta: Any, attributes: Dict[str, Any] | None = None
+    ) -> Iterator[trace.Span]:
+        """Start a span for an incoming MCP request, continuing the caller's trace from _meta"""
+        values = meta.model_dump() if meta is not None else {}
+        carrier = {key: values[key] for key in ("traceparent", "tracestate") if values.get(key)}
+        parent = otel_extract(carrier) if carrier else None
+        with tracer.start_as_current_span(
+            name, context=parent, kind=SpanKind.SERVER, attributes=attributes
+        ) as span:
+            yield span
 
     @staticmethod
-    def inject_trace_context(arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Inject current trace context into outgoing MCP request arguments"""
-        carrier = {}
-        TraceContextTextMapPropagator().inject(carrier)
-
-        # Create or update _meta with trace context
-        _meta = arguments.get("_meta", {})
-        if "traceparent" in carrier:
-            _meta["traceparent"] = carrier["traceparent"]
-        if "tracestate" in carrier:
-            _meta["tracestate"] = carrier["tracestate"]
-        arguments["_meta"] = _meta
-
-        return arguments
+    def inject_trace_context(request: "ClientRequest") -> None:
+        """Add the current trace context to an outgoing MCP request's _meta"""
+        carrier: Dict[str, str] = {}
+        otel_inject(carrier)
+        params = getattr(request.root, "params", None)
+        if not carrier or params is None:
+            return
+
+        from mcp.types import RequestParams
+
+        meta = params.meta or RequestParams.Meta()
+        for key, value in carrier.items():
+            setattr(meta, key, value)
+        params.meta = meta
+
+
+def traces_workflow_step(method: FuncT) -> FuncT:
+    """Decorator for workflow agent methods, tracing each call as a workflow step"""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        with tracer.start_as_current_span(
+            f"{method.__name__} {self.name}",
+            attributes={"agent.name": self.name, "mcp_agent.workflow": type(self).__name__},
+        ):
+            return await method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def set_usage_attributes(span: trace.Span, usage: Any) -> None:
+    """Record the token usage reported by an Anthropic or OpenAI response on a span"""
+    if usage is None:
+        return
+    input_tokens = getattr(usage, "input_tokens", None)
+    if input_tokens is None:
+        input_tokens = getattr(usage, "prompt_tokens", None)
+    output_tokens = getattr(usage, "output_tokens", None)
+    if output_tokens is None:
+        output_tokens = getattr(usage, "completion_tokens", None)
+
+    if isinstance(input_tokens, int):
+        span.set_attribute("gen_ai.usage.input_tokens", input_tokens)
+    if isinstance(output_tokens, int):
+        span.set_attribute("gen_ai.usage.output_tokens", output_tokens)
+
+
+def record_error(span: trace.Span, error: BaseException) -> None:
+    """Mark a span as failed"""
+    span.record_exception(error)
+    span.set_status(Status(StatusCode.ERROR, str(error)))
 
 
 telemetry = TelemetryManager()
@@ -9,19 +9,24 @@ import json
 import traceback
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Protocol
+from typing import TYPE_CHECKING, Dict, List, Protocol
 
-import aiohttp
 from opentelemetry import trace
 from rich import print
 from rich.json import JSON
 from rich.text import Text
 
-from mcp_agent.config import LoggerSettings
 from mcp_agent.console import console
 from mcp_agent.logging.events import Event, EventFilter
 from mcp_agent.logging.json_serializer import JSONSerializer
 from mcp_agent.logging.listeners import EventListener, LifecycleAwareListener
+from mcp_agent.logging.metrics import event_bus_dropped
+from mcp_agent.logging.profiler import profile_phase, profiled
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from mcp_agent.config import LoggerSettings
 
 
 class EventTransport(Protocol):
@@ -195,12 +200,15 @@ class HTTPTransport(FilteredEventTransport):
 
         self.batch: List[Event] = []
         self.lock = asyncio.Lock()
-        self._session: aiohttp.ClientSession | None = None
+        self._session: "aiohttp.ClientSession | None" = None
         self._serializer = JSONSerializer()
 
     async def start(self) -> None:
         """Initialize HTTP session."""
         if not self._session:
+            # Imported here as aiohttp is slow to import and only needed for HTTP logging
+            import aiohttp
+
             self._session = aiohttp.ClientSession(
                 headers=self.headers, timeout=aiohttp.ClientTimeout(total=self.timeout)
             )
@@ -341,6 +349,7 @@ class AsyncEventBus:
                     try:
                         self._queue.get_nowait()
                         self._queue.task_done()
+                        event_bus_dropped.add(1, {"reason": "shutdown"})
                     except asyncio.QueueEmpty:
                         break
             except Exception as e:
@@ -369,6 +378,7 @@ class AsyncEventBus:
                 except Exception as e:
                     print(f"Error stopping listener: {e}")
 
+    @profiled("events")
     async def emit(self, event: Event) -> None:
         """Emit an event to all listeners and transport."""
         # Inject current tracing info if available
@@ -382,6 +392,7 @@ class AsyncEventBus:
         try:
             await self.transport.send_event(event)
         except Exception as e:
+            event_bus_dropped.add(1, {"reason": "transport_error"})
             print(f"Error in transport.send_event: {e}")
 
         # Then queue for listeners
@@ -422,7 +433,8 @@ class AsyncEventBus:
                         print(f"Error creating listener task: {e}")
 
                 if tasks:
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
+                    with profile_phase("dispatch", "events", type=event.type):
+                        results = await asyncio.gather(*tasks, return_exceptions=True)
                     for r in results:
                         if isinstance(r, Exception):
                             print(f"Error in listener: {r}")
@@ -460,7 +472,7 @@ class AsyncEventBus:
 
 
 def create_transport(
-    settings: LoggerSettings, event_filter: EventFilter | None = None
+    settings: "LoggerSettings", event_filter: EventFilter | None = None
 ) -> EventTransport:
     """Create event transport based on settings."""
     if settings.type == "none":
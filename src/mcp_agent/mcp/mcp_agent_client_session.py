@@ -17,12 +17,15 @@ from mcp.shared.session import (
 from mcp.types import (
     ErrorData,
     ListRootsResult,
+    ResourceListChangedNotification,
+    ResourceUpdatedNotification,
     Root,
 )
 from pydantic import AnyUrl
 
 from mcp_agent.context_dependent import ContextDependent
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.tracing import MCPRequestTrace
 from mcp_agent.mcp.sampling import sample
 
 if TYPE_CHECKING:
@@ -68,12 +71,16 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs, list_roots_callback=list_roots, sampling_callback=sample)
         self.server_config: Optional[MCPServerSettings] = None
+        self.server_name: Optional[str] = None
+        # ClientSession does not chain to ContextDependent.__init__
+        self._context = None
 
     async def send_request(
         self,
         request: SendRequestT,
         result_type: type[ReceiveResultT],
     ) -> ReceiveResultT:
+        MCPRequestTrace.inject_trace_context(request)
         logger.debug("send_request: request=", data=request.model_dump())
         try:
             result = await super().send_request(request, result_type)
@@ -109,8 +116,29 @@ class MCPAgentClientSession(ClientSession, ContextDependent):
             "_received_notification: notification=",
             data=notification.model_dump(),
         )
+        match notification.root:
+            case ResourceUpdatedNotification(params=params):
+                self._invalidate_cached_resource(str(params.uri))
+            case ResourceListChangedNotification():
+                self._invalidate_cached_resource(None)
         return await super()._received_notification(notification)
 
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool | None:
+        try:
+            return await super().__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            # Resource subscriptions end with the session
+            resource_cache = getattr(self._context, "resource_cache", None)
+            if resource_cache is not None and self.server_name:
+                resource_cache.drop_subscribed(self.server_name)
+
+    def _invalidate_cached_resource(self, uri: str | None) -> None:
+        """Drop a resource (or all of this server's resources) from the context resource cache"""
+        resource_cache = getattr(self._context, "resource_cache", None)
+        if resource_cache is not None and self.server_name:
+            logger.debug(f"{self.server_name}: Invalidating cached resource {uri or '*'}")
+            resource_cache.invalidate(self.server_name, uri)
+
     async def send_progress_notification(
         self, progress_token: str | int, progress: float, total: float | None = None
     ) -> None:
@@ -1,3 +1,4 @@
+import time
 from asyncio import Lock, gather
 from typing import (
     TYPE_CHECKING,
@@ -7,6 +8,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Set,
     TypeVar,
 )
 
@@ -21,14 +23,20 @@ from mcp.types import (
     TextContent,
     Tool,
 )
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
 from pydantic import AnyUrl, BaseModel, ConfigDict
 
 from mcp_agent.context_dependent import ContextDependent
 from mcp_agent.event_progress import ProgressAction
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.metrics import tool_call_duration
+from mcp_agent.logging.profiler import profile_phase
+from mcp_agent.logging.tracing import record_error, tracer
 from mcp_agent.mcp.gen_client import gen_client
 from mcp_agent.mcp.mcp_agent_client_session import MCPAgentClientSession
 from mcp_agent.mcp.mcp_connection_manager import MCPConnectionManager
+from mcp_agent.mcp.resource_cache import ResourceCache
 
 if TYPE_CHECKING:
     from mcp_agent.context import Context
@@ -53,6 +61,16 @@ class NamespacedTool(BaseModel):
     namespaced_tool_name: str
 
 
+async def get_connection_manager(context: "Context") -> MCPConnectionManager:
+    """
+    Return the connection manager shared by all aggregators in a context, creating it if needed.
+    """
+    if not hasattr(context, "_connection_manager"):
+        context._connection_manager = MCPConnectionManager(context.server_registry, context=context)
+        await context._connection_manager.__aenter__()
+    return context._connection_manager
+
+
 class MCPAggregator(ContextDependent):
     """
     Aggregates multiple MCP servers. When a developer calls, e.g. call_tool(...),
@@ -76,13 +94,7 @@ class MCPAggregator(ContextDependent):
 
         # Keep a connection manager to manage persistent connections for this aggregator
         if self.connection_persistence:
-            # Try to get existing connection manager from context
-            if not hasattr(self.context, "_connection_manager"):
-                self.context._connection_manager = MCPConnectionManager(
-                    self.context.server_registry
-                )
-                await self.context._connection_manager.__aenter__()
-            self._persistent_connection_manager = self.context._connection_manager
+            self._persistent_connection_manager = await get_connection_manager(self.context)
 
         await self.load_servers()
 
@@ -127,6 +139,12 @@ class MCPAggregator(ContextDependent):
 
         # Cache for prompt objects, maps server_name -> list of prompt objects
         self._prompt_cache: Dict[str, List[Prompt]] = {}
+        # Prompt index, maps server_name -> prompt_name -> prompt object
+        self._prompt_index: Dict[str, Dict[str, Prompt]] = {}
+        # Reverse prompt index, maps prompt_name -> server names (in server_names order)
+        self._prompt_servers: Dict[str, List[str]] = {}
+        # Prompt names that no server provided during the last fallback search
+        self._missing_prompts: Set[str] = set()
         self._prompt_cache_lock = Lock()
 
     async def close(self) -> None:
@@ -196,9 +214,13 @@ class MCPAggregator(ContextDependent):
 
         async with self._prompt_cache_lock:
             self._prompt_cache.clear()
+            self._prompt_index.clear()
+            self._prompt_servers.clear()
+            self._missing_prompts.clear()
 
-        for server_name in self.server_names:
-            if self.connection_persistence:
+        if self.connection_persistence:
+
+            async def connect(server_name: str) -> None:
                 logger.info(
                     f"Creating persistent connection to server: {server_name}",
                     data={
@@ -207,11 +229,14 @@ class MCPAggregator(ContextDependent):
                         "agent_name": self.agent_name,
                     },
                 )
-
                 await self._persistent_connection_manager.get_server(
                     server_name, client_session_factory=MCPAgentClientSession
                 )
 
+            # Servers already connected by another agent are shared rather than relaunched
+            await gather(*(connect(server_name) for server_name in self.server_names))
+
+        if self.server_names:
             logger.info(
                 f"MCP Servers initialized for agent '{self.agent_name}'",
                 data={
@@ -289,7 +314,7 @@ class MCPAggregator(ContextDependent):
 
             # Process prompts
             async with self._prompt_cache_lock:
-                self._prompt_cache[server_name] = prompts
+                self._set_server_prompts(server_name, prompts)
 
             logger.debug(
                 f"MCP Aggregator initialized for server '{server_name}'",
@@ -320,6 +345,82 @@ class MCPAggregator(ContextDependent):
             logger.debug(f"Error getting capabilities for server '{server_name}': {e}")
             return None
 
+    def _set_server_prompts(self, server_name: str, prompts: List[Prompt]) -> None:
+        """
+        Replace the cached prompts for a server and update the prompt indexes.
+        Callers must hold the prompt cache lock.
+        """
+        for prompt_name in self._prompt_index.get(server_name, {}):
+            servers = self._prompt_servers.get(prompt_name)
+            if servers and server_name in servers:
+                servers.remove(server_name)
+                if not servers:
+                    del self._prompt_servers[prompt_name]
+
+        self._prompt_cache[server_name] = prompts
+        self._prompt_index[server_name] = {prompt.name: prompt for prompt in prompts}
+
+        server_order = {name: position for position, name in enumerate(self.server_names)}
+        for prompt_name in self._prompt_index[server_name]:
+            servers = self._prompt_servers.setdefault(prompt_name, [])
+            servers.append(server_name)
+            servers.sort(key=lambda name: server_order.get(name, len(server_order)))
+            self._missing_prompts.discard(prompt_name)
+
+    async def _refresh_server_prompts(self, server_name: str) -> List[Prompt]:
+        """
+        Fetch the prompt list from a server and update the prompt cache.
+        The cache is left untouched if the server could not be queried.
+        """
+        result = await self._execute_on_server(
+            server_name=server_name,
+            operation_type="prompts-list",
+            operation_name="",
+            method_name="list_prompts",
+            error_factory=lambda _: None,
+        )
+        if result is None:
+            return []
+
+        prompts = getattr(result, "prompts", [])
+        async with self._prompt_cache_lock:
+            self._set_server_prompts(server_name, prompts)
+        return prompts
+
+    async def _get_prompt_quietly(
+        self,
+        server_name: str,
+        prompt_name: str,
+        arguments: dict[str, str] | None = None,
+    ) -> GetPromptResult | None:
+        """
+        Get a prompt from a specific server, returning None rather than an error result
+        if the server could not provide it.
+        """
+        method_args = {"name": prompt_name}
+        if arguments:
+            method_args["arguments"] = arguments
+
+        result = await self._execute_on_server(
+            server_name=server_name,
+            operation_type="prompt",
+            operation_name=prompt_name,
+            method_name="get_prompt",
+            method_args=method_args,
+            error_factory=lambda _: None,  # Return None instead of an error
+        )
+        if not result or not result.messages:
+            return None
+
+        # Add namespaced name using the actual server where found
+        result.namespaced_name = f"{server_name}{SEP}{prompt_name}"
+
+        # Store the arguments in the result for display purposes
+        if arguments:
+            result.arguments = arguments
+
+        return result
+
     async def list_servers(self) -> List[str]:
         """Return the list of server names aggregated by this agent."""
         if not self.initialized:
@@ -368,45 +469,62 @@ class MCPAggregator(ContextDependent):
         async def try_execute(client: ClientSession):
             try:
                 method = getattr(client, method_name)
-                return await method(**method_args)
+                result = await method(**(method_args or {}))
+                if getattr(result, "isError", False):
+                    trace.get_current_span().set_status(Status(StatusCode.ERROR))
+                return result
             except Exception as e:
                 error_msg = (
                     f"Failed to {method_name} '{operation_name}' on server '{server_name}': {e}"
                 )
                 logger.error(error_msg)
+                record_error(trace.get_current_span(), e)
                 if error_factory:
                     return error_factory(error_msg)
                 else:
                     # Re-raise the original exception to propagate it
                     raise e
 
-        if self.connection_persistence:
-            server_connection = await self._persistent_connection_manager.get_server(
-                server_name, client_session_factory=MCPAgentClientSession
-            )
-            return await try_execute(server_connection.session)
-        else:
-            logger.debug(
-                f"Creating temporary connection to server: {server_name}",
-                data={
-                    "progress_action": ProgressAction.STARTING,
-                    "server_name": server_name,
-                    "agent_name": self.agent_name,
+        with (
+            tracer.start_as_current_span(
+                f"{method_name} {operation_name}",
+                kind=SpanKind.CLIENT,
+                attributes={
+                    "mcp.server": server_name,
+                    "mcp.operation": operation_type,
+                    "mcp.name": operation_name,
+                    "agent.name": self.agent_name or "",
                 },
-            )
-            async with gen_client(
-                server_name, server_registry=self.context.server_registry
-            ) as client:
-                result = await try_execute(client)
+            ),
+            profile_phase(method_name, "mcp", server=server_name, operation=operation_name),
+        ):
+            if self.connection_persistence:
+                server_connection = await self._persistent_connection_manager.get_server(
+                    server_name, client_session_factory=MCPAgentClientSession
+                )
+                return await try_execute(server_connection.session)
+            else:
                 logger.debug(
-                    f"Closing temporary connection to server: {server_name}",
+                    f"Creating temporary connection to server: {server_name}",
                     data={
-                        "progress_action": ProgressAction.SHUTDOWN,
+                        "progress_action": ProgressAction.STARTING,
                         "server_name": server_name,
                         "agent_name": self.agent_name,
                     },
                 )
-                return result
+                async with gen_client(
+                    server_name, server_registry=self.context.server_registry
+                ) as client:
+                    result = await try_execute(client)
+                    logger.debug(
+                        f"Closing temporary connection to server: {server_name}",
+                        data={
+                            "progress_action": ProgressAction.SHUTDOWN,
+                            "server_name": server_name,
+                            "agent_name": self.agent_name,
+                        },
+                    )
+                    return result
 
     async def _parse_resource_name(self, name: str, resource_type: str) -> tuple[str, str]:
         """
@@ -469,7 +587,8 @@ class MCPAggregator(ContextDependent):
             },
         )
 
-        return await self._execute_on_server(
+        started = time.perf_counter()
+        result = await self._execute_on_server(
             server_name=server_name,
             operation_type="tool",
             operation_name=local_tool_name,
@@ -479,6 +598,11 @@ class MCPAggregator(ContextDependent):
                 isError=True, content=[TextContent(type="text", text=msg)]
             ),
         )
+        tool_call_duration.record(
+            time.perf_counter() - started,
+            {"server": server_name, "tool": local_tool_name, "error": result.isError},
+        )
+        return result
 
     async def get_prompt(
         self,
@@ -534,20 +658,18 @@ class MCPAggregator(ContextDependent):
                     messages=[],
                 )
 
-            # Check the prompt cache to avoid unnecessary errors
+            # Check the prompt index to avoid unnecessary errors
             if local_prompt_name:
                 async with self._prompt_cache_lock:
-                    if server_name in self._prompt_cache:
-                        # Check if any prompt in the cache has this name
-                        prompt_names = [prompt.name for prompt in self._prompt_cache[server_name]]
-                        if local_prompt_name not in prompt_names:
-                            logger.debug(
-                                f"Prompt '{local_prompt_name}' not found in cache for server '{server_name}'"
-                            )
-                            return GetPromptResult(
-                                description=f"Prompt '{local_prompt_name}' not found on server '{server_name}'",
-                                messages=[],
-                            )
+                    server_prompts = self._prompt_index.get(server_name)
+                    if server_prompts is not None and local_prompt_name not in server_prompts:
+                        logger.debug(
+                            f"Prompt '{local_prompt_name}' not found in cache for server '{server_name}'"
+                        )
+                        return GetPromptResult(
+                            description=f"Prompt '{local_prompt_name}' not found on server '{server_name}'",
+                            messages=[],
+                        )
 
             # Try to get the prompt from the specified server
             method_args = {"name": local_prompt_name} if local_prompt_name else {}
@@ -576,13 +698,10 @@ class MCPAggregator(ContextDependent):
         # No specific server - use the cache to find servers that have this prompt
         logger.debug(f"Searching for prompt '{local_prompt_name}' using cache")
 
-        # Find potential servers from the cache
-        potential_servers = []
+        # Find potential servers from the index
         async with self._prompt_cache_lock:
-            for s_name, prompt_list in self._prompt_cache.items():
-                prompt_names = [prompt.name for prompt in prompt_list]
-                if local_prompt_name in prompt_names:
-                    potential_servers.append(s_name)
+            potential_servers = list(self._prompt_servers.get(local_prompt_name, []))
+            known_missing = local_prompt_name in self._missing_prompts
 
         if potential_servers:
             logger.debug(
@@ -598,35 +717,19 @@ class MCPAggregator(ContextDependent):
                     continue
 
                 try:
-                    method_args = {"name": local_prompt_name}
-                    if arguments:
-                        method_args["arguments"] = arguments
-
-                    result = await self._execute_on_server(
-                        server_name=s_name,
-                        operation_type="prompt",
-                        operation_name=local_prompt_name,
-                        method_name="get_prompt",
-                        method_args=method_args,
-                        error_factory=lambda _: None,  # Return None instead of an error
-                    )
+                    result = await self._get_prompt_quietly(s_name, local_prompt_name, arguments)
 
                     # If we got a successful result with messages, return it
-                    if result and result.messages:
+                    if result:
                         logger.debug(
                             f"Successfully retrieved prompt '{local_prompt_name}' from server '{s_name}'"
                         )
-                        # Add namespaced name using the actual server where found
-                        result.namespaced_name = f"{s_name}{SEP}{local_prompt_name}"
-
-                        # Store the arguments in the result for display purposes
-                        if arguments:
-                            result.arguments = arguments
-
                         return result
 
                 except Exception as e:
                     logger.debug(f"Error retrieving prompt from server '{s_name}': {e}")
+        elif known_missing:
+            logger.debug(f"Prompt '{local_prompt_name}' previously not found on any server")
         else:
             logger.debug(f"Prompt '{local_prompt_name}' not found in any server's cache")
 
@@ -642,67 +745,37 @@ class MCPAggregator(ContextDependent):
                         f"Server '{s_name}' does not support prompts, skipping from fallback search"
                     )
 
-            # Try all supported servers in order
-            for s_name in supported_servers:
-                try:
-                    # Use a quiet approach - don't log errors if not found
-                    method_args = {"name": local_prompt_name}
-                    if arguments:
-                        method_args["arguments"] = arguments
-
-                    result = await self._execute_on_server(
-                        server_name=s_name,
-                        operation_type="prompt",
-                        operation_name=local_prompt_name,
-                        method_name="get_prompt",
-                        method_args=method_args,
-                        error_factory=lambda _: None,  # Return None instead of an error
-                    )
+            # Query all supported servers concurrently, preferring the first in server order.
+            # Errors are not logged during the fallback search.
+            results = await gather(
+                *(
+                    self._get_prompt_quietly(s_name, local_prompt_name, arguments)
+                    for s_name in supported_servers
+                ),
+                return_exceptions=True,
+            )
 
-                    # If we got a successful result with messages, return it
-                    if result and result.messages:
-                        logger.debug(
-                            f"Found prompt '{local_prompt_name}' on server '{s_name}' (not in cache)"
-                        )
-                        # Add namespaced name using the actual server where found
-                        result.namespaced_name = f"{s_name}{SEP}{local_prompt_name}"
-
-                        # Store the arguments in the result for display purposes
-                        if arguments:
-                            result.arguments = arguments
-
-                        # Update the cache - need to fetch the prompt object to store in cache
-                        try:
-                            prompt_list_result = await self._execute_on_server(
-                                server_name=s_name,
-                                operation_type="prompts-list",
-                                operation_name="",
-                                method_name="list_prompts",
-                                error_factory=lambda _: None,
-                            )
-
-                            prompts = getattr(prompt_list_result, "prompts", [])
-                            matching_prompts = [p for p in prompts if p.name == local_prompt_name]
-                            if matching_prompts:
-                                async with self._prompt_cache_lock:
-                                    if s_name not in self._prompt_cache:
-                                        self._prompt_cache[s_name] = []
-                                    # Add if not already in the cache
-                                    prompt_names_in_cache = [
-                                        p.name for p in self._prompt_cache[s_name]
-                                    ]
-                                    if local_prompt_name not in prompt_names_in_cache:
-                                        self._prompt_cache[s_name].append(matching_prompts[0])
-                        except Exception:
-                            # Ignore errors when updating cache
-                            pass
+            for s_name, result in zip(supported_servers, results):
+                if not result or isinstance(result, BaseException):
+                    continue
 
-                        return result
+                logger.debug(
+                    f"Found prompt '{local_prompt_name}' on server '{s_name}' (not in cache)"
+                )
 
+                # Update the cache from the server's current prompt list
+                try:
+                    await self._refresh_server_prompts(s_name)
                 except Exception:
-                    # Don't log errors during fallback search
+                    # Ignore errors when updating cache
                     pass
 
+                return result
+
+            # Remember the miss until the prompt cache is next refreshed
+            async with self._prompt_cache_lock:
+                self._missing_prompts.add(local_prompt_name)
+
         # If we get here, we couldn't find the prompt on any server
         logger.info(f"Prompt '{local_prompt_name}' not found on any server")
         return GetPromptResult(
@@ -743,23 +816,8 @@ class MCPAggregator(ContextDependent):
                 results[server_name] = []
                 return results
 
-            # Fetch from server
-            result = await self._execute_on_server(
-                server_name=server_name,
-                operation_type="prompts-list",
-                operation_name="",
-                method_name="list_prompts",
-                error_factory=lambda _: None,
-            )
-
-            # Get prompts from result
-            prompts = getattr(result, "prompts", [])
-
-            # Update cache
-            async with self._prompt_cache_lock:
-                self._prompt_cache[server_name] = prompts
-
-            results[server_name] = prompts
+            # Fetch from server and update cache
+            results[server_name] = await self._refresh_server_prompts(server_name)
             return results
 
         # No specific server - check if we can use the cache for all servers
@@ -780,27 +838,17 @@ class MCPAggregator(ContextDependent):
                 logger.debug(f"Server '{s_name}' does not support prompts, skipping")
                 results[s_name] = []
 
-        # Fetch prompts from supported servers
-        for s_name in supported_servers:
-            try:
-                result = await self._execute_on_server(
-                    server_name=s_name,
-                    operation_type="prompts-list",
-                    operation_name="",
-                    method_name="list_prompts",
-                    error_factory=lambda _: None,
-                )
-
-                prompts = getattr(result, "prompts", [])
-
-                # Update cache and results
-                async with self._prompt_cache_lock:
-                    self._prompt_cache[s_name] = prompts
-
-                results[s_name] = prompts
-            except Exception as e:
-                logger.debug(f"Error fetching prompts from {s_name}: {e}")
+        # Fetch prompts from supported servers concurrently, updating the cache
+        fetched = await gather(
+            *(self._refresh_server_prompts(s_name) for s_name in supported_servers),
+            return_exceptions=True,
+        )
+        for s_name, prompts in zip(supported_servers, fetched):
+            if isinstance(prompts, BaseException):
+                logger.debug(f"Error fetching prompts from {s_name}: {prompts}")
                 results[s_name] = []
+            else:
+                results[s_name] = prompts
 
         logger.debug(f"Available prompts across servers: {results}")
         return results
@@ -864,6 +912,14 @@ class MCPAggregator(ContextDependent):
         Raises:
             Exception: If the resource couldn't be found or other error occurs
         """
+        # Serve repeated reads of the same resource from the context cache
+        resource_cache = self._resource_cache
+        if resource_cache is not None:
+            cached = resource_cache.get(server_name, resource_uri)
+            if cached is not None:
+                logger.debug(f"Using cached resource '{resource_uri}' from '{server_name}'")
+                return cached
+
         logger.info(
             "Requesting resource",
             data={
@@ -879,6 +935,12 @@ class MCPAggregator(ContextDependent):
         except Exception as e:
             raise ValueError(f"Invalid resource URI: {resource_uri}. Error: {e}")
 
+        # Subscribe before reading, so an update made after the read is notified
+        subscribed, generation = False, None
+        if resource_cache is not None:
+            generation = resource_cache.generation(server_name)
+            subscribed = await self._subscribe_resource(server_name, uri)
+
         # Use the _execute_on_server method to call read_resource on the server
         result = await self._execute_on_server(
             server_name=server_name,
@@ -894,8 +956,39 @@ class MCPAggregator(ContextDependent):
         if result is None:
             raise ValueError(f"Resource '{resource_uri}' not found on server '{server_name}'")
 
+        if resource_cache is not None:
+            resource_cache.put(
+                server_name, resource_uri, result, subscribed=subscribed, generation=generation
+            )
+
         return result
 
+    @property
+    def _resource_cache(self) -> ResourceCache | None:
+        return getattr(self.context, "resource_cache", None)
+
+    async def _subscribe_resource(self, server_name: str, uri: AnyUrl) -> bool:
+        """
+        Subscribe to updates for a resource so that cached copies are invalidated.
+        Only possible on persistent connections to servers that support subscriptions.
+        """
+        if not self.connection_persistence:
+            return False
+
+        capabilities = await self.get_capabilities(server_name)
+        if not capabilities or not capabilities.resources or not capabilities.resources.subscribe:
+            return False
+
+        result = await self._execute_on_server(
+            server_name=server_name,
+            operation_type="resource-subscribe",
+            operation_name=str(uri),
+            method_name="subscribe_resource",
+            method_args={"uri": uri},
+            error_factory=lambda _: None,
+        )
+        return result is not None
+
     async def list_resources(self, server_name: str | None = None) -> Dict[str, List[str]]:
         """
         List available resources from one or all servers.
@@ -28,6 +28,7 @@ from mcp_agent.context_dependent import ContextDependent
 from mcp_agent.core.exceptions import ServerInitializationError
 from mcp_agent.event_progress import ProgressAction
 from mcp_agent.logging.logger import get_logger
+from mcp_agent.logging.metrics import track_connections
 from mcp_agent.mcp.logger_textio import get_stderr_handler
 from mcp_agent.mcp.mcp_agent_client_session import MCPAgentClientSession
 
@@ -64,9 +65,11 @@ class ServerConnection:
             ClientSession,
         ],
         init_hook: Optional["InitHookCallable"] = None,
+        context: Optional["Context"] = None,
     ) -> None:
         self.server_name = server_name
         self.server_config = server_config
+        self._context = context
         self.session: ClientSession | None = None
         self._client_session_factory = client_session_factory
         self._init_hook = init_hook
@@ -85,6 +88,15 @@ class ServerConnection:
         """Check if the server connection is healthy and ready to use."""
         return self.session is not None and not self._error_occurred
 
+    @property
+    def state(self) -> str:
+        """The connection state reported in metrics: connecting, connected or failed"""
+        if self._error_occurred:
+            return "failed"
+        if self._initialized_event.is_set():
+            return "connected"
+        return "connecting"
+
     def reset_error_state(self) -> None:
         """Reset the error state, allowing reconnection attempts."""
         self._error_occurred = False
@@ -146,6 +158,12 @@ class ServerConnection:
         if hasattr(session, "server_config"):
             session.server_config = self.server_config
 
+        # Let the session identify itself and reach the owning context (e.g. for cache invalidation)
+        if hasattr(session, "server_name"):
+            session.server_name = self.server_name
+        if self._context is not None and hasattr(session, "_context"):
+            session._context = self._context
+
         self.session = session
 
         return session
@@ -199,6 +217,7 @@ class MCPConnectionManager(ContextDependent):
         self.server_registry = server_registry
         self.running_servers: Dict[str, ServerConnection] = {}
         self._lock = Lock()
+        track_connections(self)
         # Manage our own task group - independent of task context
         self._task_group = None
         self._task_group_active = False
@@ -280,6 +299,7 @@ class MCPConnectionManager(ContextDependent):
             transport_context_factory=transport_context_factory,
             client_session_factory=client_session_factory,
             init_hook=init_hook or self.server_registry.init_hooks.get(server_name),
+            context=self._context,
         )
 
         async with self._lock:
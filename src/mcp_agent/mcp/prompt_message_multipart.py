@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 from mcp.types import (
     EmbeddedResource,
@@ -8,10 +8,32 @@ from mcp.types import (
     Role,
     TextContent,
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from mcp_agent.mcp.helpers.content_helpers import get_text
 
+ConvertedT = TypeVar("ConvertedT")
+
+
+def _fingerprint(part: Union[TextContent, ImageContent, EmbeddedResource]) -> int:
+    """
+    A cheap fingerprint of a content part's value. Python caches the hash of a string,
+    so large text and base64 data are not rehashed on every call.
+    """
+    if isinstance(part, TextContent):
+        return hash(part.text)
+    if isinstance(part, ImageContent):
+        return hash((part.data, part.mimeType))
+    resource = part.resource
+    return hash(
+        (
+            str(resource.uri),
+            resource.mimeType,
+            getattr(resource, "text", None),
+            getattr(resource, "blob", None),
+        )
+    )
+
 
 class PromptMessageMultipart(BaseModel):
     """
@@ -22,6 +44,50 @@ class PromptMessageMultipart(BaseModel):
     role: Role
     content: List[Union[TextContent, ImageContent, EmbeddedResource]]
 
+    # Provider-specific conversions of this message:
+    # provider -> (content parts, signature, variant, result)
+    _converted: Dict[str, Tuple[Tuple[Any, ...], Tuple[Any, ...], Optional[str], Any]] = (
+        PrivateAttr(default_factory=dict)
+    )
+
+    def converted(
+        self,
+        provider: str,
+        convert: Callable[["PromptMessageMultipart"], ConvertedT],
+        variant: Optional[str] = None,
+    ) -> ConvertedT:
+        """
+        Convert this message to a provider's format, caching the result on the message.
+
+        The cached conversion is reused until the message's role or content changes - a
+        part is replaced, or its text or data is edited in place - or it is requested with
+        a different variant (e.g. after a model switch). Only one conversion is kept per
+        provider.
+
+        Args:
+            provider: Name of the provider format
+            convert: Function converting the message to the provider format
+            variant: Optional qualifier such as the model name
+
+        Returns:
+            The converted message. It is shared, so callers must not modify it.
+        """
+        # Parts are compared by identity and kept referenced, so their ids are not reused
+        parts = tuple(self.content)
+        signature = (self.role, *(_fingerprint(part) for part in parts))
+        cached = self._converted.get(provider)
+        if (
+            cached is not None
+            and cached[1] == signature
+            and cached[2] == variant
+            and all(a is b for a, b in zip(cached[0], parts))
+        ):
+            return cached[3]
+
+        result = convert(self)
+        self._converted[provider] = (parts, signature, variant, result)
+        return result
+
     @classmethod
     def to_multipart(cls, messages: List[PromptMessage]) -> List["PromptMessageMultipart"]:
         """Convert a sequence of PromptMessages into PromptMessageMultipart objects."""
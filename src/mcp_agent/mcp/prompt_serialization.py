@@ -14,10 +14,15 @@ and PromptMessageMultipart objects. It includes functionality for:
    - Converting resources to JSON after resource delimiter (---RESOURCE)
    - Parsing delimited text back into PromptMessageMultipart objects
    - This maintains human readability for text content while preserving structure for resources
+
+Both formats can be read incrementally with iter_messages_from_file, which yields one
+message at a time so large transcripts never need to be held in memory all at once.
 """
 
 import json
-from typing import List
+import mmap
+import re
+from typing import Iterator, List
 
 from mcp.types import EmbeddedResource, ImageContent, TextContent, TextResourceContents
 
@@ -104,10 +109,91 @@ def load_messages_from_json_file(file_path: str) -> List[PromptMessageMultipart]
     Returns:
         List of PromptMessageMultipart objects
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        json_str = f.read()
+    return list(iter_messages_from_json_file(file_path))
+
+
+_JSON_STRUCTURE = re.compile(rb'["\[\]{}]')
+
+
+def _end_of_json_string(buffer: mmap.mmap, start: int) -> int:
+    """Return the index just past the string whose opening quote is at start"""
+    position = start + 1
+    while True:
+        quote = buffer.find(b'"', position)
+        if quote == -1:
+            raise ValueError("Unterminated string in JSON file")
+        # The quote is escaped if preceded by an odd number of backslashes
+        backslashes = 0
+        while buffer[quote - 1 - backslashes] == 0x5C:
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return quote + 1
+        position = quote + 1
+
+
+def _iter_json_array_items(buffer: mmap.mmap) -> Iterator[bytes]:
+    """Yield the raw bytes of each top-level object in a JSON array"""
+    depth = 0
+    start = -1
+    position = 0
+    while True:
+        token = _JSON_STRUCTURE.search(buffer, position)
+        if token is None:
+            return
+        char = token.group()
+        position = token.end()
+        if char == b'"':
+            # Skip strings, including large base64 data, without scanning them byte by byte
+            position = _end_of_json_string(buffer, token.start())
+        elif char in (b"[", b"{"):
+            if depth == 1 and char == b"{":
+                start = token.start()
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 1 and char == b"}":
+                yield buffer[start:position]
+            elif depth == 0:
+                return
 
-    return json_to_multipart_messages(json_str)
+
+def iter_messages_from_json_file(file_path: str) -> Iterator[PromptMessageMultipart]:
+    """
+    Incrementally load PromptMessageMultipart objects from a JSON file.
+
+    The file is memory-mapped and each message is parsed only when it is reached,
+    so image and blob data for other messages is never decoded or held in memory.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Yields:
+        PromptMessageMultipart objects in file order
+    """
+    with open(file_path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            # Nothing to map - let json report the error as for a non-streaming load
+            yield from json_to_multipart_messages("")
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            first = re.compile(rb"\S").search(buffer)
+            if first is None or first.group() != b"[":
+                yield from json_to_multipart_messages(buffer[:].decode("utf-8"))
+                return
+
+            for item in _iter_json_array_items(buffer):
+                yield PromptMessageMultipart.model_validate_json(item)
+
+
+def iter_messages_from_file(file_path: str) -> Iterator[PromptMessageMultipart]:
+    """
+    Incrementally load PromptMessageMultipart objects from a file, with format determined
+    by file extension (JSON for .json files, delimited text otherwise).
+    """
+    if str(file_path).lower().endswith(".json"):
+        return iter_messages_from_json_file(file_path)
+    return iter_messages_from_delimited_file(file_path)
 
 
 def save_messages_to_file(messages: List[PromptMessageMultipart], file_path: str) -> None:
@@ -256,9 +342,37 @@ def delimited_format_to_multipart_messages(
     Returns:
         List of PromptMessageMultipart objects
     """
-    lines = content.split("\n")
-    messages = []
+    # Check if this is a legacy format (pre-JSON serialization)
+    legacy_format = resource_delimiter in content and '"type":' not in content
+
+    return list(
+        _iter_delimited_messages(
+            iter(content.split("\n")),
+            user_delimiter,
+            assistant_delimiter,
+            resource_delimiter,
+            legacy_format,
+        )
+    )
+
+
+def _build_message(
+    role: str, text_contents: List[TextContent], resource_contents: list
+) -> PromptMessageMultipart:
+    # Create content list with text parts first (filtering out empty text), then resource parts
+    combined_content = [tc for tc in text_contents if tc.text.strip() != ""]
+    combined_content.extend(resource_contents)
+    return PromptMessageMultipart(role=role, content=combined_content)
+
 
+def _iter_delimited_messages(
+    lines: Iterator[str],
+    user_delimiter: str,
+    assistant_delimiter: str,
+    resource_delimiter: str,
+    legacy_format: bool,
+) -> Iterator[PromptMessageMultipart]:
+    """Parse delimited format line by line, yielding each message once it is complete"""
     current_role = None
     text_contents = []  # List of TextContent
     resource_contents = []  # List of EmbeddedResource or ImageContent
@@ -267,17 +381,13 @@ def delimited_format_to_multipart_messages(
     collecting_text = False
     text_lines = []
 
-    # Check if this is a legacy format (pre-JSON serialization)
-    legacy_format = resource_delimiter in content and '"type":' not in content
-
-    # Add a condition to ensure we process the first user message properly
-    # This is the key fix: We need to process the first line correctly
-    if lines and lines[0].strip() == user_delimiter:
+    # Process the first line only if it starts a user message
+    first_line = next(lines, None)
+    if first_line is not None and first_line.strip() == user_delimiter:
         current_role = "user"
         collecting_text = True
 
-    # Process each line
-    for line in lines[1:] if lines else []:  # Skip the first line if already processed above
+    for line in lines:
         line_stripped = line.strip()
 
         # Handle role delimiters
@@ -289,21 +399,7 @@ def delimited_format_to_multipart_messages(
                     text_contents.append(TextContent(type="text", text="\n".join(text_lines)))
                     text_lines = []
 
-                # Create content list with text parts first, then resource parts
-                combined_content = []
-
-                # Filter out any empty text content items
-                filtered_text_contents = [tc for tc in text_contents if tc.text.strip() != ""]
-
-                combined_content.extend(filtered_text_contents)
-                combined_content.extend(resource_contents)
-
-                messages.append(
-                    PromptMessageMultipart(
-                        role=current_role,
-                        content=combined_content,
-                    )
-                )
+                yield _build_message(current_role, text_contents, resource_contents)
 
             # Start a new message
             current_role = "user" if line_stripped == user_delimiter else "assistant"
@@ -352,6 +448,10 @@ def delimited_format_to_multipart_messages(
                     json_lines = []
                     continue
 
+                # A complete JSON object must end with a closing brace
+                if not line_stripped.endswith("}"):
+                    continue
+
                 # Try to parse the JSON to see if we have a complete object
                 try:
                     json_text = "\n".join(json_lines)
@@ -392,23 +492,7 @@ def delimited_format_to_multipart_messages(
 
         # Add the final message if it has content
         if text_contents or resource_contents:
-            # Create content list with text parts first, then resource parts
-            combined_content = []
-
-            # Filter out any empty text content items
-            filtered_text_contents = [tc for tc in text_contents if tc.text.strip() != ""]
-
-            combined_content.extend(filtered_text_contents)
-            combined_content.extend(resource_contents)
-
-            messages.append(
-                PromptMessageMultipart(
-                    role=current_role,
-                    content=combined_content,
-                )
-            )
-
-    return messages
+            yield _build_message(current_role, text_contents, resource_contents)
 
 
 def save_messages_to_delimited_file(
@@ -460,12 +544,56 @@ def load_messages_from_delimited_file(
     Returns:
         List of PromptMessageMultipart objects
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    return delimited_format_to_multipart_messages(
-        content,
-        user_delimiter,
-        assistant_delimiter,
-        resource_delimiter,
+    return list(
+        iter_messages_from_delimited_file(
+            file_path, user_delimiter, assistant_delimiter, resource_delimiter
+        )
     )
+
+
+def _iter_file_lines(f) -> Iterator[str]:
+    """Yield lines without line endings, matching str.split("\\n") on the whole file"""
+    line = ""
+    for line in f:
+        yield line[:-1] if line.endswith("\n") else line
+    if line == "" or line.endswith("\n"):
+        yield ""
+
+
+def iter_messages_from_delimited_file(
+    file_path: str,
+    user_delimiter: str = USER_DELIMITER,
+    assistant_delimiter: str = ASSISTANT_DELIMITER,
+    resource_delimiter: str = RESOURCE_DELIMITER,
+) -> Iterator[PromptMessageMultipart]:
+    """
+    Incrementally load PromptMessageMultipart objects from a file in hybrid delimited format.
+    The file is read line by line, and each message is yielded as soon as it is complete.
+
+    Args:
+        file_path: Path to the file
+        user_delimiter: Delimiter for user messages
+        assistant_delimiter: Delimiter for assistant messages
+        resource_delimiter: Delimiter for resources
+
+    Yields:
+        PromptMessageMultipart objects in file order
+    """
+    # Check for the legacy format by searching the memory-mapped file
+    legacy_format = False
+    with open(file_path, "rb") as f:
+        if f.seek(0, 2) > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                legacy_format = (
+                    buffer.find(resource_delimiter.encode("utf-8")) != -1
+                    and buffer.find(b'"type":') == -1
+                )
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        yield from _iter_delimited_messages(
+            _iter_file_lines(f),
+            user_delimiter,
+            assistant_delimiter,
+            resource_delimiter,
+            legacy_format,
+        )
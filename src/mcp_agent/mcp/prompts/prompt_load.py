@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Literal
+from typing import Iterator, List, Literal
 
 from mcp.server.fastmcp.prompts.base import (
     AssistantMessage,
@@ -118,12 +118,11 @@ def load_prompt(file: Path) -> List[PromptMessage]:
     
     if file_str.endswith(".json"):
         # JSON format (MCP SDK compatible)
-        from mcp_agent.mcp.prompt_serialization import load_messages_from_json_file
-        
-        # Load multipart messages and convert to flat messages
-        multipart_messages = load_messages_from_json_file(str(file))
+        from mcp_agent.mcp.prompt_serialization import iter_messages_from_json_file
+
+        # Load multipart messages incrementally and convert to flat messages
         messages = []
-        for mp in multipart_messages:
+        for mp in iter_messages_from_json_file(str(file)):
             messages.extend(mp.from_multipart())
         return messages
     else:
@@ -135,6 +134,7 @@ def load_prompt(file: Path) -> List[PromptMessage]:
 def load_prompt_multipart(file: Path) -> List[PromptMessageMultipart]:
     """
     Load a prompt from a file and return as PromptMessageMultipart objects.
+    Use iter_prompt_multipart to stream large files instead.
     
     The loader uses file extension to determine the format:
     - .json files are loaded as MCP SDK compatible JSON format
@@ -146,12 +146,27 @@ def load_prompt_multipart(file: Path) -> List[PromptMessageMultipart]:
     Returns:
         List of PromptMessageMultipart objects
     """
-    file_str = str(file).lower()
-    
-    if file_str.endswith(".json"):
+    return list(iter_prompt_multipart(file))
+
+
+def iter_prompt_multipart(file: Path) -> Iterator[PromptMessageMultipart]:
+    """
+    Load a prompt from a file, yielding PromptMessageMultipart objects one at a time.
+
+    JSON files are streamed so that large recorded sessions are never fully held in
+    memory. Template files are small and are loaded as for load_prompt_multipart.
+
+    Args:
+        file: Path to the prompt file
+
+    Yields:
+        PromptMessageMultipart objects in file order
+    """
+    if str(file).lower().endswith(".json"):
         # JSON format (MCP SDK compatible)
-        from mcp_agent.mcp.prompt_serialization import load_messages_from_json_file
-        return load_messages_from_json_file(str(file))
+        from mcp_agent.mcp.prompt_serialization import iter_messages_from_json_file
+
+        yield from iter_messages_from_json_file(str(file))
     else:
         # Template-based format (delimited text)
-        return PromptMessageMultipart.to_multipart(load_prompt(file))
+        yield from PromptMessageMultipart.to_multipart(load_prompt(file))
@@ -7,11 +7,10 @@ Uses the prompt_template module for clean, testable handling of prompt templates
 
 import argparse
 import asyncio
-import base64
 import logging
 import sys
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server.fastmcp.prompts.base import (
@@ -47,6 +46,32 @@ logger = logging.getLogger("prompt_server")
 mcp = FastMCP("Prompt Server")
 
 
+def _registered_prompts() -> Dict[str, Any] | None:
+    """
+    FastMCP's table of registered prompts, or None if this version of the SDK does not
+    expose one. FastMCP has no public API for removing a prompt, so this is the only
+    access to its internals.
+    """
+    prompts = getattr(getattr(mcp, "_prompt_manager", None), "_prompts", None)
+    return prompts if isinstance(prompts, dict) else None
+
+
+def supports_prompt_removal() -> bool:
+    """Whether prompts can be removed, and so reloaded when their files change"""
+    return _registered_prompts() is not None
+
+
+def _remove_fastmcp_prompt(name: str) -> None:
+    prompts = _registered_prompts()
+    if prompts is None:
+        logger.warning(
+            f"Unable to remove prompt {name}: not supported by this version of the MCP SDK. "
+            "Restart the prompt server to pick up changes."
+        )
+        return
+    prompts.pop(name, None)
+
+
 def convert_to_fastmcp_messages(prompt_messages: List[PromptMessage]) -> List[Message]:
     """
     Convert PromptMessage objects from prompt_load to FastMCP Message objects.
@@ -82,11 +107,14 @@ class PromptConfig(PromptMetadata):
     http_timeout: float = 10.0
     transport: str = "stdio"
     port: int = 8000
+    watch_interval: float = 1.0
 
 
 # We'll maintain registries of all exposed resources and prompts
 exposed_resources: Dict[str, Path] = {}
 prompt_registry: Dict[str, PromptMetadata] = {}
+# Prompt name registered for each prompt file, so that changed files replace their prompt
+prompt_file_names: Dict[Path, str] = {}
 
 
 # Define a single type for prompt handlers to avoid mypy issues
@@ -137,8 +165,18 @@ def get_delimiter_config(
     return config_values
 
 
+def unregister_prompt(file_path: Path) -> None:
+    """Remove the prompt registered for a prompt file, if any"""
+    prompt_name = prompt_file_names.pop(file_path, None)
+    if prompt_name is None:
+        return
+    prompt_registry.pop(prompt_name, None)
+    _remove_fastmcp_prompt(prompt_name)
+    logger.info(f"Unregistered prompt: {prompt_name} ({file_path})")
+
+
 def register_prompt(file_path: Path, config: Optional[PromptConfig] = None) -> None:
-    """Register a prompt file"""
+    """Register a prompt file, replacing any prompt previously registered for it"""
     try:
         # Get delimiter configuration
         config_values = get_delimiter_config(config, file_path)
@@ -156,17 +194,20 @@ def register_prompt(file_path: Path, config: Optional[PromptConfig] = None) -> N
         metadata = loader.get_metadata(file_path)
         template = loader.load_from_file(file_path)
 
-        # Ensure unique name
-        prompt_name = metadata.name
+        # Replace the existing prompt for this file, otherwise ensure a unique name
+        previous_name = prompt_file_names.get(file_path)
+        unregister_prompt(file_path)
+        prompt_name = previous_name or metadata.name
         if prompt_name in prompt_registry:
             base_name = prompt_name
             suffix = 1
             while prompt_name in prompt_registry:
                 prompt_name = f"{base_name}_{suffix}"
                 suffix += 1
-            metadata.name = prompt_name
+        metadata.name = prompt_name
 
         prompt_registry[metadata.name] = metadata
+        prompt_file_names[file_path] = metadata.name
         logger.info(f"Registered prompt: {metadata.name} ({file_path})")
 
         # Create and register prompt handler
@@ -188,10 +229,10 @@ def register_prompt(file_path: Path, config: Optional[PromptConfig] = None) -> N
                         f"Missing required template variables: {', '.join(missing_vars)}"
                     )
 
-                # Apply template and create messages
+                # Apply template and create messages, loading resources off the event loop
                 content_sections = template.apply_substitutions(context)
-                prompt_messages = create_messages_with_resources(
-                    content_sections, config_values["prompt_files"]
+                prompt_messages = await asyncio.to_thread(
+                    create_messages_with_resources, content_sections, config_values["prompt_files"]
                 )
                 return convert_to_fastmcp_messages(prompt_messages)
 
@@ -208,13 +249,13 @@ def register_prompt(file_path: Path, config: Optional[PromptConfig] = None) -> N
                 arguments=arguments,
                 fn=template_handler_with_vars,
             )
-            mcp._prompt_manager.add_prompt(prompt)
+            mcp.add_prompt(prompt)
         else:
             # Create a simple prompt without variables
             async def template_handler_without_vars() -> list[Message]:
                 content_sections = template.content_sections
-                prompt_messages = create_messages_with_resources(
-                    content_sections, config_values["prompt_files"]
+                prompt_messages = await asyncio.to_thread(
+                    create_messages_with_resources, content_sections, config_values["prompt_files"]
                 )
                 return convert_to_fastmcp_messages(prompt_messages)
 
@@ -225,7 +266,7 @@ def register_prompt(file_path: Path, config: Optional[PromptConfig] = None) -> N
                 arguments=[],
                 fn=template_handler_without_vars,
             )
-            mcp._prompt_manager.add_prompt(prompt)
+            mcp.add_prompt(prompt)
 
         # Register any referenced resources in the prompt
         for resource_path in metadata.resource_paths:
@@ -295,6 +336,12 @@ def parse_args():
         default=8000,
         help="Port to use for SSE transport (default: 8000)",
     )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between checks for changed prompt files, 0 to disable (default: 1.0)",
+    )
     parser.add_argument(
         "--test", type=str, help="Test a specific prompt without starting the server"
     )
@@ -331,41 +378,66 @@ def initialize_config(args) -> PromptConfig:
         http_timeout=args.http_timeout,
         transport=args.transport,
         port=args.port,
+        watch_interval=args.watch_interval,
     )
 
 
 async def register_file_resource_handler(config: PromptConfig) -> None:
     """Register the general file resource handler"""
 
+    def load_file(path: str) -> str:
+        # Find the file, checking relative paths first
+        file_path = resource_utils.find_resource_file(path, config.prompt_files)
+        if file_path is None:
+            # If not found as relative path, try absolute path
+            file_path = Path(path)
+            if not file_path.exists():
+                raise FileNotFoundError(f"Resource file not found: {path}")
+
+        # Binary files are returned base64 encoded, text files as UTF-8 text
+        content, _, _ = resource_utils.load_file_content(file_path)
+        return content
+
     @mcp.resource("file://{path}")
     async def get_file_resource(path: str):
         """Read a file from the given path."""
         try:
-            # Find the file, checking relative paths first
-            file_path = resource_utils.find_resource_file(path, config.prompt_files)
-            if file_path is None:
-                # If not found as relative path, try absolute path
-                file_path = Path(path)
-                if not file_path.exists():
-                    raise FileNotFoundError(f"Resource file not found: {path}")
-
-            mime_type = mime_utils.guess_mime_type(str(file_path))
-            is_binary = mime_utils.is_binary_content(mime_type)
-
-            if is_binary:
-                # For binary files, read as binary and base64 encode
-                with open(file_path, "rb") as f:
-                    return base64.b64encode(f.read()).decode("utf-8")
-            else:
-                # For text files, read as text with UTF-8 encoding
-                with open(file_path, "r", encoding="utf-8") as f:
-                    return f.read()
+            return await asyncio.to_thread(load_file, path)
         except Exception as e:
             # Log the error and re-raise
             logger.error(f"Error accessing resource at '{path}': {e}")
             raise
 
 
+def _file_signature(file_path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+async def watch_prompt_files(config: PromptConfig) -> None:
+    """
+    Poll the prompt files for changes, re-registering changed prompts and
+    removing prompts whose files have been deleted.
+    """
+    signatures = {path: _file_signature(path) for path in config.prompt_files}
+    while True:
+        await asyncio.sleep(config.watch_interval)
+        for path in config.prompt_files:
+            signature = await asyncio.to_thread(_file_signature, path)
+            if signature == signatures.get(path):
+                continue
+            signatures[path] = signature
+
+            if signature is None:
+                unregister_prompt(path)
+            else:
+                logger.info(f"Prompt file changed, reloading: {path}")
+                register_prompt(path, config)
+
+
 async def test_prompt(prompt_name: str, config: PromptConfig) -> int:
     """Test a prompt and print its details"""
     if prompt_name not in prompt_registry:
@@ -444,12 +516,20 @@ async def async_main() -> int:
     if args.test:
         return await test_prompt(args.test, config)
 
+    watcher = None
+    if config.watch_interval > 0:
+        watcher = asyncio.create_task(watch_prompt_files(config))
+
     # Start the server with the specified transport
-    if config.transport == "stdio":
-        await mcp.run_stdio_async()
-    else:  # sse
-        # TODO update to 2025-03-26 specification and test config.
-        await mcp.run_sse_async()
+    try:
+        if config.transport == "stdio":
+            await mcp.run_stdio_async()
+        else:  # sse
+            # TODO update to 2025-03-26 specification and test config.
+            await mcp.run_sse_async()
+    finally:
+        if watcher is not None:
+            watcher.cancel()
     return 0
 
 
@@ -7,14 +7,14 @@ Provides clean, testable classes for managing template substitution.
 
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
 
 from mcp.types import (
     EmbeddedResource,
     TextContent,
     TextResourceContents,
 )
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, PrivateAttr, field_validator
 
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 from mcp_agent.mcp.prompt_serialization import (
@@ -27,6 +27,29 @@ from mcp_agent.mcp.prompts.prompt_constants import (
     USER_DELIMITER,
 )
 
+# Matches {{variable}} placeholders, capturing the variable name
+TEMPLATE_VARIABLE_PATTERN = re.compile(r"{{([^}]+)}}")
+
+
+def compile_template_text(text: str) -> List[str]:
+    """
+    Compile text into alternating literal chunks and variable names.
+    Even indices are literal text, odd indices are variable names.
+    """
+    return TEMPLATE_VARIABLE_PATTERN.split(text)
+
+
+def render_compiled_text(segments: List[str], context: Dict[str, Any]) -> str:
+    """Render compiled text, leaving placeholders for variables missing from the context"""
+    if len(segments) == 1:
+        return segments[0]
+
+    parts = segments.copy()
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        parts[i] = str(context[name]) if name in context else f"{{{{{name}}}}}"
+    return "".join(parts)
+
 
 class PromptMetadata(BaseModel):
     """Metadata about a prompt file"""
@@ -49,6 +72,9 @@ class PromptContent(BaseModel):
     role: str = "user"
     resources: List[str] = []
 
+    _compiled_text: List[str] | None = PrivateAttr(default=None)
+    _compiled_resources: List[List[str]] | None = PrivateAttr(default=None)
+
     @field_validator("role")
     @classmethod
     def validate_role(cls, role: str) -> str:
@@ -59,25 +85,15 @@ class PromptContent(BaseModel):
 
     def apply_substitutions(self, context: Dict[str, Any]) -> "PromptContent":
         """Apply variable substitutions to the text and resources"""
-
-        # Define placeholder pattern once to avoid repetition
-        def make_placeholder(key: str) -> str:
-            return f"{{{{{key}}}}}"
-
-        # Apply substitutions to text
-        result = self.text
-        for key, value in context.items():
-            result = result.replace(make_placeholder(key), str(value))
-
-        # Apply substitutions to resource paths
-        substituted_resources = []
-        for resource in self.resources:
-            substituted = resource
-            for key, value in context.items():
-                substituted = substituted.replace(make_placeholder(key), str(value))
-            substituted_resources.append(substituted)
-
-        return PromptContent(text=result, role=self.role, resources=substituted_resources)
+        if self._compiled_text is None:
+            self._compiled_text = compile_template_text(self.text)
+            self._compiled_resources = [compile_template_text(r) for r in self.resources]
+
+        return PromptContent(
+            text=render_compiled_text(self._compiled_text, context),
+            role=self.role,
+            resources=[render_compiled_text(r, context) for r in self._compiled_resources],
+        )
 
 
 class PromptTemplate:
@@ -207,9 +223,7 @@ class PromptTemplate:
 
     def _extract_template_variables(self, text: str) -> Set[str]:
         """Extract template variables from text using regex"""
-        variable_pattern = r"{{([^}]+)}}"
-        matches = re.findall(variable_pattern, text)
-        return set(matches)
+        return set(TEMPLATE_VARIABLE_PATTERN.findall(text))
 
     def to_multipart_messages(self) -> List[PromptMessageMultipart]:
         """
@@ -265,7 +279,7 @@ class PromptTemplate:
         # Standard mode with delimiters
         sections = []
         current_role = None
-        current_content = ""
+        current_lines: List[str] = []
         current_resources = []
 
         i = 0
@@ -279,10 +293,10 @@ class PromptTemplate:
                 # If we're moving to a new user/assistant section (not resource)
                 if role_type != "resource":
                     # Save the previous section if it exists
-                    if current_role is not None and current_content:
+                    if current_role is not None and current_lines:
                         sections.append(
                             PromptContent(
-                                text=current_content.strip(),
+                                text="\n".join(current_lines).strip(),
                                 role=current_role,
                                 resources=current_resources,
                             )
@@ -290,7 +304,7 @@ class PromptTemplate:
 
                     # Start a new section
                     current_role = role_type
-                    current_content = ""
+                    current_lines = []
                     current_resources = []
 
                 # Handle resource delimiters within sections
@@ -302,15 +316,15 @@ class PromptTemplate:
 
             # If we're in a section, add to the current content
             elif current_role is not None:
-                current_content += line + "\n"
+                current_lines.append(line)
 
             i += 1
 
         # Add the last section if there is one
-        if current_role is not None and current_content:
+        if current_role is not None and current_lines:
             sections.append(
                 PromptContent(
-                    text=current_content.strip(),
+                    text="\n".join(current_lines).strip(),
                     role=current_role,
                     resources=current_resources,
                 )
@@ -332,10 +346,19 @@ class PromptTemplateLoader:
             delimiter_map: Optional map of delimiters to roles
         """
         self.delimiter_map = delimiter_map or DEFAULT_DELIMITER_MAP
+        # Compiled templates and metadata, keyed by path and validated against (mtime, size)
+        self._template_cache: Dict[Path, Tuple[Tuple[int, int], PromptTemplate]] = {}
+        self._metadata_cache: Dict[Path, Tuple[Tuple[int, int], PromptMetadata]] = {}
+
+    @staticmethod
+    def _file_signature(file_path: Path) -> Tuple[int, int]:
+        stat = Path(file_path).stat()
+        return stat.st_mtime_ns, stat.st_size
 
     def load_from_file(self, file_path: Path) -> PromptTemplate:
         """
         Load a prompt template from a file.
+        Templates are cached until the file's modification time or size changes.
 
         Args:
             file_path: Path to the template file
@@ -343,10 +366,17 @@ class PromptTemplateLoader:
         Returns:
             A PromptTemplate object
         """
+        signature = self._file_signature(file_path)
+        cached = self._template_cache.get(file_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
 
-        return PromptTemplate(content, self.delimiter_map, template_file_path=file_path)
+        template = PromptTemplate(content, self.delimiter_map, template_file_path=file_path)
+        self._template_cache[file_path] = (signature, template)
+        return template
 
     def load_from_multipart(self, messages: List[PromptMessageMultipart]) -> PromptTemplate:
         """
@@ -371,6 +401,11 @@ class PromptTemplateLoader:
         Returns:
             PromptMetadata with information about the template
         """
+        signature = self._file_signature(file_path)
+        cached = self._metadata_cache.get(file_path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
         template = self.load_from_file(file_path)
 
         # Generate a description based on content
@@ -429,10 +464,12 @@ class PromptTemplateLoader:
                 if i + 1 < len(lines) and lines[i + 1].strip():
                     resource_paths.append(lines[i + 1].strip())
 
-        return PromptMetadata(
+        metadata = PromptMetadata(
             name=file_path.stem,
             description=description,
             template_variables=template.template_variables,
             resource_paths=resource_paths,
             file_path=file_path,
         )
+        self._metadata_cache[file_path] = (signature, metadata)
+        return metadata
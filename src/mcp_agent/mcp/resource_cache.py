@@ -0,0 +1,276 @@
+"""
+A size-bounded LRU cache for MCP resource contents, keyed by (server_name, uri).
+
+Entries are invalidated when the owning server sends a resources/updated or
+resources/list_changed notification, and dropped when the connection holding their
+subscription closes. Results from servers that cannot notify us are revalidated after a
+TTL. Large results are spilled to disk and reloaded on demand so
+that repeatedly attached documents do not have to stay resident in memory.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from mcp.types import BlobResourceContents, ReadResourceResult, TextResourceContents
+
+from mcp_agent.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from mcp_agent.config import ResourceCacheSettings
+
+logger = get_logger(__name__)
+
+CacheKey = Tuple[str, str]
+
+
+@dataclass
+class _CacheEntry:
+    """A cached resource, held either in memory or as a spill file on disk"""
+
+    size: int
+    result: ReadResourceResult | None = None
+    spill_path: Path | None = None
+    expires_at: float | None = None
+    subscribed: bool = False
+
+
+def resource_result_size(result: ReadResourceResult) -> int:
+    """Approximate size in bytes of the text and base64 blob data in a resource result"""
+    size = 0
+    for content in result.contents:
+        if isinstance(content, TextResourceContents):
+            size += len(content.text)
+        elif isinstance(content, BlobResourceContents):
+            size += len(content.blob)
+    return size
+
+
+class ResourceCache:
+    """
+    LRU cache of ReadResourceResults shared by all agents in a Context.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        spill_threshold_bytes: int = 4 * 1024 * 1024,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+        ttl_seconds: float | None = 30.0,
+        spill_dir: str | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.spill_threshold_bytes = spill_threshold_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._spill_root = spill_dir
+        self._spill_dir: Path | None = None
+        self._entries: OrderedDict[CacheKey, _CacheEntry] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        # Incremented whenever a server's entries are invalidated
+        self._generations: Dict[str, int] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._entries
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes of resource data currently held in memory"""
+        return self._memory_bytes
+
+    @property
+    def disk_bytes(self) -> int:
+        """Bytes of resource data currently spilled to disk"""
+        return self._disk_bytes
+
+    def get(self, server_name: str, uri: str) -> ReadResourceResult | None:
+        """
+        Return the cached result for a resource, or None if it is missing or expired.
+        """
+        key = (server_name, str(uri))
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        if entry.result is not None:
+            return entry.result
+
+        try:
+            return ReadResourceResult.model_validate_json(entry.spill_path.read_bytes())
+        except Exception as e:
+            logger.warning(f"Unable to read spilled resource '{uri}': {e}")
+            self._remove(key)
+            return None
+
+    def generation(self, server_name: str) -> int:
+        """
+        A counter that changes whenever the server's entries are invalidated. Take it
+        before reading a resource and pass it to put, so a result that was updated
+        while it was being read is not cached.
+        """
+        return self._generations.get(server_name, 0)
+
+    def put(
+        self,
+        server_name: str,
+        uri: str,
+        result: ReadResourceResult,
+        subscribed: bool = False,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Cache a resource result.
+
+        Args:
+            server_name: The server the resource was read from
+            uri: The resource URI
+            result: The result to cache
+            subscribed: True if the server will notify us of updates, in which case
+                        the entry does not expire
+            generation: The server's generation before the resource was read
+        """
+        key = (server_name, str(uri))
+        self._remove(key)
+        if generation is not None and generation != self.generation(server_name):
+            logger.debug(f"Resource '{uri}' changed while it was read, so it is not cached")
+            return
+
+        size = resource_result_size(result)
+        expires_at = None
+        if not subscribed and self.ttl_seconds is not None:
+            expires_at = time.monotonic() + self.ttl_seconds
+
+        entry = _CacheEntry(size=size, expires_at=expires_at, subscribed=subscribed)
+        if size > self.spill_threshold_bytes:
+            if size > self.max_disk_bytes:
+                logger.debug(f"Resource '{uri}' is too large to cache ({size} bytes)")
+                return
+            entry.spill_path = self._spill(result)
+            if entry.spill_path is None:
+                return
+            self._disk_bytes += size
+        else:
+            if size > self.max_memory_bytes:
+                return
+            entry.result = result
+            self._memory_bytes += size
+
+        self._entries[key] = entry
+        self._evict()
+
+    def invalidate(self, server_name: str, uri: str | None = None) -> None:
+        """
+        Remove a single resource, or every resource from a server if uri is None.
+        """
+        self._generations[server_name] = self.generation(server_name) + 1
+        if uri is not None:
+            self._remove((server_name, str(uri)))
+            return
+
+        for key in [key for key in self._entries if key[0] == server_name]:
+            self._remove(key)
+
+    def drop_subscribed(self, server_name: str) -> None:
+        """
+        Remove a server's subscribed entries, once the connection holding the
+        subscriptions has closed and updates would no longer be notified.
+        """
+        self._generations[server_name] = self.generation(server_name) + 1
+        for key, entry in list(self._entries.items()):
+            if key[0] == server_name and entry.subscribed:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries and any spill files."""
+        self._entries.clear()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def _spill(self, result: ReadResourceResult) -> Path | None:
+        try:
+            if self._spill_dir is None:
+                if self._spill_root:
+                    os.makedirs(self._spill_root, exist_ok=True)
+                self._spill_dir = Path(
+                    tempfile.mkdtemp(prefix="fast-agent-resources-", dir=self._spill_root)
+                )
+            fd, path = tempfile.mkstemp(suffix=".json", dir=self._spill_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(result.model_dump_json(by_alias=True).encode("utf-8"))
+            return Path(path)
+        except OSError as e:
+            logger.warning(f"Unable to spill resource to disk: {e}")
+            return None
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        if entry.spill_path is not None:
+            self._disk_bytes -= entry.size
+            try:
+                entry.spill_path.unlink()
+            except OSError:
+                pass
+        else:
+            self._memory_bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or self._memory_bytes > self.max_memory_bytes
+            or self._disk_bytes > self.max_disk_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counts and current sizes."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_bytes": self._memory_bytes,
+            "disk_bytes": self._disk_bytes,
+        }
+
+
+def create_resource_cache(settings: Optional["ResourceCacheSettings"]) -> ResourceCache | None:
+    """Create a ResourceCache from settings, or None if caching is disabled."""
+    if settings is None or not settings.enabled:
+        return None
+    return ResourceCache(
+        max_entries=settings.max_entries,
+        max_memory_bytes=int(settings.max_memory_mb * 1024 * 1024),
+        spill_threshold_bytes=int(settings.spill_threshold_mb * 1024 * 1024),
+        max_disk_bytes=int(settings.max_disk_mb * 1024 * 1024),
+        ttl_seconds=settings.ttl_seconds,
+        spill_dir=settings.spill_dir,
+    )
@@ -1,4 +1,6 @@
 import base64
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -17,6 +19,15 @@ HTTP_TIMEOUT = 10  # Default timeout for HTTP requests
 # Define a type alias for resource content results
 ResourceContent = Tuple[str, str, bool]
 
+# Loaded file contents keyed by path, validated against (mtime_ns, size)
+MAX_CACHED_RESOURCES = 128
+MAX_CACHED_RESOURCE_BYTES = 64 * 1024 * 1024
+_resource_content_cache: "OrderedDict[Path, Tuple[Tuple[int, int], ResourceContent]]" = (
+    OrderedDict()
+)
+_resource_content_lock = threading.Lock()
+_resource_content_bytes = 0
+
 
 def find_resource_file(resource_path: str, prompt_files: List[Path]) -> Optional[Path]:
     """Find a resource file relative to one of the prompt files"""
@@ -49,20 +60,68 @@ def load_resource_content(resource_path: str, prompt_files: List[Path]) -> Resou
     if resource_file is None:
         raise FileNotFoundError(f"Resource not found: {resource_path}")
 
+    return load_file_content(resource_file)
+
+
+def load_file_content(file_path: Path) -> ResourceContent:
+    """
+    Load a file's content and determine its mime type.
+    Results are cached until the file's modification time or size changes, so repeated
+    requests for the same image are not re-read and re-encoded.
+
+    Returns:
+        Tuple of (content, mime_type, is_binary), as for load_resource_content
+    """
+    stat = Path(file_path).stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    key = Path(file_path)
+
+    with _resource_content_lock:
+        cached = _resource_content_cache.get(key)
+        if cached and cached[0] == signature:
+            _resource_content_cache.move_to_end(key)
+            return cached[1]
+
     # Determine mime type
-    mime_type = mime_utils.guess_mime_type(str(resource_file))
+    mime_type = mime_utils.guess_mime_type(str(file_path))
     is_binary = mime_utils.is_binary_content(mime_type)
 
     if is_binary:
         # For binary files, read as binary and base64 encode
-        with open(resource_file, "rb") as f:
+        with open(file_path, "rb") as f:
             content = base64.b64encode(f.read()).decode("utf-8")
     else:
         # For text files, read as text
-        with open(resource_file, "r", encoding="utf-8") as f:
+        with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
 
-    return content, mime_type, is_binary
+    result = (content, mime_type, is_binary)
+    size = len(content)
+    if size > MAX_CACHED_RESOURCE_BYTES:
+        return result
+
+    global _resource_content_bytes
+    with _resource_content_lock:
+        previous = _resource_content_cache.pop(key, None)
+        if previous is not None:
+            _resource_content_bytes -= len(previous[1][0])
+        _resource_content_cache[key] = (signature, result)
+        _resource_content_bytes += size
+        while (
+            len(_resource_content_cache) > MAX_CACHED_RESOURCES
+            or _resource_content_bytes > MAX_CACHED_RESOURCE_BYTES
+        ):
+            _, (_, evicted) = _resource_content_cache.popitem(last=False)
+            _resource_content_bytes -= len(evicted[0])
+    return result
+
+
+def clear_resource_content_cache() -> None:
+    """Discard all cached file contents"""
+    global _resource_content_bytes
+    with _resource_content_lock:
+        _resource_content_cache.clear()
+        _resource_content_bytes = 0
 
 
 # Create a safe way to generate resource URIs that Pydantic accepts
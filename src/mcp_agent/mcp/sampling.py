@@ -2,7 +2,11 @@
 This simplified implementation directly converts between MCP types and PromptMessageMultipart.
 """
 
-from typing import TYPE_CHECKING
+import asyncio
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager, nullcontext
+from typing import TYPE_CHECKING, AsyncIterator, Deque, Dict, List, Optional
 
 from mcp import ClientSession
 from mcp.types import CreateMessageRequestParams, CreateMessageResult, TextContent
@@ -13,21 +17,26 @@ from mcp_agent.logging.logger import get_logger
 from mcp_agent.mcp.interfaces import AugmentedLLMProtocol
 
 if TYPE_CHECKING:
+    from mcp_agent.config import MCPSamplingSettings
+    from mcp_agent.context import Context
     from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
 logger = get_logger(__name__)
 
 
 def create_sampling_llm(
-    params: CreateMessageRequestParams, model_string: str
+    params: CreateMessageRequestParams,
+    model_string: str,
+    context: Optional["Context"] = None,
 ) -> AugmentedLLMProtocol:
     """
     Create an LLM instance for sampling without tools support.
     This utility function creates a minimal LLM instance based on the model string.
 
     Args:
-        mcp_ctx: The MCP ClientSession
+        params: The sampling request parameters
         model_string: The model to use (e.g. "passthrough", "claude-3-5-sonnet-latest")
+        context: Optional application context (defaults to the current global context)
 
     Returns:
         An initialized LLM instance ready to use
@@ -35,13 +44,14 @@ def create_sampling_llm(
     from mcp_agent.agents.agent import Agent
     from mcp_agent.llm.model_factory import ModelFactory
 
-    app_context = None
-    try:
-        from mcp_agent.context import get_current_context
+    app_context = context
+    if app_context is None:
+        try:
+            from mcp_agent.context import get_current_context
 
-        app_context = get_current_context()
-    except Exception:
-        logger.warning("App context not available for sampling call")
+            app_context = get_current_context()
+        except Exception:
+            logger.warning("App context not available for sampling call")
 
     agent = Agent(
         config=sampling_agent_config(params),
@@ -59,15 +69,186 @@ def create_sampling_llm(
     return llm
 
 
+class _ServerSamplingLimit:
+    """Concurrency and requests-per-minute limits for sampling requests from one server"""
+
+    def __init__(self, max_concurrency: int | None, requests_per_minute: int | None) -> None:
+        self.semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self.requests_per_minute = requests_per_minute
+        self._request_times: Deque[float] = deque()
+
+    async def wait_for_budget(self) -> None:
+        """Wait until a request fits in the requests-per-minute budget, then record it"""
+        if not self.requests_per_minute:
+            return
+
+        while True:
+            now = time.monotonic()
+            while self._request_times and now - self._request_times[0] >= 60:
+                self._request_times.popleft()
+
+            if len(self._request_times) < self.requests_per_minute:
+                self._request_times.append(now)
+                return
+
+            await asyncio.sleep(60 - (now - self._request_times[0]))
+
+
+class SamplingService:
+    """
+    Serves MCP sampling requests from a pool of reusable LLM instances per model.
+
+    Requests beyond max_concurrency queue until an LLM is free, and servers can be given
+    their own concurrency and requests-per-minute limits through their sampling settings.
+    Pooled LLMs have their history cleared between requests.
+    """
+
+    def __init__(
+        self,
+        context: Optional["Context"] = None,
+        max_concurrency: int = 8,
+        pool_size: int = 4,
+    ) -> None:
+        self.context = context
+        self.max_concurrency = max_concurrency
+        self.pool_size = pool_size
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._idle_llms: Dict[str, List[AugmentedLLMProtocol]] = defaultdict(list)
+        self._server_limits: Dict[str, _ServerSamplingLimit] = {}
+
+        self.llms_created = 0
+
+    async def generate(
+        self,
+        params: CreateMessageRequestParams,
+        model: str,
+        server_name: str | None = None,
+        server_settings: Optional["MCPSamplingSettings"] = None,
+    ) -> "PromptMessageMultipart":
+        """
+        Generate a response to a sampling request.
+
+        Args:
+            params: The sampling request parameters
+            model: The model string configured for the requesting server
+            server_name: The requesting server, used to apply per-server limits
+            server_settings: The requesting server's sampling settings
+
+        Returns:
+            The LLM's response
+        """
+        if not params.messages:
+            raise ValueError("No messages provided")
+
+        # Convert all SamplingMessages to PromptMessageMultipart objects
+        conversation = SamplingConverter.convert_messages(params.messages)
+
+        # Extract request parameters using our converter
+        request_params = SamplingConverter.extract_request_params(params)
+
+        server_limit = self._server_limit(server_name, server_settings)
+        queued_at = time.monotonic()
+
+        async with server_limit.semaphore if server_limit else nullcontext():
+            if server_limit:
+                await server_limit.wait_for_budget()
+            async with self._semaphore:
+                queue_wait = time.monotonic() - queued_at
+                if queue_wait > 0.1:
+                    logger.debug(
+                        f"Sampling request from '{server_name}' queued for {queue_wait:.2f}s"
+                    )
+                async with self._checkout(params, model) as llm:
+                    return await llm.generate(conversation, request_params)
+
+    @asynccontextmanager
+    async def _checkout(
+        self, params: CreateMessageRequestParams, model: str
+    ) -> AsyncIterator[AugmentedLLMProtocol]:
+        """Take an idle LLM for the model from the pool (or create one) and return it after use"""
+        idle = self._idle_llms[model]
+        if idle:
+            llm = idle.pop()
+        else:
+            llm = create_sampling_llm(params, model, context=self.context)
+            self.llms_created += 1
+
+        llm.instruction = sampling_agent_config(params).instruction
+        healthy = False
+        try:
+            yield llm
+            healthy = True
+        finally:
+            if healthy and len(idle) < self.pool_size:
+                llm.clear_history()
+                idle.append(llm)
+
+    def _server_limit(
+        self, server_name: str | None, server_settings: Optional["MCPSamplingSettings"]
+    ) -> _ServerSamplingLimit | None:
+        if not server_name or server_settings is None:
+            return None
+        if not server_settings.max_concurrency and not server_settings.requests_per_minute:
+            return None
+
+        if server_name not in self._server_limits:
+            self._server_limits[server_name] = _ServerSamplingLimit(
+                server_settings.max_concurrency, server_settings.requests_per_minute
+            )
+        return self._server_limits[server_name]
+
+
+_default_sampling_service: SamplingService | None = None
+
+
+def get_sampling_service(context: Optional["Context"]) -> SamplingService:
+    """
+    Return the sampling service for a context, creating it on first use.
+    """
+    global _default_sampling_service
+
+    if context is None:
+        if _default_sampling_service is None:
+            _default_sampling_service = SamplingService()
+        return _default_sampling_service
+
+    if context.sampling_service is None:
+        settings = context.config.sampling if context.config else None
+        if settings is None:
+            context.sampling_service = SamplingService(context=context)
+        else:
+            context.sampling_service = SamplingService(
+                context=context,
+                max_concurrency=settings.max_concurrency,
+                pool_size=settings.pool_size,
+            )
+    return context.sampling_service
+
+
+def _session_context(session: ClientSession | None) -> Optional["Context"]:
+    """The application context attached to a client session, falling back to the global context"""
+    context = getattr(session, "_context", None)
+    if context is not None:
+        return context
+
+    try:
+        from mcp_agent.context import get_current_context
+
+        return get_current_context()
+    except Exception:
+        logger.warning("App context not available for sampling call")
+        return None
+
+
 async def sample(mcp_ctx: ClientSession, params: CreateMessageRequestParams) -> CreateMessageResult:
     """
     Handle sampling requests from the MCP protocol using SamplingConverter.
 
     This function:
     1. Extracts the model from the request
-    2. Uses SamplingConverter to convert types
-    3. Calls the LLM's generate_prompt method
-    4. Returns the result as a CreateMessageResult
+    2. Passes the request to the context's SamplingService
+    3. Returns the result as a CreateMessageResult
 
     Args:
         mcp_ctx: The MCP ClientSession
@@ -78,33 +259,23 @@ async def sample(mcp_ctx: ClientSession, params: CreateMessageRequestParams) ->
     """
     model = None
     try:
+        session = getattr(mcp_ctx, "session", None)
+        server_config = getattr(session, "server_config", None)
+
         # Extract model from server config
-        if (
-            hasattr(mcp_ctx, "session")
-            and hasattr(mcp_ctx.session, "server_config")
-            and mcp_ctx.session.server_config
-            and hasattr(mcp_ctx.session.server_config, "sampling")
-            and mcp_ctx.session.server_config.sampling.model
-        ):
-            model = mcp_ctx.session.server_config.sampling.model
+        if server_config and server_config.sampling and server_config.sampling.model:
+            model = server_config.sampling.model
 
         if model is None:
             raise ValueError("No model configured")
 
-        # Create an LLM instance
-        llm = create_sampling_llm(params, model)
-
-        # Extract all messages from the request params
-        if not params.messages:
-            raise ValueError("No messages provided")
-
-        # Convert all SamplingMessages to PromptMessageMultipart objects
-        conversation = SamplingConverter.convert_messages(params.messages)
-
-        # Extract request parameters using our converter
-        request_params = SamplingConverter.extract_request_params(params)
-
-        llm_response: PromptMessageMultipart = await llm.generate(conversation, request_params)
+        service = get_sampling_service(_session_context(session))
+        llm_response: PromptMessageMultipart = await service.generate(
+            params,
+            model,
+            server_name=getattr(session, "server_name", None),
+            server_settings=server_config.sampling,
+        )
         logger.info(f"Complete sampling request : {llm_response.first_text()[:50]}...")
 
         return CreateMessageResult(
@@ -0,0 +1,234 @@
+"""
+Durable, append-only storage for conversation history, backed by SQLite.
+
+Each turn is appended in its own transaction, so history survives a crash without
+rewriting the whole conversation. Large image and blob content is stored once in a
+separate table, keyed by its SHA-256 hash, and referenced from the message JSON.
+Sessions are resumed by ID, and messages can be read back in batches so that old
+turns are only loaded when needed.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+
+if TYPE_CHECKING:
+    from mcp_agent.config import SessionStoreSettings
+
+BLOB_REFERENCE = "$blob"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS messages (
+    session_id TEXT NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (session_id, seq)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+
+class SessionStore:
+    """
+    Stores PromptMessageMultipart conversation history by session ID.
+    Safe to use from multiple threads.
+    """
+
+    def __init__(self, path: str | Path, blob_threshold_bytes: int = 1024) -> None:
+        """
+        Args:
+            path: SQLite database file, created if it does not exist
+            blob_threshold_bytes: Image and blob data at least this large is stored out-of-line
+        """
+        self.path = Path(path)
+        self.blob_threshold_bytes = blob_threshold_bytes
+        self._lock = threading.Lock()
+
+        if self.path.parent and not self.path.parent.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        self._connection.executescript(_SCHEMA)
+
+    def create_session(self, session_id: str | None = None) -> str:
+        """Create a session, returning its ID. Existing sessions are left unchanged."""
+        session_id = session_id or uuid.uuid4().hex
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO sessions (id, created_at, updated_at) VALUES (?, ?, ?)",
+                (session_id, now, now),
+            )
+        return session_id
+
+    def list_sessions(self) -> List[str]:
+        """Return session IDs, most recently updated first."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id FROM sessions ORDER BY updated_at DESC"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def delete_session(self, session_id: str) -> None:
+        """Delete a session and any blobs no longer referenced by other sessions."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+            self._connection.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+            remaining = {
+                reference
+                for (body,) in self._connection.execute("SELECT body FROM messages")
+                for reference in _blob_references(json.loads(body))
+            }
+            for (blob_hash,) in self._connection.execute("SELECT hash FROM blobs").fetchall():
+                if blob_hash not in remaining:
+                    self._connection.execute("DELETE FROM blobs WHERE hash = ?", (blob_hash,))
+
+    def append(self, session_id: str, messages: List[PromptMessageMultipart]) -> None:
+        """Append messages to a session in a single transaction, creating it if needed."""
+        if not messages:
+            return
+
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO sessions (id, created_at, updated_at) VALUES (?, ?, ?)",
+                (session_id, now, now),
+            )
+            self._connection.execute(
+                "UPDATE sessions SET updated_at = ? WHERE id = ?", (now, session_id)
+            )
+            (next_seq,) = self._connection.execute(
+                "SELECT COALESCE(MAX(seq) + 1, 0) FROM messages WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+
+            for offset, message in enumerate(messages):
+                body = message.model_dump(by_alias=True, mode="json", exclude_none=True)
+                for part in body["content"]:
+                    self._store_blobs(part)
+                self._connection.execute(
+                    "INSERT INTO messages (session_id, seq, role, body) VALUES (?, ?, ?, ?)",
+                    (session_id, next_seq + offset, message.role, json.dumps(body)),
+                )
+
+    def message_count(self, session_id: str) -> int:
+        """Return the number of messages stored for a session."""
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM messages WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return count
+
+    def load(
+        self, session_id: str, start: int = 0, limit: int | None = None
+    ) -> List[PromptMessageMultipart]:
+        """
+        Load messages from a session.
+
+        Args:
+            session_id: The session to load
+            start: Index of the first message to load. Negative values count from the end.
+            limit: Maximum number of messages to load
+        """
+        if start < 0:
+            start = max(0, self.message_count(session_id) + start)
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT body FROM messages WHERE session_id = ? AND seq >= ? ORDER BY seq LIMIT ?",
+                (session_id, start, -1 if limit is None else limit),
+            ).fetchall()
+            bodies = [json.loads(body) for (body,) in rows]
+            blobs = self._load_blobs({ref for body in bodies for ref in _blob_references(body)})
+
+        return [_restore_message(body, blobs) for body in bodies]
+
+    def iter_messages(
+        self, session_id: str, start: int = 0, batch_size: int = 50
+    ) -> Iterator[PromptMessageMultipart]:
+        """Lazily iterate over a session's messages, loading them in batches."""
+        while True:
+            batch = self.load(session_id, start=start, limit=batch_size)
+            yield from batch
+            if len(batch) < batch_size:
+                return
+            start += batch_size
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _store_blobs(self, part: Dict[str, Any]) -> None:
+        """Move large image and blob data into the blobs table, replacing it with a reference"""
+        target, field = part, "data"
+        if part.get("type") == "resource":
+            target, field = part.get("resource", {}), "blob"
+
+        data = target.get(field)
+        if not isinstance(data, str) or len(data) < self.blob_threshold_bytes:
+            return
+
+        blob_hash = hashlib.sha256(data.encode("utf-8")).hexdigest()
+        self._connection.execute(
+            "INSERT OR IGNORE INTO blobs (hash, data) VALUES (?, ?)", (blob_hash, data)
+        )
+        target[field] = {BLOB_REFERENCE: blob_hash}
+
+    def _load_blobs(self, hashes: set) -> Dict[str, str]:
+        blobs: Dict[str, str] = {}
+        for blob_hash in hashes:
+            row = self._connection.execute(
+                "SELECT data FROM blobs WHERE hash = ?", (blob_hash,)
+            ).fetchone()
+            if row is not None:
+                blobs[blob_hash] = row[0]
+        return blobs
+
+
+def _blob_fields(body: Dict[str, Any]) -> Iterator[tuple[Dict[str, Any], str]]:
+    for part in body.get("content", []):
+        if part.get("type") == "resource":
+            yield part.get("resource", {}), "blob"
+        else:
+            yield part, "data"
+
+
+def _blob_references(body: Dict[str, Any]) -> Iterator[str]:
+    for target, field in _blob_fields(body):
+        value = target.get(field)
+        if isinstance(value, dict) and BLOB_REFERENCE in value:
+            yield value[BLOB_REFERENCE]
+
+
+def _restore_message(body: Dict[str, Any], blobs: Dict[str, str]) -> PromptMessageMultipart:
+    for target, field in _blob_fields(body):
+        value = target.get(field)
+        if isinstance(value, dict) and BLOB_REFERENCE in value:
+            target[field] = blobs.get(value[BLOB_REFERENCE], "")
+    return PromptMessageMultipart.model_validate(body)
+
+
+def create_session_store(settings: Optional["SessionStoreSettings"]) -> SessionStore | None:
+    """Create a SessionStore from settings, or None if session storage is disabled."""
+    if settings is None or not settings.enabled:
+        return None
+    return SessionStore(settings.path, blob_threshold_bytes=settings.blob_threshold_bytes)
@@ -1,6 +1,7 @@
 # src/mcp_agent/mcp_server/agent_server.py
 
 import asyncio
+from typing import Any
 
 from mcp.server.fastmcp import Context as MCPContext
 from mcp.server.fastmcp import FastMCP
@@ -8,19 +9,54 @@ from mcp.server.fastmcp import FastMCP
 import mcp_agent
 import mcp_agent.core
 import mcp_agent.core.prompt
+from mcp_agent.config import AgentServerSettings, MetricsSettings
 from mcp_agent.core.agent_app import AgentApp
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.executor.process import ProcessExecutor
+from mcp_agent.llm.conversation_scope import conversation_scope
+from mcp_agent.logging.metrics import prometheus_reader
+from mcp_agent.logging.tracing import MCPRequestTrace
+from mcp_agent.mcp_server.metrics_endpoint import MetricsEndpoint
+from mcp_agent.mcp_server.session_pool import AgentSessionPool, request_context, session_key
+
+
+def _request_meta(ctx: MCPContext) -> Any:
+    """The _meta sent with the MCP request being handled, if any"""
+    try:
+        return ctx.request_context.meta
+    except (AttributeError, ValueError):
+        return None
 
 
 class AgentMCPServer:
-    """Exposes FastAgent agents as MCP tools through an MCP server."""
+    """
+    Exposes FastAgent agents as MCP tools through an MCP server.
+    Each client session has its own conversation with each agent.
+    """
 
     def __init__(
         self,
         agent_app: AgentApp,
         server_name: str = "FastAgent-MCP-Server",
         server_description: str | None = None,
+        settings: AgentServerSettings | None = None,
+        metrics: MetricsSettings | None = None,
     ) -> None:
         self.agent_app = agent_app
+        self.metrics = metrics
+        settings = settings or AgentServerSettings()
+        # With the process executor, conversations are held by worker processes
+        executors = [getattr(agent, "executor", None) for agent in agent_app._agents.values()]
+        self.process_executor = next(
+            (executor for executor in executors if isinstance(executor, ProcessExecutor)), None
+        )
+        self._ending_sessions: set[asyncio.Task] = set()
+        self.sessions = AgentSessionPool(
+            max_sessions=settings.max_sessions,
+            max_concurrent_requests=settings.max_concurrent_requests,
+            idle_timeout_seconds=settings.session_idle_timeout_seconds,
+            on_evict=self._end_worker_session if self.process_executor else None,
+        )
         self.mcp_server = FastMCP(
             name=server_name,
             instructions=server_description
@@ -44,18 +80,24 @@ class AgentMCPServer:
         async def send_message(message: str, ctx: MCPContext) -> str:
             """Send a message to the agent and return its response."""
 
-            # Get the agent's context
-            agent_context = getattr(agent, "context", None)
-
             # Define the function to execute
             async def execute_send():
                 return await agent.send(message)
 
-            # Execute with bridged context
-            if agent_context and ctx:
-                return await self.with_bridged_context(agent_context, ctx, execute_send)
-            else:
-                return await execute_send()
+            # Continue the caller's trace, and use this client's conversation with the agent
+            key = session_key(ctx, self.sessions.close)
+            with MCPRequestTrace.start_span_from_mcp_request(
+                f"tools/call {agent_name}_send",
+                _request_meta(ctx),
+                attributes={"agent.name": agent_name},
+            ):
+                async with self.sessions.session(key):
+                    if self.process_executor is not None:
+                        response = await self.process_executor.run_agent(
+                            agent_name, [Prompt.user(message)], session=key
+                        )
+                        return response.all_text()
+                    return await self.with_bridged_context(None, ctx, execute_send)
 
         # Register a history prompt for this agent
         @self.mcp_server.prompt(
@@ -68,8 +110,18 @@ class AgentMCPServer:
             if not hasattr(agent, "_llm") or agent._llm is None:
                 return []
 
+            # Only this client's conversation is returned
+            key = session_key(self.mcp_server.get_context(), self.sessions.close)
+            session = self.sessions.get(key)
+            if session is None:
+                return []
+            if self.process_executor is not None:
+                multipart_history = await self.process_executor.history(agent_name, key)
+            else:
+                with conversation_scope(session.scope):
+                    multipart_history = agent._llm.message_history
+
             # Convert the multipart message history to standard PromptMessages
-            multipart_history = agent._llm.message_history
             prompt_messages = mcp_agent.core.prompt.Prompt.from_multipart(multipart_history)
 
             # In FastMCP, we need to return the raw list of messages
@@ -78,74 +130,72 @@ class AgentMCPServer:
 
     def run(self, transport: str = "sse", host: str = "0.0.0.0", port: int = 8000) -> None:
         """Run the MCP server."""
-        if transport == "sse":
-            # For running as a web server
-            self.mcp_server.settings.host = host
-            self.mcp_server.settings.port = port
-
-        self.mcp_server.run(transport=transport)
+        asyncio.run(self.run_async(transport=transport, host=host, port=port))
 
     async def run_async(
         self, transport: str = "sse", host: str = "0.0.0.0", port: int = 8000
     ) -> None:
         """Run the MCP server asynchronously."""
-        if transport == "sse":
-            self.mcp_server.settings.host = host
-            self.mcp_server.settings.port = port
-            try:
-                await self.mcp_server.run_sse_async()
-            except (asyncio.CancelledError, KeyboardInterrupt):
-                # Gracefully handle cancellation during shutdown
-                await self.shutdown()
-                pass
-        else:  # stdio
-            try:
-                await self.mcp_server.run_stdio_async()
-            except (asyncio.CancelledError, KeyboardInterrupt):
-                # Gracefully handle cancellation during shutdown
-                await self.shutdown()
-                pass
+        metrics_endpoint = await self._start_metrics_endpoint()
+        try:
+            if transport == "sse":
+                self.mcp_server.settings.host = host
+                self.mcp_server.settings.port = port
+                try:
+                    await self.mcp_server.run_sse_async()
+                except (asyncio.CancelledError, KeyboardInterrupt):
+                    # Gracefully handle cancellation during shutdown
+                    await self.shutdown()
+                    pass
+            else:  # stdio
+                try:
+                    await self.mcp_server.run_stdio_async()
+                except (asyncio.CancelledError, KeyboardInterrupt):
+                    # Gracefully handle cancellation during shutdown
+                    await self.shutdown()
+                    pass
+        finally:
+            if metrics_endpoint is not None:
+                await metrics_endpoint.stop()
+
+    async def _start_metrics_endpoint(self) -> MetricsEndpoint | None:
+        """Serve metrics for Prometheus, if metrics.prometheus_port is configured"""
+        reader = prometheus_reader()
+        if reader is None or self.metrics is None or self.metrics.prometheus_port is None:
+            return None
+        endpoint = MetricsEndpoint(
+            reader, host=self.metrics.prometheus_host, port=self.metrics.prometheus_port
+        )
+        await endpoint.start()
+        return endpoint
+
+    def _end_worker_session(self, key) -> None:
+        """Discard an evicted session's conversations held by the worker processes"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # The server has stopped, and its workers with it
+            return
+        task = loop.create_task(self.process_executor.end_session(str(key)))
+        self._ending_sessions.add(task)
+        task.add_done_callback(self._ending_sessions.discard)
 
     async def with_bridged_context(self, agent_context, mcp_context, func, *args, **kwargs):
         """
-        Execute a function with bridged context between MCP and agent
+        Execute a function with bridged context between MCP and agent.
+
+        The MCP context is passed to the agent's code through current_request_context(),
+        rather than stored on the shared agent context, so concurrent requests do not
+        see each other's context.
 
         Args:
-            agent_context: The agent's context object
+            agent_context: Unused, kept for compatibility
             mcp_context: The MCP context from the tool call
             func: The function to execute
             args, kwargs: Arguments to pass to the function
         """
-        # Store original progress reporter if it exists
-        original_progress_reporter = None
-        if hasattr(agent_context, "progress_reporter"):
-            original_progress_reporter = agent_context.progress_reporter
-
-        # Store MCP context in agent context for nested calls
-        agent_context.mcp_context = mcp_context
-
-        # Create bridged progress reporter
-        async def bridged_progress(progress, total=None) -> None:
-            if mcp_context:
-                await mcp_context.report_progress(progress, total)
-            if original_progress_reporter:
-                await original_progress_reporter(progress, total)
-
-        # Install bridged progress reporter
-        if hasattr(agent_context, "progress_reporter"):
-            agent_context.progress_reporter = bridged_progress
-
-        try:
-            # Call the function
+        with request_context(mcp_context):
             return await func(*args, **kwargs)
-        finally:
-            # Restore original progress reporter
-            if hasattr(agent_context, "progress_reporter"):
-                agent_context.progress_reporter = original_progress_reporter
-
-            # Remove MCP context reference
-            if hasattr(agent_context, "mcp_context"):
-                delattr(agent_context, "mcp_context")
 
     async def shutdown(self):
         """Gracefully shutdown the MCP server and its resources."""
@@ -0,0 +1,150 @@
+"""
+Prometheus text endpoint for the metrics recorded while agents are served over MCP.
+
+Metrics are read from the OpenTelemetry reader installed by configure_metrics when
+metrics.prometheus_port is set, and rendered in the Prometheus text exposition format.
+The endpoint is a minimal HTTP server on its own port, so it is available with both
+the SSE and stdio transports.
+"""
+
+import asyncio
+import re
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List
+
+from mcp_agent.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader, Metric, MetricsData
+
+logger = get_logger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Prometheus base unit suffixes for OpenTelemetry units
+_UNIT_SUFFIXES = {"s": "seconds", "ms": "milliseconds", "By": "bytes"}
+
+
+def render_prometheus(data: "MetricsData | None") -> str:
+    """Render collected metrics in the Prometheus text format"""
+    if data is None:
+        return ""
+    lines: List[str] = []
+    for resource_metrics in data.resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                lines.extend(_render_metric(metric))
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _render_metric(metric: "Metric") -> Iterator[str]:
+    from opentelemetry.sdk.metrics.export import Histogram, Sum
+
+    name = re.sub(r"[^a-zA-Z0-9_:]", "_", metric.name)
+    suffix = _UNIT_SUFFIXES.get(metric.unit or "")
+    if suffix and not name.endswith(f"_{suffix}"):
+        name = f"{name}_{suffix}"
+
+    data = metric.data
+    if isinstance(data, Histogram):
+        yield f"# HELP {name} {_escape_help(metric.description)}"
+        yield f"# TYPE {name} histogram"
+        for point in data.data_points:
+            cumulative = 0
+            for bound, count in zip(point.explicit_bounds, point.bucket_counts):
+                cumulative += count
+                yield f"{name}_bucket{_labels(point.attributes, le=_number(bound))} {cumulative}"
+            yield f"{name}_bucket{_labels(point.attributes, le='+Inf')} {point.count}"
+            yield f"{name}_sum{_labels(point.attributes)} {_number(point.sum)}"
+            yield f"{name}_count{_labels(point.attributes)} {point.count}"
+        return
+
+    metric_type = "gauge"
+    if isinstance(data, Sum) and data.is_monotonic:
+        metric_type = "counter"
+        name = f"{name}_total"
+    yield f"# HELP {name} {_escape_help(metric.description)}"
+    yield f"# TYPE {name} {metric_type}"
+    for point in data.data_points:
+        yield f"{name}{_labels(point.attributes)} {_number(point.value)}"
+
+
+def _labels(attributes: Dict[str, Any] | None, **extra: str) -> str:
+    labels = {**(attributes or {}), **extra}
+    if not labels:
+        return ""
+    rendered = ",".join(
+        f'{re.sub(r"[^a-zA-Z0-9_]", "_", str(key))}="{_escape_label(value)}"'
+        for key, value in labels.items()
+    )
+    return f"{{{rendered}}}"
+
+
+def _escape_label(value: Any) -> str:
+    text = str(value).lower() if isinstance(value, bool) else str(value)
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _escape_help(text: str | None) -> str:
+    return (text or "").replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == float("-inf"):
+        return "-Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class MetricsEndpoint:
+    """Serves metrics in the Prometheus text format at /metrics"""
+
+    def __init__(
+        self, reader: "InMemoryMetricReader", host: str = "127.0.0.1", port: int = 9464
+    ) -> None:
+        self.reader = reader
+        self.host = host
+        self.port = port
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # Report the bound port, when started on port 0
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Serving metrics at http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            # Headers are not used
+            while (await asyncio.wait_for(reader.readline(), timeout=5)).strip():
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            path = parts[1].split("?", 1)[0] if len(parts) > 1 else ""
+            if path == "/metrics":
+                status, body = "200 OK", render_prometheus(self.reader.get_metrics_data())
+            else:
+                status, body = "404 Not Found", "Not found\n"
+
+            payload = body.encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                "Connection: close\r\n\r\n".encode("latin-1")
+                + payload
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.error(f"Error serving metrics: {e}")
+        finally:
+            writer.close()
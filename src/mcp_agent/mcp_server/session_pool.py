@@ -0,0 +1,233 @@
+"""
+Per-client conversations for agents served over MCP.
+
+Each MCP client session gets its own ConversationScope, so concurrent clients calling
+the same agent hold separate conversation histories. Requests within a session are
+handled one at a time, and the number of requests processed at once across all
+sessions is bounded, with further requests waiting in turn. Sessions are evicted when
+their client disconnects, after an idle timeout, or when the session limit is reached.
+"""
+
+import asyncio
+import functools
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Hashable, Iterator
+from weakref import WeakKeyDictionary
+
+from mcp_agent.llm.conversation_scope import ConversationScope, conversation_scope
+from mcp_agent.logging.logger import get_logger
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import Context as MCPContext
+
+logger = get_logger(__name__)
+
+# The MCP request being handled by the current task
+_request_context: ContextVar["MCPContext | None"] = ContextVar("mcp_request_context", default=None)
+
+# Keys of live MCP client sessions. Unlike id(), a key is never reused by a later session.
+_session_keys: "WeakKeyDictionary[Any, str]" = WeakKeyDictionary()
+
+
+def current_request_context() -> "MCPContext | None":
+    """The MCP context of the tool call being handled, when serving agents over MCP"""
+    return _request_context.get()
+
+
+@contextmanager
+def request_context(mcp_context: "MCPContext | None") -> Iterator[None]:
+    """Make the MCP context available to the agents handling this request"""
+    token = _request_context.set(mcp_context)
+    try:
+        yield
+    finally:
+        _request_context.reset(token)
+
+
+@dataclass
+class AgentSession:
+    """Conversation state and bookkeeping for one MCP client session"""
+
+    key: Hashable
+    scope: ConversationScope
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    last_used: float = field(default_factory=time.monotonic)
+    active: int = 0
+    """Requests holding or waiting for this session"""
+
+    closed: bool = False
+    """The client has disconnected, so the session is evicted once its requests finish"""
+
+
+@dataclass
+class SessionPoolStats:
+    created: int = 0
+    evicted: int = 0
+    queued: int = 0
+    """Requests that waited for a free session or request slot"""
+
+
+class AgentSessionPool:
+    """Holds the conversation scope for each MCP client session"""
+
+    def __init__(
+        self,
+        max_sessions: int = 100,
+        max_concurrent_requests: int = 16,
+        idle_timeout_seconds: float = 1800,
+        on_evict: Callable[[Hashable], None] | None = None,
+    ) -> None:
+        self.max_sessions = max(1, max_sessions)
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.on_evict = on_evict
+        """Called with the key of each evicted session"""
+        self.stats = SessionPoolStats()
+
+        # Least recently used first
+        self._sessions: OrderedDict[Hashable, AgentSession] = OrderedDict()
+        self._requests: asyncio.Semaphore | None = None
+        self._changed: asyncio.Condition | None = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, key: Hashable) -> AgentSession | None:
+        """Return a session without using it, or None if there is no such session"""
+        return self._sessions.get(key)
+
+    @asynccontextmanager
+    async def session(self, key: Hashable) -> AsyncIterator[AgentSession]:
+        """
+        Use the session for `key`, creating it if needed. Agents called within the block
+        use the session's conversations.
+        """
+        session = await self._checkout(key)
+        try:
+            async with session.lock:
+                requests = self._request_slots()
+                if requests.locked():
+                    self.stats.queued += 1
+                async with requests:
+                    with conversation_scope(session.scope):
+                        yield session
+        finally:
+            await self._checkin(session)
+
+    def evict(self, key: Hashable) -> bool:
+        """Discard an idle session's conversations. Returns False if the session is in use."""
+        session = self._sessions.get(key)
+        if session is None or session.active:
+            return False
+        del self._sessions[key]
+        session.scope.clear()
+        self.stats.evicted += 1
+        if self.on_evict is not None:
+            self.on_evict(key)
+        return True
+
+    def close(self, key: Hashable) -> None:
+        """Evict the session of a client that has disconnected, once its requests finish"""
+        session = self._sessions.get(key)
+        if session is not None:
+            session.closed = True
+            self.evict(key)
+
+    async def _checkout(self, key: Hashable) -> AgentSession:
+        changed = self._condition()
+        async with changed:
+            waited = False
+            while True:
+                self._evict_idle()
+                session = self._sessions.get(key)
+                if session is None and len(self._sessions) >= self.max_sessions:
+                    idle = next((k for k, s in self._sessions.items() if not s.active), None)
+                    if idle is None:
+                        # Every session is busy, so wait for one to finish
+                        if not waited:
+                            self.stats.queued += 1
+                            waited = True
+                        await changed.wait()
+                        continue
+                    logger.debug(f"Evicting least recently used session {idle}")
+                    self.evict(idle)
+
+                if session is None:
+                    session = AgentSession(key=key, scope=ConversationScope(name=str(key)))
+                    self._sessions[key] = session
+                    self.stats.created += 1
+
+                session.active += 1
+                self._sessions.move_to_end(key)
+                return session
+
+    async def _checkin(self, session: AgentSession) -> None:
+        changed = self._condition()
+        async with changed:
+            session.active -= 1
+            session.last_used = time.monotonic()
+            if session.closed:
+                self.evict(session.key)
+            changed.notify_all()
+
+    def _evict_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_timeout_seconds
+        for key, session in list(self._sessions.items()):
+            if not session.active and session.last_used < cutoff:
+                logger.debug(f"Evicting idle session {key}")
+                self.evict(key)
+
+    def _condition(self) -> asyncio.Condition:
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    def _request_slots(self) -> asyncio.Semaphore:
+        if self._requests is None:
+            self._requests = asyncio.Semaphore(self.max_concurrent_requests)
+        return self._requests
+
+
+def session_key(mcp_context: Any, on_disconnect: Callable[[str], None] | None = None) -> str:
+    """
+    Identify the client session of an MCP request. on_disconnect is called with the key,
+    on the event loop, once the client session has closed.
+    """
+    try:
+        session = mcp_context.request_context.session
+    except (AttributeError, ValueError):
+        # No request in progress, for example when called outside of a tool call
+        return "default"
+    key = _session_keys.get(session)
+    if key is None:
+        key = _session_keys[session] = uuid.uuid4().hex
+        if on_disconnect is not None:
+            _on_close(session, functools.partial(on_disconnect, key))
+    return key
+
+
+def _on_close(session: Any, callback: Callable[[], None]) -> None:
+    """Call callback on the event loop when an MCP session closes"""
+    exit_stack = getattr(session, "_exit_stack", None)
+    if isinstance(exit_stack, AsyncExitStack):
+        # MCP sessions close their exit stack as they end, on the loop serving them
+        exit_stack.callback(callback)
+        return
+    # Otherwise wait for the session to be released. Finalizers run on whichever thread
+    # collects the session, so hand the callback back to the loop.
+    loop = asyncio.get_running_loop()
+    weakref.finalize(session, _call_soon, loop, callback).atexit = False
+
+
+def _call_soon(loop: asyncio.AbstractEventLoop, callback: Callable[[], None]) -> None:
+    try:
+        loop.call_soon_threadsafe(callback)
+    except RuntimeError:
+        # The loop has closed, and the server with it
+        pass
@@ -1,13 +1,8 @@
 import asyncio
 from pathlib import Path
-from typing import TYPE_CHECKING
 
 from mcp_agent.core.fastagent import FastAgent
 from mcp_agent.llm.augmented_llm import RequestParams
-from mcp_agent.mcp.prompts.prompt_load import load_prompt_multipart
-
-if TYPE_CHECKING:
-    from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 
 # Create the application
 fast = FastAgent("Data Analysis (Roots)")
@@ -52,8 +47,7 @@ Visualisations should be saved as .png files in the current working directory.
 async def main() -> None:
     # Use the app's context manager
     async with fast.run() as agent:
-        prompts: list[PromptMessageMultipart] = load_prompt_multipart(Path("slides.md"))
-        await agent.slides.apply_prompt_messages(prompts)
+        await agent.slides.apply_prompt_file(Path("slides.md"))
 
         await agent.orchestrator.send(
             "Produce a compelling presentation for the CSV data file in the /mnt/data/ directory."
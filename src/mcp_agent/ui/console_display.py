@@ -5,6 +5,7 @@ from rich.panel import Panel
 from rich.text import Text
 
 from mcp_agent import console
+from mcp_agent.logging.profiler import profiled
 from mcp_agent.mcp.mcp_aggregator import SEP
 
 # Constants
@@ -26,6 +27,7 @@ class ConsoleDisplay:
         """
         self.config = config
 
+    @profiled("display")
     def show_tool_result(self, result: CallToolResult) -> None:
         """Display a tool result in a formatted panel."""
         if not self.config or not self.config.logger.show_tools:
@@ -49,6 +51,7 @@ class ConsoleDisplay:
         console.console.print(panel)
         console.console.print("\n")
 
+    @profiled("display")
     def show_oai_tool_result(self, result) -> None:
         """Display an OpenAI tool result in a formatted panel."""
         if not self.config or not self.config.logger.show_tools:
@@ -70,6 +73,7 @@ class ConsoleDisplay:
         console.console.print(panel)
         console.console.print("\n")
 
+    @profiled("display")
     def show_tool_call(self, available_tools, tool_name, tool_args) -> None:
         """Display a tool call in a formatted panel."""
         if not self.config or not self.config.logger.show_tools:
@@ -128,6 +132,7 @@ class ConsoleDisplay:
 
         return display_tool_list
 
+    @profiled("display")
     async def show_assistant_message(
         self,
         message_text: Union[str, Text],
@@ -175,6 +180,7 @@ class ConsoleDisplay:
         console.console.print(panel)
         console.console.print("\n")
 
+    @profiled("display")
     def show_user_message(
         self, message, model: Optional[str], chat_turn: int, name: Optional[str] = None
     ) -> None:
@@ -199,6 +205,7 @@ class ConsoleDisplay:
         console.console.print(panel)
         console.console.print("\n")
 
+    @profiled("display")
     async def show_prompt_loaded(
         self,
         prompt_name: str,
@@ -0,0 +1,31 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from mcp_agent.cli.commands.bench import bench_agent_file
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_bench_agent_file(monkeypatch):
+    """Benchmark the integration agent in-process with the passthrough model."""
+    test_dir = Path(os.path.dirname(os.path.abspath(__file__)))
+    monkeypatch.chdir(test_dir)
+
+    report = await bench_agent_file(
+        test_dir / "integration_agent.py",
+        "test",
+        None,
+        messages=["one", "two", "three"],
+        concurrency=3,
+        requests=12,
+        session_turns=2,
+    )
+
+    assert report.agent == "test"
+    assert report.turns == 12
+    assert report.errors == {}
+    assert report.turn_latency.count == 12
+    assert report.usage is not None
+    assert report.to_dict()["throughput"] > 0
@@ -0,0 +1,73 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+
+from mcp_agent.cli.commands.bench import LatencySummary, drive, load_corpus, percentile, summarize
+
+
+def test_percentiles_interpolate():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 50) == pytest.approx(50.5)
+    assert percentile(values, 99) == pytest.approx(99.01)
+    assert percentile([3.0], 95) == 3.0
+
+    latency = LatencySummary.of([0.1, 0.2, 0.3])
+    assert (latency.count, latency.p50, latency.max) == (3, pytest.approx(200), pytest.approx(300))
+
+
+def test_load_corpus(tmp_path):
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text('"first"\n\n{"message": "second", "id": 2}\n')
+
+    assert load_corpus(corpus) == ["first", "second"]
+
+    corpus.write_text(json.dumps({"text": "no message"}))
+    with pytest.raises(ValueError, match="corpus.jsonl:1"):
+        load_corpus(corpus)
+
+
+@pytest.mark.asyncio
+async def test_drive_sends_requested_turns_across_sessions():
+    conversations = []
+
+    @asynccontextmanager
+    async def open_session():
+        conversation = []
+        conversations.append(conversation)
+
+        async def send(message):
+            await asyncio.sleep(0)
+            if message == "fail":
+                raise ConnectionError(message)
+            conversation.append(message)
+
+        yield send
+
+    results, elapsed = await drive(
+        open_session, ["a", "b", "fail"], concurrency=2, requests=9, session_turns=2
+    )
+    report = summarize("test", "agent", 2, results, elapsed)
+
+    assert report.turns == 9
+    assert report.errors == {"ConnectionError": 2}
+    assert report.turn_latency.count == 7
+    assert sum(len(conversation) for conversation in conversations) == 7
+    assert all(len(conversation) <= 2 for conversation in conversations)
+
+
+@pytest.mark.asyncio
+async def test_drive_stops_at_duration():
+    @asynccontextmanager
+    async def open_session():
+        async def send(message):
+            await asyncio.sleep(0.01)
+
+        yield send
+
+    results, elapsed = await drive(open_session, ["hi"], concurrency=3, duration=0.1)
+
+    assert 3 <= len(results) <= 40
+    assert elapsed < 1
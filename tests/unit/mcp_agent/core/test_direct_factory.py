@@ -0,0 +1,111 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_agent.core import direct_factory
+from mcp_agent.core.agent_types import AgentConfig, AgentType
+from mcp_agent.core.startup_timeline import StartupTimeline
+from mcp_agent.core.validation import get_dependencies_groups
+
+
+def agent_entry(name, agent_type=AgentType.BASIC, **extra):
+    return {"type": agent_type.value, "config": AgentConfig(name=name), **extra}
+
+
+@pytest.mark.asyncio
+async def test_agents_in_a_group_are_created_concurrently(monkeypatch):
+    running = 0
+    peak = 0
+    created = []
+
+    async def fake_create_agent(app_instance, name, agent_data, active_agents, model_factory):
+        nonlocal running, peak
+        if agent_data["type"] == AgentType.CHAIN.value:
+            assert set(agent_data["sequence"]) <= set(active_agents)
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        created.append(name)
+        return {name: name}
+
+    monkeypatch.setattr(direct_factory, "_create_agent", fake_create_agent)
+    app = SimpleNamespace(context=SimpleNamespace(config=SimpleNamespace(startup_concurrency=3)))
+    agents = {f"agent{i}": agent_entry(f"agent{i}") for i in range(6)}
+    agents["chain"] = agent_entry("chain", AgentType.CHAIN, sequence=["agent0", "agent1"])
+
+    active = await direct_factory.create_agents_in_dependency_order(app, agents, None)
+
+    assert set(active) == set(agents)
+    assert created[-1] == "chain"
+    assert peak == 3
+    timeline = app.context.startup_timeline
+    assert [event.name for event in timeline.events if event.kind == "agent"] == created
+    assert timeline.total < 0.3
+
+
+def test_timeline_records_failures():
+    timeline = StartupTimeline()
+    with timeline.track("server", "fetch"):
+        pass
+    with pytest.raises(RuntimeError):
+        with timeline.track("agent", "broken"):
+            raise RuntimeError("no model")
+
+    assert [event.error for event in timeline.events] == [None, "no model"]
+    assert "failed: no model" in timeline.report()
+    assert list(timeline.summary()) == ["server:fetch", "agent:broken"]
+
+
+def test_workflows_are_grouped_after_the_agents_they_use():
+    agents = {
+        "writer": agent_entry("writer"),
+        "critic": agent_entry("critic"),
+        "collate": agent_entry("collate"),
+        "fan": agent_entry("fan", AgentType.PARALLEL, fan_out=["writer"], fan_in="collate"),
+        "refine": agent_entry(
+            "refine", AgentType.EVALUATOR_OPTIMIZER, generator="fan", evaluator="critic"
+        ),
+    }
+
+    groups = get_dependencies_groups(agents)
+
+    assert [sorted(group) for group in groups] == [
+        ["collate", "critic", "writer"],
+        ["fan"],
+        ["refine"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_created_agents_are_shut_down_when_one_fails(monkeypatch):
+    class FakeAgent:
+        def __init__(self):
+            self.shut_down = False
+
+        async def shutdown(self):
+            self.shut_down = True
+
+    created = {}
+
+    async def fake_create_agent(app_instance, name, agent_data, active_agents, model_factory):
+        if name == "broken":
+            raise RuntimeError("no model")
+        created[name] = FakeAgent()
+        return {name: created[name]}
+
+    monkeypatch.setattr(direct_factory, "_create_agent", fake_create_agent)
+    app = SimpleNamespace(context=SimpleNamespace(config=SimpleNamespace(startup_concurrency=3)))
+    agents = {
+        "writer": agent_entry("writer"),
+        "critic": agent_entry("critic"),
+        "chain": agent_entry("chain", AgentType.CHAIN, sequence=["writer"]),
+        "broken": agent_entry("broken", AgentType.CHAIN, sequence=["critic"]),
+    }
+
+    with pytest.raises(RuntimeError):
+        await direct_factory.create_agents_in_dependency_order(app, agents, None)
+
+    assert set(created) == {"writer", "critic", "chain"}
+    assert all(agent.shut_down for agent in created.values())
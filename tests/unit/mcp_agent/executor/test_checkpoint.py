@@ -0,0 +1,249 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mcp_agent.agents.workflow.chain_agent import ChainAgent
+from mcp_agent.agents.workflow.orchestrator_agent import OrchestratorAgent
+from mcp_agent.agents.workflow.orchestrator_models import AgentTask, Plan, Step
+from mcp_agent.config import CheckpointSettings, Settings
+from mcp_agent.context import Context
+from mcp_agent.core.agent_types import AgentConfig
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.executor.checkpoint import (
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+    WorkflowCheckpoint,
+    open_checkpoint,
+    workflow_id,
+)
+from mcp_agent.executor.workflow import WorkflowState
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+from mcp_agent.llm.conversation_scope import ConversationScope, conversation_scope
+from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        store = SQLiteCheckpointStore(tmp_path / "checkpoints.db")
+    else:
+        store = FileCheckpointStore(tmp_path / "checkpoints")
+    yield store
+    store.close()
+
+
+def create_context(store, max_attempts: int = 1) -> Context:
+    settings = CheckpointSettings(
+        enabled=True, max_attempts=max_attempts, initial_interval_seconds=0
+    )
+    return Context(config=Settings(checkpoints=settings), checkpoint_store=store)
+
+
+def mock_agent(name: str, *responses) -> MagicMock:
+    agent = MagicMock()
+    agent.name = name
+    agent.generate = AsyncMock(side_effect=list(responses))
+    return agent
+
+
+def test_store_round_trip(store):
+    store.save_state("run", WorkflowState(name="chain", status="running"))
+    store.save_step("run", "agent/0", {"text": "first"})
+    store.save_step("run", "agent/1", ["second"])
+
+    checkpoint = store.load("run")
+    assert checkpoint.state.name == "chain"
+    assert checkpoint.steps == {"agent/0": {"text": "first"}, "agent/1": ["second"]}
+    assert store.list_checkpoints() == ["run"]
+
+    store.delete("run")
+    assert store.load("run") is None
+    assert store.list_checkpoints() == []
+
+
+def test_file_store_skips_interrupted_step(tmp_path):
+    store = FileCheckpointStore(tmp_path)
+    store.save_state("run", WorkflowState(name="chain"))
+    store.save_step("run", "agent/0", "done")
+    with open(tmp_path / "run" / "steps.jsonl", "a") as steps_file:
+        steps_file.write('{"key": "agent/1", "val')
+
+    assert store.load("run").steps == {"agent/0": "done"}
+
+
+@pytest.mark.asyncio
+async def test_failed_steps_are_retried(store):
+    checkpoint = WorkflowCheckpoint(
+        store, "run", "chain", CheckpointSettings(max_attempts=3, initial_interval_seconds=0)
+    )
+    run = AsyncMock(side_effect=[ConnectionError("overloaded"), "result"])
+
+    async with checkpoint.running():
+        assert await checkpoint.step("agent/0", run, str) == "result"
+
+    assert run.call_count == 2
+    assert store.load("run") is None
+
+
+def test_expired_checkpoints_are_deleted(store):
+    store.save_state("run", WorkflowState(name="chain"))
+
+    assert store.delete_expired(time.time() - 60) == 0
+    assert store.delete_expired(time.time() + 60) == 1
+    assert store.list_checkpoints() == []
+
+
+@pytest.mark.asyncio
+async def test_expired_checkpoint_is_not_resumed(store):
+    store.save_state("run", WorkflowState(name="chain", updated_at=time.time() - 120))
+    store.save_step("run", "agent/0", "stale")
+    checkpoint = WorkflowCheckpoint(store, "run", "chain", CheckpointSettings(ttl_seconds=60))
+
+    async with checkpoint.running():
+        assert await checkpoint.step("agent/0", AsyncMock(return_value="fresh"), str) == "fresh"
+
+    assert checkpoint.replayed_steps == 0
+
+
+@pytest.mark.asyncio
+async def test_retried_steps_do_not_repeat_history(store):
+    agent = MagicMock()
+    agent._llm = PassthroughLLM(name="child")
+    attempts = []
+
+    async def run():
+        response = await agent._llm.generate([Prompt.user("task")])
+        attempts.append(response)
+        if len(attempts) == 1:
+            raise ConnectionError("overloaded")
+        return response
+
+    checkpoint = WorkflowCheckpoint(
+        store, "run", "chain", CheckpointSettings(max_attempts=2, initial_interval_seconds=0)
+    )
+    async with checkpoint.running():
+        await checkpoint.step("agent/0", run, PromptMessageMultipart, agent)
+
+    assert len(attempts) == 2
+    assert [message.role for message in agent._llm.message_history] == ["user", "assistant"]
+
+
+@pytest.mark.asyncio
+async def test_replayed_steps_are_added_to_history(store):
+    store.save_state("run", WorkflowState(name="chain", updated_at=time.time()))
+    store.save_step("run", "agent/0", Prompt.assistant("done").model_dump(mode="json"))
+    agent = MagicMock()
+    agent._llm = PassthroughLLM(name="child")
+    run = AsyncMock()
+
+    checkpoint = WorkflowCheckpoint(store, "run", "chain", CheckpointSettings())
+    async with checkpoint.running():
+        response = await checkpoint.step(
+            "agent/0", run, PromptMessageMultipart, agent, [Prompt.user("task")]
+        )
+
+    run.assert_not_called()
+    assert response.first_text() == "done"
+    assert [message.all_text() for message in agent._llm.message_history] == ["task", "done"]
+
+
+def test_runs_in_different_sessions_have_different_checkpoints(store):
+    agent = MagicMock()
+    agent.name = "chain"
+    agent.context = create_context(store)
+    messages = [Prompt.user("start")]
+
+    def checkpoint_id(scope):
+        with conversation_scope(scope):
+            return open_checkpoint(agent, messages).workflow_id
+
+    unscoped = workflow_id("chain", messages)
+    assert open_checkpoint(agent, messages).workflow_id == unscoped
+    assert checkpoint_id(ConversationScope()) == unscoped
+    assert checkpoint_id(ConversationScope("a")) == checkpoint_id(ConversationScope("a"))
+    assert (
+        len(
+            {unscoped, checkpoint_id(ConversationScope("a")), checkpoint_id(ConversationScope("b"))}
+        )
+        == 3
+    )
+
+
+@pytest.mark.asyncio
+async def test_scoped_run_resumes_in_a_new_scope_with_the_same_name(store):
+    first = mock_agent("first", Prompt.assistant("one"))
+    second = mock_agent("second", ConnectionError("overloaded"), Prompt.assistant("two"))
+    chain = ChainAgent(
+        AgentConfig(name="chain"), agents=[first, second], context=create_context(store)
+    )
+
+    with conversation_scope(ConversationScope("session")):
+        with pytest.raises(ConnectionError):
+            await chain.generate([Prompt.user("start")])
+
+    with conversation_scope(ConversationScope("session")):
+        response = await chain.generate([Prompt.user("start")])
+
+    assert response.first_text() == "two"
+    assert first.generate.call_count == 1
+    assert store.list_checkpoints() == []
+
+
+@pytest.mark.asyncio
+async def test_chain_resumes_after_failure(store):
+    first = mock_agent("first", Prompt.assistant("one"))
+    second = mock_agent("second", ConnectionError("overloaded"), Prompt.assistant("two"))
+    chain = ChainAgent(
+        AgentConfig(name="chain"), agents=[first, second], context=create_context(store)
+    )
+
+    with pytest.raises(ConnectionError):
+        await chain.generate([Prompt.user("start")])
+    (workflow_id,) = store.list_checkpoints()
+    failed = store.load(workflow_id)
+    assert failed.state.status == "failed"
+    assert failed.state.error["type"] == "ConnectionError"
+
+    response = await chain.generate([Prompt.user("start")])
+
+    assert response.first_text() == "two"
+    assert first.generate.call_count == 1
+    assert second.generate.call_count == 2
+    assert store.list_checkpoints() == []
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_skips_completed_tasks(store):
+    writer = mock_agent("writer", Prompt.assistant("draft"))
+    reviewer = mock_agent("reviewer", ConnectionError("overloaded"), Prompt.assistant("ok"))
+    orchestrator = OrchestratorAgent(
+        AgentConfig(name="orchestrator"),
+        agents=[writer, reviewer],
+        context=create_context(store),
+    )
+    plan = Plan(
+        steps=[
+            Step(description="Write", tasks=[AgentTask(description="Write", agent="writer")]),
+            Step(description="Review", tasks=[AgentTask(description="Review", agent="reviewer")]),
+        ],
+        is_complete=True,
+    )
+    llm = MagicMock()
+    llm.structured = AsyncMock(return_value=(plan, Prompt.assistant("plan")))
+    llm.generate = AsyncMock(return_value=Prompt.assistant("final"))
+    orchestrator._llm = llm
+
+    with pytest.raises(ConnectionError):
+        await orchestrator.generate([Prompt.user("objective")])
+
+    response = await orchestrator.generate([Prompt.user("objective")])
+
+    assert response.first_text() == "final"
+    assert llm.structured.call_count == 1
+    assert writer.generate.call_count == 1
+    assert reviewer.generate.call_count == 2
+    assert [r.task_results[0].result for r in orchestrator.plan_result.step_results] == [
+        "draft",
+        "ok",
+    ]
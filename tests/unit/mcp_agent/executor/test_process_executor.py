@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from mcp_agent.config import LoggerSettings, ProcessSettings, Settings
+from mcp_agent.core.agent_types import AgentConfig, AgentType
+from mcp_agent.core.exceptions import AgentConfigError
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.executor.process import ProcessExecutor
+
+
+def create_executor(**settings) -> ProcessExecutor:
+    executor = ProcessExecutor(ProcessSettings(workers=1, **settings))
+    executor.register_agents(
+        {
+            "echo": {
+                "config": AgentConfig(name="echo", instruction="Echo", model="passthrough"),
+                "type": AgentType.BASIC.value,
+                # Decorated functions stay in the parent process
+                "func": lambda: None,
+            }
+        },
+        Settings(logger=LoggerSettings(type="none")),
+    )
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_sessions_keep_their_conversations():
+    executor = create_executor()
+    try:
+        response = await executor.run_agent("echo", [Prompt.user("hello")], session="a")
+        assert response.first_text() == "hello"
+        await executor.run_agent("echo", [Prompt.user("again")], session="a")
+        await executor.run_agent("echo", [Prompt.user("other")], session="b")
+
+        assert len(await executor.history("echo", "a")) == 4
+        assert len(await executor.history("echo", "b")) == 2
+
+        await executor.end_session("a")
+        assert await executor.history("echo", "a") == []
+    finally:
+        await executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_ending_a_session_ends_its_nested_sessions():
+    executor = create_executor()
+    try:
+        for session in ("a", "a/fan_out/echo", "a/fan_out/echo", "ab"):
+            await executor.run_agent("echo", [Prompt.user("hello")], session=session)
+
+        await executor.end_session("a")
+
+        assert list(executor._sessions) == ["ab"]
+        # The worker discarded the branch's conversation too
+        await executor.run_agent("echo", [Prompt.user("hello")], session="a/fan_out/echo")
+        assert len(await executor.history("echo", "a/fan_out/echo")) == 2
+    finally:
+        await executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_agent_errors_are_raised_in_the_caller():
+    executor = create_executor()
+    try:
+        with pytest.raises(AgentConfigError):
+            await executor.run_agent("missing", [Prompt.user("hello")])
+    finally:
+        await executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_crashed_worker_is_replaced():
+    executor = create_executor()
+    try:
+        await executor.run_agent("echo", [Prompt.user("hello")], session="a")
+        crashed = executor._workers[0]
+        crashed.process.kill()
+        await crashed.reader
+
+        response = await executor.run_agent("echo", [Prompt.user("after")], session="a")
+        assert response.first_text() == "after"
+        assert executor._workers[0].process.pid != crashed.process.pid
+    finally:
+        await executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_workers_are_recycled():
+    executor = create_executor(max_tasks_per_worker=1)
+    try:
+        await executor.run_agent("echo", [Prompt.user("one")])
+        first = executor._workers[0]
+        await executor.run_agent("echo", [Prompt.user("two")])
+        assert executor._workers[0] is not first
+        assert first.retiring
+    finally:
+        await executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_turns_waiting_on_a_retired_worker_use_its_replacement():
+    executor = create_executor(max_tasks_per_worker=1, worker_concurrency=1)
+    try:
+        responses = await asyncio.gather(
+            *(executor.run_agent("echo", [Prompt.user(f"turn {i}")]) for i in range(3))
+        )
+
+        assert [response.first_text() for response in responses] == ["turn 0", "turn 1", "turn 2"]
+    finally:
+        await executor.shutdown()
@@ -0,0 +1,123 @@
+import pytest
+
+from mcp_agent.llm.memory import (
+    DROPPED_TOOL_RESULT,
+    SUMMARY_PREFIX,
+    MemoryPolicy,
+    SimpleMemory,
+    split_turns,
+)
+
+
+def anthropic_tool_turn(index: int, result_text: str = "result " * 40) -> list[dict]:
+    return [
+        {"role": "user", "content": f"question {index}"},
+        {
+            "role": "assistant",
+            "content": [{"type": "tool_use", "id": f"t{index}", "name": "fetch", "input": {}}],
+        },
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": f"t{index}",
+                    "content": [{"type": "text", "text": result_text}],
+                    "is_error": False,
+                }
+            ],
+        },
+        {"role": "assistant", "content": f"answer {index}"},
+    ]
+
+
+def openai_tool_turn(index: int) -> list[dict]:
+    return [
+        {"role": "user", "content": f"question {index}"},
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{"id": f"c{index}", "type": "function", "function": {"name": "fetch"}}],
+        },
+        {"role": "tool", "tool_call_id": f"c{index}", "content": "result " * 40},
+        {"role": "assistant", "content": f"answer {index}"},
+    ]
+
+
+def test_split_turns_keeps_tool_results_with_their_turn():
+    turns = split_turns(anthropic_tool_turn(1) + openai_tool_turn(2))
+
+    assert [len(turn) for turn in turns] == [4, 4]
+
+
+@pytest.mark.asyncio
+async def test_window_drops_whole_turns_to_fit_budget():
+    memory = SimpleMemory()
+    memory.extend([{"role": "user", "content": "pinned prompt"}], is_prompt=True)
+    memory.set([m for i in range(5) for m in anthropic_tool_turn(i)])
+    turn_tokens = memory.estimate_tokens() // 5
+
+    report = await memory.apply_policy(
+        MemoryPolicy(strategy="window", max_tokens=turn_tokens * 2 + 10)
+    )
+
+    assert memory.prompt_messages == [{"role": "user", "content": "pinned prompt"}]
+    assert memory.history[0] == {"role": "user", "content": "question 3"}
+    assert len(memory.history) == 8
+    assert report.dropped_messages == 12
+    assert report.estimated_tokens == memory.estimate_tokens()
+
+
+@pytest.mark.asyncio
+async def test_window_always_keeps_latest_turn():
+    memory = SimpleMemory()
+    memory.set(openai_tool_turn(1))
+
+    await memory.apply_policy(MemoryPolicy(strategy="window", max_tokens=1))
+
+    assert len(memory.history) == 4
+
+
+@pytest.mark.asyncio
+async def test_stale_tool_results_are_dropped():
+    memory = SimpleMemory()
+    memory.set(anthropic_tool_turn(1) + openai_tool_turn(2) + anthropic_tool_turn(3))
+
+    report = await memory.apply_policy(MemoryPolicy(tool_result_turns=1))
+
+    assert report.dropped_tool_results == 2
+    assert memory.history[2]["content"][0]["content"][0]["text"] == DROPPED_TOOL_RESULT
+    assert memory.history[2]["content"][0]["tool_use_id"] == "t1"
+    assert memory.history[6]["content"] == DROPPED_TOOL_RESULT
+    assert memory.history[10]["content"][0]["content"][0]["text"] != DROPPED_TOOL_RESULT
+
+    report = await memory.apply_policy(MemoryPolicy(tool_result_turns=1))
+    assert report.dropped_tool_results == 0
+
+
+@pytest.mark.asyncio
+async def test_summarize_replaces_oldest_turns():
+    memory = SimpleMemory()
+    memory.set([m for i in range(4) for m in anthropic_tool_turn(i)])
+    summarized = []
+
+    async def summarizer(messages):
+        summarized.extend(messages)
+        return "earlier questions were answered"
+
+    report = await memory.apply_policy(
+        MemoryPolicy(strategy="summarize", max_tokens=10_000, summarize_turns=2), summarizer
+    )
+    assert summarized == []
+    assert report.summarized_messages == 0
+
+    report = await memory.apply_policy(
+        MemoryPolicy(strategy="summarize", max_tokens=220, summarize_turns=2), summarizer
+    )
+
+    assert len(summarized) == 8
+    assert report.summarized_messages == 8
+    assert memory.history[0]["content"] == SUMMARY_PREFIX + "earlier questions were answered"
+    # The summary is acknowledged, so user messages are never consecutive
+    assert memory.history[1]["role"] == "assistant"
+    assert memory.history[2] == {"role": "user", "content": "question 2"}
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+
+from mcp_agent.llm.mock_provider import (
+    Latency,
+    MockProviderServer,
+    MockResponse,
+    MockToolCall,
+)
+from mcp_agent.llm.rate_limiter import ProviderRateLimiter
+
+MESSAGES = [{"role": "user", "content": "hello there"}]
+
+
+@pytest.mark.asyncio
+async def test_anthropic_tool_use_and_echo():
+    async with MockProviderServer() as server:
+        server.add_responses(
+            MockResponse(tool_calls=[MockToolCall(name="fetch", arguments={"url": "x"})])
+        )
+        client = AsyncAnthropic(api_key="test", base_url=server.anthropic_base_url)
+
+        message = await client.messages.create(model="m", max_tokens=100, messages=MESSAGES)
+        assert message.stop_reason == "tool_use"
+        assert message.content[0].name == "fetch"
+        assert message.content[0].input == {"url": "x"}
+
+        message = await client.messages.create(model="m", max_tokens=100, messages=MESSAGES)
+        assert message.content[0].text == "hello there"
+        assert message.usage.output_tokens > 0
+        assert len(server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_anthropic_streaming():
+    async with MockProviderServer(token_interval=0.001) as server:
+        server.add_responses(
+            MockResponse(text="streamed reply", tool_calls=[MockToolCall(name="fetch")])
+        )
+        client = AsyncAnthropic(api_key="test", base_url=server.anthropic_base_url)
+
+        async with client.messages.stream(model="m", max_tokens=100, messages=MESSAGES) as stream:
+            text = "".join([chunk async for chunk in stream.text_stream])
+            message = await stream.get_final_message()
+
+        assert text == "streamed reply"
+        assert message.content[1].name == "fetch"
+        assert message.stop_reason == "tool_use"
+
+
+@pytest.mark.asyncio
+async def test_openai_completion_and_streaming():
+    async with MockProviderServer() as server:
+        server.add_responses(
+            MockResponse(tool_calls=[MockToolCall(name="fetch", arguments={"url": "x"})])
+        )
+        client = AsyncOpenAI(api_key="test", base_url=server.openai_base_url)
+
+        completion = await client.chat.completions.create(model="m", messages=MESSAGES)
+        call = completion.choices[0].message.tool_calls[0]
+        assert completion.choices[0].finish_reason == "tool_calls"
+        assert (call.function.name, call.function.arguments) == ("fetch", '{"url": "x"}')
+
+        stream = await client.chat.completions.create(
+            model="m", messages=MESSAGES, stream=True, stream_options={"include_usage": True}
+        )
+        chunks = [chunk async for chunk in stream]
+        text = "".join(chunk.choices[0].delta.content or "" for chunk in chunks if chunk.choices)
+        assert text == "hello there"
+        assert chunks[-1].usage.total_tokens > 0
+
+
+@pytest.mark.asyncio
+async def test_injected_errors_are_retried():
+    async with MockProviderServer() as server:
+        server.add_responses(
+            MockResponse(status=529, retry_after=0), MockResponse(status=429, retry_after=0)
+        )
+        client = AsyncAnthropic(api_key="test", base_url=server.anthropic_base_url, max_retries=0)
+        limiter = ProviderRateLimiter("mock", max_retries=2)
+
+        message = await limiter.call(
+            lambda: client.messages.create(model="m", max_tokens=100, messages=MESSAGES)
+        )
+
+        assert message.content[0].text == "hello there"
+        assert limiter.stats.retries == 2
+        assert limiter.stats.rate_limited == 1
+
+
+def test_latency_distributions_have_the_configured_mean():
+    rng = random.Random(0)
+    for distribution in ("constant", "uniform", "normal", "lognormal", "exponential"):
+        latency = Latency(distribution=distribution, seconds=0.5, spread=0.1)
+        samples = [latency.sample(rng) for _ in range(5000)]
+        assert min(samples) >= 0
+        assert sum(samples) / len(samples) == pytest.approx(0.5, rel=0.05)
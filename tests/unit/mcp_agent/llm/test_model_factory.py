@@ -84,3 +84,13 @@ def test_allows_generic_model():
     instance = factory(None)
     assert isinstance(instance, GenericAugmentedLLM)
     assert instance._base_url() == "http://localhost:11434/v1"
+
+
+def test_capabilities_resolve_aliases_and_model_strings():
+    """Test that capabilities are found from aliases and full model strings"""
+    sonnet = ModelFactory.get_capabilities("sonnet")
+    assert sonnet is not None
+    assert sonnet == ModelFactory.get_capabilities("claude-3-7-sonnet-latest")
+    assert ModelFactory.get_capabilities("openai.o3-mini.high").context_window == 200_000
+    assert ModelFactory.get_capabilities("generic.llama3.2:latest") is None
+    assert ModelFactory.get_capabilities("not-a-model") is None
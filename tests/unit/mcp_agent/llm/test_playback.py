@@ -77,3 +77,44 @@ async def test_exhaustion_behaviour():
     for _ in range(3):
         overage = await llm.generate([Prompt.user("overage?")])
         assert f"({_ + 1} overage)" in overage.first_text()
+
+
+@pytest.mark.asyncio
+async def test_playback_consumes_messages_lazily():
+    consumed = []
+
+    def recording():
+        for i in range(3):
+            consumed.append(i)
+            yield Prompt.user(f"message {i}")
+            yield Prompt.assistant(f"response {i}")
+
+    llm = PlaybackLLM()
+    llm.load_messages(recording())
+    assert consumed == []
+
+    response = await llm.generate([Prompt.user("first")])
+    assert "response 0" == response.first_text()
+    assert consumed == [0]
+
+    await llm.generate([Prompt.user("second")])
+    await llm.generate([Prompt.user("third")])
+    exhausted = await llm.generate([Prompt.user("fourth")])
+    assert "MESSAGES EXHAUSTED (list size 6) (0 overage)" == exhausted.first_text()
+
+
+@pytest.mark.asyncio
+async def test_apply_prompt_file_streams_to_playback(tmp_path):
+    from mcp_agent.mcp.prompt_serialization import save_messages_to_file
+
+    recording = tmp_path / "recording.json"
+    save_messages_to_file(
+        [Prompt.user("message 1"), Prompt.assistant("response 1")], str(recording)
+    )
+    agent = Agent(AgentConfig(name="playback_agent", servers=[]), context=None)
+    agent._llm = PlaybackLLM()
+
+    assert "HISTORY LOADED" == await agent.apply_prompt_file(recording)
+    response = await agent.send("next")
+
+    assert "response 1" == response
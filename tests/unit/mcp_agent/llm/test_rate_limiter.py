@@ -0,0 +1,157 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_agent.config import LoggerSettings, OpenAISettings, RateLimitSettings, Settings
+from mcp_agent.context import Context
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.core.request_params import RequestParams
+from mcp_agent.executor.executor import AsyncioExecutor
+from mcp_agent.llm.conversation_scope import ConversationScope, conversation_scope
+from mcp_agent.llm.mock_provider import MockProviderServer, MockResponse
+from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
+from mcp_agent.llm.rate_limiter import ProviderRateLimiter, RateLimiter, retry_after
+
+
+class FakeRateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, headers):
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_requests_wait_for_budget():
+    limiter = ProviderRateLimiter("test", requests_per_minute=600)
+    # Drain the bucket so the next request has to wait for one refill (0.1s)
+    limiter._requests.consume(600)
+
+    waited = await limiter.acquire()
+
+    assert waited == pytest.approx(0.1, abs=0.05)
+    assert limiter.stats.queued == 1
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_go_first():
+    limiter = ProviderRateLimiter("test", requests_per_minute=600)
+    limiter._requests.consume(600)
+    order = []
+
+    async def request(name, priority):
+        await limiter.acquire(priority=priority)
+        order.append(name)
+
+    batch = asyncio.create_task(request("batch", "batch"))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(request("interactive", "interactive"))
+    await asyncio.gather(batch, interactive)
+
+    assert order == ["interactive", "batch"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_requests_are_retried_after_delay():
+    limiter = ProviderRateLimiter("test", max_retries=2)
+    attempts = []
+
+    async def request():
+        attempts.append(asyncio.get_running_loop().time())
+        if len(attempts) == 1:
+            raise FakeRateLimitError({"retry-after-ms": "50"})
+        return "ok"
+
+    assert await limiter.call(request) == "ok"
+    assert attempts[1] - attempts[0] >= 0.05
+    assert limiter.stats.rate_limited == 1
+    assert limiter.stats.retries == 1
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_are_raised():
+    limiter = ProviderRateLimiter("test")
+
+    async def request():
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        await limiter.call(request)
+    assert limiter.stats.retries == 0
+
+
+def test_retry_after_parsing():
+    assert retry_after(FakeRateLimitError({"retry-after": "2"})) == 2.0
+    assert retry_after(FakeRateLimitError({"retry-after-ms": "1500"})) == 1.5
+    assert retry_after(FakeRateLimitError({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0
+    assert retry_after(FakeRateLimitError({})) is None
+    assert retry_after(ValueError()) is None
+
+
+def test_limiters_are_shared_per_key_and_model():
+    registry = RateLimiter()
+    settings = RateLimitSettings(requests_per_minute=60)
+
+    first = registry.limiter("openai", "key", "gpt-4o", settings)
+
+    assert registry.limiter("openai", "key", "gpt-4o") is first
+    assert registry.limiter("openai", "other-key", "gpt-4o") is not first
+    assert first._requests.capacity == 60
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_settle_their_own_reservations(monkeypatch):
+    async with MockProviderServer() as server:
+        server.add_responses(MockResponse(status=400), MockResponse(text="ok", latency=0.05))
+        context = Context(
+            config=Settings(
+                openai=OpenAISettings(
+                    api_key="test",
+                    base_url=server.openai_base_url,
+                    rate_limit=RateLimitSettings(tokens_per_minute=1_000_000),
+                ),
+                logger=LoggerSettings(show_chat=False, show_tools=False),
+            ),
+            executor=AsyncioExecutor(),
+            rate_limiter=RateLimiter(),
+        )
+        llm = OpenAIAugmentedLLM(
+            context=context,
+            model="test-model",
+            request_params=RequestParams(maxTokens=100),
+        )
+        settled = []
+        monkeypatch.setattr(
+            ProviderRateLimiter, "settle", lambda self, reserved, actual: settled.append(actual)
+        )
+
+        async def generate(text):
+            with conversation_scope(ConversationScope()):
+                return await llm.generate([Prompt.user(text)])
+
+        await asyncio.gather(generate("fails"), generate("succeeds"))
+
+        # The failed request returns its whole reservation, the other settles its usage
+        failed, succeeded = sorted(settled)
+        assert failed == 0
+        assert succeeded > 0
+
+
+@pytest.mark.asyncio
+async def test_requests_are_retried_by_the_client_without_a_rate_limiter():
+    async with MockProviderServer() as server:
+        server.add_responses(MockResponse(status=500), MockResponse(text="ok"))
+        context = Context(
+            config=Settings(
+                openai=OpenAISettings(api_key="test", base_url=server.openai_base_url),
+                logger=LoggerSettings(show_chat=False, show_tools=False),
+            ),
+            executor=AsyncioExecutor(),
+        )
+        llm = OpenAIAugmentedLLM(context=context, model="test-model")
+
+        response = await llm.generate([Prompt.user("hello")])
+
+        assert response.first_text() == "ok"
+        assert len(server.requests) == 2
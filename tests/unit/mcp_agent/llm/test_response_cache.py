@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+from anthropic.types import Message, TextBlock, Usage
+
+from mcp_agent.config import AnthropicSettings, LoggerSettings, OpenAISettings, Settings
+from mcp_agent.context import Context
+from mcp_agent.core.exceptions import ResponseCacheMissError
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.executor.executor import AsyncioExecutor
+from mcp_agent.llm.conversation_scope import ConversationScope, conversation_scope
+from mcp_agent.llm.mock_provider import MockProviderServer, MockResponse
+from mcp_agent.llm.providers.augmented_llm_anthropic import AnthropicAugmentedLLM
+from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
+from mcp_agent.llm.response_cache import ResponseCache, request_key
+from mcp_agent.llm.usage_ledger import UsageLedger
+
+
+def _message(text: str) -> Message:
+    return Message(
+        id="msg",
+        model="m",
+        role="assistant",
+        type="message",
+        content=[TextBlock(type="text", text=text)],
+        stop_reason="end_turn",
+        usage=Usage(input_tokens=10, output_tokens=5),
+    )
+
+
+def _context(server: MockProviderServer, cache: ResponseCache) -> Context:
+    return Context(
+        config=Settings(
+            anthropic=AnthropicSettings(api_key="test", base_url=server.anthropic_base_url),
+            openai=OpenAISettings(api_key="test", base_url=server.openai_base_url),
+            logger=LoggerSettings(show_chat=False, show_tools=False),
+        ),
+        executor=AsyncioExecutor(),
+        usage_ledger=UsageLedger(),
+        response_cache=cache,
+    )
+
+
+def test_request_key_is_canonical():
+    def create(**kwargs):
+        pass
+
+    key = request_key("anthropic", create, {"model": "m", "messages": [{"a": 1, "b": 2}]})
+    assert key == request_key("anthropic", create, {"messages": [{"b": 2, "a": 1}], "model": "m"})
+    assert key != request_key("openai", create, {"model": "m", "messages": [{"a": 1, "b": 2}]})
+    assert request_key("anthropic", create, {"model": object()}) is None
+
+
+def test_least_recently_used_responses_are_evicted(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.db", max_entries=2)
+    cache.put("a", _message("first"))
+    cache.put("b", _message("second"))
+    assert cache.get("a").content[0].text == "first"
+
+    cache.put("c", _message("third"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["entries"] == 2
+    assert cache.evictions == 1
+
+
+def test_read_only_and_replay_modes_do_not_write(tmp_path):
+    path = tmp_path / "responses.db"
+    ResponseCache(path).put("a", _message("cached"))
+
+    read_only = ResponseCache(path, mode="read_only")
+    read_only.put("b", _message("not cached"))
+    assert read_only.get("a").content[0].text == "cached"
+    assert read_only.get("b") is None
+
+    replay = ResponseCache(path, mode="replay")
+    with pytest.raises(ResponseCacheMissError):
+        replay.get("b")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("llm_class", [AnthropicAugmentedLLM, OpenAIAugmentedLLM])
+async def test_identical_requests_are_served_from_cache(tmp_path, llm_class):
+    path = tmp_path / "responses.db"
+    async with MockProviderServer() as server:
+        context = _context(server, ResponseCache(path))
+        first = await llm_class(context=context, model="test-model").generate(
+            [Prompt.user("hello there")]
+        )
+        second = await llm_class(context=context, model="test-model").generate(
+            [Prompt.user("hello there")]
+        )
+
+        assert second.all_text() == first.all_text() == "hello there"
+        assert len(server.requests) == 1
+        # Cached responses cost nothing
+        assert context.usage_ledger.summary().llm_calls == 1
+
+        context.response_cache = ResponseCache(path, mode="replay")
+        await llm_class(context=context, model="test-model").generate([Prompt.user("hello there")])
+        with pytest.raises(ResponseCacheMissError):
+            await llm_class(context=context, model="test-model").generate(
+                [Prompt.user("something else")]
+            )
+        assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_do_not_hide_concurrent_provider_calls(tmp_path):
+    async with MockProviderServer() as server:
+        context = _context(server, ResponseCache(tmp_path / "responses.db"))
+        llm = OpenAIAugmentedLLM(context=context, model="test-model")
+        await llm.generate([Prompt.user("cached")])
+        server.add_responses(MockResponse(text="slow", latency=0.1))
+
+        async def generate(text):
+            with conversation_scope(ConversationScope()):
+                return await llm.generate([Prompt.user(text)])
+
+        await asyncio.gather(generate("uncached"), generate("cached"))
+
+        assert len(server.requests) == 2
+        assert context.usage_ledger.summary().llm_calls == 2
@@ -0,0 +1,130 @@
+from typing import Literal
+
+import pytest
+from pydantic import BaseModel
+
+from mcp_agent.config import AnthropicSettings, LoggerSettings, OpenAISettings, Settings
+from mcp_agent.context import Context
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.executor.executor import AsyncioExecutor
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+from mcp_agent.llm.mock_provider import MockProviderServer, MockResponse, MockToolCall
+from mcp_agent.llm.providers.augmented_llm_anthropic import (
+    STRUCTURED_OUTPUT_TOOL,
+    AnthropicAugmentedLLM,
+)
+from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
+from mcp_agent.llm.structured_output import model_schema, parse_structured
+
+
+class Forecast(BaseModel):
+    city: str
+    outlook: Literal["sunny", "rainy"]
+
+
+def _context(server: MockProviderServer) -> Context:
+    return Context(
+        config=Settings(
+            anthropic=AnthropicSettings(api_key="test", base_url=server.anthropic_base_url),
+            openai=OpenAISettings(api_key="test", base_url=server.openai_base_url),
+            logger=LoggerSettings(show_chat=False, show_tools=False),
+        ),
+        executor=AsyncioExecutor(),
+    )
+
+
+def test_parse_structured_ignores_code_fences():
+    text = '```json\n{"city": "Paris", "outlook": "sunny"}\n```'
+    assert parse_structured(text, Forecast) == Forecast(city="Paris", outlook="sunny")
+    with pytest.raises(ValueError):
+        parse_structured('{"city": "Paris", "outlook": "snow"}', Forecast)
+    assert model_schema(Forecast) is model_schema(Forecast)
+
+
+@pytest.mark.asyncio
+async def test_anthropic_forces_structured_output_tool():
+    async with MockProviderServer() as server:
+        server.add_responses(
+            MockResponse(
+                tool_calls=[
+                    MockToolCall(
+                        name=STRUCTURED_OUTPUT_TOOL,
+                        arguments={"city": "Paris", "outlook": "sunny"},
+                    )
+                ]
+            )
+        )
+        llm = AnthropicAugmentedLLM(context=_context(server), model="claude-test")
+
+        result, response = await llm.structured([Prompt.user("Weather?")], Forecast)
+
+        assert result == Forecast(city="Paris", outlook="sunny")
+        body = server.requests[0]["body"]
+        assert body["tool_choice"] == {"type": "tool", "name": STRUCTURED_OUTPUT_TOOL}
+        assert body["tools"][0]["input_schema"] == model_schema(Forecast)
+        # The exchange is kept as text, so the next turn does not expect a tool result
+        assert response.all_text() == '{"city": "Paris", "outlook": "sunny"}'
+        assert [message["role"] for message in llm.history.get()] == ["user", "assistant"]
+        # The memory policy is applied before native structured requests, as for generate
+        assert llm.memory_report is not None
+
+
+@pytest.mark.asyncio
+async def test_openai_repairs_invalid_response_once():
+    async with MockProviderServer() as server:
+        server.add_responses(
+            MockResponse(text='{"city": "Paris", "outlook": "snow"}'),
+            MockResponse(text='{"city": "Paris", "outlook": "rainy"}'),
+        )
+        llm = OpenAIAugmentedLLM(context=_context(server), model="gpt-test")
+
+        result, _ = await llm.structured([Prompt.user("Weather?")], Forecast)
+
+        assert result == Forecast(city="Paris", outlook="rainy")
+        first, repair = (request["body"] for request in server.requests)
+        assert first["response_format"]["json_schema"]["name"] == "Forecast"
+        assert "could not be parsed" in repair["messages"][-1]["content"][0]["text"]
+        assert len(repair["messages"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_repair_is_bounded():
+    llm = PassthroughLLM(name="structured")
+    llm.structured_repair_attempts = 2
+
+    result, response = await llm.structured([Prompt.user("not json")], Forecast)
+
+    assert result is None
+    assert "Failed to parse structured response" in response.all_text()
+    # The passthrough echoes each repair prompt, which is no more valid than the first reply
+    assert len(llm.message_history) == 6
+
+
+@pytest.mark.asyncio
+async def test_openai_falls_back_to_text_when_json_schema_is_rejected():
+    async with MockProviderServer() as server:
+        server.add_responses(
+            MockResponse(status=400),
+            MockResponse(text='{"city": "Paris", "outlook": "sunny"}'),
+        )
+        llm = OpenAIAugmentedLLM(context=_context(server), model="gpt-test")
+
+        result, _ = await llm.structured([Prompt.user("Weather?")], Forecast)
+
+        assert result == Forecast(city="Paris", outlook="sunny")
+        rejected, fallback = (request["body"] for request in server.requests)
+        assert "response_format" in rejected
+        assert "response_format" not in fallback
+        assert [message.role for message in llm.message_history] == ["user", "assistant"]
+
+
+@pytest.mark.asyncio
+async def test_native_structured_output_defaults_to_text():
+    llm = PassthroughLLM(name="structured")
+    llm.native_structured_output = True
+
+    result, _ = await llm.structured(
+        [Prompt.user('{"city": "Paris", "outlook": "rainy"}')], Forecast
+    )
+
+    assert result == Forecast(city="Paris", outlook="rainy")
@@ -0,0 +1,96 @@
+import pytest
+
+from mcp_agent.core.exceptions import ContextWindowExceededError
+from mcp_agent.core.request_params import RequestParams
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+from mcp_agent.llm.conversation_scope import ConversationScope, conversation_scope
+from mcp_agent.llm.memory import MemoryPolicy
+from mcp_agent.llm.token_counter import BINARY_TOKEN_ESTIMATE, TokenCounter
+
+
+def test_counts_text_and_binary_content():
+    counter = TokenCounter()
+    message = {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": "x" * 400},
+            {"type": "image", "source": {"type": "base64", "data": "A" * 100_000}},
+        ],
+    }
+
+    assert counter.count_message(message) == pytest.approx(100 + BINARY_TOKEN_ESTIMATE, abs=5)
+    assert TokenCounter(tokenizer=lambda text: 1).count({"text": "x" * 400}) == 1
+
+
+def test_tokenizer_is_loaded_on_first_count():
+    calls = []
+
+    def unavailable():
+        calls.append(1)
+        raise OSError("no network")
+
+    counter = TokenCounter(tokenizer_factory=unavailable)
+    assert calls == []
+
+    assert counter.count_text("x" * 400) == 100
+    assert counter.count_text("x" * 40) == 10
+    assert calls == [1]
+
+
+def test_calibration_moves_towards_reported_usage():
+    counter = TokenCounter()
+    counter.calibrate(estimated=100, actual=1000)
+    assert counter.scale == 1.0
+
+    for _ in range(20):
+        counter.calibrate(estimated=1000, actual=1500)
+
+    assert counter.scale == pytest.approx(1.5, rel=0.01)
+    assert counter.scaled(1000) == pytest.approx(1500, rel=0.01)
+
+
+def make_llm() -> PassthroughLLM:
+    llm = PassthroughLLM()
+    llm.default_request_params.model = "claude-3-haiku-20240307"
+    return llm
+
+
+def turn(index: int, size: int) -> list[dict]:
+    return [
+        {"role": "user", "content": f"question {index} " + "x" * size},
+        {"role": "assistant", "content": f"answer {index}"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_oversized_history_is_trimmed_before_sending():
+    llm = make_llm()
+    pinned = [{"role": "user", "content": "pinned prompt"}]
+    # Each turn is roughly 50,000 tokens; the model accepts 200,000 less 4,096 for output
+    messages = pinned + [m for i in range(6) for m in turn(i, 200_000)]
+
+    fitted, estimate = await llm._fit_context_window(messages, 1, 0, RequestParams(maxTokens=4096))
+
+    assert fitted[0] == pinned[0]
+    assert fitted[1]["content"].startswith("question 3")
+    assert len(fitted) == 7
+    assert llm.memory_report.dropped_messages == 6
+    assert estimate == llm.memory_report.estimated_tokens
+    # The report belongs to the conversation, not to the LLM shared between conversations
+    with conversation_scope(ConversationScope()):
+        assert llm.memory_report is None
+
+    small = pinned + turn(0, 100)
+    fitted, _ = await llm._fit_context_window(small, 1, 0, RequestParams(maxTokens=4096))
+    assert fitted is small
+
+
+@pytest.mark.asyncio
+async def test_request_too_large_after_trimming_raises():
+    llm = make_llm()
+    messages = turn(0, 1_000_000)
+
+    with pytest.raises(ContextWindowExceededError):
+        await llm._fit_context_window(
+            messages, 0, 0, RequestParams(memory=MemoryPolicy(strategy="window"))
+        )
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+from mcp_agent.llm.model_factory import ModelFactory
+from mcp_agent.llm.usage_ledger import (
+    UsageLedger,
+    UsageRecord,
+    current_workflows,
+    tracks_usage,
+    workflow_scope,
+)
+
+
+def test_totals_by_agent_workflow_and_model():
+    ledger = UsageLedger()
+    with workflow_scope("chain"):
+        ledger.record(UsageRecord(kind="llm", name="gpt-4o", agent="a", input_tokens=100, cost=1.0))
+        with workflow_scope("parallel"):
+            ledger.record(UsageRecord(kind="llm", name="haiku", agent="b", output_tokens=50))
+            ledger.record(UsageRecord(kind="tool", name="fetch", agent="b", latency=0.5))
+    ledger.record(UsageRecord(kind="llm", name="gpt-4o", agent="a", error=True))
+
+    assert ledger.summary().llm_calls == 3
+    assert ledger.summary().errors == 1
+    assert ledger.summary(workflow="chain").total_tokens == 150
+    assert ledger.summary(workflow="chain").cost == 1.0
+    assert ledger.summary(workflow="parallel").tool_calls == 1
+    assert ledger.summary(workflow="parallel").tool_time == 0.5
+    assert ledger.summary(agent="a").llm_calls == 2
+    assert ledger.by_model()["gpt-4o"].input_tokens == 100
+    assert ledger.records[1].workflows == ("chain", "parallel")
+    assert ledger.summary(agent="missing").llm_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_workflow_scope_follows_concurrent_tasks():
+    class Workflow:
+        name = "fan_out"
+
+        @tracks_usage
+        async def generate(self):
+            async def fan_out_agent():
+                await asyncio.sleep(0)
+                return current_workflows()
+
+            return await asyncio.gather(fan_out_agent(), asyncio.to_thread(current_workflows))
+
+    assert await Workflow().generate() == [("fan_out",), ("fan_out",)]
+    assert current_workflows() == ()
+
+
+def test_cost_uses_cache_prices():
+    sonnet = ModelFactory.get_capabilities("sonnet")
+
+    cost = sonnet.cost(
+        input_tokens=1_000_000, output_tokens=0, cache_read_tokens=500_000, cache_write_tokens=0
+    )
+
+    assert cost == pytest.approx(0.5 * 3 + 0.5 * 0.3)
+    assert ModelFactory.get_capabilities("gpt-4o").cost(0, 1_000_000) == pytest.approx(10)
+
+
+def test_llm_calls_are_recorded_with_cost(monkeypatch):
+    ledger = UsageLedger()
+    llm = PassthroughLLM(name="writer")
+    llm.default_request_params.model = "gpt-4o-mini"
+    monkeypatch.setattr(llm.context, "usage_ledger", ledger, raising=False)
+
+    llm._record_llm_call(0.25, input_tokens=1_000_000, output_tokens=1_000_000)
+
+    summary = ledger.summary(agent="writer")
+    assert summary.llm_calls == 1
+    assert summary.llm_time == 0.25
+    assert summary.cost == pytest.approx(0.15 + 0.6)
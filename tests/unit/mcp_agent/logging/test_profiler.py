@@ -0,0 +1,92 @@
+import asyncio
+import json
+
+import pytest
+
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+from mcp_agent.logging.profiler import (
+    Profiler,
+    active_profiler,
+    profile_phase,
+    profiled,
+    profiles_workflow_step,
+)
+
+
+@pytest.mark.asyncio
+async def test_nested_phases_record_self_time():
+    with Profiler() as profiler:
+        with profile_phase("turn", "llm", agent="a"):
+            await asyncio.sleep(0.02)
+            with profile_phase("request", "http"):
+                await asyncio.sleep(0.03)
+
+    assert active_profiler() is None
+    request, turn = profiler.events
+    assert (turn.name, turn.args) == ("turn", {"agent": "a"})
+    assert turn.duration >= request.duration + 0.02
+    assert turn.self_time == pytest.approx(turn.duration - request.duration)
+    assert [summary.name for summary in profiler.summary()] == ["request", "turn"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_use_separate_tracks():
+    @profiled("work")
+    async def work():
+        await asyncio.sleep(0.01)
+
+    with Profiler() as profiler:
+        with profile_phase("outer", "llm"):
+            await asyncio.gather(work(), work())
+
+    outer = next(event for event in profiler.events if event.name == "outer")
+    tracks = {event.track for event in profiler.events if event.name == "work"}
+    assert len(tracks) == 2 and outer.track not in tracks
+    # Phases in other tasks are not subtracted from the parent's self time
+    assert outer.self_time == pytest.approx(outer.duration)
+
+
+@pytest.mark.asyncio
+async def test_workflow_steps_are_profiled():
+    class Workflow:
+        name = "fan_out"
+
+        @profiles_workflow_step
+        async def generate(self):
+            pass
+
+    with Profiler() as profiler:
+        await Workflow().generate()
+
+    (event,) = profiler.events
+    assert (event.category, event.name, event.args) == (
+        "workflow",
+        "Workflow",
+        {"agent": "fan_out"},
+    )
+
+
+def test_phases_are_not_recorded_without_profiler():
+    profiler = Profiler()
+    with profile_phase("ignored", "llm"):
+        pass
+    assert profiler.events == []
+
+
+@pytest.mark.asyncio
+async def test_chrome_trace_of_llm_turn(tmp_path):
+    llm = PassthroughLLM(name="profiled")
+    path = tmp_path / "trace.json"
+
+    with Profiler() as profiler:
+        await llm.generate([Prompt.user("hello")])
+    profiler.write_chrome_trace(path)
+
+    trace = json.loads(path.read_text())
+    phases = {event["name"]: event for event in trace["traceEvents"] if event["ph"] == "X"}
+    assert phases["generate"]["cat"] == "llm"
+    assert phases["generate"]["args"]["agent"] == "profiled"
+    assert phases["generate"]["dur"] >= phases[llm.provider]["dur"]
+    assert phases["show_user_message"]["cat"] == "display"
+    assert "generate" in profiler.report()
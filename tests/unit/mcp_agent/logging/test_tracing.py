@@ -0,0 +1,107 @@
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams, ClientRequest, RequestParams
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from mcp_agent.config import OpenTelemetrySettings, Settings
+from mcp_agent.context import configure_otel
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+from mcp_agent.logging.tracing import MCPRequestTrace, tracer, traces_workflow_step
+
+
+@pytest.fixture
+def spans():
+    provider = trace.get_tracer_provider()
+    if not isinstance(provider, TracerProvider):
+        provider = TracerProvider()
+        trace.set_tracer_provider(provider)
+    exporter = InMemorySpanExporter()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    yield exporter
+    exporter.shutdown()
+
+
+@pytest.fixture
+def installed(monkeypatch):
+    """Capture the provider configure_otel would install, without making it global"""
+    providers = []
+    monkeypatch.setattr(trace, "get_tracer_provider", lambda: trace.ProxyTracerProvider())
+    monkeypatch.setattr(trace, "set_tracer_provider", providers.append)
+    return providers
+
+
+@pytest.mark.asyncio
+async def test_no_provider_without_exporter(installed):
+    await configure_otel(Settings(otel=OpenTelemetrySettings()))
+    assert installed == []
+
+
+@pytest.mark.asyncio
+async def test_sample_rate_sets_ratio_sampler(installed):
+    await configure_otel(Settings(otel=OpenTelemetrySettings(console_debug=True, sample_rate=0.25)))
+    (provider,) = installed
+    description = provider.sampler.get_description()
+    assert description.startswith("ParentBased")
+    assert "TraceIdRatioBased{0.25}" in description
+
+
+@pytest.mark.asyncio
+async def test_generate_creates_span(spans):
+    llm = PassthroughLLM(name="tracer_test")
+    await llm.generate([Prompt.user("hello")])
+
+    (span,) = [s for s in spans.get_finished_spans() if s.name == "generate tracer_test"]
+    assert span.attributes["agent.name"] == "tracer_test"
+    assert span.attributes["mcp_agent.message_count"] == 1
+
+
+def test_trace_context_is_injected_into_request_meta(spans):
+    request = ClientRequest(
+        CallToolRequest(method="tools/call", params=CallToolRequestParams(name="fetch"))
+    )
+    with tracer.start_as_current_span("caller") as span:
+        MCPRequestTrace.inject_trace_context(request)
+
+    meta = request.model_dump(by_alias=True)["params"]["_meta"]
+    trace_id = format(span.get_span_context().trace_id, "032x")
+    assert trace_id in meta["traceparent"]
+
+
+def test_server_span_continues_callers_trace(spans):
+    with tracer.start_as_current_span("caller") as caller:
+        request = ClientRequest(
+            CallToolRequest(method="tools/call", params=CallToolRequestParams(name="fetch"))
+        )
+        MCPRequestTrace.inject_trace_context(request)
+
+    with MCPRequestTrace.start_span_from_mcp_request(
+        "tools/call agent_send", request.root.params.meta
+    ) as server:
+        assert server.parent.span_id == caller.get_span_context().span_id
+        assert server.get_span_context().trace_id == caller.get_span_context().trace_id
+
+
+def test_server_span_without_meta_starts_new_trace(spans):
+    with MCPRequestTrace.start_span_from_mcp_request(
+        "tools/call agent_send", RequestParams.Meta()
+    ) as server:
+        assert server.parent is None
+
+
+@pytest.mark.asyncio
+async def test_workflow_steps_are_traced(spans):
+    class Workflow:
+        name = "fan_out"
+
+        @traces_workflow_step
+        async def generate(self):
+            return trace.get_current_span()
+
+    current = await Workflow().generate()
+
+    (span,) = [s for s in spans.get_finished_spans() if s.name == "generate fan_out"]
+    assert span.context.span_id == current.get_span_context().span_id
+    assert span.attributes["mcp_agent.workflow"] == "Workflow"
@@ -0,0 +1,66 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from mcp_agent.mcp.prompts import prompt_server
+
+
+@pytest.fixture
+def prompt_file(tmp_path: Path):
+    path = tmp_path / "greeting.txt"
+    path.write_text("---USER\nHello {{name}}")
+    yield path
+    prompt_server.unregister_prompt(path)
+
+
+def test_register_prompt_replaces_prompt_for_changed_file(prompt_file):
+    prompt_server.register_prompt(prompt_file)
+    assert prompt_server.prompt_registry["greeting"].template_variables == {"name"}
+
+    prompt_file.write_text("---USER\nHello {{name}}, welcome to {{place}}")
+    stat = prompt_file.stat()
+    os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    prompt_server.register_prompt(prompt_file)
+
+    assert "greeting_1" not in prompt_server.prompt_registry
+    assert prompt_server.prompt_registry["greeting"].template_variables == {"name", "place"}
+    prompt = prompt_server.mcp._prompt_manager.get_prompt("greeting")
+    assert {argument.name for argument in prompt.arguments} == {"name", "place"}
+
+
+@pytest.mark.asyncio
+async def test_prompt_handler_loads_resources(prompt_file):
+    (prompt_file.parent / "notes.txt").write_text("some notes")
+    prompt_file.write_text("---USER\nRead this\n---RESOURCE\nnotes.txt")
+    prompt_server.register_prompt(prompt_file)
+
+    messages = await prompt_server.mcp._prompt_manager.render_prompt("greeting")
+
+    assert len(messages) == 2
+    assert messages[1].content.resource.text == "some notes"
+
+
+def test_unregister_prompt_removes_prompt(prompt_file):
+    prompt_server.register_prompt(prompt_file)
+    prompt_server.unregister_prompt(prompt_file)
+
+    assert "greeting" not in prompt_server.prompt_registry
+    assert prompt_server.mcp._prompt_manager.get_prompt("greeting") is None
+
+
+def test_prompt_removal_is_supported_by_the_sdk():
+    # Guards the use of FastMCP internals: fails when an SDK update removes them
+    assert prompt_server.supports_prompt_removal()
+
+
+def test_unregister_prompt_without_sdk_support(prompt_file, monkeypatch):
+    prompt_server.register_prompt(prompt_file)
+    monkeypatch.setattr(prompt_server, "_registered_prompts", lambda: None)
+
+    prompt_server.unregister_prompt(prompt_file)
+
+    assert "greeting" not in prompt_server.prompt_registry
+
+    monkeypatch.undo()
+    prompt_server._remove_fastmcp_prompt("greeting")
@@ -47,6 +47,16 @@ class TestPromptContent:
         assert result.text == "Hello Bob! Your age is {{age}}."
         assert result.role == "user"
 
+    def test_apply_substitutions_is_single_pass(self):
+        """Substituted values are not themselves treated as templates"""
+        content = PromptContent(text="{{a}} and {{b}}", role="user")
+
+        first = content.apply_substitutions({"a": "{{b}}", "b": "B"})
+        second = content.apply_substitutions({"a": 1})
+
+        assert first.text == "{{b}} and B"
+        assert second.text == "1 and {{b}}"
+
     def test_apply_substitutions_with_resources(self):
         """Test substituting variables in content with resources"""
         content = PromptContent(
@@ -330,6 +340,23 @@ another_resource.txt""")
         assert "Nice to meet you, {{name}}!" in assistant_section.text
         assert assistant_section.resources == ["another_resource.txt"]
 
+    def test_load_from_file_is_cached_until_file_changes(self, temp_template_file):
+        """Test that unchanged files are not re-parsed"""
+        loader = PromptTemplateLoader()
+        template = loader.load_from_file(temp_template_file)
+
+        assert loader.load_from_file(temp_template_file) is template
+        assert loader.get_metadata(temp_template_file) is loader.get_metadata(temp_template_file)
+
+        temp_template_file.write_text("Goodbye {{person}}, see you {{when}}!")
+        stat = temp_template_file.stat()
+        os.utime(temp_template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = loader.load_from_file(temp_template_file)
+        assert reloaded is not template
+        assert reloaded.template_variables == {"person", "when"}
+        assert loader.get_metadata(temp_template_file).template_variables == {"person", "when"}
+
 
 # Integration test with realistic examples
 class TestImageHandling:
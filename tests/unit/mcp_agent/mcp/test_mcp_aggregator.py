@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import pytest
+from mcp import GetPromptResult
+from mcp.types import ListPromptsResult, Prompt, PromptMessage, TextContent
+
+from mcp_agent.mcp.mcp_aggregator import MCPAggregator
+
+
+class FakePromptServers:
+    """Stands in for MCP server sessions, recording each get_prompt/list_prompts call"""
+
+    def __init__(self, prompts: dict[str, list[str]]) -> None:
+        self.prompts = prompts
+        self.calls: list[tuple[str, str]] = []
+
+    async def execute(
+        self,
+        server_name,
+        operation_type,
+        operation_name,
+        method_name,
+        method_args=None,
+        error_factory=None,
+    ):
+        self.calls.append((server_name, method_name))
+        if method_name == "list_prompts":
+            return ListPromptsResult(prompts=[Prompt(name=n) for n in self.prompts[server_name]])
+        if method_args["name"] in self.prompts[server_name]:
+            return GetPromptResult(
+                messages=[
+                    PromptMessage(role="user", content=TextContent(type="text", text=server_name))
+                ]
+            )
+        return error_factory("not found")
+
+    async def capabilities(self, server_name):
+        return SimpleNamespace(prompts=True)
+
+
+def create_aggregator(servers: FakePromptServers) -> MCPAggregator:
+    aggregator = MCPAggregator(
+        server_names=list(servers.prompts.keys()), connection_persistence=False, context=object()
+    )
+    aggregator.initialized = True
+    aggregator._execute_on_server = servers.execute
+    aggregator.get_capabilities = servers.capabilities
+    return aggregator
+
+
+@pytest.mark.asyncio
+async def test_get_prompt_uses_index_in_server_order():
+    servers = FakePromptServers({"one": ["shared"], "two": ["shared", "other"]})
+    aggregator = create_aggregator(servers)
+    await aggregator.list_prompts()
+
+    assert aggregator._prompt_servers["shared"] == ["one", "two"]
+    assert aggregator._prompt_servers["other"] == ["two"]
+
+    servers.calls.clear()
+    result = await aggregator.get_prompt("other")
+
+    assert result.namespaced_name == "two-other"
+    assert servers.calls == [("two", "get_prompt")]
+
+
+@pytest.mark.asyncio
+async def test_get_prompt_rejects_unknown_name_on_indexed_server():
+    servers = FakePromptServers({"one": ["known"]})
+    aggregator = create_aggregator(servers)
+    await aggregator.list_prompts()
+    servers.calls.clear()
+
+    result = await aggregator.get_prompt("unknown", server_name="one")
+
+    assert result.messages == []
+    assert servers.calls == []
+
+
+@pytest.mark.asyncio
+async def test_get_prompt_fallback_updates_index_and_caches_misses():
+    servers = FakePromptServers({"one": [], "two": []})
+    aggregator = create_aggregator(servers)
+    await aggregator.list_prompts()
+
+    # Prompt added to a server after the cache was populated
+    servers.prompts["two"].append("late")
+    result = await aggregator.get_prompt("late")
+    assert result.namespaced_name == "two-late"
+    assert aggregator._prompt_servers["late"] == ["two"]
+
+    # Unknown prompts are only searched for once
+    await aggregator.get_prompt("missing")
+    servers.calls.clear()
+    result = await aggregator.get_prompt("missing")
+    assert result.messages == []
+    assert servers.calls == []
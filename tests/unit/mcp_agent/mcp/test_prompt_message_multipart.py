@@ -186,3 +186,36 @@ class TestPromptMessageMultipart:
         empty_result = GetPromptResult(messages=[])
         multiparts = PromptMessageMultipart.from_get_prompt_result(empty_result)
         assert multiparts == []
+
+    def test_converted_is_cached_per_provider(self):
+        """Test that provider conversions are cached until the message or variant changes."""
+        message = PromptMessageMultipart(
+            role="user", content=[TextContent(type="text", text="Hello")]
+        )
+        calls = []
+
+        def convert(msg):
+            calls.append(msg)
+            return {"role": msg.role, "content": msg.first_text()}
+
+        first = message.converted("anthropic", convert, "model-a")
+        assert message.converted("anthropic", convert, "model-a") is first
+        assert len(calls) == 1
+
+        # A different provider or a model switch converts again
+        message.converted("openai", convert, "model-a")
+        message.converted("anthropic", convert, "model-b")
+        assert len(calls) == 3
+
+        # Modifying the content invalidates the cached conversion
+        message.content.append(TextContent(type="text", text="again"))
+        message.converted("anthropic", convert, "model-b")
+        assert len(calls) == 4
+
+        # So does editing a part in place
+        message.content[0].text = "Goodbye"
+        assert message.converted("anthropic", convert, "model-b")["content"] == "Goodbye"
+        assert len(calls) == 5
+
+        # Conversions are not serialized
+        assert "_converted" not in message.model_dump()
@@ -6,12 +6,42 @@ from mcp.types import EmbeddedResource, ImageContent, TextContent, TextResourceC
 
 from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
 from mcp_agent.mcp.prompt_serialization import (
+    delimited_format_to_multipart_messages,
+    iter_messages_from_file,
     json_to_multipart_messages,
     multipart_messages_to_delimited_format,
     multipart_messages_to_json,
+    save_messages_to_file,
 )
 
 
+def _streaming_messages() -> list[PromptMessageMultipart]:
+    return [
+        PromptMessageMultipart(
+            role="user",
+            content=[
+                TextContent(type="text", text='Tricky text with "quotes", {braces} and ]['),
+                EmbeddedResource(
+                    type="resource",
+                    resource=TextResourceContents(
+                        uri="resource://data.json",
+                        mimeType="application/json",
+                        text='{"nested": {"key": "value\\"}"}}',
+                    ),
+                ),
+            ],
+        ),
+        PromptMessageMultipart(
+            role="assistant",
+            content=[
+                TextContent(type="text", text="Here is an image"),
+                ImageContent(type="image", data="iVBORw0KGgo=" * 1000, mimeType="image/png"),
+            ],
+        ),
+        PromptMessageMultipart(role="user", content=[TextContent(type="text", text="Thanks")]),
+    ]
+
+
 class TestPromptSerialization:
     """Tests for prompt serialization and delimited format conversion."""
 
@@ -180,3 +210,29 @@ class TestPromptSerialization:
         assert delimited[3] == "Hello!\n\nCan you help me?"
         assert delimited[4] == "---ASSISTANT"
         assert delimited[5] == "I'd be happy to help.\n\nWhat can I assist you with today?"
+
+
+class TestStreamingLoad:
+    """Tests for incremental loading of saved messages."""
+
+    def test_json_file_streams_messages(self, tmp_path):
+        """Test that JSON files are loaded one message at a time."""
+        messages = _streaming_messages()
+        path = str(tmp_path / "history.json")
+        save_messages_to_file(messages, path)
+
+        iterator = iter_messages_from_file(path)
+        assert next(iterator) == messages[0]
+        assert list(iterator) == messages[1:]
+
+    def test_delimited_file_matches_string_parser(self, tmp_path):
+        """Test that line-by-line loading matches parsing the whole file."""
+        messages = _streaming_messages()
+        path = tmp_path / "history.txt"
+        save_messages_to_file(messages, str(path))
+
+        for content in (path.read_text(), path.read_text() + "\n"):
+            path.write_text(content)
+            expected = delimited_format_to_multipart_messages(content)
+            assert list(iter_messages_from_file(str(path))) == expected
+            assert expected[1].content[1].data == messages[1].content[1].data
@@ -0,0 +1,112 @@
+import base64
+
+from mcp.types import BlobResourceContents, ReadResourceResult, TextResourceContents
+from pydantic import AnyUrl
+
+from mcp_agent.mcp.resource_cache import ResourceCache
+
+
+def text_result(uri: str, text: str) -> ReadResourceResult:
+    return ReadResourceResult(
+        contents=[TextResourceContents(uri=AnyUrl(uri), mimeType="text/plain", text=text)]
+    )
+
+
+def blob_result(uri: str, size: int) -> ReadResourceResult:
+    blob = base64.b64encode(b"x" * size).decode("ascii")
+    return ReadResourceResult(
+        contents=[BlobResourceContents(uri=AnyUrl(uri), mimeType="image/png", blob=blob)]
+    )
+
+
+def test_get_returns_cached_result_per_server():
+    cache = ResourceCache()
+    result = text_result("resource://a", "hello")
+    cache.put("one", "resource://a", result)
+
+    assert cache.get("one", "resource://a") is result
+    assert cache.get("two", "resource://a") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_by_entries_and_memory():
+    cache = ResourceCache(max_entries=2, max_memory_bytes=10)
+    cache.put("s", "resource://a", text_result("resource://a", "aaaa"))
+    cache.put("s", "resource://b", text_result("resource://b", "bbbb"))
+    cache.get("s", "resource://a")  # a becomes most recently used
+    cache.put("s", "resource://c", text_result("resource://c", "cccc"))
+
+    assert ("s", "resource://b") not in cache
+    assert ("s", "resource://a") in cache
+    assert ("s", "resource://c") in cache
+
+    cache.put("s", "resource://d", text_result("resource://d", "dddddddd"))
+    assert cache.memory_bytes <= 10
+    assert ("s", "resource://d") in cache
+
+
+def test_invalidate_resource_and_server():
+    cache = ResourceCache()
+    cache.put("one", "resource://a", text_result("resource://a", "a"))
+    cache.put("one", "resource://b", text_result("resource://b", "b"))
+    cache.put("two", "resource://a", text_result("resource://a", "a"))
+
+    cache.invalidate("one", "resource://a")
+    assert ("one", "resource://a") not in cache
+    assert ("one", "resource://b") in cache
+
+    cache.invalidate("one")
+    assert len(cache) == 1
+
+
+def test_unsubscribed_entries_expire():
+    cache = ResourceCache(ttl_seconds=0)
+    cache.put("s", "resource://a", text_result("resource://a", "a"))
+    cache.put("s", "resource://b", text_result("resource://b", "b"), subscribed=True)
+
+    assert cache.get("s", "resource://a") is None
+    assert cache.get("s", "resource://b") is not None
+
+
+def test_results_updated_while_read_are_not_cached():
+    cache = ResourceCache()
+    generation = cache.generation("s")
+    cache.invalidate("s", "resource://a")  # notified while the read was in flight
+
+    cache.put("s", "resource://a", text_result("resource://a", "a"), generation=generation)
+    assert ("s", "resource://a") not in cache
+
+    cache.put(
+        "s", "resource://a", text_result("resource://a", "a"), generation=cache.generation("s")
+    )
+    assert ("s", "resource://a") in cache
+
+
+def test_subscribed_entries_are_dropped_when_the_connection_closes():
+    cache = ResourceCache()
+    cache.put("s", "resource://a", text_result("resource://a", "a"))
+    cache.put("s", "resource://b", text_result("resource://b", "b"), subscribed=True)
+    cache.put("t", "resource://b", text_result("resource://b", "b"), subscribed=True)
+
+    cache.drop_subscribed("s")
+
+    assert ("s", "resource://a") in cache
+    assert ("s", "resource://b") not in cache
+    assert ("t", "resource://b") in cache
+
+
+def test_large_results_spill_to_disk(tmp_path):
+    cache = ResourceCache(spill_threshold_bytes=100, spill_dir=str(tmp_path))
+    result = blob_result("resource://image", 1000)
+    cache.put("s", "resource://image", result)
+
+    assert cache.memory_bytes == 0
+    assert cache.disk_bytes > 0
+    assert len(list(tmp_path.rglob("*.json"))) == 1
+
+    loaded = cache.get("s", "resource://image")
+    assert loaded == result
+
+    cache.clear()
+    assert list(tmp_path.rglob("*.json")) == []
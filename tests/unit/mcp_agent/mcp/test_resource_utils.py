@@ -1,8 +1,19 @@
+import base64
+import os
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 from pydantic import AnyUrl
 
-from mcp_agent.mcp.resource_utils import normalize_uri
+from mcp_agent.mcp import resource_utils
+from mcp_agent.mcp.resource_utils import (
+    clear_resource_content_cache,
+    load_file_content,
+    load_resource_content,
+    normalize_uri,
+)
 
 
 class TestUriNormalization(unittest.TestCase):
@@ -83,3 +94,55 @@ class TestUriNormalization(unittest.TestCase):
         for uri, expected in test_cases:
             result = extract_title_from_uri(AnyUrl(uri))
             self.assertEqual(result, expected if expected else uri)
+
+
+class TestResourceContentCache(unittest.TestCase):
+    """Tests for cached loading of resource file contents."""
+
+    def setUp(self):
+        clear_resource_content_cache()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.prompt_file = Path(self.temp_dir.name) / "prompt.txt"
+        self.prompt_file.write_text("---USER\nhello")
+
+    def tearDown(self):
+        clear_resource_content_cache()
+        self.temp_dir.cleanup()
+
+    def test_binary_content_is_base64_encoded_and_cached(self):
+        """Test that unchanged files are served from the cache."""
+        image = Path(self.temp_dir.name) / "image.png"
+        image.write_bytes(b"\x89PNG")
+
+        content, mime_type, is_binary = load_resource_content("image.png", [self.prompt_file])
+        self.assertEqual(content, base64.b64encode(b"\x89PNG").decode("utf-8"))
+        self.assertEqual(mime_type, "image/png")
+        self.assertTrue(is_binary)
+        self.assertIs(load_file_content(image)[0], content)
+
+    def test_changed_file_is_reloaded(self):
+        """Test that a change in modification time or size invalidates the cache."""
+        text = Path(self.temp_dir.name) / "notes.txt"
+        text.write_text("first")
+        self.assertEqual(load_file_content(text)[0], "first")
+
+        text.write_text("second version")
+        stat = text.stat()
+        os.utime(text, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(load_file_content(text)[0], "second version")
+
+    def test_cache_is_bounded_in_size(self):
+        """Test that the least recently used contents are evicted beyond the byte limit."""
+        paths = []
+        for name in ("a.txt", "b.txt", "c.txt"):
+            path = Path(self.temp_dir.name) / name
+            path.write_text(name[0] * 40)
+            paths.append(path)
+
+        with mock.patch.object(resource_utils, "MAX_CACHED_RESOURCE_BYTES", 100):
+            first = load_file_content(paths[0])[0]
+            load_file_content(paths[1])
+            load_file_content(paths[2])
+
+            self.assertIsNot(load_file_content(paths[0])[0], first)
+            self.assertLessEqual(resource_utils._resource_content_bytes, 100)
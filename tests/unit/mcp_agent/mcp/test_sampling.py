@@ -1,6 +1,10 @@
+import asyncio
+
+import pytest
 from mcp.types import CreateMessageRequestParams, SamplingMessage, TextContent
 
-from mcp_agent.mcp.sampling import sampling_agent_config
+from mcp_agent.config import MCPSamplingSettings
+from mcp_agent.mcp.sampling import SamplingService, sampling_agent_config
 
 
 def test_build_sampling_agent_config_with_system_prompt():
@@ -46,3 +50,47 @@ def test_build_sampling_agent_config_empty_system_prompt():
 
     # Verify instruction is the empty string as received in params.systemPrompt
     assert config.instruction == ""
+
+
+def sampling_params(text: str, system_prompt: str | None = None) -> CreateMessageRequestParams:
+    return CreateMessageRequestParams(
+        maxTokens=100,
+        messages=[SamplingMessage(role="user", content=TextContent(type="text", text=text))],
+        systemPrompt=system_prompt,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sampling_service_reuses_llms_without_leaking_history():
+    service = SamplingService(max_concurrency=2, pool_size=2)
+
+    first = await service.generate(sampling_params("first"), "passthrough")
+    second = await service.generate(sampling_params("second"), "passthrough")
+
+    assert first.first_text() == "first"
+    assert second.first_text() == "second"
+    assert service.llms_created == 1
+
+
+@pytest.mark.asyncio
+async def test_sampling_service_bounds_concurrent_llms():
+    service = SamplingService(max_concurrency=2, pool_size=2)
+
+    results = await asyncio.gather(
+        *(service.generate(sampling_params(f"message {i}"), "passthrough") for i in range(6))
+    )
+
+    assert [r.first_text() for r in results] == [f"message {i}" for i in range(6)]
+    assert service.llms_created <= 2
+
+
+@pytest.mark.asyncio
+async def test_sampling_service_applies_server_limits():
+    service = SamplingService()
+    settings = MCPSamplingSettings(model="passthrough", max_concurrency=1, requests_per_minute=10)
+
+    await service.generate(sampling_params("hello"), "passthrough", "server", settings)
+
+    limit = service._server_limits["server"]
+    assert len(limit._request_times) == 1
+    assert service._server_limit("other", MCPSamplingSettings()) is None
@@ -0,0 +1,86 @@
+import base64
+
+import pytest
+from mcp.types import ImageContent
+
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+from mcp_agent.mcp.prompt_message_multipart import PromptMessageMultipart
+from mcp_agent.mcp.session_store import SessionStore
+
+IMAGE = base64.b64encode(b"\x89PNG" * 1000).decode("ascii")
+
+
+def image_message(text: str) -> PromptMessageMultipart:
+    return Prompt.user(text, ImageContent(type="image", data=IMAGE, mimeType="image/png"))
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SessionStore(tmp_path / "sessions.db")
+    yield store
+    store.close()
+
+
+def test_append_and_load_round_trip(store):
+    messages = [image_message("first"), Prompt.assistant("reply")]
+    store.append("s1", messages)
+    store.append("s1", [Prompt.user("second")])
+
+    loaded = store.load("s1")
+
+    assert loaded == [*messages, Prompt.user("second")]
+    assert store.message_count("s1") == 3
+    assert store.load("s1", start=-1) == [Prompt.user("second")]
+    assert [m.first_text() for m in store.iter_messages("s1", batch_size=2)] == [
+        "first",
+        "reply",
+        "second",
+    ]
+
+
+def test_large_content_is_stored_once(store):
+    store.append("s1", [image_message("one")])
+    store.append("s2", [image_message("two")])
+
+    (blob_count,) = store._connection.execute("SELECT COUNT(*) FROM blobs").fetchone()
+    (body,) = store._connection.execute("SELECT body FROM messages LIMIT 1").fetchone()
+    assert blob_count == 1
+    assert IMAGE not in body
+
+    store.delete_session("s1")
+    assert store.load("s2")[0].content[1].data == IMAGE
+
+    store.delete_session("s2")
+    (blob_count,) = store._connection.execute("SELECT COUNT(*) FROM blobs").fetchone()
+    assert blob_count == 0
+    assert store.list_sessions() == []
+
+
+def test_sessions_survive_reopening(tmp_path):
+    store = SessionStore(tmp_path / "sessions.db")
+    store.append("s1", [Prompt.user("hello")])
+    store.close()
+
+    reopened = SessionStore(tmp_path / "sessions.db")
+    assert reopened.list_sessions() == ["s1"]
+    assert reopened.load("s1") == [Prompt.user("hello")]
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_llm_saves_turns_and_resumes(store, monkeypatch):
+    llm = PassthroughLLM()
+    monkeypatch.setattr(llm.context, "session_store", store, raising=False)
+
+    await llm.generate([Prompt.user("hello")])
+    await llm.generate([Prompt.user("again")])
+    assert store.message_count(llm.session_id) == 4
+
+    resumed = PassthroughLLM()
+    restored = await resumed.resume_session(llm.session_id, max_messages=3)
+
+    # The leading assistant message is dropped so the history starts with a user turn
+    assert restored == 2
+    assert [m.first_text() for m in resumed.message_history] == ["again", "again"]
+    assert resumed.session_id == llm.session_id
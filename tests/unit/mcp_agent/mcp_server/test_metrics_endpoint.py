@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from opentelemetry.metrics import Observation
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from mcp_agent.logging.metrics import LATENCY_BUCKETS
+from mcp_agent.mcp_server.metrics_endpoint import MetricsEndpoint, render_prometheus
+
+
+@pytest.fixture
+def reader():
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    meter = provider.get_meter("test")
+
+    turns = meter.create_counter("fast_agent.agent.turns", unit="{turn}")
+    turns.add(2, {"agent": "writer"})
+    turns.add(1, {"agent": 'say "hi"'})
+
+    duration = meter.create_histogram(
+        "fast_agent.tool.call.duration",
+        unit="s",
+        explicit_bucket_boundaries_advisory=LATENCY_BUCKETS,
+    )
+    for seconds in (0.002, 0.2, 3.0):
+        duration.record(seconds, {"server": "fetch", "tool": "fetch", "error": False})
+
+    meter.create_observable_gauge(
+        "fast_agent.event_bus.queue.depth", callbacks=[lambda _: [Observation(7)]]
+    )
+    return reader
+
+
+def test_counters_are_rendered_with_total_suffix(reader):
+    text = render_prometheus(reader.get_metrics_data())
+
+    assert "# TYPE fast_agent_agent_turns_total counter" in text
+    assert 'fast_agent_agent_turns_total{agent="writer"} 2' in text
+    assert 'fast_agent_agent_turns_total{agent="say \\"hi\\""} 1' in text
+
+
+def test_histograms_have_cumulative_buckets(reader):
+    text = render_prometheus(reader.get_metrics_data())
+    name = "fast_agent_tool_call_duration_seconds"
+    labels = 'server="fetch",tool="fetch",error="false"'
+
+    assert f"# TYPE {name} histogram" in text
+    assert f'{name}_bucket{{{labels},le="0.005"}} 1' in text
+    assert f'{name}_bucket{{{labels},le="2.5"}} 2' in text
+    assert f'{name}_bucket{{{labels},le="5.0"}} 3' in text
+    assert f'{name}_bucket{{{labels},le="+Inf"}} 3' in text
+    assert f"{name}_count{{{labels}}} 3" in text
+    assert f"{name}_sum{{{labels}}} 3.202" in text
+
+
+def test_gauges_are_rendered(reader):
+    text = render_prometheus(reader.get_metrics_data())
+
+    assert "# TYPE fast_agent_event_bus_queue_depth gauge" in text
+    assert "fast_agent_event_bus_queue_depth 7" in text
+
+
+@pytest.mark.asyncio
+async def test_endpoint_serves_metrics(reader):
+    endpoint = MetricsEndpoint(reader, port=0)
+    await endpoint.start()
+    try:
+
+        async def get(path: str) -> str:
+            stream_reader, writer = await asyncio.open_connection("127.0.0.1", endpoint.port)
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+            await writer.drain()
+            response = (await stream_reader.read()).decode()
+            writer.close()
+            return response
+
+        response = await get("/metrics")
+        assert response.startswith("HTTP/1.1 200 OK")
+        assert "fast_agent_agent_turns_total" in response
+
+        assert (await get("/")).startswith("HTTP/1.1 404")
+    finally:
+        await endpoint.stop()
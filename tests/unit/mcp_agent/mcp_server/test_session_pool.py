@@ -0,0 +1,135 @@
+import asyncio
+import gc
+from contextlib import AsyncExitStack
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_agent.core.prompt import Prompt
+from mcp_agent.llm.augmented_llm_passthrough import PassthroughLLM
+from mcp_agent.llm.conversation_scope import ConversationScope, conversation_scope
+from mcp_agent.mcp_server.session_pool import AgentSessionPool, session_key
+
+
+@pytest.mark.asyncio
+async def test_scopes_hold_separate_conversations():
+    llm = PassthroughLLM()
+
+    async def converse(scope, text):
+        with conversation_scope(scope):
+            await llm.generate([Prompt.user(text)])
+            await asyncio.sleep(0)
+            await llm.generate([Prompt.user(text)])
+            return [message.first_text() for message in llm.message_history]
+
+    first, second = await asyncio.gather(
+        converse(ConversationScope(), "one"), converse(ConversationScope(), "two")
+    )
+
+    assert first == ["one"] * 4
+    assert second == ["two"] * 4
+    assert llm.message_history == []
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_reused_and_least_recently_used_evicted():
+    pool = AgentSessionPool(max_sessions=2)
+
+    async with pool.session("a") as a:
+        pass
+    async with pool.session("b"):
+        pass
+    async with pool.session("a") as again:
+        assert again is a
+    async with pool.session("c"):
+        pass
+
+    assert pool.get("a") is a
+    assert pool.get("b") is None
+    assert pool.stats.evicted == 1
+
+
+@pytest.mark.asyncio
+async def test_requests_queue_when_every_session_is_busy():
+    pool = AgentSessionPool(max_sessions=1)
+    order = []
+
+    async def request(key, delay):
+        async with pool.session(key):
+            order.append(f"start {key}")
+            await asyncio.sleep(delay)
+            order.append(f"end {key}")
+
+    await asyncio.gather(request("a", 0.05), request("b", 0))
+
+    assert order == ["start a", "end a", "start b", "end b"]
+    assert pool.stats.queued == 1
+    assert pool.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_expire():
+    pool = AgentSessionPool(idle_timeout_seconds=0)
+
+    async with pool.session("a"):
+        pass
+    async with pool.session("b"):
+        pass
+
+    assert pool.get("a") is None
+    assert len(pool) == 1
+
+
+@pytest.mark.asyncio
+async def test_session_keys_are_not_reused_and_report_disconnects():
+    class ClientSession:
+        pass
+
+    def context(session):
+        return SimpleNamespace(request_context=SimpleNamespace(session=session))
+
+    disconnected = []
+    first, second = ClientSession(), ClientSession()
+    key = session_key(context(first), disconnected.append)
+
+    assert session_key(context(first), disconnected.append) == key
+    assert session_key(context(second)) != key
+    assert session_key(SimpleNamespace()) == "default"
+
+    del first
+    gc.collect()
+    # Finalizers may run on any thread, so the callback is run on the loop
+    assert disconnected == []
+    await asyncio.sleep(0)
+    assert disconnected == [key]
+
+
+@pytest.mark.asyncio
+async def test_closing_an_mcp_session_reports_the_disconnect():
+    class ServerSession:
+        def __init__(self):
+            self._exit_stack = AsyncExitStack()
+
+    session = ServerSession()
+    disconnected = []
+    key = session_key(
+        SimpleNamespace(request_context=SimpleNamespace(session=session)), disconnected.append
+    )
+
+    await session._exit_stack.aclose()
+
+    assert disconnected == [key]
+
+
+@pytest.mark.asyncio
+async def test_closed_sessions_are_evicted_once_idle():
+    evicted = []
+    pool = AgentSessionPool(on_evict=evicted.append)
+
+    async with pool.session("a"):
+        pool.close("a")
+        assert pool.get("a") is not None
+    pool.close("missing")
+
+    assert pool.get("a") is None
+    assert evicted == ["a"]
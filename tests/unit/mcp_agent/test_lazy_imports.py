@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+import mcp_agent
+from mcp_agent.llm.model_factory import ModelFactory
+
+DEFERRED = ["anthropic", "openai", "prompt_toolkit", "aiohttp", "opentelemetry.sdk"]
+
+
+def loaded_modules(module: str) -> set:
+    result = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", f"import sys, {module}; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "module, extra",
+    [
+        ("mcp_agent", ["mcp", "rich"]),
+        ("mcp_agent.cli.__main__", ["mcp"]),
+        ("mcp_agent.core.fastagent", []),
+    ],
+)
+def test_entry_points_defer_heavy_imports(module, extra):
+    loaded = loaded_modules(module)
+
+    for name in DEFERRED + extra:
+        assert name not in loaded, f"importing {module} imported {name}"
+
+
+def test_package_attributes_resolve_lazily():
+    from mcp_agent.core.fastagent import FastAgent
+
+    assert mcp_agent.FastAgent is FastAgent
+    assert "Prompt" in dir(mcp_agent)
+    with pytest.raises(AttributeError):
+        mcp_agent.NotAThing
+
+
+def test_llm_classes_are_imported_on_demand():
+    from mcp_agent.llm.providers.augmented_llm_openai import OpenAIAugmentedLLM
+
+    config = ModelFactory.parse_model_string("gpt-4o")
+
+    assert ModelFactory.get_llm_class(config) is OpenAIAugmentedLLM